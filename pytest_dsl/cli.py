@@ -7,13 +7,15 @@ pytest-dsl命令行入口
 import sys
 import argparse
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
+from pytest_dsl.core.ast_cache import ast_cache
 from pytest_dsl.core.lexer import get_lexer
 from pytest_dsl.core.parser import (
     format_parse_errors,
     get_parser,
-    parse_with_error_handling,
 )
 from pytest_dsl.core.dsl_executor import DSLExecutor
 from pytest_dsl.core.yaml_loader import load_yaml_variables_from_args
@@ -58,6 +60,7 @@ def parse_args():
             help='YAML变量文件目录路径，'
                  '将加载该目录下所有.yaml文件'
         )
+        add_worker_options(run_parser)
 
         # 关键字列表命令
         list_parser = subparsers.add_parser(
@@ -184,6 +187,7 @@ def parse_args():
                 '--yaml-vars', action='append', default=[]
             )
             parser.add_argument('--yaml-vars-dir', default=None)
+            add_worker_options(parser)
 
             args = parser.parse_args(argv)
             args.command = 'run-compat'  # 标记为兼容模式
@@ -191,6 +195,18 @@ def parse_args():
         return args
 
 
+def add_worker_options(parser):
+    """添加并行执行相关的命令行参数"""
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help='并行执行DSL用例的worker数量（默认: 1，串行执行）'
+    )
+    parser.add_argument(
+        '--worker-mode', choices=['process', 'thread'], default='process',
+        help='并行模式：process(进程池，默认) 或 thread(线程池，适合HTTP等I/O密集型用例)'
+    )
+
+
 def list_keywords(output_format='json', name_filter=None,
                   category_filter='all', category_name_filter='all', 
                   tags_filter=None, output_file=None,
@@ -245,9 +261,8 @@ def load_yaml_variables(args):
 def execute_dsl_file(file_path, lexer, parser, executor):
     """执行单个DSL文件"""
     print(f"执行文件: {file_path}")
-    dsl_code = read_file(file_path)
     # 使用带错误收集的解析，避免None节点导致后续AttributeError
-    ast, errors = parse_with_error_handling(dsl_code, lexer=lexer)
+    _dsl_code, ast, errors = ast_cache.parse_file(file_path)
     if errors:
         print(f"解析失败 {file_path}:")
         print(format_parse_errors(errors, file_path=file_path))
@@ -273,9 +288,91 @@ def find_dsl_files(directory):
     return dsl_files
 
 
+# 每个worker（线程或进程）独立持有的执行器
+_worker_state = threading.local()
+
+
+def _get_worker_executor():
+    """获取当前worker专属的DSL执行器"""
+    executor = getattr(_worker_state, 'executor', None)
+    if executor is None:
+        executor = DSLExecutor(enable_hooks=True)
+        _worker_state.executor = executor
+    return executor
+
+
+def _init_process_worker(yaml_vars, yaml_vars_dir):
+    """进程池worker初始化：加载关键字和YAML变量"""
+    load_all_keywords(include_remote=True)
+    load_yaml_variables(argparse.Namespace(
+        yaml_vars=yaml_vars, yaml_vars_dir=yaml_vars_dir))
+
+
+def _execute_file_task(file_path):
+    """在worker中执行单个DSL文件"""
+    return execute_dsl_file(file_path, None, None, _get_worker_executor())
+
+
+def _execute_hook_case_task(case):
+    """在worker中执行单个Hook提供的用例"""
+    return execute_hook_case(case, _get_worker_executor())
+
+
+def execute_hook_case(case, executor):
+    """执行单个Hook提供的用例"""
+    case_id = case.get('id') or case.get('name', 'unknown')
+    try:
+        print(f"执行用例: {case.get('name', case_id)}")
+        # 使用DSLExecutor执行，内容为空时会通过Hook加载
+        executor.execute_from_content("", str(case_id))
+        print(f"✓ 用例 {case.get('name', case_id)} 执行成功")
+        return True
+    except Exception as e:
+        print(f"✗ 用例 {case.get('name', case_id)} 执行失败: {e}")
+        return False
+
+
+def run_in_workers(task, items, args):
+    """用线程池或进程池并行执行任务，按输入顺序返回结果
+
+    Args:
+        task: 模块级任务函数（进程模式下需要可pickle）
+        items: 任务参数列表
+        args: 命令行参数，使用其中的 workers / worker_mode
+
+    Returns:
+        list: 每个任务的返回值
+    """
+    workers = min(max(getattr(args, 'workers', 1) or 1, 1), len(items))
+    mode = getattr(args, 'worker_mode', 'process')
+    print(f"使用 {workers} 个{'线程' if mode == 'thread' else '进程'}并行执行")
+
+    if mode == 'thread':
+        pool = ThreadPoolExecutor(max_workers=workers)
+    else:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_process_worker,
+            initargs=(list(getattr(args, 'yaml_vars', None) or []),
+                      getattr(args, 'yaml_vars_dir', None)),
+        )
+
+    with pool:
+        futures = [pool.submit(task, item) for item in items]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"worker执行失败: {e}")
+                results.append(False)
+    return results
+
+
 def run_dsl_tests(args):
     """执行DSL测试的主函数"""
     path = args.path
+    parallel = (getattr(args, 'workers', 1) or 1) > 1
 
     if not path:
         print("错误: 必须指定要执行的DSL文件路径或目录")
@@ -307,17 +404,12 @@ def run_dsl_tests(args):
     if hook_cases:
         # 如果有hook提供的用例，优先执行这些用例
         print(f"通过Hook发现 {len(hook_cases)} 个DSL用例")
-        failures = 0
-        for case in hook_cases:
-            case_id = case.get('id') or case.get('name', 'unknown')
-            try:
-                print(f"执行用例: {case.get('name', case_id)}")
-                # 使用DSLExecutor执行，内容为空时会通过Hook加载
-                executor.execute_from_content("", str(case_id))
-                print(f"✓ 用例 {case.get('name', case_id)} 执行成功")
-            except Exception as e:
-                print(f"✗ 用例 {case.get('name', case_id)} 执行失败: {e}")
-                failures += 1
+        if parallel:
+            results = run_in_workers(_execute_hook_case_task, hook_cases, args)
+        else:
+            results = [execute_hook_case(case, executor)
+                       for case in hook_cases]
+        failures = results.count(False)
 
         if failures > 0:
             print(f"总计 {failures}/{len(hook_cases)} 个测试失败")
@@ -329,9 +421,6 @@ def run_dsl_tests(args):
     # 如果没有hook用例，使用传统的文件执行方式
     lexer = get_lexer()
     parser = get_parser()
-    # 复用之前创建的executor，如果没有则创建新的
-    if 'executor' not in locals():
-        executor = DSLExecutor(enable_hooks=True)
 
     # 检查路径是文件还是目录
     if os.path.isfile(path):
@@ -343,7 +432,7 @@ def run_dsl_tests(args):
         # 执行目录中的所有DSL文件
         print(f"执行目录: {path}")
 
-        # 先执行目录的setup文件（如果存在）
+        # 先执行目录的setup文件（如果存在），并行模式下也只在主进程执行一次
         setup_file = os.path.join(path, SETUP_FILE_NAME)
         if os.path.exists(setup_file):
             execute_hook_file(Path(setup_file), True, path)
@@ -357,11 +446,12 @@ def run_dsl_tests(args):
         print(f"找到 {len(dsl_files)} 个DSL文件")
 
         # 执行所有DSL文件
-        failures = 0
-        for file_path in dsl_files:
-            success = execute_dsl_file(file_path, lexer, parser, executor)
-            if not success:
-                failures += 1
+        if parallel:
+            results = run_in_workers(_execute_file_task, dsl_files, args)
+        else:
+            results = [execute_dsl_file(file_path, lexer, parser, executor)
+                       for file_path in dsl_files]
+        failures = results.count(False)
 
         # 最后执行目录的teardown文件（如果存在）
         teardown_file = os.path.join(path, TEARDOWN_FILE_NAME)
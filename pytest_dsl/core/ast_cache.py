@@ -0,0 +1,169 @@
+"""DSL语法树缓存
+
+pytest收集阶段（读取@data）和执行阶段会解析同一个DSL文件，数据驱动用例
+还会对每一行数据重复执行。该模块按内容哈希缓存解析得到的 ``Node`` 树，
+使同一进程内的收集和所有执行共享一棵语法树；可选地把语法树序列化到
+``.pytest_cache`` 下，重复运行时完全跳过解析。
+
+语法树在执行过程中是只读的，因此可以安全地在多个用例之间共享。
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from pytest_dsl.core.lexer import get_lexer
+from pytest_dsl.core.parser import parse_with_error_handling
+
+
+def _cache_format_version():
+    """磁盘缓存格式版本，语法或包版本变化时自动失效。"""
+    from pytest_dsl.core import dsl_parsetab
+
+    try:
+        from importlib.metadata import version
+        package_version = version('pytest-dsl')
+    except Exception:
+        package_version = 'unknown'
+
+    raw = f"{package_version}:{dsl_parsetab._lr_signature}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:12]
+
+
+class DSLAstCache:
+    """以文件路径 + mtime + 内容哈希为键的DSL语法树缓存"""
+
+    def __init__(self, max_entries=2048):
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        # 内容哈希 -> AST
+        self._asts = OrderedDict()
+        # 文件路径 -> (mtime_ns, size, 内容, 内容哈希)
+        self._files = {}
+        self._disk_dir = None
+        self._format_version = None
+        self.hits = 0
+        self.misses = 0
+
+    def enable_disk_cache(self, cache_dir):
+        """启用磁盘缓存，cache_dir 为 None 时关闭"""
+        with self._lock:
+            if cache_dir is None:
+                self._disk_dir = None
+                return
+            if self._format_version is None:
+                self._format_version = _cache_format_version()
+            self._disk_dir = Path(cache_dir) / self._format_version
+            self._disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def clear(self):
+        """清空内存缓存（不删除磁盘缓存）"""
+        with self._lock:
+            self._asts.clear()
+            self._files.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def content_hash(content):
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def read_file(self, path):
+        """读取DSL文件内容，文件未变化时直接返回缓存的内容
+
+        Returns:
+            tuple: (文件内容, 内容哈希)
+        """
+        path = os.path.abspath(str(path))
+        stat = os.stat(path)
+        with self._lock:
+            entry = self._files.get(path)
+            if (entry and entry[0] == stat.st_mtime_ns and
+                    entry[1] == stat.st_size):
+                return entry[2], entry[3]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        digest = self.content_hash(content)
+        with self._lock:
+            self._files[path] = (stat.st_mtime_ns, stat.st_size, content,
+                                 digest)
+        return content, digest
+
+    def parse(self, content, digest=None):
+        """解析DSL内容，命中缓存时直接返回共享的语法树
+
+        解析失败的结果不会被缓存，以保证每次都能得到完整的诊断信息。
+
+        Returns:
+            tuple: (AST节点, 错误列表)
+        """
+        digest = digest or self.content_hash(content)
+        with self._lock:
+            ast = self._asts.get(digest)
+            if ast is not None:
+                self._asts.move_to_end(digest)
+                self.hits += 1
+                return ast, []
+
+        ast = self._load_from_disk(digest)
+        if ast is None:
+            ast, errors = parse_with_error_handling(content, lexer=get_lexer())
+            if errors or ast is None:
+                return ast, errors
+            self._save_to_disk(digest, ast)
+
+        with self._lock:
+            self.misses += 1
+            self._asts[digest] = ast
+            while len(self._asts) > self.max_entries:
+                self._asts.popitem(last=False)
+        return ast, []
+
+    def parse_file(self, path):
+        """读取并解析DSL文件
+
+        Returns:
+            tuple: (文件内容, AST节点, 错误列表)
+        """
+        content, digest = self.read_file(path)
+        ast, errors = self.parse(content, digest)
+        return content, ast, errors
+
+    def _disk_path(self, digest):
+        if self._disk_dir is None:
+            return None
+        return self._disk_dir / f"{digest}.pickle"
+
+    def _load_from_disk(self, digest):
+        path = self._disk_path(digest)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # 损坏或不兼容的缓存文件直接忽略，重新解析
+            return None
+
+    def _save_to_disk(self, digest, ast):
+        path = self._disk_path(digest)
+        if path is None:
+            return
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(ast, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+# 创建全局语法树缓存实例
+ast_cache = DSLAstCache()
@@ -1,12 +1,34 @@
+from collections import ChainMap
+
+# 查找结果中表示变量不存在的标记
+MISSING = object()
+
+
 class TestContext:
     def __init__(self):
         self._data = {}
         self._external_providers = []  # 外部变量提供者列表
+        # 外部提供者覆盖的变量层（见VariableProvider.layer）
+        self._provider_layers = frozenset()
+        # 变量名 -> (命中的提供者序号, 之前各提供者的版本号)，序号等于
+        # 提供者数量表示都没有该变量；版本号变化后缓存失效
+        self._resolved = {}
         self.executor = None
+        # 本地变量的版本号：每次set/clear递增，用于增量同步
+        self._version = 0
+        self._key_versions = {}
+        self._cleared_version = 0
+
+    @property
+    def version(self) -> int:
+        """本地变量的当前版本号"""
+        return self._version
 
     def set(self, key: str, value: any) -> None:
         """设置上下文变量"""
         self._data[key] = value
+        self._version += 1
+        self._key_versions[key] = self._version
         executor = getattr(self, 'executor', None)
         state = getattr(executor, 'state', None)
         if state is not None and getattr(state, 'test_context', None) is self:
@@ -14,38 +36,116 @@ class TestContext:
 
     def get(self, key: str, default=None) -> any:
         """获取上下文变量，遵循变量优先级：本地变量 > 外部提供者变量"""
-        # 1. 首先检查本地变量
-        if key in self._data:
-            return self._data[key]
+        return self.lookup(key, default)
 
-        # 2. 检查外部提供者（按注册顺序）
-        for provider in self._external_providers:
-            if hasattr(provider, 'get_variable'):
-                value = provider.get_variable(key)
+    def has(self, key: str) -> bool:
+        """检查上下文变量是否存在（包括外部提供者）"""
+        return self.lookup(key, MISSING) is not MISSING
+
+    def lookup(self, key: str, default=None) -> any:
+        """查找变量：本地变量 > 外部提供者（按注册顺序），每层只查找一次
+
+        已解析过的变量名会记住由哪个提供者提供，之前的提供者版本号不变时
+        直接从该提供者读取，不再逐个询问前面的提供者。
+        """
+        data = self._data
+        if key in data:
+            return data[key]
+
+        providers = self._external_providers
+        if not providers:
+            return default
+
+        entry = self._resolved.get(key)
+        if entry is not None:
+            index, generations = entry
+            if generations == self._provider_generations(index):
+                if index == len(providers):
+                    return default
+                value = providers[index].get_variable(key)
                 if value is not None:
                     return value
 
-        # 3. 返回默认值
+        generations = self._provider_generations(len(providers))
+        for index, provider in enumerate(providers):
+            get_variable = getattr(provider, 'get_variable', None)
+            if get_variable is None:
+                continue
+            value = get_variable(key)
+            if value is not None:
+                self._remember_resolution(key, index, generations)
+                return value
+
+        self._remember_resolution(key, len(providers), generations)
         return default
 
-    def has(self, key: str) -> bool:
-        """检查上下文变量是否存在（包括外部提供者）"""
-        # 检查本地变量
-        if key in self._data:
-            return True
+    def _provider_generations(self, count: int) -> tuple:
+        """前count个提供者的版本号，不支持版本号的提供者为None"""
+        return tuple(getattr(provider, 'generation', None)
+                     for provider in self._external_providers[:count])
 
-        # 检查外部提供者
-        for provider in self._external_providers:
-            if hasattr(provider, 'get_variable'):
-                value = provider.get_variable(key)
-                if value is not None:
-                    return True
+    def _remember_resolution(self, key: str, index: int,
+                             generations: tuple) -> None:
+        generations = generations[:index]
+        if None not in generations:
+            self._resolved[key] = (index, generations)
 
-        return False
+    @property
+    def covers_global_context(self) -> bool:
+        """外部提供者是否已包含全局上下文的所有变量（YAML变量和全局变量）"""
+        return {'yaml', 'global'} <= self._provider_layers
+
+    def fork(self) -> 'TestContext':
+        """创建并行分支使用的子上下文
+
+        子上下文共享外部变量提供者，本地变量写时复制：可以读取父上下文
+        的变量，写入只保存在子上下文中，不影响父上下文和其他分支。
+        """
+        child = TestContext()
+        child._data = ChainMap({}, self._data)
+        child._external_providers = list(self._external_providers)
+        child._provider_layers = self._provider_layers
+        child._resolved = dict(self._resolved)
+        return child
 
     def clear(self) -> None:
         """清空上下文"""
         self._data.clear()
+        self._version += 1
+        self._key_versions.clear()
+        self._cleared_version = self._version
+
+    def cleared_since(self, version: int) -> bool:
+        """检查上下文在指定版本之后是否被清空过"""
+        return self._cleared_version > version
+
+    def get_changed_variables(self, since_version: int) -> dict:
+        """获取指定版本之后通过set修改过的本地变量
+
+        Args:
+            since_version: 上次同步时记录的版本号
+
+        Returns:
+            变量名到当前值的字典
+        """
+        return {
+            key: self._data[key]
+            for key, version in self._key_versions.items()
+            if version > since_version and key in self._data
+        }
+
+    def get_external_variables(self) -> dict:
+        """获取所有外部提供者的变量（不包括本地变量）"""
+        external_variables = {}
+        for provider in self._external_providers:
+            if hasattr(provider, 'get_all_variables'):
+                try:
+                    provider_vars = provider.get_all_variables()
+                    if isinstance(provider_vars, dict):
+                        external_variables.update(provider_vars)
+                except Exception as e:
+                    print(f"警告：获取外部变量提供者变量时发生错误: {e}")
+        return external_variables
 
     def get_local_variables(self) -> dict:
         """获取所有本地变量"""
@@ -57,18 +157,9 @@ class TestContext:
         Returns:
             包含所有上下文变量的字典，本地变量优先级高于外部变量
         """
-        all_variables = {}
-        
         # 1. 先添加外部提供者的变量
-        for provider in self._external_providers:
-            if hasattr(provider, 'get_all_variables'):
-                try:
-                    external_vars = provider.get_all_variables()
-                    if isinstance(external_vars, dict):
-                        all_variables.update(external_vars)
-                except Exception as e:
-                    print(f"警告：获取外部变量提供者变量时发生错误: {e}")
-        
+        all_variables = self.get_external_variables()
+
         # 2. 再添加本地变量（覆盖同名的外部变量）
         all_variables.update(self._data)
         
@@ -82,6 +173,10 @@ class TestContext:
         """
         if provider not in self._external_providers:
             self._external_providers.append(provider)
+            self._provider_layers = frozenset(
+                getattr(item, 'layer', None)
+                for item in self._external_providers)
+            self._resolved.clear()
 
     def sync_variables_from_external_sources(self) -> None:
         """将外部变量提供者中的常用变量同步到本地缓存中，提高访问性能
@@ -100,6 +195,8 @@ class TestContext:
                         for key, value in external_vars.items():
                             if key not in self._data:
                                 self._data[key] = value
+                                self._version += 1
+                                self._key_versions[key] = self._version
                 except Exception as e:
                     # 如果某个提供者同步失败，记录警告但继续处理其他提供者
                     print(f"警告：同步外部变量提供者变量时发生错误: {e}")
@@ -1,4 +1,5 @@
 import os
+import threading
 from pytest_dsl.core.lexer import get_lexer
 from pytest_dsl.core.parser import get_parser, Node
 from pytest_dsl.core.dsl_executor import DSLExecutor
@@ -314,12 +315,15 @@ class CustomKeywordManager:
 
             param_mapping[param_name] = param_name
 
+        # 调用栈按线程记录，并行分支同时调用同一关键字时互不影响
+        call_state = threading.local()
+
         # 注册自定义关键字到关键字管理器
         @keyword_manager.register(keyword_name, parameters)
         def custom_keyword_executor(**kwargs):
             """自定义关键字执行器"""
             # 检查递归调用深度
-            call_stack = getattr(custom_keyword_executor, '_call_stack', [])
+            call_stack = getattr(call_state, 'stack', [])
             if keyword_name in call_stack:
                 raise RecursionError(f"检测到自定义关键字递归调用: {' -> '.join(call_stack + [keyword_name])}")
 
@@ -327,7 +331,6 @@ class CustomKeywordManager:
                 raise RecursionError(f"自定义关键字调用深度过深: {len(call_stack)}")
 
             # 尝试获取当前线程的执行器，优先使用现有执行器
-            import threading
             current_executor = getattr(threading.current_thread(), 'dsl_executor', None)
 
             # 如果有当前执行器，直接使用它；否则创建新的
@@ -354,26 +357,18 @@ class CustomKeywordManager:
 
             # 先应用默认值
             for param_name, default_value in param_defaults.items():
-                executor.variables[param_name] = default_value
-                executor.test_context.set(param_name, default_value)
+                executor.state.set_local_variable(param_name, default_value)
 
             # 然后应用传入的参数值（覆盖默认值）
             for param_name, param_mapping_name in param_mapping.items():
                 if param_mapping_name in kwargs:
-                    # 确保参数值在标准变量和测试上下文中都可用
-                    executor.variables[param_name] = kwargs[param_mapping_name]
-                    executor.test_context.set(
+                    # 参数值同时在本地变量和测试上下文中可用
+                    executor.state.set_local_variable(
                         param_name, kwargs[param_mapping_name])
 
-            # 重要：创建变量替换器，使变量解析正常工作
-            from pytest_dsl.core.variable_utils import VariableReplacer
-            executor.variable_replacer = VariableReplacer(
-                executor.variables, executor.test_context
-            )
-
             # 更新调用栈
             new_call_stack = call_stack + [keyword_name]
-            custom_keyword_executor._call_stack = new_call_stack
+            call_state.stack = new_call_stack
 
             # 执行关键字体中的语句
             result = None
@@ -388,7 +383,7 @@ class CustomKeywordManager:
                 raise
             finally:
                 # 恢复调用栈
-                custom_keyword_executor._call_stack = call_stack
+                call_state.stack = call_stack
 
             return result
 
@@ -8,17 +8,14 @@ from typing import Any
 import allure
 import pytest
 
+from pytest_dsl.core.ast_cache import ast_cache
 from pytest_dsl.core.auto_decorator import resolve_case_data_source
 from pytest_dsl.core.dsl_executor import DSLExecutor
 from pytest_dsl.core.dsl_executor_utils import (
     execute_dsl_file,
     extract_metadata_from_ast,
 )
-from pytest_dsl.core.lexer import get_lexer
-from pytest_dsl.core.parser import (
-    format_parse_errors,
-    parse_with_error_handling,
-)
+from pytest_dsl.core.parser import format_parse_errors
 
 
 DSL_SUFFIXES = {".dsl", ".auto"}
@@ -164,8 +161,7 @@ class DslItem(pytest.Item):
 
 def load_data_cases(case_path: Path) -> list[tuple[int, dict[str, Any]]]:
     """Load @data rows for collection without executing the DSL body."""
-    content = case_path.read_text(encoding="utf-8")
-    ast, errors = parse_with_error_handling(content, lexer=get_lexer())
+    _content, ast, errors = ast_cache.parse_file(case_path)
     if errors:
         message = format_parse_errors(errors, file_path=str(case_path))
         raise ValueError(f"DSL解析失败:\n{message}")
@@ -1,4 +1,5 @@
 import allure
+import copy
 import csv
 import os
 import time
@@ -14,13 +15,19 @@ from pytest_dsl.core.execution import (
     KeywordInvoker,
     LoopHandlers,
     NodeDispatcher,
+    ParallelHandlers,
     RemoteKeywordInvoker,
     ReturnException,
 )
 from pytest_dsl.core.execution_tracker import (
     ExecutionTracker
 )
-from pytest_dsl.core.reporting import print_verbose
+from pytest_dsl.core.reporting import (
+    print_verbose,
+    report_attach,
+    report_step,
+    report_summary_scope,
+)
 
 
 class DSLExecutor:
@@ -29,31 +36,30 @@ class DSLExecutor:
     环境变量控制:
     - PYTEST_DSL_KEEP_VARIABLES=1: 执行完成后保留变量，用于单元测试中检查变量值
     - PYTEST_DSL_KEEP_VARIABLES=0: (默认) 执行完成后清空变量，用于正常DSL执行
+    - PYTEST_DSL_COMPILED=1: 启用编译执行模式，AST节点首次执行时编译为闭包
+    - PYTEST_DSL_REPORT_LEVEL=full|summary|off: Allure报告级别，默认full；
+      summary只在用例结束时写入一个执行摘要附件，off不记录执行过程
+    - PYTEST_DSL_PARALLEL_WORKERS=8: parallel块的默认最大并发分支数
     """
 
     def __init__(self, enable_hooks: bool = True,
-                 enable_tracking: bool = True):
+                 enable_tracking: bool = True,
+                 compiled: bool = None):
         """初始化DSL执行器
 
         Args:
             enable_hooks: 是否启用hook机制，默认True
             enable_tracking: 是否启用执行跟踪，默认True
+            compiled: 是否启用编译执行模式，默认读取 PYTEST_DSL_COMPILED
         """
-        self.state = ExecutionState()
-        self.variables = self.state.variables
-        self.test_context = self.state.test_context
-        self.state.bind_executor(self)  # 让 test_context 能够访问到 executor
+        self._bind_state(ExecutionState())
 
         # 设置变量提供者，实现YAML变量等外部变量源的注入
         self._setup_variable_providers()
 
-        self.variable_replacer = self.state.variable_replacer
-        self.expression_evaluator = ExpressionEvaluator(self)
-        self.dispatcher = NodeDispatcher(self)
-        self.runner = DSLExecutionRunner(self)
-        self.keyword_invoker = KeywordInvoker(self)
-        self.loop_handlers = LoopHandlers(self)
-        self.remote_invoker = RemoteKeywordInvoker(self)
+        if compiled is None:
+            compiled = os.environ.get('PYTEST_DSL_COMPILED', '0') == '1'
+        self._init_runtime(compiled)
         self.imported_files = set()  # 跟踪已导入的文件，避免循环导入
 
         # Hook相关配置
@@ -75,6 +81,39 @@ class DSLExecutor:
         # 设置线程本地的执行器引用，供远程关键字客户端使用
         self._set_thread_local_executor()
 
+    def _bind_state(self, state):
+        """绑定执行状态，让 test_context 能够访问到 executor"""
+        self.state = state
+        self.variables = state.variables
+        self.test_context = state.test_context
+        self.variable_replacer = state.variable_replacer
+        state.bind_executor(self)
+
+    def _init_runtime(self, compiled):
+        """创建绑定到本执行器的节点分发和执行组件"""
+        self.expression_evaluator = ExpressionEvaluator(self)
+        self.dispatcher = NodeDispatcher(self, compiled=compiled)
+        self.runner = DSLExecutionRunner(self)
+        self.keyword_invoker = KeywordInvoker(self)
+        self.loop_handlers = LoopHandlers(self)
+        self.parallel_handlers = ParallelHandlers(self)
+        self.remote_invoker = RemoteKeywordInvoker(self)
+
+    def _fork(self, state):
+        """创建并行分支使用的子执行器
+
+        子执行器使用独立的变量状态、节点栈和执行组件，与父执行器共享
+        关键字、远程服务器、hook和执行跟踪器。
+
+        Args:
+            state: 分支的执行状态，通常由 ``self.state.fork()`` 创建
+        """
+        branch = copy.copy(self)
+        branch._bind_state(state)
+        branch._init_runtime(self.dispatcher.compiled)
+        branch._node_stack = list(self._node_stack)
+        return branch
+
     def _set_thread_local_executor(self):
         """设置线程本地的执行器引用"""
         import threading
@@ -161,10 +200,10 @@ class DSLExecutor:
             if context_info:
                 error_details += f"\n上下文: {context_info}"
 
-            allure.attach(
+            report_attach(
+                "DSL执行异常",
                 error_details,
-                name="DSL执行异常",
-                attachment_type=allure.attachment_type.TEXT
+                error=True,
             )
 
         # 如果原始异常已经是DSLExecutionError，不要重复封装
@@ -286,7 +325,14 @@ class DSLExecutor:
                         stmt, "current_file")
 
     def _handle_start(self, node):
-        """处理开始节点"""
+        """处理开始节点
+
+        summary报告级别下，整个用例的执行摘要在结束时作为一个附件写入。
+        """
+        with report_summary_scope():
+            return self._execute_start(node)
+
+    def _execute_start(self, node):
         teardown_node = None
 
         try:
@@ -332,10 +378,10 @@ class DSLExecutor:
                     self.execute(teardown_node)
                 except Exception as e:
                     print(f"🚨 清理操作发生严重错误: {str(e)}")
-                    allure.attach(
+                    report_attach(
+                        "清理严重错误",
                         f"清理严重失败: {str(e)}",
-                        name="清理严重错误",
-                        attachment_type=allure.attachment_type.TEXT
+                        error=True,
                     )
 
             # 测试用例执行完成后清空上下文/变量
@@ -465,10 +511,14 @@ class DSLExecutor:
 
     def _handle_statements(self, node):
         """处理语句列表"""
-        for stmt in node.children:
+        pipeline = self.remote_invoker.pipeline_enabled
+        for index, stmt in enumerate(node.children):
             if stmt is None:
                 # 防御性处理，跳过空语句节点
                 continue
+            if pipeline and stmt.type == 'RemoteKeywordCall':
+                self.remote_invoker.prefetch_keyword_calls(
+                    node.children, index)
             try:
                 self.execute(stmt)
             except ReturnException as e:
@@ -480,7 +530,7 @@ class DSLExecutor:
         step_name = f"变量赋值: {node.value}"
         line_info = self._get_line_info(node)
 
-        with allure.step(step_name):
+        with report_step(step_name, summary_key="变量赋值"):
             try:
                 var_name = node.value
                 # 在求值表达式之前，确保当前节点设置正确
@@ -494,17 +544,15 @@ class DSLExecutor:
                 scope = self.state.set_variable(var_name, expr_value)
                 if scope == "global":
                     # 记录全局变量赋值，包含行号信息
-                    allure.attach(
-                        f"全局变量: {var_name}\n值: {expr_value}{line_info}",
-                        name="全局变量赋值",
-                        attachment_type=allure.attachment_type.TEXT
+                    report_attach(
+                        "全局变量赋值",
+                        lambda: f"全局变量: {var_name}\n值: {expr_value}{line_info}",
                     )
                 else:
                     # 记录变量赋值，包含行号信息
-                    allure.attach(
-                        f"变量: {var_name}\n值: {expr_value}{line_info}",
-                        name="赋值详情",
-                        attachment_type=allure.attachment_type.TEXT
+                    report_attach(
+                        "赋值详情",
+                        lambda: f"变量: {var_name}\n值: {expr_value}{line_info}",
                     )
 
                 # 注释：移除变量变化通知，因为远程关键字执行前的实时同步已经足够
@@ -514,10 +562,10 @@ class DSLExecutor:
                 # 在步骤内部记录异常详情
                 error_details = (f"执行Assignment节点: {str(e)}{line_info}\n"
                                  f"上下文: 执行Assignment节点")
-                allure.attach(
+                report_attach(
+                    "DSL执行异常",
                     error_details,
-                    name="DSL执行异常",
-                    attachment_type=allure.attachment_type.TEXT
+                    error=True,
                 )
                 # 重新抛出异常，让外层的统一异常处理机制处理
                 raise
@@ -589,7 +637,7 @@ class DSLExecutor:
         var_name = node.value
         line_info = self._get_line_info(node)
 
-        with allure.step(f"关键字赋值: {var_name}"):
+        with report_step(f"关键字赋值: {var_name}", summary_key="关键字赋值"):
             try:
                 keyword_call_node = node.children[0]
                 # Call the invoker directly instead of self.execute()
@@ -601,17 +649,15 @@ class DSLExecutor:
 
                 scope = self.state.set_variable(var_name, result)
                 if scope == "global":
-                    allure.attach(
-                        f"全局变量: {var_name}\n值: {result}{line_info}",
-                        name="关键字赋值详情",
-                        attachment_type=allure.attachment_type.TEXT
+                    report_attach(
+                        "关键字赋值详情",
+                        lambda: f"全局变量: {var_name}\n值: {result}{line_info}",
                     )
                 else:
                     # 记录关键字赋值，包含行号信息
-                    allure.attach(
-                        f"变量: {var_name}\n值: {result}{line_info}",
-                        name="关键字赋值详情",
-                        attachment_type=allure.attachment_type.TEXT
+                    report_attach(
+                        "关键字赋值详情",
+                        lambda: f"变量: {var_name}\n值: {result}{line_info}",
                     )
 
                 # 注释：移除变量变化通知，因为远程关键字执行前的实时同步已经足够
@@ -622,10 +668,10 @@ class DSLExecutor:
                 error_details = (f"执行AssignmentKeywordCall节点: {str(e)}"
                                  f"{line_info}\n"
                                  f"上下文: 执行AssignmentKeywordCall节点")
-                allure.attach(
+                report_attach(
+                    "DSL执行异常",
                     error_details,
-                    name="DSL执行异常",
-                    attachment_type=allure.attachment_type.TEXT
+                    error=True,
                 )
                 # 重新抛出异常，让外层的统一异常处理机制处理
                 raise
@@ -655,6 +701,14 @@ class DSLExecutor:
         """处理键值对遍历循环: for key, value in dict do ... end"""
         return self.loop_handlers.handle_for_key_value_loop(node)
 
+    def _handle_parallel(self, node):
+        """处理并行块: parallel do ... end"""
+        return self.parallel_handlers.handle_parallel(node)
+
+    def _handle_parallel_for(self, node):
+        """处理并行循环: parallel for item in list with max N do ... end"""
+        return self.parallel_handlers.handle_parallel_for(node)
+
     def _execute_keyword_call(self, node):
         """执行关键字调用"""
         return self.keyword_invoker.execute(node)
@@ -697,10 +751,10 @@ class DSLExecutor:
 
                     # 记录到allure报告中
                     error_msg = f"清理操作失败 (行{error_info['line_number'] if error_info['line_number'] else '未知'}): {str(e)}"
-                    allure.attach(
+                    report_attach(
+                        "清理操作警告",
                         error_msg,
-                        name="清理操作警告",
-                        attachment_type=allure.attachment_type.TEXT
+                        error=True,
                     )
         else:
             # 其他类型的节点（如单个语句），直接执行
@@ -715,10 +769,10 @@ class DSLExecutor:
                 teardown_errors.append(error_info)
 
                 error_msg = f"清理操作失败 (行{error_info['line_number'] if error_info['line_number'] else '未知'}): {str(e)}"
-                allure.attach(
+                report_attach(
+                    "清理操作警告",
                     error_msg,
-                    name="清理操作警告",
-                    attachment_type=allure.attachment_type.TEXT
+                    error=True,
                 )
 
         # 如果有清理错误，打印汇总信息但不抛出异常
@@ -739,7 +793,7 @@ class DSLExecutor:
         Raises:
             ReturnException: 抛出异常来实现return控制流
         """
-        with allure.step("执行返回语句"):
+        with report_step("执行返回语句"):
             expr_node = node.children[0]
             return_value = self.eval_expression(expr_node)
         raise ReturnException(return_value)
@@ -753,7 +807,7 @@ class DSLExecutor:
         Raises:
             BreakException: 抛出异常来实现break控制流
         """
-        with allure.step("执行break语句"):
+        with report_step("执行break语句"):
             pass
         raise BreakException()
 
@@ -766,23 +820,26 @@ class DSLExecutor:
         Raises:
             ContinueException: 抛出异常来实现continue控制流
         """
-        with allure.step("执行continue语句"):
+        with report_step("执行continue语句"):
             pass
         raise ContinueException()
 
-    @allure.step("执行条件语句")
     def _handle_if_statement(self, node):
         """处理if-elif-else语句
 
         Args:
             node: IfStatement节点，包含条件表达式、if分支、可选的elif分支和可选的else分支
         """
+        with report_step("执行条件语句", summary_key="执行条件语句"):
+            return self._execute_if_branches(node)
+
+    def _execute_if_branches(self, node):
         # 首先检查if条件
         condition = self.eval_expression(node.children[0])
 
         if condition:
             # 执行if分支
-            with allure.step("执行if分支"):
+            with report_step("执行if分支"):
                 self.execute(node.children[1])
                 return
 
@@ -794,14 +851,14 @@ class DSLExecutor:
             if hasattr(child, 'type') and child.type == 'ElifClause':
                 elif_condition = self.eval_expression(child.children[0])
                 if elif_condition:
-                    with allure.step(f"执行elif分支 {i - 1}"):
+                    with report_step(f"执行elif分支 {i - 1}"):
                         self.execute(child.children[1])
                         return
 
             # 如果是普通的statements节点（else分支）
             elif not hasattr(child, 'type') or child.type == 'Statements':
                 # 这是else分支，只有在所有前面的条件都为假时才执行
-                with allure.step("执行else分支"):
+                with report_step("执行else分支"):
                     self.execute(child)
                     return
 
@@ -853,6 +910,8 @@ class DSLExecutor:
             'Break': "Break语句",
             'Continue': "Continue语句",
             'Retry': "重试块",
+            'Parallel': "并行块",
+            'ParallelFor': f"并行循环: {getattr(node, 'value', '')}",
             'Teardown': "清理操作",
             'Start': "开始执行",
             'Statements': "语句块"
@@ -4,6 +4,7 @@
 """
 
 from pathlib import Path
+from pytest_dsl.core.ast_cache import ast_cache
 from pytest_dsl.core.dsl_executor import DSLExecutor
 from pytest_dsl.core.lexer import get_lexer
 from pytest_dsl.core.parser import get_parser
@@ -34,9 +35,8 @@ def execute_dsl_file(filename: str, executor: DSLExecutor = None) -> None:
         executor: 可选的DSL执行器实例，如果不提供则创建新的
     """
     try:
-        # 读取文件内容
-        with open(filename, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # 读取文件内容（文件未变化时复用收集阶段缓存的内容和语法树）
+        content, _digest = ast_cache.read_file(filename)
 
         # 创建或使用提供的执行器
         if executor is None:
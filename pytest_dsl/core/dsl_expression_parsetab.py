@@ -0,0 +1,176 @@
+
+# dsl_expression_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'expressionleftCOMMAleftORleftANDrightNOTleftINleftGTLTGELEEQNEleftPLUSMINUSleftTIMESDIVIDEMODULOrightUMINUSleftINDEX_ACCESSrightEQUALSAND AS AUTHOR_KEYWORD BREAK COLON COMMA CONTINUE DATA_KEYWORD DATE DATE_KEYWORD DESCRIPTION_KEYWORD DIVIDE DO DOLLAR_VARIABLE DOT ELIF ELSE END EQ EQUALS EVERY FALSE FOR FUNCTION GE GT ID IF IMPORT_KEYWORD IN INDEX_LBRACKET LBRACE LBRACKET LE LPAREN LT MINUS MODULO NAME_KEYWORD NE NONE NOT NULL NUMBER OR PARALLEL PIPE PLACEHOLDER PLUS RANGE RBRACE RBRACKET REMOTE_KEYWORD RETRY RETRY_TIMES RETURN RPAREN STRING TAGS_KEYWORD TEARDOWN TIMES TRUE UNTIL USING WITHstart : metadata statements teardown\n             | metadata statements\n             | statements teardown\n             | statementsmetadata : metadata_items\n                | emptyempty :metadata_items : metadata_item metadata_items\n                     | metadata_itemmetadata_item : NAME_KEYWORD COLON metadata_value\n                    | DESCRIPTION_KEYWORD COLON metadata_value\n                    | TAGS_KEYWORD COLON LBRACKET tags RBRACKET\n                    | AUTHOR_KEYWORD COLON metadata_value\n                    | DATE_KEYWORD COLON DATE\n                    | DATE_KEYWORD COLON STRING\n                    | DATA_KEYWORD COLON data_source\n                    | IMPORT_KEYWORD COLON STRING\n                    | REMOTE_KEYWORD COLON STRING AS ID\n                    | REMOTE_KEYWORD COLON STRING AS PLACEHOLDERmetadata_value : STRING\n                     | ID\n                     | NULL\n                     | NONEtags : tag COMMA tags\n            | tagtag : STRING\n           | ID\n           | NULL\n           | NONEstatements : statement statements\n                  | statementstatement : assignment\n                | keyword_call\n                | remote_keyword_call\n                | loop\n                | retry_statement\n                | parallel_statement\n                | custom_keyword\n                | return_statement\n                | if_statement\n                | break_statement\n                | continue_statementassignment : ID EQUALS expression\n                 | ID EQUALS keyword_call\n                 | ID EQUALS remote_keyword_callexpression : logical_or_exprexpr_atom : NUMBER\n                 | STRING\n                 | PLACEHOLDER\n                 | DOLLAR_VARIABLE\n                 | ID\n                 | boolean_expr\n                 | null_expr\n                 | list_expr\n                 | dict_expr\n                 | LPAREN expression RPAREN\n                 | expr_atom INDEX_LBRACKET expression RBRACKET %prec INDEX_ACCESS\n                 | expr_atom DOT ID %prec INDEX_ACCESSboolean_expr : TRUE\n                    | FALSEnull_expr : NULL\n                 | NONElist_expr : LBRACKET list_items RBRACKET\n                 | LBRACKET RBRACKETlist_items : list_item\n                  | list_item COMMA list_itemslist_item : expressiondict_expr : LBRACE dict_items RBRACE\n                 | LBRACE RBRACEdict_items : dict_item\n                  | dict_item COMMA dict_itemsdict_item : expression COLON expressionloop : FOR ID IN RANGE LPAREN expression COMMA expression RPAREN DO statements END\n            | FOR ID IN expression DO statements END\n            | FOR ID COMMA ID IN expression DO statements ENDretry_statement : RETRY expression retry_modifiers DO statements END\n                       | RETRY expression RETRY_TIMES retry_modifiers DO statements ENDparallel_statement : PARALLEL DO statements END\n                          | PARALLEL FOR ID IN parallel_source DO statements END\n                          | PARALLEL FOR ID IN parallel_source WITH ID expression DO statements ENDparallel_source : RANGE LPAREN expression COMMA expression RPAREN\n                       | expressionretry_modifiers : retry_modifier retry_modifiers\n                       | retry_modifier\n                       | emptyretry_modifier : EVERY expression\n                      | UNTIL expressionkeyword_call : LBRACKET ID RBRACKET COMMA parameter_list\n                   | LBRACKET ID RBRACKETparameter_list : parameter_itemsparameter_items : parameter_item COMMA parameter_items\n                     | parameter_itemparameter_item : ID COLON expressionteardown : TEARDOWN DO statements END\n                | TEARDOWN DO ENDdata_source : STRING USING IDcustom_keyword : FUNCTION ID LPAREN param_definitions RPAREN DO statements ENDparam_definitions : param_def_list\n                        | param_def_list : param_def COMMA param_def_list\n                     | param_defparam_def : ID EQUALS STRING\n                | ID EQUALS NUMBER\n                | ID EQUALS boolean_expr\n                | ID EQUALS null_expr\n                | IDreturn_statement : RETURN expressionbreak_statement : BREAKcontinue_statement : CONTINUEif_statement : IF expression DO statements END\n                   | IF expression DO statements elif_clauses END\n                   | IF expression DO statements ELSE statements END\n                   | IF expression DO statements elif_clauses ELSE statements ENDelif_clauses : elif_clause\n                    | elif_clause elif_clauseselif_clause : ELIF expression DO statementslogical_or_expr : logical_or_expr OR logical_and_expr\n                       | logical_and_exprlogical_and_expr : logical_and_expr AND logical_not_expr\n                        | logical_not_exprlogical_not_expr : NOT logical_not_expr\n                        | comparison_exprcomparison_expr : arithmetic_expr comparison_operator arithmetic_expr\n                       | arithmetic_expr NOT IN arithmetic_expr\n                       | arithmetic_exprcomparison_operator : GT\n                           | LT\n                           | GE\n                           | LE\n                           | EQ\n                           | NE\n                           | INarithmetic_expr : additive_expradditive_expr : additive_expr PLUS multiplicative_expr\n                     | additive_expr MINUS multiplicative_expr\n                     | multiplicative_exprmultiplicative_expr : multiplicative_expr TIMES unary_expr\n                           | multiplicative_expr DIVIDE unary_expr\n                           | multiplicative_expr MODULO unary_expr\n                           | unary_exprunary_expr : MINUS unary_expr %prec UMINUS\n                  | expr_atomremote_keyword_call : ID PIPE LBRACKET ID RBRACKET COMMA parameter_list\n                          | ID PIPE LBRACKET ID RBRACKET\n                          | PLACEHOLDER PIPE LBRACKET ID RBRACKET COMMA parameter_list\n                          | PLACEHOLDER PIPE LBRACKET ID RBRACKET'
+    
+_lr_action_items = {'NOT':([0,5,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,46,47,51,55,62,63,64,65,66,68,69,70,71,72,73,74,76,],[5,5,33,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,5,-59,-60,-61,-62,5,5,5,5,-141,5,-64,-69,-134,-135,-137,-138,-139,-58,-56,-63,5,-68,5,5,-57,]),'MINUS':([0,5,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,46,47,51,55,61,62,63,64,65,66,68,69,70,71,72,73,74,76,],[10,10,42,-136,10,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,10,-59,-60,-61,-62,10,10,10,10,10,-132,-126,-127,-128,-129,-130,-131,10,10,10,10,10,-141,10,-64,-69,10,-134,-135,-137,-138,-139,-58,-56,-63,10,-68,10,10,-57,]),'NUMBER':([0,5,10,22,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,47,61,71,73,74,],[13,13,13,13,13,13,13,13,13,-132,-126,-127,-128,-129,-130,-131,13,13,13,13,13,13,13,13,13,13,]),'STRING':([0,5,10,22,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,47,61,71,73,74,],[14,14,14,14,14,14,14,14,14,-132,-126,-127,-128,-129,-130,-131,14,14,14,14,14,14,14,14,14,14,]),'PLACEHOLDER':([0,5,10,22,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,47,61,71,73,74,],[15,15,15,15,15,15,15,15,15,-132,-126,-127,-128,-129,-130,-131,15,15,15,15,15,15,15,15,15,15,]),'DOLLAR_VARIABLE':([0,5,10,22,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,47,61,71,73,74,],[16,16,16,16,16,16,16,16,16,-132,-126,-127,-128,-129,-130,-131,16,16,16,16,16,16,16,16,16,16,]),'ID':([0,5,10,22,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,47,48,61,71,73,74,],[17,17,17,17,17,17,17,17,17,-132,-126,-127,-128,-129,-130,-131,17,17,17,17,17,17,68,17,17,17,17,]),'LPAREN':([0,5,10,22,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,47,61,71,73,74,],[22,22,22,22,22,22,22,22,22,-132,-126,-127,-128,-129,-130,-131,22,22,22,22,22,22,22,22,22,22,]),'TRUE':([0,5,10,22,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,47,61,71,73,74,],[23,23,23,23,23,23,23,23,23,-132,-126,-127,-128,-129,-130,-131,23,23,23,23,23,23,23,23,23,23,]),'FALSE':([0,5,10,22,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,47,61,71,73,74,],[24,24,24,24,24,24,24,24,24,-132,-126,-127,-128,-129,-130,-131,24,24,24,24,24,24,24,24,24,24,]),'NULL':([0,5,10,22,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,47,61,71,73,74,],[25,25,25,25,25,25,25,25,25,-132,-126,-127,-128,-129,-130,-131,25,25,25,25,25,25,25,25,25,25,]),'NONE':([0,5,10,22,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,47,61,71,73,74,],[26,26,26,26,26,26,26,26,26,-132,-126,-127,-128,-129,-130,-131,26,26,26,26,26,26,26,26,26,26,]),'LBRACKET':([0,5,10,22,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,47,61,71,73,74,],[27,27,27,27,27,27,27,27,27,-132,-126,-127,-128,-129,-130,-131,27,27,27,27,27,27,27,27,27,27,]),'LBRACE':([0,5,10,22,27,28,29,30,32,34,35,36,37,38,39,40,41,42,43,44,45,47,61,71,73,74,],[28,28,28,28,28,28,28,28,28,-132,-126,-127,-128,-129,-130,-131,28,28,28,28,28,28,28,28,28,28,]),'$end':([1,2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,31,46,51,55,58,59,60,62,63,64,65,66,68,69,70,72,75,76,],[0,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-121,-141,-64,-69,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,]),'RPAREN':([2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,31,46,49,51,55,58,59,60,62,63,64,65,66,68,69,70,72,75,76,],[-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-121,-141,69,-64,-69,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,]),'COMMA':([2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,31,46,51,52,53,55,56,58,59,60,62,63,64,65,66,68,69,70,72,75,76,79,],[-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-121,-141,-64,71,-67,-69,73,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,-72,]),'RBRACKET':([2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,27,31,46,50,51,52,53,55,58,59,60,62,63,64,65,66,67,68,69,70,72,75,76,77,],[-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,51,-121,-141,70,-64,-65,-67,-69,-117,-119,-123,-134,-135,-137,-138,-139,76,-58,-56,-63,-68,-124,-57,-66,]),'COLON':([2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,31,46,51,55,57,58,59,60,62,63,64,65,66,68,69,70,72,75,76,],[-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-121,-141,-64,-69,74,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,]),'RBRACE':([2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,28,31,46,51,54,55,56,58,59,60,62,63,64,65,66,68,69,70,72,75,76,78,79,],[-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,55,-121,-141,-64,72,-69,-70,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,-71,-72,]),'OR':([2,3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,31,46,51,55,58,59,60,62,63,64,65,66,68,69,70,72,75,76,],[29,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-121,-141,-64,-69,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,]),'AND':([3,4,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,31,46,51,55,58,59,60,62,63,64,65,66,68,69,70,72,75,76,],[30,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-121,-141,-64,-69,30,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,]),'GT':([7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,46,51,55,62,63,64,65,66,68,69,70,72,76,],[35,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-141,-64,-69,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'LT':([7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,46,51,55,62,63,64,65,66,68,69,70,72,76,],[36,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-141,-64,-69,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'GE':([7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,46,51,55,62,63,64,65,66,68,69,70,72,76,],[37,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-141,-64,-69,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'LE':([7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,46,51,55,62,63,64,65,66,68,69,70,72,76,],[38,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-141,-64,-69,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'EQ':([7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,46,51,55,62,63,64,65,66,68,69,70,72,76,],[39,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-141,-64,-69,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'NE':([7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,46,51,55,62,63,64,65,66,68,69,70,72,76,],[40,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-141,-64,-69,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'IN':([7,8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,33,46,51,55,62,63,64,65,66,68,69,70,72,76,],[34,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,61,-141,-64,-69,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'PLUS':([8,9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,46,51,55,62,63,64,65,66,68,69,70,72,76,],[41,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-141,-64,-69,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'TIMES':([9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,46,51,55,62,63,64,65,66,68,69,70,72,76,],[43,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-141,-64,-69,43,43,-137,-138,-139,-58,-56,-63,-68,-57,]),'DIVIDE':([9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,46,51,55,62,63,64,65,66,68,69,70,72,76,],[44,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-141,-64,-69,44,44,-137,-138,-139,-58,-56,-63,-68,-57,]),'MODULO':([9,11,12,13,14,15,16,17,18,19,20,21,23,24,25,26,46,51,55,62,63,64,65,66,68,69,70,72,76,],[45,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-141,-64,-69,45,45,-137,-138,-139,-58,-56,-63,-68,-57,]),'INDEX_LBRACKET':([12,13,14,15,16,17,18,19,20,21,23,24,25,26,51,55,68,69,70,72,76,],[47,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-64,-69,-58,-56,-63,-68,-57,]),'DOT':([12,13,14,15,16,17,18,19,20,21,23,24,25,26,51,55,68,69,70,72,76,],[48,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-64,-69,-58,-56,-63,-68,-57,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'expression':([0,22,27,28,47,71,73,74,],[1,49,53,57,67,53,57,79,]),'logical_or_expr':([0,22,27,28,47,71,73,74,],[2,2,2,2,2,2,2,2,]),'logical_and_expr':([0,22,27,28,29,47,71,73,74,],[3,3,3,3,58,3,3,3,3,]),'logical_not_expr':([0,5,22,27,28,29,30,47,71,73,74,],[4,31,4,4,4,4,59,4,4,4,4,]),'comparison_expr':([0,5,22,27,28,29,30,47,71,73,74,],[6,6,6,6,6,6,6,6,6,6,6,]),'arithmetic_expr':([0,5,22,27,28,29,30,32,47,61,71,73,74,],[7,7,7,7,7,7,7,60,7,75,7,7,7,]),'additive_expr':([0,5,22,27,28,29,30,32,47,61,71,73,74,],[8,8,8,8,8,8,8,8,8,8,8,8,8,]),'multiplicative_expr':([0,5,22,27,28,29,30,32,41,42,47,61,71,73,74,],[9,9,9,9,9,9,9,9,62,63,9,9,9,9,9,]),'unary_expr':([0,5,10,22,27,28,29,30,32,41,42,43,44,45,47,61,71,73,74,],[11,11,46,11,11,11,11,11,11,11,11,64,65,66,11,11,11,11,11,]),'expr_atom':([0,5,10,22,27,28,29,30,32,41,42,43,44,45,47,61,71,73,74,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'boolean_expr':([0,5,10,22,27,28,29,30,32,41,42,43,44,45,47,61,71,73,74,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'null_expr':([0,5,10,22,27,28,29,30,32,41,42,43,44,45,47,61,71,73,74,],[19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,]),'list_expr':([0,5,10,22,27,28,29,30,32,41,42,43,44,45,47,61,71,73,74,],[20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,]),'dict_expr':([0,5,10,22,27,28,29,30,32,41,42,43,44,45,47,61,71,73,74,],[21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,]),'comparison_operator':([7,],[32,]),'list_items':([27,71,],[50,77,]),'list_item':([27,71,],[52,52,]),'dict_items':([28,73,],[54,78,]),'dict_item':([28,73,],[56,56,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> expression","S'",1,None,None,None),
+  ('start -> metadata statements teardown','start',3,'p_start','parser.py',59),
+  ('start -> metadata statements','start',2,'p_start','parser.py',60),
+  ('start -> statements teardown','start',2,'p_start','parser.py',61),
+  ('start -> statements','start',1,'p_start','parser.py',62),
+  ('metadata -> metadata_items','metadata',1,'p_metadata','parser.py',84),
+  ('metadata -> empty','metadata',1,'p_metadata','parser.py',85),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',93),
+  ('metadata_items -> metadata_item metadata_items','metadata_items',2,'p_metadata_items','parser.py',98),
+  ('metadata_items -> metadata_item','metadata_items',1,'p_metadata_items','parser.py',99),
+  ('metadata_item -> NAME_KEYWORD COLON metadata_value','metadata_item',3,'p_metadata_item','parser.py',107),
+  ('metadata_item -> DESCRIPTION_KEYWORD COLON metadata_value','metadata_item',3,'p_metadata_item','parser.py',108),
+  ('metadata_item -> TAGS_KEYWORD COLON LBRACKET tags RBRACKET','metadata_item',5,'p_metadata_item','parser.py',109),
+  ('metadata_item -> AUTHOR_KEYWORD COLON metadata_value','metadata_item',3,'p_metadata_item','parser.py',110),
+  ('metadata_item -> DATE_KEYWORD COLON DATE','metadata_item',3,'p_metadata_item','parser.py',111),
+  ('metadata_item -> DATE_KEYWORD COLON STRING','metadata_item',3,'p_metadata_item','parser.py',112),
+  ('metadata_item -> DATA_KEYWORD COLON data_source','metadata_item',3,'p_metadata_item','parser.py',113),
+  ('metadata_item -> IMPORT_KEYWORD COLON STRING','metadata_item',3,'p_metadata_item','parser.py',114),
+  ('metadata_item -> REMOTE_KEYWORD COLON STRING AS ID','metadata_item',5,'p_metadata_item','parser.py',115),
+  ('metadata_item -> REMOTE_KEYWORD COLON STRING AS PLACEHOLDER','metadata_item',5,'p_metadata_item','parser.py',116),
+  ('metadata_value -> STRING','metadata_value',1,'p_metadata_value','parser.py',135),
+  ('metadata_value -> ID','metadata_value',1,'p_metadata_value','parser.py',136),
+  ('metadata_value -> NULL','metadata_value',1,'p_metadata_value','parser.py',137),
+  ('metadata_value -> NONE','metadata_value',1,'p_metadata_value','parser.py',138),
+  ('tags -> tag COMMA tags','tags',3,'p_tags','parser.py',143),
+  ('tags -> tag','tags',1,'p_tags','parser.py',144),
+  ('tag -> STRING','tag',1,'p_tag','parser.py',152),
+  ('tag -> ID','tag',1,'p_tag','parser.py',153),
+  ('tag -> NULL','tag',1,'p_tag','parser.py',154),
+  ('tag -> NONE','tag',1,'p_tag','parser.py',155),
+  ('statements -> statement statements','statements',2,'p_statements','parser.py',160),
+  ('statements -> statement','statements',1,'p_statements','parser.py',161),
+  ('statement -> assignment','statement',1,'p_statement','parser.py',169),
+  ('statement -> keyword_call','statement',1,'p_statement','parser.py',170),
+  ('statement -> remote_keyword_call','statement',1,'p_statement','parser.py',171),
+  ('statement -> loop','statement',1,'p_statement','parser.py',172),
+  ('statement -> retry_statement','statement',1,'p_statement','parser.py',173),
+  ('statement -> parallel_statement','statement',1,'p_statement','parser.py',174),
+  ('statement -> custom_keyword','statement',1,'p_statement','parser.py',175),
+  ('statement -> return_statement','statement',1,'p_statement','parser.py',176),
+  ('statement -> if_statement','statement',1,'p_statement','parser.py',177),
+  ('statement -> break_statement','statement',1,'p_statement','parser.py',178),
+  ('statement -> continue_statement','statement',1,'p_statement','parser.py',179),
+  ('assignment -> ID EQUALS expression','assignment',3,'p_assignment','parser.py',184),
+  ('assignment -> ID EQUALS keyword_call','assignment',3,'p_assignment','parser.py',185),
+  ('assignment -> ID EQUALS remote_keyword_call','assignment',3,'p_assignment','parser.py',186),
+  ('expression -> logical_or_expr','expression',1,'p_expression','parser.py',201),
+  ('expr_atom -> NUMBER','expr_atom',1,'p_expr_atom','parser.py',206),
+  ('expr_atom -> STRING','expr_atom',1,'p_expr_atom','parser.py',207),
+  ('expr_atom -> PLACEHOLDER','expr_atom',1,'p_expr_atom','parser.py',208),
+  ('expr_atom -> DOLLAR_VARIABLE','expr_atom',1,'p_expr_atom','parser.py',209),
+  ('expr_atom -> ID','expr_atom',1,'p_expr_atom','parser.py',210),
+  ('expr_atom -> boolean_expr','expr_atom',1,'p_expr_atom','parser.py',211),
+  ('expr_atom -> null_expr','expr_atom',1,'p_expr_atom','parser.py',212),
+  ('expr_atom -> list_expr','expr_atom',1,'p_expr_atom','parser.py',213),
+  ('expr_atom -> dict_expr','expr_atom',1,'p_expr_atom','parser.py',214),
+  ('expr_atom -> LPAREN expression RPAREN','expr_atom',3,'p_expr_atom','parser.py',215),
+  ('expr_atom -> expr_atom INDEX_LBRACKET expression RBRACKET','expr_atom',4,'p_expr_atom','parser.py',216),
+  ('expr_atom -> expr_atom DOT ID','expr_atom',3,'p_expr_atom','parser.py',217),
+  ('boolean_expr -> TRUE','boolean_expr',1,'p_boolean_expr','parser.py',262),
+  ('boolean_expr -> FALSE','boolean_expr',1,'p_boolean_expr','parser.py',263),
+  ('null_expr -> NULL','null_expr',1,'p_null_expr','parser.py',268),
+  ('null_expr -> NONE','null_expr',1,'p_null_expr','parser.py',269),
+  ('list_expr -> LBRACKET list_items RBRACKET','list_expr',3,'p_list_expr','parser.py',274),
+  ('list_expr -> LBRACKET RBRACKET','list_expr',2,'p_list_expr','parser.py',275),
+  ('list_items -> list_item','list_items',1,'p_list_items','parser.py',283),
+  ('list_items -> list_item COMMA list_items','list_items',3,'p_list_items','parser.py',284),
+  ('list_item -> expression','list_item',1,'p_list_item','parser.py',292),
+  ('dict_expr -> LBRACE dict_items RBRACE','dict_expr',3,'p_dict_expr','parser.py',297),
+  ('dict_expr -> LBRACE RBRACE','dict_expr',2,'p_dict_expr','parser.py',298),
+  ('dict_items -> dict_item','dict_items',1,'p_dict_items','parser.py',306),
+  ('dict_items -> dict_item COMMA dict_items','dict_items',3,'p_dict_items','parser.py',307),
+  ('dict_item -> expression COLON expression','dict_item',3,'p_dict_item','parser.py',315),
+  ('loop -> FOR ID IN RANGE LPAREN expression COMMA expression RPAREN DO statements END','loop',12,'p_loop','parser.py',320),
+  ('loop -> FOR ID IN expression DO statements END','loop',7,'p_loop','parser.py',321),
+  ('loop -> FOR ID COMMA ID IN expression DO statements END','loop',9,'p_loop','parser.py',322),
+  ('retry_statement -> RETRY expression retry_modifiers DO statements END','retry_statement',6,'p_retry_statement','parser.py',337),
+  ('retry_statement -> RETRY expression RETRY_TIMES retry_modifiers DO statements END','retry_statement',7,'p_retry_statement','parser.py',338),
+  ('parallel_statement -> PARALLEL DO statements END','parallel_statement',4,'p_parallel_statement','parser.py',363),
+  ('parallel_statement -> PARALLEL FOR ID IN parallel_source DO statements END','parallel_statement',8,'p_parallel_statement','parser.py',364),
+  ('parallel_statement -> PARALLEL FOR ID IN parallel_source WITH ID expression DO statements END','parallel_statement',11,'p_parallel_statement','parser.py',365),
+  ('parallel_source -> RANGE LPAREN expression COMMA expression RPAREN','parallel_source',6,'p_parallel_source','parser.py',385),
+  ('parallel_source -> expression','parallel_source',1,'p_parallel_source','parser.py',386),
+  ('retry_modifiers -> retry_modifier retry_modifiers','retry_modifiers',2,'p_retry_modifiers','parser.py',395),
+  ('retry_modifiers -> retry_modifier','retry_modifiers',1,'p_retry_modifiers','parser.py',396),
+  ('retry_modifiers -> empty','retry_modifiers',1,'p_retry_modifiers','parser.py',397),
+  ('retry_modifier -> EVERY expression','retry_modifier',2,'p_retry_modifier','parser.py',407),
+  ('retry_modifier -> UNTIL expression','retry_modifier',2,'p_retry_modifier','parser.py',408),
+  ('keyword_call -> LBRACKET ID RBRACKET COMMA parameter_list','keyword_call',5,'p_keyword_call','parser.py',414),
+  ('keyword_call -> LBRACKET ID RBRACKET','keyword_call',3,'p_keyword_call','parser.py',415),
+  ('parameter_list -> parameter_items','parameter_list',1,'p_parameter_list','parser.py',446),
+  ('parameter_items -> parameter_item COMMA parameter_items','parameter_items',3,'p_parameter_items','parser.py',451),
+  ('parameter_items -> parameter_item','parameter_items',1,'p_parameter_items','parser.py',452),
+  ('parameter_item -> ID COLON expression','parameter_item',3,'p_parameter_item','parser.py',460),
+  ('teardown -> TEARDOWN DO statements END','teardown',4,'p_teardown','parser.py',473),
+  ('teardown -> TEARDOWN DO END','teardown',3,'p_teardown','parser.py',474),
+  ('data_source -> STRING USING ID','data_source',3,'p_data_source','parser.py',484),
+  ('custom_keyword -> FUNCTION ID LPAREN param_definitions RPAREN DO statements END','custom_keyword',8,'p_custom_keyword','parser.py',489),
+  ('param_definitions -> param_def_list','param_definitions',1,'p_param_definitions','parser.py',494),
+  ('param_definitions -> <empty>','param_definitions',0,'p_param_definitions','parser.py',495),
+  ('param_def_list -> param_def COMMA param_def_list','param_def_list',3,'p_param_def_list','parser.py',503),
+  ('param_def_list -> param_def','param_def_list',1,'p_param_def_list','parser.py',504),
+  ('param_def -> ID EQUALS STRING','param_def',3,'p_param_def','parser.py',512),
+  ('param_def -> ID EQUALS NUMBER','param_def',3,'p_param_def','parser.py',513),
+  ('param_def -> ID EQUALS boolean_expr','param_def',3,'p_param_def','parser.py',514),
+  ('param_def -> ID EQUALS null_expr','param_def',3,'p_param_def','parser.py',515),
+  ('param_def -> ID','param_def',1,'p_param_def','parser.py',516),
+  ('return_statement -> RETURN expression','return_statement',2,'p_return_statement','parser.py',526),
+  ('break_statement -> BREAK','break_statement',1,'p_break_statement','parser.py',532),
+  ('continue_statement -> CONTINUE','continue_statement',1,'p_continue_statement','parser.py',538),
+  ('if_statement -> IF expression DO statements END','if_statement',5,'p_if_statement','parser.py',544),
+  ('if_statement -> IF expression DO statements elif_clauses END','if_statement',6,'p_if_statement','parser.py',545),
+  ('if_statement -> IF expression DO statements ELSE statements END','if_statement',7,'p_if_statement','parser.py',546),
+  ('if_statement -> IF expression DO statements elif_clauses ELSE statements END','if_statement',8,'p_if_statement','parser.py',547),
+  ('elif_clauses -> elif_clause','elif_clauses',1,'p_elif_clauses','parser.py',568),
+  ('elif_clauses -> elif_clause elif_clauses','elif_clauses',2,'p_elif_clauses','parser.py',569),
+  ('elif_clause -> ELIF expression DO statements','elif_clause',4,'p_elif_clause','parser.py',577),
+  ('logical_or_expr -> logical_or_expr OR logical_and_expr','logical_or_expr',3,'p_logical_or_expr','parser.py',582),
+  ('logical_or_expr -> logical_and_expr','logical_or_expr',1,'p_logical_or_expr','parser.py',583),
+  ('logical_and_expr -> logical_and_expr AND logical_not_expr','logical_and_expr',3,'p_logical_and_expr','parser.py',591),
+  ('logical_and_expr -> logical_not_expr','logical_and_expr',1,'p_logical_and_expr','parser.py',592),
+  ('logical_not_expr -> NOT logical_not_expr','logical_not_expr',2,'p_logical_not_expr','parser.py',600),
+  ('logical_not_expr -> comparison_expr','logical_not_expr',1,'p_logical_not_expr','parser.py',601),
+  ('comparison_expr -> arithmetic_expr comparison_operator arithmetic_expr','comparison_expr',3,'p_comparison_expr','parser.py',609),
+  ('comparison_expr -> arithmetic_expr NOT IN arithmetic_expr','comparison_expr',4,'p_comparison_expr','parser.py',610),
+  ('comparison_expr -> arithmetic_expr','comparison_expr',1,'p_comparison_expr','parser.py',611),
+  ('comparison_operator -> GT','comparison_operator',1,'p_comparison_operator','parser.py',621),
+  ('comparison_operator -> LT','comparison_operator',1,'p_comparison_operator','parser.py',622),
+  ('comparison_operator -> GE','comparison_operator',1,'p_comparison_operator','parser.py',623),
+  ('comparison_operator -> LE','comparison_operator',1,'p_comparison_operator','parser.py',624),
+  ('comparison_operator -> EQ','comparison_operator',1,'p_comparison_operator','parser.py',625),
+  ('comparison_operator -> NE','comparison_operator',1,'p_comparison_operator','parser.py',626),
+  ('comparison_operator -> IN','comparison_operator',1,'p_comparison_operator','parser.py',627),
+  ('arithmetic_expr -> additive_expr','arithmetic_expr',1,'p_arithmetic_expr','parser.py',641),
+  ('additive_expr -> additive_expr PLUS multiplicative_expr','additive_expr',3,'p_additive_expr','parser.py',646),
+  ('additive_expr -> additive_expr MINUS multiplicative_expr','additive_expr',3,'p_additive_expr','parser.py',647),
+  ('additive_expr -> multiplicative_expr','additive_expr',1,'p_additive_expr','parser.py',648),
+  ('multiplicative_expr -> multiplicative_expr TIMES unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',657),
+  ('multiplicative_expr -> multiplicative_expr DIVIDE unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',658),
+  ('multiplicative_expr -> multiplicative_expr MODULO unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',659),
+  ('multiplicative_expr -> unary_expr','multiplicative_expr',1,'p_multiplicative_expr','parser.py',660),
+  ('unary_expr -> MINUS unary_expr','unary_expr',2,'p_unary_expr','parser.py',674),
+  ('unary_expr -> expr_atom','unary_expr',1,'p_unary_expr','parser.py',675),
+  ('remote_keyword_call -> ID PIPE LBRACKET ID RBRACKET COMMA parameter_list','remote_keyword_call',7,'p_remote_keyword_call','parser.py',1138),
+  ('remote_keyword_call -> ID PIPE LBRACKET ID RBRACKET','remote_keyword_call',5,'p_remote_keyword_call','parser.py',1139),
+  ('remote_keyword_call -> PLACEHOLDER PIPE LBRACKET ID RBRACKET COMMA parameter_list','remote_keyword_call',7,'p_remote_keyword_call','parser.py',1140),
+  ('remote_keyword_call -> PLACEHOLDER PIPE LBRACKET ID RBRACKET','remote_keyword_call',5,'p_remote_keyword_call','parser.py',1141),
+]
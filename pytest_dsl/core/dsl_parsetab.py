@@ -0,0 +1,176 @@
+
+# dsl_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftCOMMAleftORleftANDrightNOTleftINleftGTLTGELEEQNEleftPLUSMINUSleftTIMESDIVIDEMODULOrightUMINUSleftINDEX_ACCESSrightEQUALSAND AS AUTHOR_KEYWORD BREAK COLON COMMA CONTINUE DATA_KEYWORD DATE DATE_KEYWORD DESCRIPTION_KEYWORD DIVIDE DO DOLLAR_VARIABLE DOT ELIF ELSE END EQ EQUALS EVERY FALSE FOR FUNCTION GE GT ID IF IMPORT_KEYWORD IN INDEX_LBRACKET LBRACE LBRACKET LE LPAREN LT MINUS MODULO NAME_KEYWORD NE NONE NOT NULL NUMBER OR PARALLEL PIPE PLACEHOLDER PLUS RANGE RBRACE RBRACKET REMOTE_KEYWORD RETRY RETRY_TIMES RETURN RPAREN STRING TAGS_KEYWORD TEARDOWN TIMES TRUE UNTIL USING WITHstart : metadata statements teardown\n             | metadata statements\n             | statements teardown\n             | statementsmetadata : metadata_items\n                | emptyempty :metadata_items : metadata_item metadata_items\n                     | metadata_itemmetadata_item : NAME_KEYWORD COLON metadata_value\n                    | DESCRIPTION_KEYWORD COLON metadata_value\n                    | TAGS_KEYWORD COLON LBRACKET tags RBRACKET\n                    | AUTHOR_KEYWORD COLON metadata_value\n                    | DATE_KEYWORD COLON DATE\n                    | DATE_KEYWORD COLON STRING\n                    | DATA_KEYWORD COLON data_source\n                    | IMPORT_KEYWORD COLON STRING\n                    | REMOTE_KEYWORD COLON STRING AS ID\n                    | REMOTE_KEYWORD COLON STRING AS PLACEHOLDERmetadata_value : STRING\n                     | ID\n                     | NULL\n                     | NONEtags : tag COMMA tags\n            | tagtag : STRING\n           | ID\n           | NULL\n           | NONEstatements : statement statements\n                  | statementstatement : assignment\n                | keyword_call\n                | remote_keyword_call\n                | loop\n                | retry_statement\n                | parallel_statement\n                | custom_keyword\n                | return_statement\n                | if_statement\n                | break_statement\n                | continue_statementassignment : ID EQUALS expression\n                 | ID EQUALS keyword_call\n                 | ID EQUALS remote_keyword_callexpression : logical_or_exprexpr_atom : NUMBER\n                 | STRING\n                 | PLACEHOLDER\n                 | DOLLAR_VARIABLE\n                 | ID\n                 | boolean_expr\n                 | null_expr\n                 | list_expr\n                 | dict_expr\n                 | LPAREN expression RPAREN\n                 | expr_atom INDEX_LBRACKET expression RBRACKET %prec INDEX_ACCESS\n                 | expr_atom DOT ID %prec INDEX_ACCESSboolean_expr : TRUE\n                    | FALSEnull_expr : NULL\n                 | NONElist_expr : LBRACKET list_items RBRACKET\n                 | LBRACKET RBRACKETlist_items : list_item\n                  | list_item COMMA list_itemslist_item : expressiondict_expr : LBRACE dict_items RBRACE\n                 | LBRACE RBRACEdict_items : dict_item\n                  | dict_item COMMA dict_itemsdict_item : expression COLON expressionloop : FOR ID IN RANGE LPAREN expression COMMA expression RPAREN DO statements END\n            | FOR ID IN expression DO statements END\n            | FOR ID COMMA ID IN expression DO statements ENDretry_statement : RETRY expression retry_modifiers DO statements END\n                       | RETRY expression RETRY_TIMES retry_modifiers DO statements ENDparallel_statement : PARALLEL DO statements END\n                          | PARALLEL FOR ID IN parallel_source DO statements END\n                          | PARALLEL FOR ID IN parallel_source WITH ID expression DO statements ENDparallel_source : RANGE LPAREN expression COMMA expression RPAREN\n                       | expressionretry_modifiers : retry_modifier retry_modifiers\n                       | retry_modifier\n                       | emptyretry_modifier : EVERY expression\n                      | UNTIL expressionkeyword_call : LBRACKET ID RBRACKET COMMA parameter_list\n                   | LBRACKET ID RBRACKETparameter_list : parameter_itemsparameter_items : parameter_item COMMA parameter_items\n                     | parameter_itemparameter_item : ID COLON expressionteardown : TEARDOWN DO statements END\n                | TEARDOWN DO ENDdata_source : STRING USING IDcustom_keyword : FUNCTION ID LPAREN param_definitions RPAREN DO statements ENDparam_definitions : param_def_list\n                        | param_def_list : param_def COMMA param_def_list\n                     | param_defparam_def : ID EQUALS STRING\n                | ID EQUALS NUMBER\n                | ID EQUALS boolean_expr\n                | ID EQUALS null_expr\n                | IDreturn_statement : RETURN expressionbreak_statement : BREAKcontinue_statement : CONTINUEif_statement : IF expression DO statements END\n                   | IF expression DO statements elif_clauses END\n                   | IF expression DO statements ELSE statements END\n                   | IF expression DO statements elif_clauses ELSE statements ENDelif_clauses : elif_clause\n                    | elif_clause elif_clauseselif_clause : ELIF expression DO statementslogical_or_expr : logical_or_expr OR logical_and_expr\n                       | logical_and_exprlogical_and_expr : logical_and_expr AND logical_not_expr\n                        | logical_not_exprlogical_not_expr : NOT logical_not_expr\n                        | comparison_exprcomparison_expr : arithmetic_expr comparison_operator arithmetic_expr\n                       | arithmetic_expr NOT IN arithmetic_expr\n                       | arithmetic_exprcomparison_operator : GT\n                           | LT\n                           | GE\n                           | LE\n                           | EQ\n                           | NE\n                           | INarithmetic_expr : additive_expradditive_expr : additive_expr PLUS multiplicative_expr\n                     | additive_expr MINUS multiplicative_expr\n                     | multiplicative_exprmultiplicative_expr : multiplicative_expr TIMES unary_expr\n                           | multiplicative_expr DIVIDE unary_expr\n                           | multiplicative_expr MODULO unary_expr\n                           | unary_exprunary_expr : MINUS unary_expr %prec UMINUS\n                  | expr_atomremote_keyword_call : ID PIPE LBRACKET ID RBRACKET COMMA parameter_list\n                          | ID PIPE LBRACKET ID RBRACKET\n                          | PLACEHOLDER PIPE LBRACKET ID RBRACKET COMMA parameter_list\n                          | PLACEHOLDER PIPE LBRACKET ID RBRACKET'
+    
+_lr_action_items = {'ID':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,22,30,31,33,34,35,36,37,42,43,44,47,52,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,87,90,91,92,93,94,95,96,97,98,99,100,101,102,104,106,107,108,109,110,111,112,113,114,115,120,121,122,123,124,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,144,148,153,154,163,164,165,172,177,178,179,180,181,182,183,184,185,187,188,189,190,191,192,193,194,195,202,203,205,206,207,208,209,210,211,212,213,214,215,217,218,219,228,229,231,233,235,236,237,238,242,244,245,246,251,253,254,258,259,260,261,262,263,264,265,267,271,272,275,277,278,279,282,283,285,289,290,],[28,28,-5,-6,28,-9,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,46,55,72,86,72,72,-108,-109,-8,93,93,93,106,-46,-118,-120,72,-122,-125,-133,-136,72,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,72,-59,-60,-61,-62,72,72,28,152,-107,28,-10,-20,-21,-22,-23,-11,160,-89,-13,-14,-15,-16,-17,-51,-43,-44,-45,166,-49,167,168,72,171,72,72,72,72,-121,72,-132,-126,-127,-128,-129,-130,-131,72,72,72,72,72,-141,72,187,-64,-69,196,28,204,208,209,28,-117,-119,-123,72,-134,-135,-137,-138,-139,-58,-56,-63,72,-68,72,72,-78,72,-12,160,-88,-90,-92,-96,-18,-19,-144,-146,72,28,72,28,-124,-57,196,-110,28,72,72,204,204,204,-76,28,267,72,28,-111,28,-93,-91,-143,-145,72,-74,28,-77,72,-112,28,-79,72,-97,-113,-75,28,28,-80,-73,]),'LBRACKET':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,31,34,35,36,37,42,45,52,53,54,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,87,90,91,92,93,94,95,96,98,99,100,101,102,104,106,107,108,109,110,111,114,120,121,122,123,124,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,144,148,154,172,177,178,179,180,181,182,183,184,185,187,188,189,190,191,192,193,194,195,202,205,206,207,208,209,210,211,212,213,214,215,217,218,219,229,231,233,235,242,244,246,251,253,254,258,259,260,261,262,263,264,265,267,271,272,275,277,278,279,282,283,285,289,290,],[22,22,-5,-6,22,-9,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,82,82,82,-108,-109,-8,97,110,112,113,-46,-118,-120,82,-122,-125,-133,-136,82,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,82,-59,-60,-61,-62,82,82,22,-107,22,-10,-20,-21,-22,-23,-11,-89,-13,-14,-15,-16,-17,-51,-43,-44,-45,82,-49,82,82,82,82,82,-121,82,-132,-126,-127,-128,-129,-130,-131,82,82,82,82,82,-141,82,-64,-69,22,22,-117,-119,-123,82,-134,-135,-137,-138,-139,-58,-56,-63,82,-68,82,82,-78,82,-12,-88,-90,-92,-96,-18,-19,-144,-146,82,22,82,22,-124,-57,-110,22,82,82,-76,22,82,22,-111,22,-93,-91,-143,-145,82,-74,22,-77,82,-112,22,-79,82,-97,-113,-75,22,22,-80,-73,]),'PLACEHOLDER':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,31,34,35,36,37,42,52,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,87,90,91,92,93,94,95,96,98,99,100,101,102,104,106,107,108,109,110,111,114,120,121,122,123,124,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,144,148,154,165,172,177,178,179,180,181,182,183,184,185,187,188,189,190,191,192,193,194,195,202,205,206,207,208,209,210,211,212,213,214,215,217,218,219,229,231,233,235,242,244,246,251,253,254,258,259,260,261,262,263,264,265,267,271,272,275,277,278,279,282,283,285,289,290,],[29,29,-5,-6,29,-9,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,70,70,70,-108,-109,-8,111,-46,-118,-120,70,-122,-125,-133,-136,70,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,70,-59,-60,-61,-62,70,70,29,-107,29,-10,-20,-21,-22,-23,-11,-89,-13,-14,-15,-16,-17,-51,-43,-44,-45,70,-49,70,70,70,70,70,-121,70,-132,-126,-127,-128,-129,-130,-131,70,70,70,70,70,-141,70,-64,-69,29,210,29,-117,-119,-123,70,-134,-135,-137,-138,-139,-58,-56,-63,70,-68,70,70,-78,70,-12,-88,-90,-92,-96,-18,-19,-144,-146,70,29,70,29,-124,-57,-110,29,70,70,-76,29,70,29,-111,29,-93,-91,-143,-145,70,-74,29,-77,70,-112,29,-79,70,-97,-113,-75,29,29,-80,-73,]),'FOR':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,32,36,37,42,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,84,87,90,91,92,93,94,95,96,98,99,100,101,102,104,106,107,108,109,111,124,139,144,148,154,172,177,178,179,181,182,183,184,185,187,188,189,191,194,202,205,206,207,208,209,210,211,212,214,217,218,219,229,231,242,244,251,253,254,258,259,260,261,263,264,265,271,272,275,278,279,282,283,285,289,290,],[30,30,-5,-6,30,-9,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,85,-108,-109,-8,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,30,-107,30,-10,-20,-21,-22,-23,-11,-89,-13,-14,-15,-16,-17,-51,-43,-44,-45,-49,-121,-141,-64,-69,30,30,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-78,-12,-88,-90,-92,-96,-18,-19,-144,-146,30,30,-124,-57,-110,30,-76,30,30,-111,30,-93,-91,-143,-145,-74,30,-77,-112,30,-79,-97,-113,-75,30,30,-80,-73,]),'RETRY':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,36,37,42,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,84,87,90,91,92,93,94,95,96,98,99,100,101,102,104,106,107,108,109,111,124,139,144,148,154,172,177,178,179,181,182,183,184,185,187,188,189,191,194,202,205,206,207,208,209,210,211,212,214,217,218,219,229,231,242,244,251,253,254,258,259,260,261,263,264,265,271,272,275,278,279,282,283,285,289,290,],[31,31,-5,-6,31,-9,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-108,-109,-8,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,31,-107,31,-10,-20,-21,-22,-23,-11,-89,-13,-14,-15,-16,-17,-51,-43,-44,-45,-49,-121,-141,-64,-69,31,31,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-78,-12,-88,-90,-92,-96,-18,-19,-144,-146,31,31,-124,-57,-110,31,-76,31,31,-111,31,-93,-91,-143,-145,-74,31,-77,-112,31,-79,-97,-113,-75,31,31,-80,-73,]),'PARALLEL':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,36,37,42,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,84,87,90,91,92,93,94,95,96,98,99,100,101,102,104,106,107,108,109,111,124,139,144,148,154,172,177,178,179,181,182,183,184,185,187,188,189,191,194,202,205,206,207,208,209,210,211,212,214,217,218,219,229,231,242,244,251,253,254,258,259,260,261,263,264,265,271,272,275,278,279,282,283,285,289,290,],[32,32,-5,-6,32,-9,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-108,-109,-8,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,32,-107,32,-10,-20,-21,-22,-23,-11,-89,-13,-14,-15,-16,-17,-51,-43,-44,-45,-49,-121,-141,-64,-69,32,32,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-78,-12,-88,-90,-92,-96,-18,-19,-144,-146,32,32,-124,-57,-110,32,-76,32,32,-111,32,-93,-91,-143,-145,-74,32,-77,-112,32,-79,-97,-113,-75,32,32,-80,-73,]),'FUNCTION':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,36,37,42,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,84,87,90,91,92,93,94,95,96,98,99,100,101,102,104,106,107,108,109,111,124,139,144,148,154,172,177,178,179,181,182,183,184,185,187,188,189,191,194,202,205,206,207,208,209,210,211,212,214,217,218,219,229,231,242,244,251,253,254,258,259,260,261,263,264,265,271,272,275,278,279,282,283,285,289,290,],[33,33,-5,-6,33,-9,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-108,-109,-8,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,33,-107,33,-10,-20,-21,-22,-23,-11,-89,-13,-14,-15,-16,-17,-51,-43,-44,-45,-49,-121,-141,-64,-69,33,33,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-78,-12,-88,-90,-92,-96,-18,-19,-144,-146,33,33,-124,-57,-110,33,-76,33,33,-111,33,-93,-91,-143,-145,-74,33,-77,-112,33,-79,-97,-113,-75,33,33,-80,-73,]),'RETURN':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,36,37,42,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,84,87,90,91,92,93,94,95,96,98,99,100,101,102,104,106,107,108,109,111,124,139,144,148,154,172,177,178,179,181,182,183,184,185,187,188,189,191,194,202,205,206,207,208,209,210,211,212,214,217,218,219,229,231,242,244,251,253,254,258,259,260,261,263,264,265,271,272,275,278,279,282,283,285,289,290,],[34,34,-5,-6,34,-9,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-108,-109,-8,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,34,-107,34,-10,-20,-21,-22,-23,-11,-89,-13,-14,-15,-16,-17,-51,-43,-44,-45,-49,-121,-141,-64,-69,34,34,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-78,-12,-88,-90,-92,-96,-18,-19,-144,-146,34,34,-124,-57,-110,34,-76,34,34,-111,34,-93,-91,-143,-145,-74,34,-77,-112,34,-79,-97,-113,-75,34,34,-80,-73,]),'IF':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,36,37,42,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,84,87,90,91,92,93,94,95,96,98,99,100,101,102,104,106,107,108,109,111,124,139,144,148,154,172,177,178,179,181,182,183,184,185,187,188,189,191,194,202,205,206,207,208,209,210,211,212,214,217,218,219,229,231,242,244,251,253,254,258,259,260,261,263,264,265,271,272,275,278,279,282,283,285,289,290,],[35,35,-5,-6,35,-9,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-108,-109,-8,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,35,-107,35,-10,-20,-21,-22,-23,-11,-89,-13,-14,-15,-16,-17,-51,-43,-44,-45,-49,-121,-141,-64,-69,35,35,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-78,-12,-88,-90,-92,-96,-18,-19,-144,-146,35,35,-124,-57,-110,35,-76,35,35,-111,35,-93,-91,-143,-145,-74,35,-77,-112,35,-79,-97,-113,-75,35,35,-80,-73,]),'BREAK':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,36,37,42,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,84,87,90,91,92,93,94,95,96,98,99,100,101,102,104,106,107,108,109,111,124,139,144,148,154,172,177,178,179,181,182,183,184,185,187,188,189,191,194,202,205,206,207,208,209,210,211,212,214,217,218,219,229,231,242,244,251,253,254,258,259,260,261,263,264,265,271,272,275,278,279,282,283,285,289,290,],[36,36,-5,-6,36,-9,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-108,-109,-8,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,36,-107,36,-10,-20,-21,-22,-23,-11,-89,-13,-14,-15,-16,-17,-51,-43,-44,-45,-49,-121,-141,-64,-69,36,36,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-78,-12,-88,-90,-92,-96,-18,-19,-144,-146,36,36,-124,-57,-110,36,-76,36,36,-111,36,-93,-91,-143,-145,-74,36,-77,-112,36,-79,-97,-113,-75,36,36,-80,-73,]),'CONTINUE':([0,2,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,36,37,42,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,84,87,90,91,92,93,94,95,96,98,99,100,101,102,104,106,107,108,109,111,124,139,144,148,154,172,177,178,179,181,182,183,184,185,187,188,189,191,194,202,205,206,207,208,209,210,211,212,214,217,218,219,229,231,242,244,251,253,254,258,259,260,261,263,264,265,271,272,275,278,279,282,283,285,289,290,],[37,37,-5,-6,37,-9,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-108,-109,-8,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,37,-107,37,-10,-20,-21,-22,-23,-11,-89,-13,-14,-15,-16,-17,-51,-43,-44,-45,-49,-121,-141,-64,-69,37,37,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-78,-12,-88,-90,-92,-96,-18,-19,-144,-146,37,37,-124,-57,-110,37,-76,37,37,-111,37,-93,-91,-143,-145,-74,37,-77,-112,37,-79,-97,-113,-75,37,37,-80,-73,]),'NAME_KEYWORD':([0,7,91,92,93,94,95,96,99,100,101,102,104,202,208,209,210,],[19,19,-10,-20,-21,-22,-23,-11,-13,-14,-15,-16,-17,-12,-96,-18,-19,]),'DESCRIPTION_KEYWORD':([0,7,91,92,93,94,95,96,99,100,101,102,104,202,208,209,210,],[20,20,-10,-20,-21,-22,-23,-11,-13,-14,-15,-16,-17,-12,-96,-18,-19,]),'TAGS_KEYWORD':([0,7,91,92,93,94,95,96,99,100,101,102,104,202,208,209,210,],[21,21,-10,-20,-21,-22,-23,-11,-13,-14,-15,-16,-17,-12,-96,-18,-19,]),'AUTHOR_KEYWORD':([0,7,91,92,93,94,95,96,99,100,101,102,104,202,208,209,210,],[23,23,-10,-20,-21,-22,-23,-11,-13,-14,-15,-16,-17,-12,-96,-18,-19,]),'DATE_KEYWORD':([0,7,91,92,93,94,95,96,99,100,101,102,104,202,208,209,210,],[24,24,-10,-20,-21,-22,-23,-11,-13,-14,-15,-16,-17,-12,-96,-18,-19,]),'DATA_KEYWORD':([0,7,91,92,93,94,95,96,99,100,101,102,104,202,208,209,210,],[25,25,-10,-20,-21,-22,-23,-11,-13,-14,-15,-16,-17,-12,-96,-18,-19,]),'IMPORT_KEYWORD':([0,7,91,92,93,94,95,96,99,100,101,102,104,202,208,209,210,],[26,26,-10,-20,-21,-22,-23,-11,-13,-14,-15,-16,-17,-12,-96,-18,-19,]),'REMOTE_KEYWORD':([0,7,91,92,93,94,95,96,99,100,101,102,104,202,208,209,210,],[27,27,-10,-20,-21,-22,-23,-11,-13,-14,-15,-16,-17,-12,-96,-18,-19,]),'$end':([1,3,6,8,9,10,11,12,13,14,15,16,17,18,36,37,38,39,41,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,87,89,98,106,107,108,109,111,124,139,144,148,156,177,178,179,181,182,183,184,185,187,188,189,191,194,201,205,206,207,211,212,218,219,229,242,253,258,259,260,261,263,265,271,275,278,279,282,289,290,],[0,-4,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-108,-109,-2,-3,-30,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-107,-1,-89,-51,-43,-44,-45,-49,-121,-141,-64,-69,-95,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-78,-94,-88,-90,-92,-144,-146,-124,-57,-110,-76,-111,-93,-91,-143,-145,-74,-77,-112,-79,-97,-113,-75,-80,-73,]),'TEARDOWN':([3,6,8,9,10,11,12,13,14,15,16,17,18,36,37,38,41,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,87,98,106,107,108,109,111,124,139,144,148,177,178,179,181,182,183,184,185,187,188,189,191,194,205,206,207,211,212,218,219,229,242,253,258,259,260,261,263,265,271,275,278,279,282,289,290,],[40,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-108,-109,40,-30,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-107,-89,-51,-43,-44,-45,-49,-121,-141,-64,-69,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-78,-88,-90,-92,-144,-146,-124,-57,-110,-76,-111,-93,-91,-143,-145,-74,-77,-112,-79,-97,-113,-75,-80,-73,]),'END':([6,8,9,10,11,12,13,14,15,16,17,18,36,37,41,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,87,90,98,106,107,108,109,111,124,139,144,148,151,155,177,178,179,181,182,183,184,185,187,188,189,191,194,200,205,206,207,211,212,216,218,219,229,230,232,240,242,243,253,255,256,258,259,260,261,263,265,266,269,270,271,274,275,278,279,280,282,286,288,289,290,],[-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-108,-109,-30,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-107,156,-89,-51,-43,-44,-45,-49,-121,-141,-64,-69,194,201,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-78,229,-88,-90,-92,-144,-146,242,-124,-57,-110,253,-114,263,-76,265,-111,271,-115,-93,-91,-143,-145,-74,-77,275,278,279,-112,282,-79,-97,-113,-116,-75,289,290,-80,-73,]),'ELSE':([6,8,9,10,11,12,13,14,15,16,17,18,36,37,41,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,87,98,106,107,108,109,111,124,139,144,148,177,178,179,181,182,183,184,185,187,188,189,191,194,200,205,206,207,211,212,218,219,229,230,232,242,253,256,258,259,260,261,263,265,271,275,278,279,280,282,289,290,],[-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-108,-109,-30,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-107,-89,-51,-43,-44,-45,-49,-121,-141,-64,-69,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-78,231,-88,-90,-92,-144,-146,-124,-57,-110,254,-114,-76,-111,-115,-93,-91,-143,-145,-74,-77,-112,-79,-97,-113,-116,-75,-80,-73,]),'ELIF':([6,8,9,10,11,12,13,14,15,16,17,18,36,37,41,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,87,98,106,107,108,109,111,124,139,144,148,177,178,179,181,182,183,184,185,187,188,189,191,194,200,205,206,207,211,212,218,219,229,232,242,253,258,259,260,261,263,265,271,275,278,279,280,282,289,290,],[-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-108,-109,-30,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-107,-89,-51,-43,-44,-45,-49,-121,-141,-64,-69,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-78,233,-88,-90,-92,-144,-146,-124,-57,-110,233,-76,-111,-93,-91,-143,-145,-74,-77,-112,-79,-97,-113,-116,-75,-80,-73,]),'COLON':([19,20,21,23,24,25,26,27,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,124,139,144,148,150,177,178,179,181,182,183,184,185,187,188,189,191,204,218,219,],[43,44,45,47,48,49,50,51,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-121,-141,-64,-69,193,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,235,-124,-57,]),'EQUALS':([28,196,],[52,226,]),'PIPE':([28,29,106,111,],[53,54,53,54,]),'NOT':([31,34,35,52,60,62,63,64,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,106,110,111,114,120,121,122,123,139,140,144,148,166,181,182,183,184,185,187,188,189,190,191,192,193,195,213,215,219,233,235,246,262,267,277,],[60,60,60,60,60,126,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,60,-59,-60,-61,-62,60,60,-51,60,-49,60,60,60,60,60,-141,60,-64,-69,-51,-134,-135,-137,-138,-139,-58,-56,-63,60,-68,60,60,60,60,60,-57,60,60,60,60,60,60,]),'MINUS':([31,34,35,52,60,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,106,110,111,114,120,121,122,123,125,127,128,129,130,131,132,133,134,135,136,137,138,139,140,144,148,166,180,181,182,183,184,185,187,188,189,190,191,192,193,195,213,215,219,233,235,246,262,267,277,],[65,65,65,65,65,135,-136,65,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,65,-59,-60,-61,-62,65,65,-51,65,-49,65,65,65,65,65,65,-132,-126,-127,-128,-129,-130,-131,65,65,65,65,65,-141,65,-64,-69,-51,65,-134,-135,-137,-138,-139,-58,-56,-63,65,-68,65,65,65,65,65,-57,65,65,65,65,65,65,]),'NUMBER':([31,34,35,52,60,65,77,82,83,110,114,120,121,122,123,125,127,128,129,130,131,132,133,134,135,136,137,138,140,180,190,192,193,195,213,215,226,233,235,246,262,267,277,],[68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,-132,-126,-127,-128,-129,-130,-131,68,68,68,68,68,68,68,68,68,68,68,68,68,248,68,68,68,68,68,68,]),'STRING':([31,34,35,43,44,47,48,49,50,51,52,60,65,77,82,83,97,110,114,120,121,122,123,125,127,128,129,130,131,132,133,134,135,136,137,138,140,180,190,192,193,195,203,213,215,226,233,235,246,262,267,277,],[69,69,69,92,92,92,101,103,104,105,69,69,69,69,69,69,159,69,69,69,69,69,69,69,-132,-126,-127,-128,-129,-130,-131,69,69,69,69,69,69,69,69,69,69,69,159,69,69,247,69,69,69,69,69,69,]),'DOLLAR_VARIABLE':([31,34,35,52,60,65,77,82,83,110,114,120,121,122,123,125,127,128,129,130,131,132,133,134,135,136,137,138,140,180,190,192,193,195,213,215,233,235,246,262,267,277,],[71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-132,-126,-127,-128,-129,-130,-131,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,]),'LPAREN':([31,34,35,52,60,65,77,82,83,86,110,114,120,121,122,123,125,127,128,129,130,131,132,133,134,135,136,137,138,140,169,180,190,192,193,195,213,215,225,233,235,246,262,267,277,],[77,77,77,77,77,77,77,77,77,153,77,77,77,77,77,77,77,-132,-126,-127,-128,-129,-130,-131,77,77,77,77,77,77,213,77,77,77,77,77,77,77,246,77,77,77,77,77,77,]),'TRUE':([31,34,35,52,60,65,77,82,83,110,114,120,121,122,123,125,127,128,129,130,131,132,133,134,135,136,137,138,140,180,190,192,193,195,213,215,226,233,235,246,262,267,277,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,-132,-126,-127,-128,-129,-130,-131,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'FALSE':([31,34,35,52,60,65,77,82,83,110,114,120,121,122,123,125,127,128,129,130,131,132,133,134,135,136,137,138,140,180,190,192,193,195,213,215,226,233,235,246,262,267,277,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,-132,-126,-127,-128,-129,-130,-131,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'NULL':([31,34,35,43,44,47,52,60,65,77,82,83,97,110,114,120,121,122,123,125,127,128,129,130,131,132,133,134,135,136,137,138,140,180,190,192,193,195,203,213,215,226,233,235,246,262,267,277,],[80,80,80,94,94,94,80,80,80,80,80,80,161,80,80,80,80,80,80,80,-132,-126,-127,-128,-129,-130,-131,80,80,80,80,80,80,80,80,80,80,80,161,80,80,80,80,80,80,80,80,80,]),'NONE':([31,34,35,43,44,47,52,60,65,77,82,83,97,110,114,120,121,122,123,125,127,128,129,130,131,132,133,134,135,136,137,138,140,180,190,192,193,195,203,213,215,226,233,235,246,262,267,277,],[81,81,81,95,95,95,81,81,81,81,81,81,162,81,81,81,81,81,81,81,-132,-126,-127,-128,-129,-130,-131,81,81,81,81,81,81,81,81,81,81,81,162,81,81,81,81,81,81,81,81,81,]),'LBRACE':([31,34,35,52,60,65,77,82,83,110,114,120,121,122,123,125,127,128,129,130,131,132,133,134,135,136,137,138,140,180,190,192,193,195,213,215,233,235,246,262,267,277,],[83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,-132,-126,-127,-128,-129,-130,-131,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,]),'DO':([32,40,56,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,88,116,117,118,119,124,139,144,148,170,173,174,175,176,177,178,179,181,182,183,184,185,187,188,189,191,218,219,223,224,227,241,257,276,281,287,],[84,90,-7,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,154,172,-7,-7,-85,-121,-141,-64,-69,214,217,-83,-86,-87,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,244,-82,251,264,272,283,285,-81,]),'RBRACKET':([46,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,82,110,124,139,143,144,145,146,148,157,158,159,160,161,162,166,167,168,177,178,179,181,182,183,184,185,186,187,188,189,191,218,219,220,234,],[98,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,144,144,-121,-141,189,-64,-65,-67,-69,202,-25,-26,-27,-28,-29,98,211,212,-117,-119,-123,-134,-135,-137,-138,-139,219,-58,-56,-63,-68,-124,-57,-66,-24,]),'DATE':([48,],[100,]),'IN':([55,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,126,139,144,148,152,166,171,181,182,183,184,185,187,188,189,191,219,],[114,127,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,180,-141,-64,-69,195,-51,215,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'COMMA':([55,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,98,124,139,144,145,146,148,149,158,159,160,161,162,166,177,178,179,181,182,183,184,185,187,188,189,191,196,199,207,211,212,218,219,222,239,247,248,249,250,258,268,],[115,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,163,-121,-141,-64,190,-67,-69,192,203,-26,-27,-28,-29,-51,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-106,228,236,237,238,-124,-57,-72,262,-102,-103,-104,-105,-93,277,]),'RETRY_TIMES':([56,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,124,139,144,148,177,178,179,181,182,183,184,185,187,188,189,191,218,219,],[117,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-121,-141,-64,-69,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,]),'EVERY':([56,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,117,118,124,139,144,148,175,176,177,178,179,181,182,183,184,185,187,188,189,191,218,219,],[120,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,120,120,-121,-141,-64,-69,-86,-87,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,]),'UNTIL':([56,57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,117,118,124,139,144,148,175,176,177,178,179,181,182,183,184,185,187,188,189,191,218,219,],[121,-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,121,121,-121,-141,-64,-69,-86,-87,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,]),'RPAREN':([57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,124,139,142,144,148,153,177,178,179,181,182,183,184,185,187,188,189,191,196,197,198,199,218,219,247,248,249,250,252,273,284,],[-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-121,-141,188,-64,-69,-99,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-106,227,-98,-101,-124,-57,-102,-103,-104,-105,-100,281,287,]),'RBRACE':([57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,83,124,139,144,147,148,149,177,178,179,181,182,183,184,185,187,188,189,191,218,219,221,222,],[-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,148,-121,-141,-64,191,-69,-70,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,-71,-72,]),'WITH':([57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,124,139,144,148,177,178,179,181,182,183,184,185,187,188,189,191,218,219,223,224,287,],[-46,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-121,-141,-64,-69,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,245,-82,-81,]),'OR':([57,58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,124,139,144,148,166,177,178,179,181,182,183,184,185,187,188,189,191,218,219,],[122,-118,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-121,-141,-64,-69,-51,-117,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,]),'AND':([58,59,61,62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,124,139,144,148,166,177,178,179,181,182,183,184,185,187,188,189,191,218,219,],[123,-120,-122,-125,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-121,-141,-64,-69,-51,123,-119,-123,-134,-135,-137,-138,-139,-58,-56,-63,-68,-124,-57,]),'GT':([62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,139,144,148,166,181,182,183,184,185,187,188,189,191,219,],[128,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-141,-64,-69,-51,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'LT':([62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,139,144,148,166,181,182,183,184,185,187,188,189,191,219,],[129,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-141,-64,-69,-51,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'GE':([62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,139,144,148,166,181,182,183,184,185,187,188,189,191,219,],[130,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-141,-64,-69,-51,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'LE':([62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,139,144,148,166,181,182,183,184,185,187,188,189,191,219,],[131,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-141,-64,-69,-51,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'EQ':([62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,139,144,148,166,181,182,183,184,185,187,188,189,191,219,],[132,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-141,-64,-69,-51,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'NE':([62,63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,139,144,148,166,181,182,183,184,185,187,188,189,191,219,],[133,-133,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-141,-64,-69,-51,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'PLUS':([63,64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,139,144,148,166,181,182,183,184,185,187,188,189,191,219,],[134,-136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-141,-64,-69,-51,-134,-135,-137,-138,-139,-58,-56,-63,-68,-57,]),'TIMES':([64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,139,144,148,166,181,182,183,184,185,187,188,189,191,219,],[136,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-141,-64,-69,-51,136,136,-137,-138,-139,-58,-56,-63,-68,-57,]),'DIVIDE':([64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,139,144,148,166,181,182,183,184,185,187,188,189,191,219,],[137,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-141,-64,-69,-51,137,137,-137,-138,-139,-58,-56,-63,-68,-57,]),'MODULO':([64,66,67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,139,144,148,166,181,182,183,184,185,187,188,189,191,219,],[138,-140,-142,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-141,-64,-69,-51,138,138,-137,-138,-139,-58,-56,-63,-68,-57,]),'INDEX_LBRACKET':([67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,144,148,166,187,188,189,191,219,],[140,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-64,-69,-51,-58,-56,-63,-68,-57,]),'DOT':([67,68,69,70,71,72,73,74,75,76,78,79,80,81,106,111,144,148,166,187,188,189,191,219,],[141,-47,-48,-49,-50,-51,-52,-53,-54,-55,-59,-60,-61,-62,-51,-49,-64,-69,-51,-58,-56,-63,-68,-57,]),'USING':([103,],[164,]),'AS':([105,],[165,]),'RANGE':([114,195,],[169,225,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'start':([0,],[1,]),'metadata':([0,],[2,]),'statements':([0,2,6,84,90,154,172,214,217,231,244,251,254,264,272,283,285,],[3,38,41,151,155,200,216,240,243,255,266,269,270,274,280,286,288,]),'metadata_items':([0,7,],[4,42,]),'empty':([0,56,117,118,],[5,119,119,119,]),'statement':([0,2,6,84,90,154,172,214,217,231,244,251,254,264,272,283,285,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'metadata_item':([0,7,],[7,7,]),'assignment':([0,2,6,84,90,154,172,214,217,231,244,251,254,264,272,283,285,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'keyword_call':([0,2,6,52,84,90,154,172,214,217,231,244,251,254,264,272,283,285,],[9,9,9,108,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'remote_keyword_call':([0,2,6,52,84,90,154,172,214,217,231,244,251,254,264,272,283,285,],[10,10,10,109,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'loop':([0,2,6,84,90,154,172,214,217,231,244,251,254,264,272,283,285,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'retry_statement':([0,2,6,84,90,154,172,214,217,231,244,251,254,264,272,283,285,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'parallel_statement':([0,2,6,84,90,154,172,214,217,231,244,251,254,264,272,283,285,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'custom_keyword':([0,2,6,84,90,154,172,214,217,231,244,251,254,264,272,283,285,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'return_statement':([0,2,6,84,90,154,172,214,217,231,244,251,254,264,272,283,285,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'if_statement':([0,2,6,84,90,154,172,214,217,231,244,251,254,264,272,283,285,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'break_statement':([0,2,6,84,90,154,172,214,217,231,244,251,254,264,272,283,285,],[17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,]),'continue_statement':([0,2,6,84,90,154,172,214,217,231,244,251,254,264,272,283,285,],[18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,]),'teardown':([3,38,],[39,89,]),'expression':([31,34,35,52,77,82,83,110,114,120,121,140,190,192,193,195,213,215,233,235,246,262,267,277,],[56,87,88,107,142,146,150,146,170,175,176,186,146,150,222,224,239,241,257,258,268,273,276,284,]),'logical_or_expr':([31,34,35,52,77,82,83,110,114,120,121,140,190,192,193,195,213,215,233,235,246,262,267,277,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'logical_and_expr':([31,34,35,52,77,82,83,110,114,120,121,122,140,190,192,193,195,213,215,233,235,246,262,267,277,],[58,58,58,58,58,58,58,58,58,58,58,177,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'logical_not_expr':([31,34,35,52,60,77,82,83,110,114,120,121,122,123,140,190,192,193,195,213,215,233,235,246,262,267,277,],[59,59,59,59,124,59,59,59,59,59,59,59,59,178,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'comparison_expr':([31,34,35,52,60,77,82,83,110,114,120,121,122,123,140,190,192,193,195,213,215,233,235,246,262,267,277,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'arithmetic_expr':([31,34,35,52,60,77,82,83,110,114,120,121,122,123,125,140,180,190,192,193,195,213,215,233,235,246,262,267,277,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,179,62,218,62,62,62,62,62,62,62,62,62,62,62,62,]),'additive_expr':([31,34,35,52,60,77,82,83,110,114,120,121,122,123,125,140,180,190,192,193,195,213,215,233,235,246,262,267,277,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'multiplicative_expr':([31,34,35,52,60,77,82,83,110,114,120,121,122,123,125,134,135,140,180,190,192,193,195,213,215,233,235,246,262,267,277,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,181,182,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'unary_expr':([31,34,35,52,60,65,77,82,83,110,114,120,121,122,123,125,134,135,136,137,138,140,180,190,192,193,195,213,215,233,235,246,262,267,277,],[66,66,66,66,66,139,66,66,66,66,66,66,66,66,66,66,66,66,183,184,185,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'expr_atom':([31,34,35,52,60,65,77,82,83,110,114,120,121,122,123,125,134,135,136,137,138,140,180,190,192,193,195,213,215,233,235,246,262,267,277,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'boolean_expr':([31,34,35,52,60,65,77,82,83,110,114,120,121,122,123,125,134,135,136,137,138,140,180,190,192,193,195,213,215,226,233,235,246,262,267,277,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,249,73,73,73,73,73,73,]),'null_expr':([31,34,35,52,60,65,77,82,83,110,114,120,121,122,123,125,134,135,136,137,138,140,180,190,192,193,195,213,215,226,233,235,246,262,267,277,],[74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,250,74,74,74,74,74,74,]),'list_expr':([31,34,35,52,60,65,77,82,83,110,114,120,121,122,123,125,134,135,136,137,138,140,180,190,192,193,195,213,215,233,235,246,262,267,277,],[75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'dict_expr':([31,34,35,52,60,65,77,82,83,110,114,120,121,122,123,125,134,135,136,137,138,140,180,190,192,193,195,213,215,233,235,246,262,267,277,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'metadata_value':([43,44,47,],[91,96,99,]),'data_source':([49,],[102,]),'retry_modifiers':([56,117,118,],[116,173,174,]),'retry_modifier':([56,117,118,],[118,118,118,]),'comparison_operator':([62,],[125,]),'list_items':([82,110,190,],[143,143,220,]),'list_item':([82,110,190,],[145,145,145,]),'dict_items':([83,192,],[147,221,]),'dict_item':([83,192,],[149,149,]),'tags':([97,203,],[157,234,]),'tag':([97,203,],[158,158,]),'param_definitions':([153,],[197,]),'param_def_list':([153,228,],[198,252,]),'param_def':([153,228,],[199,199,]),'parameter_list':([163,237,238,],[205,260,261,]),'parameter_items':([163,236,237,238,],[206,259,206,206,]),'parameter_item':([163,236,237,238,],[207,207,207,207,]),'parallel_source':([195,],[223,]),'elif_clauses':([200,232,],[230,256,]),'elif_clause':([200,232,],[232,232,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> start","S'",1,None,None,None),
+  ('start -> metadata statements teardown','start',3,'p_start','parser.py',59),
+  ('start -> metadata statements','start',2,'p_start','parser.py',60),
+  ('start -> statements teardown','start',2,'p_start','parser.py',61),
+  ('start -> statements','start',1,'p_start','parser.py',62),
+  ('metadata -> metadata_items','metadata',1,'p_metadata','parser.py',84),
+  ('metadata -> empty','metadata',1,'p_metadata','parser.py',85),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',93),
+  ('metadata_items -> metadata_item metadata_items','metadata_items',2,'p_metadata_items','parser.py',98),
+  ('metadata_items -> metadata_item','metadata_items',1,'p_metadata_items','parser.py',99),
+  ('metadata_item -> NAME_KEYWORD COLON metadata_value','metadata_item',3,'p_metadata_item','parser.py',107),
+  ('metadata_item -> DESCRIPTION_KEYWORD COLON metadata_value','metadata_item',3,'p_metadata_item','parser.py',108),
+  ('metadata_item -> TAGS_KEYWORD COLON LBRACKET tags RBRACKET','metadata_item',5,'p_metadata_item','parser.py',109),
+  ('metadata_item -> AUTHOR_KEYWORD COLON metadata_value','metadata_item',3,'p_metadata_item','parser.py',110),
+  ('metadata_item -> DATE_KEYWORD COLON DATE','metadata_item',3,'p_metadata_item','parser.py',111),
+  ('metadata_item -> DATE_KEYWORD COLON STRING','metadata_item',3,'p_metadata_item','parser.py',112),
+  ('metadata_item -> DATA_KEYWORD COLON data_source','metadata_item',3,'p_metadata_item','parser.py',113),
+  ('metadata_item -> IMPORT_KEYWORD COLON STRING','metadata_item',3,'p_metadata_item','parser.py',114),
+  ('metadata_item -> REMOTE_KEYWORD COLON STRING AS ID','metadata_item',5,'p_metadata_item','parser.py',115),
+  ('metadata_item -> REMOTE_KEYWORD COLON STRING AS PLACEHOLDER','metadata_item',5,'p_metadata_item','parser.py',116),
+  ('metadata_value -> STRING','metadata_value',1,'p_metadata_value','parser.py',135),
+  ('metadata_value -> ID','metadata_value',1,'p_metadata_value','parser.py',136),
+  ('metadata_value -> NULL','metadata_value',1,'p_metadata_value','parser.py',137),
+  ('metadata_value -> NONE','metadata_value',1,'p_metadata_value','parser.py',138),
+  ('tags -> tag COMMA tags','tags',3,'p_tags','parser.py',143),
+  ('tags -> tag','tags',1,'p_tags','parser.py',144),
+  ('tag -> STRING','tag',1,'p_tag','parser.py',152),
+  ('tag -> ID','tag',1,'p_tag','parser.py',153),
+  ('tag -> NULL','tag',1,'p_tag','parser.py',154),
+  ('tag -> NONE','tag',1,'p_tag','parser.py',155),
+  ('statements -> statement statements','statements',2,'p_statements','parser.py',160),
+  ('statements -> statement','statements',1,'p_statements','parser.py',161),
+  ('statement -> assignment','statement',1,'p_statement','parser.py',169),
+  ('statement -> keyword_call','statement',1,'p_statement','parser.py',170),
+  ('statement -> remote_keyword_call','statement',1,'p_statement','parser.py',171),
+  ('statement -> loop','statement',1,'p_statement','parser.py',172),
+  ('statement -> retry_statement','statement',1,'p_statement','parser.py',173),
+  ('statement -> parallel_statement','statement',1,'p_statement','parser.py',174),
+  ('statement -> custom_keyword','statement',1,'p_statement','parser.py',175),
+  ('statement -> return_statement','statement',1,'p_statement','parser.py',176),
+  ('statement -> if_statement','statement',1,'p_statement','parser.py',177),
+  ('statement -> break_statement','statement',1,'p_statement','parser.py',178),
+  ('statement -> continue_statement','statement',1,'p_statement','parser.py',179),
+  ('assignment -> ID EQUALS expression','assignment',3,'p_assignment','parser.py',184),
+  ('assignment -> ID EQUALS keyword_call','assignment',3,'p_assignment','parser.py',185),
+  ('assignment -> ID EQUALS remote_keyword_call','assignment',3,'p_assignment','parser.py',186),
+  ('expression -> logical_or_expr','expression',1,'p_expression','parser.py',201),
+  ('expr_atom -> NUMBER','expr_atom',1,'p_expr_atom','parser.py',206),
+  ('expr_atom -> STRING','expr_atom',1,'p_expr_atom','parser.py',207),
+  ('expr_atom -> PLACEHOLDER','expr_atom',1,'p_expr_atom','parser.py',208),
+  ('expr_atom -> DOLLAR_VARIABLE','expr_atom',1,'p_expr_atom','parser.py',209),
+  ('expr_atom -> ID','expr_atom',1,'p_expr_atom','parser.py',210),
+  ('expr_atom -> boolean_expr','expr_atom',1,'p_expr_atom','parser.py',211),
+  ('expr_atom -> null_expr','expr_atom',1,'p_expr_atom','parser.py',212),
+  ('expr_atom -> list_expr','expr_atom',1,'p_expr_atom','parser.py',213),
+  ('expr_atom -> dict_expr','expr_atom',1,'p_expr_atom','parser.py',214),
+  ('expr_atom -> LPAREN expression RPAREN','expr_atom',3,'p_expr_atom','parser.py',215),
+  ('expr_atom -> expr_atom INDEX_LBRACKET expression RBRACKET','expr_atom',4,'p_expr_atom','parser.py',216),
+  ('expr_atom -> expr_atom DOT ID','expr_atom',3,'p_expr_atom','parser.py',217),
+  ('boolean_expr -> TRUE','boolean_expr',1,'p_boolean_expr','parser.py',262),
+  ('boolean_expr -> FALSE','boolean_expr',1,'p_boolean_expr','parser.py',263),
+  ('null_expr -> NULL','null_expr',1,'p_null_expr','parser.py',268),
+  ('null_expr -> NONE','null_expr',1,'p_null_expr','parser.py',269),
+  ('list_expr -> LBRACKET list_items RBRACKET','list_expr',3,'p_list_expr','parser.py',274),
+  ('list_expr -> LBRACKET RBRACKET','list_expr',2,'p_list_expr','parser.py',275),
+  ('list_items -> list_item','list_items',1,'p_list_items','parser.py',283),
+  ('list_items -> list_item COMMA list_items','list_items',3,'p_list_items','parser.py',284),
+  ('list_item -> expression','list_item',1,'p_list_item','parser.py',292),
+  ('dict_expr -> LBRACE dict_items RBRACE','dict_expr',3,'p_dict_expr','parser.py',297),
+  ('dict_expr -> LBRACE RBRACE','dict_expr',2,'p_dict_expr','parser.py',298),
+  ('dict_items -> dict_item','dict_items',1,'p_dict_items','parser.py',306),
+  ('dict_items -> dict_item COMMA dict_items','dict_items',3,'p_dict_items','parser.py',307),
+  ('dict_item -> expression COLON expression','dict_item',3,'p_dict_item','parser.py',315),
+  ('loop -> FOR ID IN RANGE LPAREN expression COMMA expression RPAREN DO statements END','loop',12,'p_loop','parser.py',320),
+  ('loop -> FOR ID IN expression DO statements END','loop',7,'p_loop','parser.py',321),
+  ('loop -> FOR ID COMMA ID IN expression DO statements END','loop',9,'p_loop','parser.py',322),
+  ('retry_statement -> RETRY expression retry_modifiers DO statements END','retry_statement',6,'p_retry_statement','parser.py',337),
+  ('retry_statement -> RETRY expression RETRY_TIMES retry_modifiers DO statements END','retry_statement',7,'p_retry_statement','parser.py',338),
+  ('parallel_statement -> PARALLEL DO statements END','parallel_statement',4,'p_parallel_statement','parser.py',363),
+  ('parallel_statement -> PARALLEL FOR ID IN parallel_source DO statements END','parallel_statement',8,'p_parallel_statement','parser.py',364),
+  ('parallel_statement -> PARALLEL FOR ID IN parallel_source WITH ID expression DO statements END','parallel_statement',11,'p_parallel_statement','parser.py',365),
+  ('parallel_source -> RANGE LPAREN expression COMMA expression RPAREN','parallel_source',6,'p_parallel_source','parser.py',385),
+  ('parallel_source -> expression','parallel_source',1,'p_parallel_source','parser.py',386),
+  ('retry_modifiers -> retry_modifier retry_modifiers','retry_modifiers',2,'p_retry_modifiers','parser.py',395),
+  ('retry_modifiers -> retry_modifier','retry_modifiers',1,'p_retry_modifiers','parser.py',396),
+  ('retry_modifiers -> empty','retry_modifiers',1,'p_retry_modifiers','parser.py',397),
+  ('retry_modifier -> EVERY expression','retry_modifier',2,'p_retry_modifier','parser.py',407),
+  ('retry_modifier -> UNTIL expression','retry_modifier',2,'p_retry_modifier','parser.py',408),
+  ('keyword_call -> LBRACKET ID RBRACKET COMMA parameter_list','keyword_call',5,'p_keyword_call','parser.py',414),
+  ('keyword_call -> LBRACKET ID RBRACKET','keyword_call',3,'p_keyword_call','parser.py',415),
+  ('parameter_list -> parameter_items','parameter_list',1,'p_parameter_list','parser.py',446),
+  ('parameter_items -> parameter_item COMMA parameter_items','parameter_items',3,'p_parameter_items','parser.py',451),
+  ('parameter_items -> parameter_item','parameter_items',1,'p_parameter_items','parser.py',452),
+  ('parameter_item -> ID COLON expression','parameter_item',3,'p_parameter_item','parser.py',460),
+  ('teardown -> TEARDOWN DO statements END','teardown',4,'p_teardown','parser.py',473),
+  ('teardown -> TEARDOWN DO END','teardown',3,'p_teardown','parser.py',474),
+  ('data_source -> STRING USING ID','data_source',3,'p_data_source','parser.py',484),
+  ('custom_keyword -> FUNCTION ID LPAREN param_definitions RPAREN DO statements END','custom_keyword',8,'p_custom_keyword','parser.py',489),
+  ('param_definitions -> param_def_list','param_definitions',1,'p_param_definitions','parser.py',494),
+  ('param_definitions -> <empty>','param_definitions',0,'p_param_definitions','parser.py',495),
+  ('param_def_list -> param_def COMMA param_def_list','param_def_list',3,'p_param_def_list','parser.py',503),
+  ('param_def_list -> param_def','param_def_list',1,'p_param_def_list','parser.py',504),
+  ('param_def -> ID EQUALS STRING','param_def',3,'p_param_def','parser.py',512),
+  ('param_def -> ID EQUALS NUMBER','param_def',3,'p_param_def','parser.py',513),
+  ('param_def -> ID EQUALS boolean_expr','param_def',3,'p_param_def','parser.py',514),
+  ('param_def -> ID EQUALS null_expr','param_def',3,'p_param_def','parser.py',515),
+  ('param_def -> ID','param_def',1,'p_param_def','parser.py',516),
+  ('return_statement -> RETURN expression','return_statement',2,'p_return_statement','parser.py',526),
+  ('break_statement -> BREAK','break_statement',1,'p_break_statement','parser.py',532),
+  ('continue_statement -> CONTINUE','continue_statement',1,'p_continue_statement','parser.py',538),
+  ('if_statement -> IF expression DO statements END','if_statement',5,'p_if_statement','parser.py',544),
+  ('if_statement -> IF expression DO statements elif_clauses END','if_statement',6,'p_if_statement','parser.py',545),
+  ('if_statement -> IF expression DO statements ELSE statements END','if_statement',7,'p_if_statement','parser.py',546),
+  ('if_statement -> IF expression DO statements elif_clauses ELSE statements END','if_statement',8,'p_if_statement','parser.py',547),
+  ('elif_clauses -> elif_clause','elif_clauses',1,'p_elif_clauses','parser.py',568),
+  ('elif_clauses -> elif_clause elif_clauses','elif_clauses',2,'p_elif_clauses','parser.py',569),
+  ('elif_clause -> ELIF expression DO statements','elif_clause',4,'p_elif_clause','parser.py',577),
+  ('logical_or_expr -> logical_or_expr OR logical_and_expr','logical_or_expr',3,'p_logical_or_expr','parser.py',582),
+  ('logical_or_expr -> logical_and_expr','logical_or_expr',1,'p_logical_or_expr','parser.py',583),
+  ('logical_and_expr -> logical_and_expr AND logical_not_expr','logical_and_expr',3,'p_logical_and_expr','parser.py',591),
+  ('logical_and_expr -> logical_not_expr','logical_and_expr',1,'p_logical_and_expr','parser.py',592),
+  ('logical_not_expr -> NOT logical_not_expr','logical_not_expr',2,'p_logical_not_expr','parser.py',600),
+  ('logical_not_expr -> comparison_expr','logical_not_expr',1,'p_logical_not_expr','parser.py',601),
+  ('comparison_expr -> arithmetic_expr comparison_operator arithmetic_expr','comparison_expr',3,'p_comparison_expr','parser.py',609),
+  ('comparison_expr -> arithmetic_expr NOT IN arithmetic_expr','comparison_expr',4,'p_comparison_expr','parser.py',610),
+  ('comparison_expr -> arithmetic_expr','comparison_expr',1,'p_comparison_expr','parser.py',611),
+  ('comparison_operator -> GT','comparison_operator',1,'p_comparison_operator','parser.py',621),
+  ('comparison_operator -> LT','comparison_operator',1,'p_comparison_operator','parser.py',622),
+  ('comparison_operator -> GE','comparison_operator',1,'p_comparison_operator','parser.py',623),
+  ('comparison_operator -> LE','comparison_operator',1,'p_comparison_operator','parser.py',624),
+  ('comparison_operator -> EQ','comparison_operator',1,'p_comparison_operator','parser.py',625),
+  ('comparison_operator -> NE','comparison_operator',1,'p_comparison_operator','parser.py',626),
+  ('comparison_operator -> IN','comparison_operator',1,'p_comparison_operator','parser.py',627),
+  ('arithmetic_expr -> additive_expr','arithmetic_expr',1,'p_arithmetic_expr','parser.py',641),
+  ('additive_expr -> additive_expr PLUS multiplicative_expr','additive_expr',3,'p_additive_expr','parser.py',646),
+  ('additive_expr -> additive_expr MINUS multiplicative_expr','additive_expr',3,'p_additive_expr','parser.py',647),
+  ('additive_expr -> multiplicative_expr','additive_expr',1,'p_additive_expr','parser.py',648),
+  ('multiplicative_expr -> multiplicative_expr TIMES unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',657),
+  ('multiplicative_expr -> multiplicative_expr DIVIDE unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',658),
+  ('multiplicative_expr -> multiplicative_expr MODULO unary_expr','multiplicative_expr',3,'p_multiplicative_expr','parser.py',659),
+  ('multiplicative_expr -> unary_expr','multiplicative_expr',1,'p_multiplicative_expr','parser.py',660),
+  ('unary_expr -> MINUS unary_expr','unary_expr',2,'p_unary_expr','parser.py',674),
+  ('unary_expr -> expr_atom','unary_expr',1,'p_unary_expr','parser.py',675),
+  ('remote_keyword_call -> ID PIPE LBRACKET ID RBRACKET COMMA parameter_list','remote_keyword_call',7,'p_remote_keyword_call','parser.py',1138),
+  ('remote_keyword_call -> ID PIPE LBRACKET ID RBRACKET','remote_keyword_call',5,'p_remote_keyword_call','parser.py',1139),
+  ('remote_keyword_call -> PLACEHOLDER PIPE LBRACKET ID RBRACKET COMMA parameter_list','remote_keyword_call',7,'p_remote_keyword_call','parser.py',1140),
+  ('remote_keyword_call -> PLACEHOLDER PIPE LBRACKET ID RBRACKET','remote_keyword_call',5,'p_remote_keyword_call','parser.py',1141),
+]
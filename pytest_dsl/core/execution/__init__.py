@@ -4,12 +4,14 @@ from pytest_dsl.core.execution.exceptions import (
     BreakException,
     ContinueException,
     DSLExecutionError,
+    ParallelExecutionError,
     ReturnException,
 )
 from pytest_dsl.core.execution.dispatcher import NodeDispatcher
 from pytest_dsl.core.execution.expression import ExpressionEvaluator
 from pytest_dsl.core.execution.keyword_invoker import KeywordInvoker
 from pytest_dsl.core.execution.loops import LoopHandlers
+from pytest_dsl.core.execution.parallel import ParallelHandlers
 from pytest_dsl.core.execution.remote_invoker import RemoteKeywordInvoker
 from pytest_dsl.core.execution.runner import DSLExecutionRunner
 from pytest_dsl.core.execution.state import ExecutionState
@@ -25,5 +27,7 @@ __all__ = [
     "RemoteKeywordInvoker",
     "DSLExecutionRunner",
     "NodeDispatcher",
+    "ParallelExecutionError",
+    "ParallelHandlers",
     "ReturnException",
 ]
@@ -8,14 +8,108 @@ from pytest_dsl.core.execution.exceptions import (
 )
 
 
+STEP_HANDLED_NODES = frozenset({
+    'KeywordCall', 'Assignment', 'AssignmentKeywordCall',
+    'ForLoop', 'RemoteKeywordCall', 'AssignmentRemoteKeywordCall'
+})
+
+
 class NodeDispatcher:
-    """Dispatches AST nodes to executor handler methods."""
+    """Dispatches AST nodes to executor handler methods.
 
-    def __init__(self, executor):
+    In the default interpreted mode every call resolves the handler and
+    bookkeeping for the node. In compiled mode each node is turned once into
+    a closure with its line number, tracker description and compiled
+    children already resolved, and statement blocks run their compiled
+    children directly. The closure takes the dispatcher to run with, so it
+    is stored on the node (``_compiled_run``, left out of the AST cache by
+    ``Node.__getstate__``) and shared by every executor running that AST.
+    """
+
+    def __init__(self, executor, compiled: bool = False):
         self.executor = executor
+        self.compiled = compiled
+        self._handlers = self._build_handlers()
 
     def execute(self, node):
         """Execute one AST node through the owning executor."""
+        if self.compiled and node is not None:
+            return self._compiled_for(node)(self)
+        return self._interpret(node)
+
+    def compile(self, node):
+        """Return a closure that executes ``node`` with a given dispatcher."""
+        node_type = node.type
+        if node_type not in self._handlers:
+            # Keep the interpreter's unknown-node error reporting.
+            return lambda dispatcher: dispatcher._interpret(node)
+
+        if node_type == 'Statements':
+            statements = [child for child in node.children
+                          if child is not None]
+            children = [self._compiled_for(child) for child in statements]
+
+            if any(child.type == 'RemoteKeywordCall'
+                   for child in statements):
+                def handler(dispatcher, _node):
+                    remote_invoker = dispatcher.executor.remote_invoker
+                    # Read per run so the setting can change after compiling.
+                    pipeline = remote_invoker.pipeline_enabled
+                    for index, child in enumerate(children):
+                        if (pipeline and
+                                statements[index].type == 'RemoteKeywordCall'):
+                            remote_invoker.prefetch_keyword_calls(
+                                statements, index)
+                        child(dispatcher)
+            else:
+                def handler(dispatcher, _node):
+                    for child in children:
+                        child(dispatcher)
+        else:
+            def handler(dispatcher, node):
+                return dispatcher._handlers[node_type](node)
+
+        line_number = getattr(node, 'line_number', None)
+        description = (self.executor._get_node_description(node)
+                       if line_number else None)
+
+        def run(dispatcher):
+            executor = dispatcher.executor
+            tracker = (executor.execution_tracker
+                       if executor.enable_tracking else None)
+            step_started = False
+            if tracker and line_number:
+                tracker.start_step(line_number, node_type, description)
+                step_started = True
+
+            node_stack = executor._node_stack
+            if line_number:
+                node_stack.append(node)
+            old_node = executor._current_node
+            executor._current_node = node
+
+            try:
+                result = handler(dispatcher, node)
+                if step_started:
+                    tracker.finish_current_step(result=result)
+                return result
+            except Exception as e:
+                dispatcher._handle_failure(node, e, step_started)
+            finally:
+                executor._current_node = old_node
+                if line_number:
+                    node_stack.pop()
+
+        return run
+
+    def _compiled_for(self, node):
+        run = getattr(node, '_compiled_run', None)
+        if run is None:
+            run = self.compile(node)
+            node._compiled_run = run
+        return run
+
+    def _interpret(self, node):
         executor = self.executor
 
         if node is None:
@@ -31,7 +125,7 @@ class NodeDispatcher:
                     line_number, node.type, description)
                 step_started = True
 
-        handler = self._get_handler(node.type)
+        handler = self._handlers.get(node.type)
         if not handler:
             error_msg = f"未知的节点类型: {node.type}"
             if step_started:
@@ -56,47 +150,47 @@ class NodeDispatcher:
                 step_started = False
             return result
         except Exception as e:
-            if step_started:
-                # Control-flow exceptions are normal execution flow,
-                # not errors — finish the step without marking it failed.
-                if isinstance(e, (BreakException, ContinueException,
-                                  ReturnException)):
-                    executor.execution_tracker.finish_current_step()
-                else:
-                    error_msg = f"{type(e).__name__}: {str(e)}"
-                    if hasattr(node, 'line_number') and node.line_number:
-                        error_msg += f" (行{node.line_number})"
-                    executor.execution_tracker.finish_current_step(error=error_msg)
-                step_started = False
-
-            if isinstance(e, (BreakException, ContinueException,
-                              ReturnException, DSLExecutionError)):
-                raise
-
-            if isinstance(e, AssertionError):
-                if not ("行号:" in str(e) or "行" in str(e)):
-                    line_info = executor._get_line_info(node)
-                    if line_info:
-                        enhanced_msg = f"{str(e)}{line_info}"
-                        raise AssertionError(enhanced_msg) from e
-                raise
-
-            step_handled_nodes = {
-                'KeywordCall', 'Assignment', 'AssignmentKeywordCall',
-                'ForLoop', 'RemoteKeywordCall', 'AssignmentRemoteKeywordCall'
-            }
-            skip_logging = node.type in step_handled_nodes
-            executor._handle_exception_with_line_info(
-                e, node, f"执行{node.type}节点",
-                skip_allure_logging=skip_logging)
+            self._handle_failure(node, e, step_started)
         finally:
             executor._current_node = old_node
             if stack_pushed:
                 executor._node_stack.pop()
 
-    def _get_handler(self, node_type):
+    def _handle_failure(self, node, e, step_started):
+        executor = self.executor
+
+        if step_started:
+            # Control-flow exceptions are normal execution flow,
+            # not errors — finish the step without marking it failed.
+            if isinstance(e, (BreakException, ContinueException,
+                              ReturnException)):
+                executor.execution_tracker.finish_current_step()
+            else:
+                error_msg = f"{type(e).__name__}: {str(e)}"
+                if hasattr(node, 'line_number') and node.line_number:
+                    error_msg += f" (行{node.line_number})"
+                executor.execution_tracker.finish_current_step(error=error_msg)
+
+        if isinstance(e, (BreakException, ContinueException,
+                          ReturnException, DSLExecutionError)):
+            raise
+
+        if isinstance(e, AssertionError):
+            if not ("行号:" in str(e) or "行" in str(e)):
+                line_info = executor._get_line_info(node)
+                if line_info:
+                    enhanced_msg = f"{str(e)}{line_info}"
+                    raise AssertionError(enhanced_msg) from e
+            raise
+
+        skip_logging = node.type in STEP_HANDLED_NODES
+        executor._handle_exception_with_line_info(
+            e, node, f"执行{node.type}节点",
+            skip_allure_logging=skip_logging)
+
+    def _build_handlers(self):
         executor = self.executor
-        handlers = {
+        return {
             'Start': executor._handle_start,
             'Metadata': lambda _: None,
             'Statements': executor._handle_statements,
@@ -107,6 +201,8 @@ class NodeDispatcher:
             'ForItemLoop': executor._handle_for_item_loop,
             'ForKeyValueLoop': executor._handle_for_key_value_loop,
             'Retry': executor._handle_retry,
+            'Parallel': executor._handle_parallel,
+            'ParallelFor': executor._handle_parallel_for,
             'KeywordCall': executor._execute_keyword_call,
             'Teardown': executor._handle_teardown,
             'Return': executor._handle_return,
@@ -119,4 +215,3 @@ class NodeDispatcher:
             'Break': executor._handle_break,
             'Continue': executor._handle_continue,
         }
-        return handlers.get(node_type)
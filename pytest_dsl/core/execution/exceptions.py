@@ -41,3 +41,17 @@ class DSLExecutionError(Exception):
                 error_parts.append(f"原因: {original_text}")
 
         super().__init__(" \n ".join(error_parts))
+
+
+class ParallelExecutionError(DSLExecutionError):
+    """并行块中多个分支失败，errors为 (分支名称, 异常) 列表"""
+
+    def __init__(self, errors, line_number: int = None,
+                 node_type: str = None):
+        self.errors = errors
+        details = [f"{len(errors)} 个并行分支执行失败:"]
+        details.extend(f"  [{label}] {type(error).__name__}: {error}"
+                       for label, error in errors)
+        super().__init__("\n".join(details), line_number=line_number,
+                         node_type=node_type,
+                         original_exception=errors[0][1])
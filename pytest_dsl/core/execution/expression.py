@@ -8,7 +8,11 @@ from pytest_dsl.core.expression_utils import (
     evaluate_logical_operation,
     evaluate_unary_operation,
 )
-from pytest_dsl.core.parser import Node
+from pytest_dsl.core.parser import Node, parse_expression_cached
+from pytest_dsl.core.variable_utils import (
+    PlaceholderSegment,
+    compile_interpolation_template,
+)
 
 
 class ExpressionEvaluator:
@@ -29,12 +33,7 @@ class ExpressionEvaluator:
                 return self.variable_replacer.replace_in_value(value)
             if expr_node.type == 'StringLiteral':
                 if '${' in expr_node.value:
-                    return self.variable_replacer.replace_in_string(
-                        expr_node.value,
-                        expression_evaluator=(
-                            self._eval_interpolation_expression
-                        ),
-                    )
+                    return self._render_node_template(expr_node)
                 return expr_node.value
             if expr_node.type == 'NumberLiteral':
                 return expr_node.value
@@ -45,10 +44,7 @@ class ExpressionEvaluator:
                 except KeyError:
                     raise KeyError(f"变量 '{var_name}' 不存在")
             if expr_node.type == 'PlaceholderRef':
-                return self.variable_replacer.replace_in_string(
-                    expr_node.value,
-                    expression_evaluator=self._eval_interpolation_expression,
-                )
+                return self._render_node_template(expr_node)
             if expr_node.type == 'KeywordCall':
                 return self.executor.execute(expr_node)
             if expr_node.type == 'ListExpr':
@@ -90,11 +86,9 @@ class ExpressionEvaluator:
                 return self.evaluate(value)
             if isinstance(value, str):
                 if '${' in value:
-                    return self.variable_replacer.replace_in_string(
-                        value,
-                        expression_evaluator=(
-                            self._eval_interpolation_expression
-                        ),
+                    return self.variable_replacer.render_template(
+                        compile_interpolation_template(value),
+                        self._eval_interpolation_segment,
                     )
 
                 var_pattern = (r'^[a-zA-Z_\u4e00-\u9fa5]'
@@ -111,23 +105,38 @@ class ExpressionEvaluator:
                 context_info=context_info,
             )
 
+    def _render_node_template(self, expr_node):
+        """Render a StringLiteral/PlaceholderRef through its cached template.
+
+        The template is compiled once and kept on the node, so repeated
+        evaluation (e.g. inside loops) does no scanning or parsing.
+        """
+        template = getattr(expr_node, 'template', None)
+        if template is None:
+            template = compile_interpolation_template(expr_node.value)
+            expr_node.template = template
+        return self.variable_replacer.render_template(
+            template,
+            self._eval_interpolation_segment,
+        )
+
     def _eval_interpolation_expression(self, expr_text: str):
         """Evaluate a ${...} body with the DSL expression parser."""
-        from pytest_dsl.core.lexer import get_lexer
-        from pytest_dsl.core.parser import parse_expression_fragment
+        expr_node, errors = parse_expression_cached(expr_text)
+        return self._eval_interpolation_segment(
+            PlaceholderSegment(expr_text, expr_node, errors))
 
-        expr_node, errors = parse_expression_fragment(
-            expr_text,
-            lexer=get_lexer(),
-        )
-        if errors:
+    def _eval_interpolation_segment(self, segment):
+        """Evaluate an already parsed ${...} body."""
+        if segment.errors:
             messages = "; ".join(error.get('message', str(error))
-                                 for error in errors)
-            raise ValueError(f"无效的占位符表达式 '{expr_text}': {messages}")
-        if expr_node is None:
-            raise ValueError(f"无效的占位符表达式 '{expr_text}'")
+                                 for error in segment.errors)
+            raise ValueError(
+                f"无效的占位符表达式 '{segment.text}': {messages}")
+        if segment.node is None:
+            raise ValueError(f"无效的占位符表达式 '{segment.text}'")
 
-        return self.evaluate(expr_node)
+        return self.evaluate(segment.node)
 
     def _eval_index_access_expr(self, expr_node):
         collection = self.evaluate(expr_node.children[0])
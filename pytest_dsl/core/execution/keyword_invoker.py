@@ -3,17 +3,61 @@
 import difflib
 import re
 
-import allure
-
 from pytest_dsl.core.execution.exceptions import DSLExecutionError
 from pytest_dsl.core.keyword_manager import keyword_manager
 from pytest_dsl.core.reporting import (
     format_keyword_arguments,
     is_verbose,
     print_keyword_trace,
+    report_attach,
+    report_level,
+    report_step,
 )
 
 
+class KeywordCallSite:
+    """Keyword lookup and parameter validation cached on a KeywordCall node.
+
+    Valid while the keyword registry generation is unchanged. The keyword
+    function is read from ``keyword_info`` on every call, so rebinding it in
+    place (as remote server groups do) takes effect immediately.
+    """
+
+    __slots__ = ('generation', 'keyword_info', 'params')
+
+    def __init__(self, generation, keyword_info):
+        self.generation = generation
+        self.keyword_info = keyword_info
+        # Validated (name, mapped_name, value_node) tuples, filled lazily
+        self.params = None
+
+    def invoke(self, kwargs):
+        """Call the keyword with its defaults applied under ``kwargs``."""
+        keyword_info = self.keyword_info
+        defaults = keyword_info.get('defaults')
+        if defaults:
+            kwargs = {**defaults, **kwargs}
+        return keyword_info['func'](**kwargs)
+
+
+class _LazyArguments:
+    """Formats keyword arguments for the report only when rendered."""
+
+    __slots__ = ('arguments', 'keyword_info', 'excluded_keys')
+
+    def __init__(self, arguments, keyword_info):
+        self.arguments = arguments
+        self.keyword_info = keyword_info
+        # The invoker adds a default step_name after this snapshot point
+        self.excluded_keys = ("context", "skip_logging")
+        if 'step_name' not in arguments:
+            self.excluded_keys += ("step_name",)
+
+    def __str__(self):
+        return format_keyword_arguments(
+            self.arguments, self.keyword_info, self.excluded_keys)
+
+
 class KeywordInvoker:
     """Executes registered local keywords for a DSL executor."""
 
@@ -26,123 +70,161 @@ class KeywordInvoker:
         keyword_name = node.value
         line_info = executor._get_line_info(node)
 
-        keyword_info = keyword_manager.get_keyword_info(keyword_name)
-        if not keyword_info:
+        call_site = self.resolve_call_site(node)
+        if call_site is None:
             error_msg = f"未注册的关键字: {keyword_name}"
-            with allure.step(f"调用关键字: {keyword_name}"):
-                allure.attach(
+            with report_step(f"调用关键字: {keyword_name}"):
+                report_attach(
+                    "DSL执行异常",
                     f"执行KeywordCall节点: 未注册的关键字: {keyword_name}"
                     f"{line_info}\n上下文: 执行KeywordCall节点",
-                    name="DSL执行异常",
-                    attachment_type=allure.attachment_type.TEXT,
+                    error=True,
                 )
             raise Exception(error_msg)
 
-        with allure.step(f"调用关键字: {keyword_name}"):
+        step_title = f"调用关键字: {keyword_name}"
+        with report_step(step_title, summary_key=step_title):
             argument_details = ""
             try:
+                keyword_info = call_site.keyword_info
                 kwargs = self.prepare_params(node, keyword_info)
-                argument_details = format_keyword_arguments(
-                    kwargs,
-                    keyword_info,
-                )
+                if report_level() == "full":
+                    argument_details = format_keyword_arguments(
+                        kwargs,
+                        keyword_info,
+                    )
+                else:
+                    # 只在需要报告错误时才格式化参数
+                    argument_details = _LazyArguments(kwargs, keyword_info)
                 print_keyword_trace(keyword_name, kwargs, keyword_info)
                 kwargs.setdefault('step_name', keyword_name)
                 kwargs['skip_logging'] = True
 
-                result = keyword_manager.execute(keyword_name, **kwargs)
+                result = call_site.invoke(kwargs)
 
-                allure.attach(
-                    f"关键字: {keyword_name}\n"
-                    f"{argument_details}\n"
-                    f"执行结果: 成功{line_info}",
-                    name="关键字调用",
-                    attachment_type=allure.attachment_type.TEXT,
+                report_attach(
+                    "关键字调用",
+                    lambda: (
+                        f"关键字: {keyword_name}\n"
+                        f"{argument_details}\n"
+                        f"执行结果: 成功{line_info}"
+                    ),
                 )
 
                 return result
             except Exception as e:
-                error_details = self._format_keyword_error(e, node, line_info)
-                if argument_details:
-                    error_details = f"{error_details}\n{argument_details}"
-                allure.attach(
-                    error_details,
-                    name="DSL执行异常",
-                    attachment_type=allure.attachment_type.TEXT,
-                )
+                def error_details():
+                    details = self._format_keyword_error(e, node, line_info)
+                    if argument_details:
+                        details = f"{details}\n{argument_details}"
+                    return details
+
+                report_attach("DSL执行异常", error_details, error=True)
                 raise
 
+    def resolve_call_site(self, node):
+        """Return the cached call site of a KeywordCall node.
+
+        The call site is rebuilt only when the keyword registry generation
+        changes. Returns None for unregistered keywords.
+        """
+        generation = keyword_manager.generation
+        call_site = getattr(node, '_keyword_call_site', None)
+        if call_site is None or call_site.generation != generation:
+            keyword_info = keyword_manager.get_keyword_info(node.value)
+            if not keyword_info:
+                return None
+            call_site = KeywordCallSite(generation, keyword_info)
+            node._keyword_call_site = call_site
+        return call_site
+
     def prepare_params(self, node, keyword_info):
         """Prepare keyword kwargs from DSL parameter nodes."""
         executor = self.executor
-        mapping = keyword_info.get('mapping', {})
         kwargs = {'context': executor.test_context}
 
-        if node.children[0]:
-            seen_raw_names = set()
-            seen_mapped_names = set()
-            for param in node.children[0]:
-                param_name = param.value
-                english_param_name = mapping.get(param_name, param_name)
-
-                if mapping:
-                    allowed_cn = set(mapping.keys())
-                    allowed_en = set(mapping.values())
-                    if (param_name not in allowed_cn and
-                            param_name not in allowed_en):
-                        details = [
-                            f"关键字参数错误: {node.value} 不支持参数: "
-                            f"{param_name}",
-                            f"支持的参数: "
-                            f"{self._format_supported_params(mapping)}",
-                        ]
-                        suggestion = self._suggest_param_name(
-                            param_name,
-                            mapping,
-                        )
-                        if suggestion:
-                            details.append(suggestion)
-                        raise DSLExecutionError(
-                            " \n ".join(details),
-                            line_number=getattr(node, 'line_number', None),
-                            node_type=getattr(node, 'type', None),
-                        )
+        for param_name, english_param_name, value_node in (
+                self.validated_params(node, keyword_info)):
+            with report_step(f"解析参数: {param_name}"):
+                try:
+                    param_value = executor.eval_expression(value_node)
+                    kwargs[english_param_name] = param_value
 
-                if param_name in seen_raw_names:
-                    raise DSLExecutionError(
-                        f"关键字参数错误: {node.value} 参数重复: {param_name}",
-                        line_number=getattr(node, 'line_number', None),
-                        node_type=getattr(node, 'type', None),
-                    )
-                if english_param_name in seen_mapped_names:
-                    raise DSLExecutionError(
-                        f"关键字参数错误: {node.value} 参数重复(映射后): "
-                        f"{english_param_name}",
-                        line_number=getattr(node, 'line_number', None),
-                        node_type=getattr(node, 'type', None),
-                    )
-                seen_raw_names.add(param_name)
-                seen_mapped_names.add(english_param_name)
-
-                with allure.step(f"解析参数: {param_name}"):
-                    try:
-                        param_value = executor.eval_expression(
-                            param.children[0])
-                        kwargs[english_param_name] = param_value
-
-                        if is_verbose():
-                            allure.attach(
-                                f"参数名: {param_name}\n"
-                                f"参数值: {param_value}",
-                                name="参数解析详情",
-                                attachment_type=allure.attachment_type.TEXT,
-                            )
-                    except Exception as e:
-                        raise Exception(
-                            f"参数解析异常 ({param_name}): {str(e)}")
+                    if is_verbose():
+                        report_attach(
+                            "参数解析详情",
+                            f"参数名: {param_name}\n"
+                            f"参数值: {param_value}",
+                        )
+                except Exception as e:
+                    raise Exception(
+                        f"参数解析异常 ({param_name}): {str(e)}")
 
         return kwargs
 
+    def validated_params(self, node, keyword_info):
+        """Return ``(name, mapped_name, value_node)`` for each parameter.
+
+        The result is cached on the node's call site, so the signature of a
+        keyword called in a loop is validated once.
+        """
+        call_site = getattr(node, '_keyword_call_site', None)
+        if call_site is None or call_site.keyword_info is not keyword_info:
+            return self._validate_params(node, keyword_info)
+        if call_site.params is None:
+            call_site.params = self._validate_params(node, keyword_info)
+        return call_site.params
+
+    def _validate_params(self, node, keyword_info):
+        mapping = keyword_info.get('mapping', {})
+        params = []
+        if not node.children[0]:
+            return tuple(params)
+
+        allowed_cn = set(mapping.keys())
+        allowed_en = set(mapping.values())
+        seen_raw_names = set()
+        seen_mapped_names = set()
+        for param in node.children[0]:
+            param_name = param.value
+            english_param_name = mapping.get(param_name, param_name)
+
+            if mapping and (param_name not in allowed_cn and
+                            param_name not in allowed_en):
+                details = [
+                    f"关键字参数错误: {node.value} 不支持参数: "
+                    f"{param_name}",
+                    f"支持的参数: "
+                    f"{self._format_supported_params(mapping)}",
+                ]
+                suggestion = self._suggest_param_name(param_name, mapping)
+                if suggestion:
+                    details.append(suggestion)
+                raise DSLExecutionError(
+                    " \n ".join(details),
+                    line_number=getattr(node, 'line_number', None),
+                    node_type=getattr(node, 'type', None),
+                )
+
+            if param_name in seen_raw_names:
+                raise DSLExecutionError(
+                    f"关键字参数错误: {node.value} 参数重复: {param_name}",
+                    line_number=getattr(node, 'line_number', None),
+                    node_type=getattr(node, 'type', None),
+                )
+            if english_param_name in seen_mapped_names:
+                raise DSLExecutionError(
+                    f"关键字参数错误: {node.value} 参数重复(映射后): "
+                    f"{english_param_name}",
+                    line_number=getattr(node, 'line_number', None),
+                    node_type=getattr(node, 'type', None),
+                )
+            seen_raw_names.add(param_name)
+            seen_mapped_names.add(english_param_name)
+            params.append((param_name, english_param_name, param.children[0]))
+
+        return tuple(params)
+
     def _format_keyword_error(self, error, node, line_info):
         error_text = str(error)
         if "参数解析异常" not in error_text and "无法解析变量引用" not in error_text:
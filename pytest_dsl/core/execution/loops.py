@@ -1,17 +1,31 @@
 """Loop statement handlers for DSL execution."""
 
-import allure
+from itertools import islice
 
 from pytest_dsl.core.execution.exceptions import (
     BreakException,
     ContinueException,
     ReturnException,
 )
-from pytest_dsl.core.reporting import preview_value
+from pytest_dsl.core.reporting import (
+    preview_value,
+    report_attach,
+    report_step,
+)
+
+# Leading items (or characters) rendered in loop collection previews; both
+# are enough to fill preview_value's default 160 character limit
+PREVIEW_ITEMS = 64
+PREVIEW_CHARS = 200
 
 
 class LoopHandlers:
-    """Executes DSL loop nodes for a DSL executor."""
+    """Executes DSL loop nodes for a DSL executor.
+
+    Loops iterate their source lazily: ranges are never materialized and
+    generators or other iterators are consumed one item at a time, so a
+    loop over a very large or streamed source runs in constant memory.
+    """
 
     def __init__(self, executor):
         self.executor = executor
@@ -26,24 +40,27 @@ class LoopHandlers:
         step_name = f"执行范围循环: {node.value}"
         line_info = executor._get_line_info(node)
 
-        with allure.step(step_name):
+        with report_step(step_name, summary_key="执行范围循环"):
             try:
                 var_name = node.value
                 start_range = executor.eval_expression(node.children[0])
                 end_range = executor.eval_expression(node.children[1])
-                loop_items = list(range(start_range, end_range))
-
-                allure.attach(
-                    f"循环变量: {var_name}\n循环范围: {start_range} 到 "
-                    f"{end_range}\n循环次数: {len(loop_items)}\n"
-                    f"循环项预览: {preview_value(loop_items)}{line_info}",
-                    name="范围循环信息",
-                    attachment_type=allure.attachment_type.TEXT,
+                loop_range = range(start_range, end_range)
+
+                report_attach(
+                    "范围循环信息",
+                    lambda: (
+                        f"循环变量: {var_name}\n循环范围: {start_range} 到 "
+                        f"{end_range}\n循环次数: {len(loop_range)}\n"
+                        f"循环项预览: "
+                        f"{preview_value(list(loop_range[:PREVIEW_ITEMS]))}"
+                        f"{line_info}"
+                    ),
                 )
 
                 statements_node = node.children[2]
 
-                for item in loop_items:
+                for item in loop_range:
                     executor.state.set_local_variable(var_name, item)
                     executor._notify_remote_servers_variable_changed(
                         var_name, item)
@@ -53,19 +70,7 @@ class LoopHandlers:
                             statements_node=statements_node,
                             line_info=line_info,
                             node_type="ForRangeLoop",
-                            step_label=f"{var_name} = {item}",
-                            break_message=(
-                                f"在 {var_name} = {item} 时遇到break语句，"
-                                f"退出循环"
-                            ),
-                            continue_message=(
-                                f"在 {var_name} = {item} 时遇到continue语句，"
-                                f"跳过本次循环"
-                            ),
-                            return_message=(
-                                f"在 {var_name} = {item} 时遇到return语句，"
-                                f"退出函数"
-                            ),
+                            step_label=lambda: f"{var_name} = {item}",
                         )
                     except _LoopBreak:
                         break
@@ -81,7 +86,7 @@ class LoopHandlers:
         step_name = f"执行遍历循环: {node.value}"
         line_info = executor._get_line_info(node)
 
-        with allure.step(step_name):
+        with report_step(step_name, summary_key="执行遍历循环"):
             try:
                 var_name = node.value
                 collection = executor.eval_expression(node.children[0])
@@ -90,17 +95,14 @@ class LoopHandlers:
                     raise TypeError(
                         f"对象不可迭代: {type(collection).__name__}")
 
-                loop_items = (
-                    list(collection) if not isinstance(collection, list)
-                    else collection
-                )
-
-                allure.attach(
-                    f"循环变量: {var_name}\n遍历集合预览: {preview_value(collection)}\n集合类型: "
-                    f"{type(collection).__name__}\n集合长度: "
-                    f"{len(loop_items)}{line_info}",
-                    name="遍历循环信息",
-                    attachment_type=allure.attachment_type.TEXT,
+                report_attach(
+                    "遍历循环信息",
+                    lambda: (
+                        f"循环变量: {var_name}\n遍历集合预览: "
+                        f"{_preview_collection(collection)}\n集合类型: "
+                        f"{type(collection).__name__}\n集合长度: "
+                        f"{_collection_length(collection)}{line_info}"
+                    ),
                 )
 
                 statements_node = node.children[1]
@@ -115,19 +117,7 @@ class LoopHandlers:
                             statements_node=statements_node,
                             line_info=line_info,
                             node_type="ForItemLoop",
-                            step_label=f"{var_name} = {item}",
-                            break_message=(
-                                f"在 {var_name} = {item} 时遇到break语句，"
-                                f"退出循环"
-                            ),
-                            continue_message=(
-                                f"在 {var_name} = {item} 时遇到continue语句，"
-                                f"跳过本次循环"
-                            ),
-                            return_message=(
-                                f"在 {var_name} = {item} 时遇到return语句，"
-                                f"退出函数"
-                            ),
+                            step_label=lambda: f"{var_name} = {item}",
                         )
                     except _LoopBreak:
                         break
@@ -146,7 +136,7 @@ class LoopHandlers:
         step_name = f"执行键值对循环: {key_var}, {value_var}"
         line_info = executor._get_line_info(node)
 
-        with allure.step(step_name):
+        with report_step(step_name, summary_key="执行键值对循环"):
             try:
                 collection = executor.eval_expression(node.children[0])
 
@@ -155,11 +145,13 @@ class LoopHandlers:
                         f"键值对遍历要求字典类型，得到: "
                         f"{type(collection).__name__}")
 
-                allure.attach(
-                    f"键变量: {key_var}\n值变量: {value_var}\n遍历字典: "
-                    f"{preview_value(collection)}\n字典长度: {len(collection)}{line_info}",
-                    name="键值对循环信息",
-                    attachment_type=allure.attachment_type.TEXT,
+                report_attach(
+                    "键值对循环信息",
+                    lambda: (
+                        f"键变量: {key_var}\n值变量: {value_var}\n遍历字典: "
+                        f"{_preview_collection(collection)}\n字典长度: "
+                        f"{len(collection)}{line_info}"
+                    ),
                 )
 
                 statements_node = node.children[1]
@@ -177,21 +169,9 @@ class LoopHandlers:
                             statements_node=statements_node,
                             line_info=line_info,
                             node_type="ForKeyValueLoop",
-                            step_label=(
+                            step_label=lambda: (
                                 f"{key_var} = {key}, {value_var} = {value}"
                             ),
-                            break_message=(
-                                f"在 {key_var} = {key}, {value_var} = {value} "
-                                f"时遇到break语句，退出循环"
-                            ),
-                            continue_message=(
-                                f"在 {key_var} = {key}, {value_var} = {value} "
-                                f"时遇到continue语句，跳过本次循环"
-                            ),
-                            return_message=(
-                                f"在 {key_var} = {key}, {value_var} = {value} "
-                                f"时遇到return语句，退出函数"
-                            ),
                         )
                     except _LoopBreak:
                         break
@@ -202,50 +182,72 @@ class LoopHandlers:
                 raise
 
     def _execute_loop_iteration(self, statements_node, line_info, node_type,
-                                step_label, break_message, continue_message,
-                                return_message):
-        with allure.step(f"循环轮次: {step_label}"):
+                                step_label):
+        """Run one loop iteration.
+
+        ``step_label`` is a callable that renders the current loop variables;
+        it is only called when a step title or control-flow message is
+        actually reported.
+        """
+        with report_step(lambda: f"循环轮次: {step_label()}",
+                         summary_key="循环轮次"):
             try:
                 self.executor.execute(statements_node)
             except BreakException:
-                allure.attach(
-                    break_message,
-                    name="循环Break",
-                    attachment_type=allure.attachment_type.TEXT,
+                report_attach(
+                    "循环Break",
+                    lambda: f"在 {step_label()} 时遇到break语句，退出循环",
                 )
                 raise _LoopBreak()
             except ContinueException:
-                allure.attach(
-                    continue_message,
-                    name="循环Continue",
-                    attachment_type=allure.attachment_type.TEXT,
+                report_attach(
+                    "循环Continue",
+                    lambda: f"在 {step_label()} 时遇到continue语句，跳过本次循环",
                 )
             except ReturnException as e:
-                allure.attach(
-                    return_message,
-                    name="循环Return",
-                    attachment_type=allure.attachment_type.TEXT,
+                report_attach(
+                    "循环Return",
+                    lambda: f"在 {step_label()} 时遇到return语句，退出函数",
                 )
                 raise e
             except Exception as e:
-                error_details = (f"循环执行异常 ({step_label}): "
+                error_details = (f"循环执行异常 ({step_label()}): "
                                  f"{str(e)}{line_info}\n"
                                  f"上下文: 执行{node_type}节点")
-                allure.attach(
-                    error_details,
-                    name="DSL执行异常",
-                    attachment_type=allure.attachment_type.TEXT,
-                )
+                report_attach("DSL执行异常", error_details, error=True)
                 raise
 
     def _attach_loop_error(self, node_type, error_text, line_info):
         error_details = (f"执行{node_type}节点: {error_text}{line_info}\n"
                          f"上下文: 执行{node_type}节点")
-        allure.attach(
-            error_details,
-            name="DSL执行异常",
-            attachment_type=allure.attachment_type.TEXT,
-        )
+        report_attach("DSL执行异常", error_details, error=True)
+
+
+def _preview_collection(collection):
+    """Preview the leading items without repr-ing the whole collection."""
+    if isinstance(collection, (list, tuple)):
+        return preview_value(collection[:PREVIEW_ITEMS])
+    if isinstance(collection, (str, bytes)):
+        # 超过预览长度的部分不会显示
+        return preview_value(collection[:PREVIEW_CHARS])
+    if isinstance(collection, dict):
+        if len(collection) <= PREVIEW_ITEMS:
+            return preview_value(collection)
+        return preview_value(dict(islice(collection.items(), PREVIEW_ITEMS)))
+    if hasattr(collection, '__len__') and hasattr(collection, '__iter__'):
+        if iter(collection) is not collection:
+            if len(collection) <= PREVIEW_ITEMS:
+                return preview_value(collection)
+            return preview_value(list(islice(collection, PREVIEW_ITEMS)))
+    # Iterators and generators are consumed by the loop itself
+    return preview_value(collection)
+
+
+def _collection_length(collection):
+    try:
+        return len(collection)
+    except TypeError:
+        return "未知（迭代器）"
 
 
 class _LoopBreak(Exception):
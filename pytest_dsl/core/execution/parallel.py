@@ -0,0 +1,203 @@
+"""Parallel block handlers for DSL execution."""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest_dsl.core.execution.exceptions import (
+    BreakException,
+    ContinueException,
+    DSLExecutionError,
+    ParallelExecutionError,
+    ReturnException,
+)
+from pytest_dsl.core.reporting import (
+    current_report_summary,
+    report_attach,
+    report_step,
+    shared_report_summary,
+)
+
+# Maximum concurrent branches when a block does not say ``with max N``
+PARALLEL_WORKERS_ENV = 'PYTEST_DSL_PARALLEL_WORKERS'
+DEFAULT_PARALLEL_WORKERS = 8
+
+
+def parallel_workers() -> int:
+    """Return the default number of concurrent parallel branches."""
+    try:
+        value = int(os.environ.get(PARALLEL_WORKERS_ENV, ''))
+    except ValueError:
+        return DEFAULT_PARALLEL_WORKERS
+    return value if value > 0 else DEFAULT_PARALLEL_WORKERS
+
+
+class _Branch:
+    """One unit of work in a parallel block."""
+
+    __slots__ = ('label', 'body', 'variables')
+
+    def __init__(self, label, body, variables=None):
+        self.label = label
+        self.body = body
+        self.variables = variables or {}
+
+
+class ParallelHandlers:
+    """Executes DSL parallel blocks for a DSL executor.
+
+    Every branch runs on a pool thread with an executor forked from the
+    parent: the branch reads the parent's variables copy-on-write and shares
+    its keywords, remote servers and tracker. Once all branches have
+    finished, the variables each branch assigned are merged back into the
+    parent in branch order, so when two branches assign the same name the
+    later branch wins regardless of timing. Failures do not cancel the other
+    branches; they are collected and raised together after the join.
+
+    Remote keyword clients track variable sync and queued variable-change
+    notifications per TestContext, and each branch has its own forked
+    context, so a server with variable sessions keeps every branch's
+    variables apart. Older servers hold a single set of
+    synced variables that concurrent branches overwrite.
+    """
+
+    def __init__(self, executor):
+        self.executor = executor
+
+    def handle_parallel(self, node):
+        """处理并行块: parallel do ... end，块内每条语句是一个分支"""
+        executor = self.executor
+        statements = [stmt for stmt in node.children[0].children
+                      if stmt is not None]
+        branches = [
+            _Branch(f"分支{index}: {executor._get_node_description(stmt)}",
+                    stmt)
+            for index, stmt in enumerate(statements, 1)
+        ]
+
+        with report_step(f"并行执行: {len(branches)} 个分支",
+                         summary_key="并行执行"):
+            self._run_branches(node, branches, parallel_workers())
+
+    def handle_parallel_for(self, node):
+        """处理并行循环: parallel for item in list with max N do ... end"""
+        executor = self.executor
+        var_name = node.value
+        collection_expr, max_expr, statements_node = node.children
+        line_info = executor._get_line_info(node)
+
+        with report_step(f"执行并行循环: {var_name}",
+                         summary_key="执行并行循环"):
+            if collection_expr.type == 'Range':
+                collection = range(
+                    executor.eval_expression(collection_expr.children[0]),
+                    executor.eval_expression(collection_expr.children[1]))
+            else:
+                collection = executor.eval_expression(collection_expr)
+            if not hasattr(collection, '__iter__'):
+                raise TypeError(f"对象不可迭代: {type(collection).__name__}")
+
+            if max_expr is None:
+                max_workers = parallel_workers()
+            else:
+                max_workers = self._max_workers(
+                    executor.eval_expression(max_expr), node)
+
+            branches = [
+                _Branch(f"{var_name} = {item}", statements_node,
+                        {var_name: item})
+                for item in collection
+            ]
+            report_attach(
+                "并行循环信息",
+                lambda: (f"循环变量: {var_name}\n分支数: {len(branches)}\n"
+                         f"最大并发数: {max_workers}{line_info}"),
+            )
+            self._run_branches(node, branches, max_workers)
+
+    def _max_workers(self, value, node):
+        try:
+            max_workers = int(value)
+        except (TypeError, ValueError):
+            max_workers = 0
+        if max_workers < 1:
+            raise DSLExecutionError(
+                f"并行最大并发数无效: {value}",
+                line_number=getattr(node, 'line_number', None),
+                node_type=node.type)
+        return max_workers
+
+    def _run_branches(self, node, branches, max_workers):
+        if not branches:
+            return
+
+        parent = self.executor
+        states = [parent.state.fork() for _ in branches]
+        tracker = (parent.execution_tracker
+                   if parent.enable_tracking else None)
+        step_stack = tracker.fork_step_stack() if tracker else None
+        summary = current_report_summary()
+
+        # A new thread starts its Allure step context from the step open on
+        # the test's thread, so a pool per block nests branches under it.
+        with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(branches)),
+                thread_name_prefix='pytest-dsl-parallel') as pool:
+            futures = [
+                pool.submit(self._run_branch, branch, state, tracker,
+                            step_stack, summary)
+                for branch, state in zip(branches, states)
+            ]
+            outcomes = [future.result() for future in futures]
+
+        for state in states:
+            parent.state.merge(state)
+
+        failures = [(branch.label, error)
+                    for branch, error in zip(branches, outcomes)
+                    if error is not None]
+        if len(failures) == 1:
+            raise failures[0][1]
+        if failures:
+            error = ParallelExecutionError(
+                failures, line_number=getattr(node, 'line_number', None),
+                node_type=node.type)
+            report_attach("DSL执行异常", str(error), error=True)
+            raise error
+
+    def _run_branch(self, branch, state, tracker, step_stack, summary):
+        """Run one branch on the current pool thread.
+
+        Returns the exception the branch failed with, or None.
+        """
+        executor = self.executor._fork(state)
+        thread = threading.current_thread()
+        previous_executor = getattr(thread, 'dsl_executor', None)
+        # Custom and remote keywords look up the executor of their thread
+        thread.dsl_executor = executor
+        if tracker is not None:
+            tracker.adopt_step_stack(step_stack)
+
+        try:
+            with shared_report_summary(summary), report_step(
+                    f"并行分支: {branch.label}", summary_key="并行分支"):
+                for name, value in branch.variables.items():
+                    state.set_local_variable(name, value)
+                try:
+                    executor.execute(branch.body)
+                except ContinueException:
+                    # continue只结束当前分支
+                    pass
+                except (BreakException, ReturnException) as e:
+                    statement = ('break' if isinstance(e, BreakException)
+                                 else 'return')
+                    raise DSLExecutionError(
+                        f"并行分支中不能使用{statement}语句",
+                        line_number=getattr(branch.body, 'line_number',
+                                            None),
+                        node_type=branch.body.type)
+            return None
+        except Exception as e:
+            return e
+        finally:
+            thread.dsl_executor = previous_executor
@@ -1,6 +1,6 @@
 """Remote keyword integration for DSL execution."""
 
-import allure
+import os
 
 from pytest_dsl.core.execution.exceptions import DSLExecutionError
 from pytest_dsl.core.reporting import (
@@ -8,6 +8,8 @@ from pytest_dsl.core.reporting import (
     is_verbose,
     print_keyword_trace,
     preview_value,
+    report_attach,
+    report_step,
 )
 from pytest_dsl.remote.diagnostics import diagnostics_has_output
 
@@ -30,6 +32,10 @@ def _format_remote_diagnostics(diagnostics, fallback_traceback=None,
     elapsed_ms = diagnostics.get("elapsed_ms")
     if elapsed_ms is not None:
         lines.append(f"elapsed_ms: {elapsed_ms}")
+    queue_wait_ms = diagnostics.get("queue_wait_ms")
+    if queue_wait_ms:
+        lines.append(f"queue_wait_ms: {queue_wait_ms}")
+        lines.append(f"queue_depth: {diagnostics.get('queue_depth', 0)}")
 
     diagnostic_error = diagnostics.get("error") or error_text
     if diagnostic_error:
@@ -68,11 +74,22 @@ def _format_remote_diagnostics(diagnostics, fallback_traceback=None,
     return "\n".join(lines)
 
 
+# Set to 1 to batch consecutive calls to the same remote server
+PIPELINE_ENV = 'PYTEST_DSL_REMOTE_PIPELINE'
+
+
 class RemoteKeywordInvoker:
     """Handles remote keyword imports, calls, assignments, and sync."""
 
     def __init__(self, executor):
         self.executor = executor
+        # 节点id -> (节点, 参数, run_keyword结果或异常)
+        self._prefetched = {}
+
+    @property
+    def pipeline_enabled(self):
+        """Whether pipelining is on, read from the environment on every use."""
+        return os.environ.get(PIPELINE_ENV, '0') == '1'
 
     def handle_import(self, node):
         """处理远程关键字导入"""
@@ -106,16 +123,20 @@ class RemoteKeywordInvoker:
 
         print(f"远程服务器已连接: {alias} ({url})")
 
-        allure.attach(
+        report_attach(
+            "远程关键字导入",
             f"已连接到远程关键字服务器: {url}\n"
             f"别名: {alias}",
-            name="远程关键字导入",
-            attachment_type=allure.attachment_type.TEXT,
         )
         return True
 
     def notify_variable_changed(self, var_name, var_value):
-        """通知远程服务器变量已发生变化"""
+        """通知远程服务器变量已发生变化
+
+        变化先缓存在各客户端中，在下次调用该服务器的关键字前一并同步，
+        避免循环中每次赋值都对每个服务器发起一次请求。变化按当前执行器的
+        TestContext缓存，并行分支的赋值只随本分支的调用发送。
+        """
         try:
             from pytest_dsl.core.serialization_utils import XMLRPCSerializer
 
@@ -128,8 +149,9 @@ class RemoteKeywordInvoker:
 
             from pytest_dsl.remote.keyword_client import remote_keyword_manager
 
+            context = getattr(self.executor, 'test_context', None)
             ok_aliases = []
-            for alias, client in remote_keyword_manager.clients.items():
+            for alias, client in list(remote_keyword_manager.clients.items()):
                 try:
                     final_variables = client._apply_hook_filter(
                         filtered_variables, variables_to_filter, 'change')
@@ -137,6 +159,14 @@ class RemoteKeywordInvoker:
                     if not final_variables:
                         continue
 
+                    queue_changes = getattr(
+                        client, 'queue_variable_changes', None)
+                    if queue_changes is not None:
+                        queue_changes(final_variables, context=context)
+                        ok_aliases.append(alias)
+                        continue
+
+                    # 不支持缓存的客户端立即同步
                     result = XMLRPCSerializer.safe_xmlrpc_call(
                         client.server, 'sync_variables_from_client',
                         final_variables, client.api_key)
@@ -153,7 +183,7 @@ class RemoteKeywordInvoker:
 
             if ok_aliases and is_verbose():
                 print(
-                    f"🔄 变量 {var_name} 已同步到远程服务器: "
+                    f"🔄 变量 {var_name} 待同步到远程服务器: "
                     f"{', '.join(ok_aliases)}"
                 )
 
@@ -162,41 +192,116 @@ class RemoteKeywordInvoker:
         except Exception as e:
             print(f"❌ 通知远程服务器变量变化时发生错误: {str(e)}")
 
-    def execute_keyword_call(self, node):
-        """执行远程关键字调用"""
+    def prefetch_keyword_calls(self, statements, index):
+        """把从index开始、调用同一服务器的连续远程关键字合并为一次请求
+
+        只在启用流水线（PYTEST_DSL_REMOTE_PIPELINE=1）且服务器支持
+        run_keywords_dependencies时生效。结果按节点缓存，各节点执行时
+        直接使用，步骤、报告和异常与逐个调用一致。
+
+        参数在批量请求前统一求值。服务器执行到设置了变量（captures或
+        side_effects中的变量）的关键字后即结束批次，后续调用没有缓存的
+        结果，执行时用最新的变量重新求值参数，因此不会使用过期的参数。
+
+        Args:
+            statements: 语句节点列表
+            index: 当前RemoteKeywordCall节点的位置
+        """
         from pytest_dsl.remote.keyword_client import remote_keyword_manager
 
-        executor = self.executor
-        call_info = node.value
-        alias = executor._replace_variables_in_string(call_info['alias'])
+        if id(statements[index]) in self._prefetched:
+            return
+
+        batch = []
+        alias = None
+        for node in statements[index:]:
+            if node is None or node.type != 'RemoteKeywordCall':
+                break
+            try:
+                node_alias = self._resolve_alias(node)
+                if alias is not None and node_alias != alias:
+                    break
+                kwargs = self._evaluate_call_arguments(node, node_alias)
+            except Exception:
+                # 留给节点自身执行时报告错误
+                break
+            alias = node_alias
+            batch.append((node, kwargs))
+
+        if len(batch) < 2:
+            return
+        client = remote_keyword_manager.get_client(alias)
+        if (client is None or
+                'run_keywords_dependencies' not in client.capabilities):
+            return
+
+        calls = [(node.value['keyword'], kwargs) for node, kwargs in batch]
+        try:
+            results = client.run_keyword_batch(
+                calls, context=self.executor.test_context)
+        except Exception as e:
+            # 无法确认哪些关键字已执行，由第一个节点报告错误
+            first_node, first_kwargs = batch[0]
+            self._prefetched[id(first_node)] = (first_node, first_kwargs, e)
+            return
+
+        for (node, kwargs), result in zip(batch, results):
+            self._prefetched[id(node)] = (node, kwargs, result)
+
+    def _resolve_alias(self, node):
+        alias = self.executor._replace_variables_in_string(node.value['alias'])
         if alias is None or (isinstance(alias, str) and not alias.strip()):
             raise Exception("远程调用别名不能为空")
         if not isinstance(alias, str):
             alias = str(alias)
-        keyword_name = call_info['keyword']
+        return alias
+
+    def _evaluate_call_arguments(self, node, alias):
+        keyword_name = node.value['keyword']
+        params = []
+        if node.children and node.children[0]:
+            params = node.children[0]
+
+        kwargs = {}
+        seen_param_names = set()
+        for param in params:
+            param_name = param.value
+            if param_name in seen_param_names:
+                raise DSLExecutionError(
+                    f"远程关键字参数错误: {alias}|{keyword_name} 参数重复: "
+                    f"{param_name}",
+                    line_number=getattr(node, 'line_number', None),
+                    node_type=getattr(node, 'type', None),
+                )
+            seen_param_names.add(param_name)
+            param_value = self.executor.eval_expression(param.children[0])
+            kwargs[param_name] = param_value
+        return kwargs
+
+    def _take_prefetched(self, node):
+        prefetched = self._prefetched.pop(id(node), None)
+        if prefetched is None or prefetched[0] is not node:
+            return None
+        return prefetched
+
+    def execute_keyword_call(self, node):
+        """执行远程关键字调用"""
+        from pytest_dsl.remote.keyword_client import remote_keyword_manager
+
+        executor = self.executor
+        alias = self._resolve_alias(node)
+        keyword_name = node.value['keyword']
         line_info = executor._get_line_info(node)
+        prefetched = self._take_prefetched(node)
 
-        with allure.step(f"执行远程关键字: {alias}|{keyword_name}"):
+        step_title = f"执行远程关键字: {alias}|{keyword_name}"
+        with report_step(step_title, summary_key=step_title):
             argument_details = ""
             try:
-                params = []
-                if node.children and node.children[0]:
-                    params = node.children[0]
-
-                kwargs = {}
-                seen_param_names = set()
-                for param in params:
-                    param_name = param.value
-                    if param_name in seen_param_names:
-                        raise DSLExecutionError(
-                            f"远程关键字参数错误: {alias}|{keyword_name} 参数重复: "
-                            f"{param_name}",
-                            line_number=getattr(node, 'line_number', None),
-                            node_type=getattr(node, 'type', None),
-                        )
-                    seen_param_names.add(param_name)
-                    param_value = executor.eval_expression(param.children[0])
-                    kwargs[param_name] = param_value
+                if prefetched is not None:
+                    kwargs = dict(prefetched[1])
+                else:
+                    kwargs = self._evaluate_call_arguments(node, alias)
 
                 kwargs['context'] = executor.test_context
                 argument_details = format_keyword_arguments(kwargs)
@@ -207,37 +312,41 @@ class RemoteKeywordInvoker:
                     kwargs.get('step_name', f"{alias}|{keyword_name}")
                 )
 
-                with allure.step(step_name):
-                    outcome = (
-                        remote_keyword_manager
-                        .execute_remote_keyword_with_outcome(
-                            alias, keyword_name, **kwargs)
-                    )
+                with report_step(step_name):
+                    if prefetched is not None:
+                        outcome = self._resolve_prefetched(
+                            alias, keyword_name, prefetched[2])
+                    else:
+                        outcome = (
+                            remote_keyword_manager
+                            .execute_remote_keyword_with_outcome(
+                                alias, keyword_name, **kwargs)
+                        )
                 result = getattr(outcome, "value", outcome)
                 diagnostics = getattr(outcome, "diagnostics", {}) or {}
                 if is_verbose():
-                    details = (f"远程关键字: {alias}|{keyword_name}\n"
-                               f"{argument_details}\n"
-                               f"远程关键字结果: {result}{line_info}")
-                    attachment_name = "远程关键字执行详情"
+                    report_attach(
+                        "远程关键字执行详情",
+                        lambda: (f"远程关键字: {alias}|{keyword_name}\n"
+                                 f"{argument_details}\n"
+                                 f"远程关键字结果: {result}{line_info}"),
+                    )
                 else:
-                    details = (f"远程关键字: {alias}|{keyword_name}\n"
-                               f"{argument_details}\n"
-                               f"结果: {preview_value(result)}{line_info}")
-                    attachment_name = "远程关键字执行结果"
-                allure.attach(
-                    details,
-                    name=attachment_name,
-                    attachment_type=allure.attachment_type.TEXT,
-                )
+                    report_attach(
+                        "远程关键字执行结果",
+                        lambda: (f"远程关键字: {alias}|{keyword_name}\n"
+                                 f"{argument_details}\n"
+                                 f"结果: {preview_value(result)}{line_info}"),
+                    )
                 if diagnostics_has_output(diagnostics):
-                    allure.attach(
-                        _format_remote_diagnostics(diagnostics),
-                        name="远程关键字远端日志",
-                        attachment_type=allure.attachment_type.TEXT,
+                    report_attach(
+                        "远程关键字远端日志",
+                        lambda: _format_remote_diagnostics(diagnostics),
                     )
                 return result
             except Exception as e:
+                # 失败后不再使用同一批次中其余节点的结果
+                self._prefetched.clear()
                 error_details = (f"执行RemoteKeywordCall节点: {str(e)}"
                                  f"{line_info}\n上下文: 执行RemoteKeywordCall节点")
                 if argument_details:
@@ -246,29 +355,39 @@ class RemoteKeywordInvoker:
                 request_id = diagnostics.get("request_id")
                 if request_id:
                     error_details = f"{error_details}\n远程请求ID: {request_id}"
-                allure.attach(
+                report_attach(
+                    "DSL执行异常",
                     error_details,
-                    name="DSL执行异常",
-                    attachment_type=allure.attachment_type.TEXT,
+                    error=True,
                 )
                 if diagnostics_has_output(diagnostics):
-                    allure.attach(
-                        _format_remote_diagnostics(
+                    report_attach(
+                        "远程关键字失败诊断",
+                        lambda: _format_remote_diagnostics(
                             diagnostics,
                             fallback_traceback=getattr(e, "traceback", []),
                             error_text=str(e)),
-                        name="远程关键字失败诊断",
-                        attachment_type=allure.attachment_type.TEXT,
+                        error=True,
                     )
                 raise
 
+    def _resolve_prefetched(self, alias, keyword_name, result):
+        from pytest_dsl.remote.keyword_client import remote_keyword_manager
+
+        if isinstance(result, Exception):
+            raise result
+        return remote_keyword_manager.get_client(
+            alias).handle_run_keyword_result(
+                keyword_name, result, return_outcome=True)
+
     def handle_assignment_keyword_call(self, node):
         """处理远程关键字调用赋值"""
         executor = self.executor
         var_name = node.value
         line_info = executor._get_line_info(node)
 
-        with allure.step(f"远程关键字赋值: {var_name}"):
+        with report_step(f"远程关键字赋值: {var_name}",
+                         summary_key="远程关键字赋值"):
             try:
                 remote_keyword_call_node = node.children[0]
                 # Call execute_keyword_call directly instead of
@@ -284,16 +403,14 @@ class RemoteKeywordInvoker:
                 actual_result = self._apply_remote_result_captures(result)
                 scope = executor.state.set_variable(var_name, actual_result)
                 if scope == "global":
-                    allure.attach(
-                        f"全局变量: {var_name}\n值: {actual_result}{line_info}",
-                        name="远程关键字赋值",
-                        attachment_type=allure.attachment_type.TEXT,
+                    report_attach(
+                        "远程关键字赋值",
+                        lambda: f"全局变量: {var_name}\n值: {actual_result}{line_info}",
                     )
                 else:
-                    allure.attach(
-                        f"变量: {var_name}\n值: {actual_result}{line_info}",
-                        name="远程关键字赋值",
-                        attachment_type=allure.attachment_type.TEXT,
+                    report_attach(
+                        "远程关键字赋值",
+                        lambda: f"变量: {var_name}\n值: {actual_result}{line_info}",
                     )
 
                 if isinstance(result, dict) and 'captures' in result:
@@ -304,10 +421,10 @@ class RemoteKeywordInvoker:
                 error_details = (f"执行AssignmentRemoteKeywordCall节点: {str(e)}"
                                  f"{line_info}\n"
                                  f"上下文: 执行AssignmentRemoteKeywordCall节点")
-                allure.attach(
+                report_attach(
+                    "DSL执行异常",
                     error_details,
-                    name="DSL执行异常",
-                    attachment_type=allure.attachment_type.TEXT,
+                    error=True,
                 )
                 raise
 
@@ -82,14 +82,10 @@ class DSLExecutionRunner:
 
     def parse_dsl_content(self, content: str) -> Node:
         """Parse DSL source content into an AST root node."""
-        from pytest_dsl.core.parser import (
-            format_parse_errors,
-            parse_with_error_handling,
-        )
-        from pytest_dsl.core.lexer import get_lexer
-
-        lexer = get_lexer()
-        ast, parse_errors = parse_with_error_handling(content, lexer)
+        from pytest_dsl.core.ast_cache import ast_cache
+        from pytest_dsl.core.parser import format_parse_errors
+
+        ast, parse_errors = ast_cache.parse(content)
 
         if parse_errors:
             raise Exception(
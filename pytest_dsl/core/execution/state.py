@@ -1,5 +1,6 @@
 """Mutable execution state for DSL runs."""
 
+from collections import ChainMap
 from typing import Any, Dict
 
 from pytest_dsl.core.context import TestContext
@@ -32,9 +33,8 @@ class ExecutionState:
         """Apply caller-provided context variables."""
         if not context:
             return
-        self.variables.update(context)
         for key, value in context.items():
-            self.test_context.set(key, value)
+            self.set_local_variable(key, value)
 
     def set_variable(self, name: str, value: Any) -> str:
         """Set a DSL variable and return the selected scope."""
@@ -46,9 +46,38 @@ class ExecutionState:
         return "local"
 
     def set_local_variable(self, name: str, value: Any) -> None:
-        """Set a local variable and keep TestContext in sync."""
-        self.variables[name] = value
+        """Set a local variable and keep TestContext in sync.
+
+        A TestContext bound to this state mirrors its writes into
+        ``variables`` itself, so the value is stored only once per layer.
+        """
         self.test_context.set(name, value)
+        if not self._context_mirrors_variables():
+            self.variables[name] = value
+
+    def _context_mirrors_variables(self) -> bool:
+        executor = self.test_context.executor
+        return getattr(executor, "state", None) is self
+
+    def fork(self) -> "ExecutionState":
+        """Create a copy-on-write child state for a parallel branch.
+
+        The child reads the parent's variables as they were at fork time and
+        keeps its own assignments to itself until they are merged back.
+        """
+        return ExecutionState(ChainMap({}, self.variables),
+                              self.test_context.fork())
+
+    def captured_variables(self) -> Dict[str, Any]:
+        """Return the local variables assigned since this state was forked."""
+        if isinstance(self.variables, ChainMap):
+            return dict(self.variables.maps[0])
+        return dict(self.variables)
+
+    def merge(self, child: "ExecutionState") -> None:
+        """Apply the variables a forked child state assigned."""
+        for name, value in child.captured_variables().items():
+            self.set_local_variable(name, value)
 
     def clear(self, keep_variables: bool = False) -> None:
         """Clear per-execution variables unless explicitly preserved."""
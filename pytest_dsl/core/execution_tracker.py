@@ -72,8 +72,9 @@ class ExecutionTracker:
         # whose body dispatches inner KeywordCalls).  Without a stack
         # the inner step's finish_current_step would overwrite
         # current_step to None, causing the outer step's finish to
-        # silently no-op.
-        self._step_stack: List[ExecutionStep] = []
+        # silently no-op.  Each thread keeps its own stack so parallel
+        # branches nest their steps independently.
+        self._thread_state = threading.local()
         self.execution_start_time: Optional[float] = None
         self.execution_end_time: Optional[float] = None
         self.callbacks: Dict[str, List[Callable]] = {
@@ -90,6 +91,21 @@ class ExecutionTracker:
         self.completed_steps = 0
         self.failed_steps = 0
 
+    @property
+    def _step_stack(self) -> List[ExecutionStep]:
+        stack = getattr(self._thread_state, 'step_stack', None)
+        if stack is None:
+            stack = self._thread_state.step_stack = []
+        return stack
+
+    def fork_step_stack(self) -> List[ExecutionStep]:
+        """返回当前线程步骤栈的副本，供并行分支在其他线程中继续嵌套"""
+        return list(self._step_stack)
+
+    def adopt_step_stack(self, stack: List[ExecutionStep]):
+        """让当前线程从fork_step_stack返回的步骤栈继续执行"""
+        self._thread_state.step_stack = list(stack)
+
     def register_callback(self, event: str, callback: Callable):
         """注册回调函数
 
@@ -1,13 +1,276 @@
 import os
 import json
+import sqlite3
 import tempfile
-import allure
+import threading
 from typing import Dict, Any, Optional
 from filelock import FileLock
 
+from pytest_dsl.core.reporting import report_attach
+
+
+# 日志超过该大小且超过快照大小时合并回快照，摊销后每次写入仍为O(1)
+JOURNAL_COMPACT_BYTES = 64 * 1024
+
+
+class JSONFileGlobalStore:
+    """基于JSON文件的全局变量存储（默认后端）
+
+    变量由两个文件组成：``global_vars.json`` 是变量快照（JSON对象），
+    同名的 ``.journal`` 文件按行追加快照之后的每次修改。写入在文件锁内
+    只追加一行日志，日志超过快照大小时才合并回快照；快照和日志都以
+    临时文件 + 原子替换的方式整体更新，读取方因此无需加锁。
+
+    进程内缓存整份变量，读取时只通过 ``os.stat`` 检测文件变化：快照或
+    日志被替换时重新加载，日志增长时只读取新追加的部分。
+
+    返回的值与缓存共享，调用方不能原地修改其中的字典或列表；存储自身
+    只替换缓存中的值，不会修改已经返回给调用方的对象。
+    """
+
+    def __init__(self, storage_file: str, lock_file: str):
+        self.storage_file = storage_file
+        self.journal_file = f"{storage_file}.journal"
+        self.lock_file = lock_file
+        self._cache: Dict[str, Any] = {}
+        self._stamp = None
+        self._journal_id = None
+        self._journal_offset = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _stat(path):
+        try:
+            return os.stat(path)
+        except FileNotFoundError:
+            return None
+
+    def _file_stamp(self):
+        stat = self._stat(self.storage_file)
+        if stat is None:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    @property
+    def generation(self):
+        """变量版本：快照被替换或日志追加时随之变化"""
+        journal = self._stat(self.journal_file)
+        journal_stamp = None if journal is None else (
+            journal.st_ino, journal.st_size)
+        return (self._file_stamp(), journal_stamp)
+
+    def _refresh(self) -> Dict[str, Any]:
+        journal = self._stat(self.journal_file)
+        journal_id = None if journal is None else journal.st_ino
+        journal_size = 0 if journal is None else journal.st_size
+        if (self._file_stamp() != self._stamp
+                or journal_id != self._journal_id
+                or journal_size < self._journal_offset):
+            self._reload()
+        elif journal_size > self._journal_offset:
+            self._read_journal()
+        return self._cache
+
+    def _reload(self) -> None:
+        # 先打开日志再读快照：合并时快照先于日志被替换，读到新日志时
+        # 读到的一定是新快照；读到旧日志时重放已合并的修改结果不变
+        try:
+            journal = open(self.journal_file, 'rb')
+        except FileNotFoundError:
+            journal = None
+        try:
+            self._stamp = self._file_stamp()
+            self._cache = self._read_file()
+            self._journal_id = None
+            self._journal_offset = 0
+            if journal is not None:
+                self._journal_id = os.fstat(journal.fileno()).st_ino
+                self._apply_journal(journal)
+        finally:
+            if journal is not None:
+                journal.close()
+
+    def _read_journal(self) -> None:
+        try:
+            with open(self.journal_file, 'rb') as journal:
+                journal.seek(self._journal_offset)
+                self._apply_journal(journal)
+        except FileNotFoundError:
+            self._reload()
+
+    def _apply_journal(self, journal) -> None:
+        """从当前位置重放日志，只处理以换行结束的完整记录"""
+        data = journal.read()
+        end = data.rfind(b'\n') + 1
+        if not end:
+            return
+        variables = self._cache
+        for line in data[:end].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if entry.get('op') == 'delete':
+                variables.pop(entry.get('name'), None)
+            elif entry.get('op') == 'set':
+                variables[entry.get('name')] = entry.get('value')
+        self._journal_offset += end
+
+    def _read_file(self) -> Dict[str, Any]:
+        try:
+            with open(self.storage_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return {}
+
+    def _replace_file(self, path: str, content: str) -> None:
+        tmp_file = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_file, path)
+
+    def _write_file(self, variables: Dict[str, Any]) -> None:
+        """把变量整体写入快照并清空日志（需持有文件锁）"""
+        self._replace_file(self.storage_file,
+                           json.dumps(variables, ensure_ascii=False))
+        self._replace_file(self.journal_file, '')
+        self._cache = variables
+        self._stamp = self._file_stamp()
+        self._journal_id = self._stat(self.journal_file).st_ino
+        self._journal_offset = 0
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        """追加一条日志记录（需持有文件锁且缓存已刷新）"""
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with open(self.journal_file, 'ab') as journal:
+            journal.write(line.encode('utf-8'))
+            self._journal_id = os.fstat(journal.fileno()).st_ino
+            self._journal_offset = journal.tell()
+
+        snapshot = self._stamp[2] if self._stamp else 0
+        if self._journal_offset > max(JOURNAL_COMPACT_BYTES, snapshot):
+            self._write_file(self._cache)
+
+    def get(self, name: str) -> Any:
+        with self._lock:
+            return self._refresh().get(name)
+
+    def has(self, name: str) -> bool:
+        with self._lock:
+            return name in self._refresh()
+
+    def get_all(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._refresh())
+
+    def set(self, name: str, value: Any) -> None:
+        # 先按JSON往返一次，缓存中保存的值与其他进程读到的保持一致
+        value = json.loads(json.dumps(value, ensure_ascii=False))
+        with self._lock, FileLock(self.lock_file):
+            self._refresh()[name] = value
+            self._append({'op': 'set', 'name': name, 'value': value})
+
+    def delete(self, name: str) -> None:
+        with self._lock, FileLock(self.lock_file):
+            variables = self._refresh()
+            if name in variables:
+                del variables[name]
+                self._append({'op': 'delete', 'name': name})
+
+    def clear(self) -> None:
+        with self._lock, FileLock(self.lock_file):
+            self._write_file({})
+
+
+class SQLiteGlobalStore:
+    """基于SQLite WAL的全局变量存储
+
+    每个变量单独一行，写入只更新变化的行。读取时通过
+    ``PRAGMA data_version`` 检测其他进程（如xdist worker）的提交，
+    未变化时直接命中进程内缓存。返回的值与缓存共享，调用方不能原地修改。
+    """
+
+    def __init__(self, database_file: str):
+        self.database_file = database_file
+        self._cache: Dict[str, Any] = {}
+        self._data_version = None
+        # 本连接的写入次数（本连接的提交不会改变 data_version）
+        self._writes = 0
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(database_file, timeout=30,
+                                     check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS global_vars '
+            '(name TEXT PRIMARY KEY, value TEXT NOT NULL)')
+
+    def _refresh(self) -> Dict[str, Any]:
+        data_version = self._conn.execute('PRAGMA data_version').fetchone()[0]
+        if data_version != self._data_version:
+            rows = self._conn.execute('SELECT name, value FROM global_vars')
+            self._cache = {name: json.loads(value) for name, value in rows}
+            self._data_version = data_version
+        return self._cache
+
+    @property
+    def generation(self):
+        """变量版本：其他连接的提交和本连接的写入次数"""
+        with self._lock:
+            data_version = self._conn.execute(
+                'PRAGMA data_version').fetchone()[0]
+            return (data_version, self._writes)
+
+    def get(self, name: str) -> Any:
+        with self._lock:
+            return self._refresh().get(name)
+
+    def has(self, name: str) -> bool:
+        with self._lock:
+            return name in self._refresh()
+
+    def get_all(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self._refresh())
+
+    def set(self, name: str, value: Any) -> None:
+        encoded = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._refresh()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO global_vars (name, value) '
+                'VALUES (?, ?)', (name, encoded))
+            # 本连接自己的提交不会改变 data_version，直接更新缓存
+            self._cache[name] = json.loads(encoded)
+            self._writes += 1
+
+    def delete(self, name: str) -> None:
+        with self._lock:
+            self._refresh()
+            self._conn.execute('DELETE FROM global_vars WHERE name = ?',
+                               (name,))
+            self._cache.pop(name, None)
+            self._writes += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM global_vars')
+            self._cache = {}
+            self._writes += 1
+
 
 class GlobalContext:
-    """全局上下文管理器，支持多进程环境下的变量共享"""
+    """全局上下文管理器，支持多进程环境下的变量共享
+
+    存储后端通过环境变量 PYTEST_DSL_GLOBAL_STORE 选择：
+    - json: (默认) 临时目录下的 global_vars.json
+    - sqlite: 临时目录下的 global_vars.db（WAL模式）
+    也可以通过 set_store() 替换为自定义后端。
+
+    读取到的字典和列表与存储的缓存共享，需要修改时请先复制，再通过
+    set_variable() 写回。
+    """
 
     def __init__(self):
         # 使用临时目录存储全局变量
@@ -17,10 +280,32 @@ class GlobalContext:
         self._storage_file = os.path.join(
             self._storage_dir, "global_vars.json")
         self._lock_file = os.path.join(self._storage_dir, "global_vars.lock")
+        self._store = None
 
         # 初始化变量提供者（延迟加载，避免循环导入）
         self._yaml_provider = None
 
+    @property
+    def store(self):
+        """当前使用的全局变量存储后端（延迟创建）"""
+        if self._store is None:
+            backend = os.environ.get('PYTEST_DSL_GLOBAL_STORE', 'json').lower()
+            if backend == 'sqlite':
+                self._store = SQLiteGlobalStore(
+                    os.path.join(self._storage_dir, "global_vars.db"))
+            else:
+                self._store = JSONFileGlobalStore(
+                    self._storage_file, self._lock_file)
+        return self._store
+
+    def set_store(self, store) -> None:
+        """替换全局变量存储后端
+
+        后端需要提供 get/has/get_all/set/delete/clear 方法，传入 None
+        时恢复为按环境变量选择的默认后端。
+        """
+        self._store = store
+
     def _get_yaml_provider(self):
         """延迟获取YAML变量提供者，避免循环导入"""
         if self._yaml_provider is None:
@@ -34,16 +319,9 @@ class GlobalContext:
 
     def set_variable(self, name: str, value: Any) -> None:
         """设置全局变量"""
-        with FileLock(self._lock_file):
-            variables = self._load_variables()
-            variables[name] = value
-            self._save_variables(variables)
+        self.store.set(name, value)
 
-        allure.attach(
-            f"全局变量: {name}\n值: {value}",
-            name="全局变量设置",
-            attachment_type=allure.attachment_type.TEXT
-        )
+        report_attach("全局变量设置", lambda: f"全局变量: {name}\n值: {value}")
 
     def get_variable(self, name: str) -> Any:
         """获取全局变量，优先从YAML变量中获取"""
@@ -54,9 +332,7 @@ class GlobalContext:
             return yaml_value
 
         # 如果YAML中没有，则从全局变量存储中获取
-        with FileLock(self._lock_file):
-            variables = self._load_variables()
-            return variables.get(name)
+        return self.store.get(name)
 
     def has_variable(self, name: str) -> bool:
         """检查全局变量是否存在（包括YAML变量）"""
@@ -66,54 +342,55 @@ class GlobalContext:
             return True
 
         # 然后检查全局变量存储
-        with FileLock(self._lock_file):
-            variables = self._load_variables()
-            return name in variables
+        return self.store.has(name)
+
+    def lookup_variable(self, name: str, default: Any = None) -> Any:
+        """查找变量（YAML变量优先），不存在时返回default
+
+        与先调用has_variable再调用get_variable相比，每个变量源只读取一次。
+        """
+        yaml_value = self._get_yaml_provider().get_variable(name)
+        if yaml_value is not None:
+            return yaml_value
+
+        store = self.store
+        value = store.get(name)
+        if value is None and not store.has(name):
+            return default
+        return value
+
+    def get_stored_variable(self, name: str) -> Any:
+        """只从全局变量存储中获取变量，不查找YAML变量"""
+        return self.store.get(name)
+
+    def has_stored_variable(self, name: str) -> bool:
+        """只检查全局变量存储，不查找YAML变量"""
+        return self.store.has(name)
+
+    def get_all_stored_variables(self) -> Dict[str, Any]:
+        """获取全局变量存储中的所有变量（字典为副本，值与缓存共享）"""
+        return self.store.get_all()
 
     def delete_variable(self, name: str) -> None:
         """删除全局变量（仅删除存储的变量，不影响YAML变量）"""
-        with FileLock(self._lock_file):
-            variables = self._load_variables()
-            if name in variables:
-                del variables[name]
-                self._save_variables(variables)
+        self.store.delete(name)
 
-        allure.attach(
-            f"删除全局变量: {name}",
-            name="全局变量删除",
-            attachment_type=allure.attachment_type.TEXT
-        )
+        report_attach("全局变量删除", lambda: f"删除全局变量: {name}")
 
     def clear_all(self) -> None:
         """清除所有全局变量（包括YAML变量）"""
-        with FileLock(self._lock_file):
-            self._save_variables({})
+        self.store.clear()
 
         # 清除YAML变量（通过变量提供者）
         yaml_provider = self._get_yaml_provider()
         if hasattr(yaml_provider, 'clear'):
             yaml_provider.clear()
 
-        allure.attach(
-            "清除所有全局变量",
-            name="全局变量清除",
-            attachment_type=allure.attachment_type.TEXT
-        )
+        report_attach("全局变量清除", "清除所有全局变量")
 
     def _load_variables(self) -> Dict[str, Any]:
-        """从文件加载变量"""
-        if not os.path.exists(self._storage_file):
-            return {}
-        try:
-            with open(self._storage_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return {}
-
-    def _save_variables(self, variables: Dict[str, Any]) -> None:
-        """保存变量到文件"""
-        with open(self._storage_file, 'w', encoding='utf-8') as f:
-            json.dump(variables, f, ensure_ascii=False, indent=2)
+        """加载所有存储的变量（兼容旧接口）"""
+        return self.store.get_all()
 
 
 class _EmptyProvider:
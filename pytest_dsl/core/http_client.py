@@ -1,12 +1,31 @@
 import json
 import logging
+import threading
+from http.cookiejar import DefaultCookiePolicy
 from typing import Dict, Any
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from urllib.parse import urljoin
+from urllib3.util.retry import Retry
 from pytest_dsl.core.auth_provider import create_auth_provider
 
 logger = logging.getLogger(__name__)
 
+# DEBUG日志中请求/响应体的最大长度
+LOG_BODY_LIMIT = 2048
+
+# 日志中需要隐藏值的请求头（小写）
+SENSITIVE_HEADERS = frozenset({
+    'authorization', 'x-api-key', 'token', 'api-key', 'cookie'
+})
+
+
+def _truncate_body(text: str) -> str:
+    """截断过长的日志内容"""
+    if len(text) > LOG_BODY_LIMIT:
+        return f"{text[:LOG_BODY_LIMIT]}...<共 {len(text)} 字符>"
+    return text
+
 
 class HTTPClient:
     """HTTP客户端类
@@ -23,7 +42,8 @@ class HTTPClient:
                  session: bool = True,
                  retry: Dict[str, Any] = None,
                  proxies: Dict[str, str] = None,
-                 auth_config: Dict[str, Any] = None):
+                 auth_config: Dict[str, Any] = None,
+                 pool: Dict[str, Any] = None):
         """初始化HTTP客户端
 
         Args:
@@ -33,9 +53,10 @@ class HTTPClient:
             timeout: 默认超时时间(秒)
             verify_ssl: 是否验证SSL证书
             session: 是否启用会话
-            retry: 重试配置
+            retry: 重试配置，在传输层通过urllib3的Retry生效
             proxies: 代理配置
             auth_config: 认证配置
+            pool: 连接池配置（connections/maxsize/block/keep_alive/hosts）
         """
         self.name = name
         self.base_url = base_url
@@ -57,10 +78,109 @@ class HTTPClient:
             if not self.auth_provider:
                 logger.warning(f"无法创建认证提供者: {auth_config}")
 
+        self.pool_config = pool or {}
+        self._pool_maxsize = int(
+            self.pool_config.get('maxsize', DEFAULT_POOLSIZE))
+
         # 创建会话
-        self._session = requests.Session() if self.use_session else None
-        if self.use_session and self.default_headers:
-            self._session.headers.update(self.default_headers)
+        self._session = self._new_session() if self.use_session else None
+
+        # 未启用会话时内部使用的连接池会话（不保存cookie，延迟创建）
+        self._transport = None
+        self._transport_lock = threading.Lock()
+
+    def _build_retry(self):
+        """根据retry配置构建传输层重试策略
+
+        max_retries/connect/read 都未配置时返回0，即不重试。状态码重试
+        不抛出异常，而是返回最后一次响应，交给断言处理。
+        """
+        retry = self.retry_config
+        max_retries = int(retry.get('max_retries') or 0)
+        connect = retry.get('connect')
+        read = retry.get('read')
+        total = max(max_retries, int(connect or 0), int(read or 0))
+        if total <= 0:
+            return 0
+
+        retry_kwargs = {
+            'total': total,
+            'connect': connect,
+            'read': read,
+            'status_forcelist': retry.get('retry_on_status',
+                                          [500, 502, 503, 504]),
+            'backoff_factor': retry.get('backoff_factor',
+                                        retry.get('retry_interval', 0)),
+            'raise_on_status': False,
+        }
+        if 'allowed_methods' in retry:
+            retry_kwargs['allowed_methods'] = [
+                method.upper() for method in retry['allowed_methods']]
+        return Retry(**retry_kwargs)
+
+    def _build_adapter(self, max_retries, **overrides) -> HTTPAdapter:
+        """创建连接池适配器，overrides可覆盖connections/maxsize/block"""
+        settings = {
+            'connections': self.pool_config.get('connections',
+                                                DEFAULT_POOLSIZE),
+            'maxsize': self._pool_maxsize,
+            'block': self.pool_config.get('block', False),
+        }
+        settings.update(overrides)
+        return HTTPAdapter(pool_connections=int(settings['connections']),
+                           pool_maxsize=int(settings['maxsize']),
+                           pool_block=bool(settings['block']),
+                           max_retries=max_retries)
+
+    def _mount_adapters(self, session: requests.Session) -> None:
+        """按连接池和重试配置挂载适配器，hosts中的前缀使用独立的连接池"""
+        max_retries = self._build_retry()
+        adapter = self._build_adapter(max_retries)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        for prefix, host_pool in (self.pool_config.get('hosts') or {}).items():
+            session.mount(prefix,
+                          self._build_adapter(max_retries, **host_pool))
+
+    def _new_session(self, persistent: bool = True) -> requests.Session:
+        """创建挂载了连接池适配器的会话
+
+        Args:
+            persistent: 为False时创建内部传输会话，不应用默认请求头，
+                也不在请求之间保存cookie，行为与 requests.request 一致
+        """
+        session = requests.Session()
+        self._mount_adapters(session)
+        if not self.pool_config.get('keep_alive', True):
+            session.headers['Connection'] = 'close'
+        if persistent:
+            if self.default_headers:
+                session.headers.update(self.default_headers)
+        else:
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    def _get_transport(self) -> requests.Session:
+        """获取未启用会话时使用的内部连接池会话"""
+        if self._transport is None:
+            with self._transport_lock:
+                if self._transport is None:
+                    self._transport = self._new_session(persistent=False)
+        return self._transport
+
+    def ensure_pool_size(self, size: int) -> None:
+        """确保连接池至少能同时保留size个连接
+
+        连接池默认每个主机只保留10个连接（可通过pool.maxsize配置），并发数
+        超过时多出的连接用完即丢弃。批量并发请求前调用本方法，使并发连接
+        都能被复用。hosts中单独配置的主机连接池保持不变。
+        """
+        if size <= self._pool_maxsize:
+            return
+        self._pool_maxsize = size
+        for session in (self._session, self._transport):
+            if session is not None:
+                self._mount_adapters(session)
 
     def reset_session(self):
         """完全重置会话对象，创建一个新的会话实例
@@ -72,12 +192,8 @@ class HTTPClient:
             if self._session:
                 self._session.close()
 
-            # 创建新会话
-            self._session = requests.Session()
-
-            # 重新应用默认头
-            if self.default_headers:
-                self._session.headers.update(self.default_headers)
+            # 创建新会话（重新应用默认头和连接池配置）
+            self._session = self._new_session()
 
             logger.debug(f"会话已完全重置: {self.name}")
 
@@ -133,23 +249,9 @@ class HTTPClient:
             request_kwargs = self.auth_provider.pre_request_hook(
                 method, url, request_kwargs)
 
-        # 记录请求详情
-        logger.debug("=== HTTP请求详情 ===")
-        logger.debug(f"方法: {method}")
-        logger.debug(f"URL: {url}")
-        if 'headers' in request_kwargs:
-            safe_headers = {k: '***' if k.lower() in ['authorization', 'x-api-key', 'token'] else v
-                            for k, v in request_kwargs['headers'].items()}
-            logger.debug(
-                f"请求头: {json.dumps(safe_headers, indent=2, ensure_ascii=False)}")
-        if 'params' in request_kwargs:
-            logger.debug(
-                f"查询参数: {json.dumps(request_kwargs['params'], indent=2, ensure_ascii=False)}")
-        if 'json' in request_kwargs:
-            logger.debug(
-                f"JSON请求体: {json.dumps(request_kwargs['json'], indent=2, ensure_ascii=False)}")
-        if 'data' in request_kwargs:
-            logger.debug(f"表单数据: {request_kwargs['data']}")
+        # 记录请求详情（仅在DEBUG级别启用时才格式化）
+        if logger.isEnabledFor(logging.DEBUG):
+            self._log_request(method, url, request_kwargs)
 
         # 为超时设置默认值
         if 'timeout' not in request_kwargs:
@@ -168,32 +270,20 @@ class HTTPClient:
             if self.use_session:
                 if self._session is None:
                     logger.warning("会话对象为空，创建新会话")
-                    self._session = requests.Session()
-                    if self.default_headers:
-                        self._session.headers.update(self.default_headers)
+                    self._session = self._new_session()
                 response = self._session.request(method, url, **request_kwargs)
             else:
-                response = requests.request(method, url, **request_kwargs)
-
-            # 记录响应详情
-            logger.debug("\n=== HTTP响应详情 ===")
-            logger.debug(f"状态码: {response.status_code}")
-            logger.debug(
-                f"响应头: {json.dumps(dict(response.headers), indent=2, ensure_ascii=False)}")
-            try:
-                if 'application/json' in response.headers.get('Content-Type', ''):
-                    logger.debug(
-                        f"响应体 (JSON): {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
-                else:
-                    logger.debug(f"响应体: {response.text}")
-            except Exception as e:
-                logger.debug(f"解析响应体失败: {str(e)}")
-                logger.debug(f"原始响应体: {response.text}")
+                response = self._get_transport().request(
+                    method, url, **request_kwargs)
 
             # 添加响应时间
             if not hasattr(response, 'elapsed_ms'):
                 response.elapsed_ms = response.elapsed.total_seconds() * 1000
 
+            # 记录响应详情（仅在DEBUG级别启用时才格式化）
+            if logger.isEnabledFor(logging.DEBUG):
+                self._log_response(response)
+
             # 调用认证提供者的响应处理钩子
             if self.auth_provider and not disable_auth:
                 self.auth_provider.post_response_hook(response, request_kwargs)
@@ -213,61 +303,71 @@ class HTTPClient:
     def _log_request(self, method: str, url: str, request_kwargs: Dict[str, Any]) -> None:
         """记录请求信息
 
+        只应在DEBUG级别启用时调用，请求体超过 LOG_BODY_LIMIT 时截断。
+
         Args:
             method: HTTP方法
             url: 请求URL
             request_kwargs: 请求参数
         """
-        logger.info(f"发送 {method} 请求到 {url}")
+        logger.debug(f"发送 {method} 请求到 {url}")
 
         # 打印请求头 (排除敏感信息)
-        headers = request_kwargs.get("headers", {})
-        safe_headers = headers.copy()
-
-        for key in headers:
-            if key.lower() in ["authorization", "x-api-key", "token", "api-key"]:
-                safe_headers[key] = "***REDACTED***"
-
-        logger.debug(f"请求头: {safe_headers}")
+        headers = request_kwargs.get("headers")
+        if headers:
+            safe_headers = {
+                k: '***' if k.lower() in SENSITIVE_HEADERS else v
+                for k, v in headers.items()}
+            logger.debug(f"请求头: {safe_headers}")
 
         # 打印查询参数
         if request_kwargs.get("params"):
             logger.debug(f"查询参数: {request_kwargs['params']}")
 
         # 打印请求体
-        if request_kwargs.get("json"):
-            logger.debug(
-                f"JSON请求体: {json.dumps(request_kwargs['json'], ensure_ascii=False)}")
+        if request_kwargs.get("json") is not None:
+            body = json.dumps(request_kwargs['json'], ensure_ascii=False,
+                              default=str)
+            logger.debug(f"JSON请求体: {_truncate_body(body)}")
         elif request_kwargs.get("data"):
-            logger.debug(f"表单数据: {request_kwargs['data']}")
+            logger.debug(
+                f"表单数据: {_truncate_body(str(request_kwargs['data']))}")
 
         # 打印文件信息
         if request_kwargs.get("files"):
-            file_info = {
-                k: f"<文件: {getattr(v, 'name', '未知文件')}>" for k, v in request_kwargs["files"].items()}
+            files = request_kwargs["files"]
+            if isinstance(files, dict):
+                file_info = {
+                    k: f"<文件: {getattr(v, 'name', '未知文件')}>"
+                    for k, v in files.items()}
+            else:
+                file_info = f"<{len(files)} 个文件>"
             logger.debug(f"上传文件: {file_info}")
 
     def _log_response(self, response: requests.Response) -> None:
         """记录响应信息
 
+        只应在DEBUG级别启用时调用。直接截取已读取的响应字节，
+        不重新解析JSON，也不解码完整的响应体。
+
         Args:
             response: 响应对象
         """
-        logger.info(
-            f"收到响应: {response.status_code} {response.reason} ({response.elapsed_ms:.2f}ms)")
+        logger.debug(
+            f"收到响应: {response.status_code} {response.reason} "
+            f"({response.elapsed_ms:.2f}ms)")
 
         # 打印响应头
         logger.debug(f"响应头: {dict(response.headers)}")
 
-        # 尝试打印响应体
+        # 打印响应体（截断）
         try:
-            if 'application/json' in response.headers.get('Content-Type', ''):
-                logger.debug(
-                    f"响应体 (JSON): {json.dumps(response.json(), ensure_ascii=False)}")
-            elif len(response.content) < 1024:  # 只打印小响应
-                logger.debug(f"响应体: {response.text}")
-            else:
-                logger.debug(f"响应体: <{len(response.content)} 字节>")
+            content = response.content or b''
+            preview = content[:LOG_BODY_LIMIT].decode(
+                response.encoding or 'utf-8', errors='replace')
+            if len(content) > LOG_BODY_LIMIT:
+                preview += f"...<共 {len(content)} 字节>"
+            logger.debug(f"响应体: {preview}")
         except Exception as e:
             logger.debug(f"无法打印响应体: {str(e)}")
 
@@ -276,6 +376,9 @@ class HTTPClient:
         if self._session:
             self._session.close()
             self._session = None
+        if self._transport:
+            self._transport.close()
+            self._transport = None
 
 
 class HTTPClientManager:
@@ -333,7 +436,8 @@ class HTTPClientManager:
             session=config.get("session", True),
             retry=config.get("retry", None),
             proxies=config.get("proxies", None),
-            auth_config=config.get("auth", None)  # 获取认证配置
+            auth_config=config.get("auth", None),  # 获取认证配置
+            pool=config.get("pool", None)
         )
         return client
 
@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 import re
@@ -37,6 +38,21 @@ DUAL_PURPOSE = {
     "endswith"
 }
 
+# 进程级编译表达式缓存的容量
+EXPRESSION_CACHE_SIZE = 512
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_jsonpath(path: str):
+    """编译JSONPath表达式（带LRU缓存）"""
+    return jsonpath.parse(path)
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_regex(pattern: str):
+    """编译正则表达式（带LRU缓存）"""
+    return re.compile(pattern)
+
 
 class HTTPRequest:
     """HTTP请求处理类
@@ -58,6 +74,9 @@ class HTTPRequest:
         self.session_name = session_name
         self.response = None
         self.captured_values = {}
+        # 当前响应的解码结果缓存（JSON、文本、HTML树），响应对象变化时失效
+        self._memo_response = None
+        self._response_memo = {}
 
     def execute(self, disable_auth: bool = False) -> Response:
         """执行HTTP请求
@@ -68,6 +87,31 @@ class HTTPRequest:
         Returns:
             Response对象
         """
+        client, method, url, request_kwargs = self.prepare(disable_auth)
+
+        # 使用Allure记录请求信息
+        self._log_request_to_allure(method, url, request_kwargs)
+
+        try:
+            # 发送请求
+            response = client.make_request(method, url, **request_kwargs)
+        except Exception as e:
+            self._raise_request_error(e, method, url)
+
+        return self.handle_response(response)
+
+    def prepare(self, disable_auth: bool = False):
+        """解析配置，获取客户端并构建请求参数
+
+        只读取配置和客户端管理器，不发送请求，也不写Allure报告，
+        因此批量请求可以先在调用线程中准备好，再把发送交给工作线程。
+
+        Args:
+            disable_auth: 是否禁用认证
+
+        Returns:
+            (client, method, url, request_kwargs) 元组
+        """
         # 获取HTTP客户端
         if self.session_name:
             client = http_client_manager.get_session(
@@ -116,12 +160,22 @@ class HTTPRequest:
         request_kwargs = {k: v for k,
                           v in request_kwargs.items() if v is not None}
 
-        # 使用Allure记录请求信息
-        self._log_request_to_allure(method, url, request_kwargs)
+        return client, method, url, request_kwargs
 
+    def handle_response(self, response: Response) -> Response:
+        """记录响应并处理捕获
+
+        Args:
+            response: 已收到的响应对象
+
+        Returns:
+            Response对象
+        """
+        method = self.config.get('method', 'GET').upper()
+        url = self.config.get('url', '')
         try:
-            # 发送请求
-            self.response = client.make_request(method, url, **request_kwargs)
+            self.response = response
+            self._reset_response_memo()
 
             # 使用Allure记录响应信息
             self._log_response_to_allure(self.response)
@@ -143,7 +197,12 @@ class HTTPRequest:
                 )
 
             return self.response
-        except requests.exceptions.RequestException as e:
+        except Exception as e:
+            self._raise_request_error(e, method, url)
+
+    def _raise_request_error(self, e: Exception, method: str, url: str):
+        """将请求过程中的异常记录到Allure并转换为ValueError"""
+        if isinstance(e, requests.exceptions.RequestException):
             # 记录请求异常到Allure
             error_message = f"请求异常: {str(e)}"
             allure.attach(
@@ -154,17 +213,56 @@ class HTTPRequest:
 
             # 重新抛出更有意义的异常
             raise ValueError(f"HTTP请求失败: {str(e)}") from e
-        except Exception as e:
-            # 捕获所有其他异常
-            error_message = f"未预期的异常: {type(e).__name__}: {str(e)}"
-            allure.attach(
-                error_message,
-                name=f"HTTP请求执行错误: {method} {url}",
-                attachment_type=allure.attachment_type.TEXT
-            )
 
-            # 重新抛出异常
-            raise ValueError(f"HTTP请求执行错误: {str(e)}") from e
+        # 捕获所有其他异常
+        error_message = f"未预期的异常: {type(e).__name__}: {str(e)}"
+        allure.attach(
+            error_message,
+            name=f"HTTP请求执行错误: {method} {url}",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+        # 重新抛出异常
+        raise ValueError(f"HTTP请求执行错误: {str(e)}") from e
+
+    def _reset_response_memo(self):
+        """清空响应解码缓存（重新发送请求后调用）"""
+        self._memo_response = self.response
+        self._response_memo = {}
+
+    def _memoized(self, key: str, factory):
+        """按当前响应对象缓存解码结果
+
+        同一个响应的多次捕获和断言只解码一次。缓存与响应对象绑定，
+        响应被替换（例如断言重试时重新发送请求）后自动失效。
+        解码失败不会被缓存，每次调用都会重新抛出异常。
+        """
+        if self._memo_response is not self.response:
+            self._reset_response_memo()
+        memo = self._response_memo
+        if key not in memo:
+            memo[key] = factory()
+        return memo[key]
+
+    def _response_json(self) -> Any:
+        """获取解码后的JSON响应体（按响应缓存）"""
+        return self._memoized('json', self.response.json)
+
+    def _response_text(self) -> str:
+        """获取响应文本（按响应缓存）"""
+        return self._memoized('text', lambda: self.response.text)
+
+    def _response_html_tree(self):
+        """获取解析后的HTML/XML树（按响应缓存）"""
+        return self._memoized('html_tree', lambda: etree.fromstring(
+            self.response.content, etree.HTMLParser()))
+
+    def _response_regex_text(self) -> str:
+        """获取正则提取使用的文本，JSON响应使用紧凑序列化后的文本"""
+        if 'application/json' in self.response.headers.get('Content-Type', ''):
+            return self._memoized(
+                'json_text', lambda: json.dumps(self._response_json()))
+        return self._response_text()
 
     def _ensure_response_exists(self, operation: str = "处理"):
         """确保响应对象存在
@@ -865,9 +963,10 @@ class HTTPRequest:
             elif extractor_type == "status":
                 return self.response.status_code
             elif extractor_type == "body":
-                if isinstance(self.response.text, str):
-                    return self.response.text
-                return str(self.response.text)
+                text = self._response_text()
+                if isinstance(text, str):
+                    return text
+                return str(text)
             elif extractor_type == "response_time":
                 return self.response.elapsed.total_seconds() * 1000
             else:
@@ -895,9 +994,9 @@ class HTTPRequest:
             提取的值
         """
         try:
-            json_data = self.response.json()
+            json_data = self._response_json()
 
-            jsonpath_expr = jsonpath.parse(path)
+            jsonpath_expr = compile_jsonpath(path)
             matches = [match.value for match in jsonpath_expr.find(json_data)]
 
             if not matches:
@@ -922,9 +1021,8 @@ class HTTPRequest:
             提取的值
         """
         try:
-            # 尝试解析响应内容
-            parser = etree.HTMLParser()
-            tree = etree.fromstring(self.response.content, parser)
+            # 解析响应内容（同一响应只解析一次）
+            tree = self._response_html_tree()
 
             # 执行XPath
             result = tree.xpath(path)
@@ -952,18 +1050,15 @@ class HTTPRequest:
         """
         try:
             # 如果响应是JSON格式，先转换为字符串
-            if 'application/json' in self.response.headers.get('Content-Type', ''):
-                text = json.dumps(self.response.json())
-            else:
-                text = self.response.text
+            text = self._response_regex_text()
 
             # 检查正则表达式是否包含捕获组
-            compiled_pattern = re.compile(pattern)
+            compiled_pattern = compile_regex(pattern)
             has_groups = compiled_pattern.groups > 0
 
             if has_groups:
                 # 如果有捕获组，只返回第一个匹配的捕获组内容
-                first_match = re.search(pattern, text)
+                first_match = compiled_pattern.search(text)
                 if not first_match:
                     return default_value
 
@@ -976,7 +1071,7 @@ class HTTPRequest:
                     return first_match.groups()
             else:
                 # 如果没有捕获组，使用findall获取所有完整匹配
-                matches = re.findall(pattern, text)
+                matches = compiled_pattern.findall(text)
 
                 if not matches:
                     return default_value
@@ -1122,9 +1217,9 @@ class HTTPRequest:
                     actual_value = str(
                         actual_value) if actual_value is not None else ""
                 try:
-                    import re
                     pattern = str(expected_value)
-                    match_result = bool(re.search(pattern, actual_value))
+                    match_result = bool(
+                        compile_regex(pattern).search(actual_value))
                     attach_verbose(
                         "正则表达式匹配",
                         f"正则表达式匹配结果: {'成功' if match_result else '失败'}\n"
@@ -1242,9 +1337,8 @@ class HTTPRequest:
                 actual_value = str(
                     actual_value) if actual_value is not None else ""
             try:
-                import re
                 pattern = str(expected_value)
-                match_result = bool(re.search(pattern, actual_value))
+                match_result = bool(compile_regex(pattern).search(actual_value))
                 attach_verbose(
                     "正则表达式匹配",
                     f"正则表达式匹配结果: {'成功' if match_result else '失败'}\n"
@@ -1355,8 +1449,10 @@ class HTTPRequest:
         response_details.append("Body:")
         try:
             if 'application/json' in response.headers.get('Content-Type', ''):
+                body = (self._response_json() if response is self.response
+                        else response.json())
                 response_details.append(json.dumps(
-                    response.json(), indent=2, ensure_ascii=False))
+                    body, indent=2, ensure_ascii=False))
             elif len(response.content) < 10240:  # 限制大小
                 response_details.append(response.text)
             else:
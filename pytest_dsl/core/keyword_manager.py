@@ -1,7 +1,8 @@
 from typing import Dict, Any, Callable, List, Optional, Set, Union, get_args, get_origin
 import functools
 import inspect
-import allure
+
+from pytest_dsl.core.reporting import report_attach, report_step
 
 
 class Parameter:
@@ -25,9 +26,59 @@ class ReturnSpec:
         }
 
 
+class KeywordRegistry(dict):
+    """关键字注册表，注册、替换或删除关键字时递增版本号
+
+    DSL调用点据此缓存关键字信息和参数校验结果，版本号变化后重新解析。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.generation = 0
+
+    def _changed(self):
+        self.generation += 1
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._changed()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self._changed()
+        return result
+
+
 class KeywordManager:
     def __init__(self):
-        self._keywords: Dict[str, Dict] = {}
+        self._keywords: Dict[str, Dict] = KeywordRegistry()
         self.current_context = None
         # 支持多级分类的中文分类系统
         self._predefined_categories = {
@@ -80,7 +131,7 @@ class KeywordManager:
                 # 检查是否已经在DSL执行器的步骤中，避免重复记录
                 skip_logging = kwargs.pop('skip_logging', False)
 
-                with allure.step(f"{step_name}"):
+                with report_step(f"{step_name}"):
                     try:
                         result = func(**kwargs)
                         if not skip_logging:
@@ -362,6 +413,11 @@ class KeywordManager:
 
         return keyword_info['func'](**final_params)
 
+    @property
+    def generation(self) -> int:
+        """关键字注册表的版本号"""
+        return self._keywords.generation
+
     def get_keyword_info(self, keyword_name: str) -> Dict:
         """获取关键字信息"""
         keyword_info = self._keywords.get(keyword_name)
@@ -523,19 +579,18 @@ class KeywordManager:
     def _log_execution(self, keyword_name: str, params: Dict,
                        result: Any) -> None:
         """记录关键字执行结果"""
-        allure.attach(
-            f"参数: {params}\n返回值: {result}",
-            name=f"关键字 {keyword_name} 执行详情",
-            attachment_type=allure.attachment_type.TEXT
+        report_attach(
+            f"关键字 {keyword_name} 执行详情",
+            lambda: f"参数: {params}\n返回值: {result}",
         )
 
     def _log_failure(self, keyword_name: str, params: Dict,
                      error: Exception) -> None:
         """记录关键字执行失败"""
-        allure.attach(
-            f"参数: {params}\n异常: {str(error)}",
-            name=f"关键字 {keyword_name} 执行失败",
-            attachment_type=allure.attachment_type.TEXT
+        report_attach(
+            f"关键字 {keyword_name} 执行失败",
+            lambda: f"参数: {params}\n异常: {str(error)}",
+            error=True,
         )
 
     def generate_docs(self) -> str:
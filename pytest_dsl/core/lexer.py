@@ -9,6 +9,8 @@ reserved = {
     'every': 'EVERY',  # 重试间隔
     'until': 'UNTIL',  # 重试成功条件
     'times': 'RETRY_TIMES',  # 可读性修饰词: retry 3 times
+    'parallel': 'PARALLEL',  # 并行块
+    'with': 'WITH',  # 并行循环并发数: parallel for ... with max 5
     'for': 'FOR',
     'in': 'IN',
     'range': 'RANGE',
@@ -297,8 +299,20 @@ def t_error(t):
 
 # 模块接口
 
+# 进程级词法分析器模板：只在首次使用时编译一次正则，之后每次解析克隆一份
+_lexer_template = None
+
 
 def get_lexer():
-    lexer = lex.lex()
+    """获取一个新的词法分析器实例。
+
+    正则规则只在进程内编译一次，返回的是模板的克隆，
+    因此每次解析都拥有独立的输入缓冲区、行号和错误列表。
+    """
+    global _lexer_template
+    if _lexer_template is None:
+        _lexer_template = lex.lex()
+    lexer = _lexer_template.clone()
+    lexer.lineno = 1
     lexer.dsl_errors = []
     return lexer
@@ -1,5 +1,8 @@
+import functools
+import os
 import sys
 import re
+import threading
 
 import ply.yacc as yacc
 from pytest_dsl.core.lexer import tokens
@@ -14,6 +17,11 @@ class Node:
         self.line_number = line_number  # 添加行号信息
         self.column = column  # 添加列号信息
 
+    def __getstate__(self):
+        # 执行期附加的缓存（以下划线开头，如关键字调用点）不写入AST磁盘缓存
+        return {key: value for key, value in self.__dict__.items()
+                if not key.startswith('_')}
+
     def set_position(self, line_number, column=None):
         """设置节点位置信息"""
         self.line_number = line_number
@@ -163,6 +171,7 @@ def p_statement(p):
                 | remote_keyword_call
                 | loop
                 | retry_statement
+                | parallel_statement
                 | custom_keyword
                 | return_statement
                 | if_statement
@@ -350,6 +359,38 @@ def p_retry_statement(p):
     p[0] = Node('Retry', [count_expr, interval_expr, until_expr, body], line_number=line_number)
 
 
+def p_parallel_statement(p):
+    '''parallel_statement : PARALLEL DO statements END
+                          | PARALLEL FOR ID IN parallel_source DO statements END
+                          | PARALLEL FOR ID IN parallel_source WITH ID expression DO statements END'''  # noqa: E501
+    line_number = getattr(p.slice[1], 'lineno', None)
+
+    if len(p) == 5:
+        # 并行块: parallel do ... end，块内每条语句是一个分支
+        p[0] = Node('Parallel', [p[3]], line_number=line_number)
+    elif len(p) == 9:
+        # 并行循环: parallel for item in list do ... end
+        p[0] = Node('ParallelFor', [p[5], None, p[7]], p[3],
+                    line_number=line_number)
+    else:
+        # 限制并发数: parallel for item in list with max 5 do ... end
+        if p[7] != 'max':
+            _parse_errors.append(_build_syntax_error(p.slice[7]))
+        # children 顺序: [遍历集合, 最大并发数/None, 语句块]
+        p[0] = Node('ParallelFor', [p[5], p[8], p[10]], p[3],
+                    line_number=line_number)
+
+
+def p_parallel_source(p):
+    '''parallel_source : RANGE LPAREN expression COMMA expression RPAREN
+                       | expression'''
+    if len(p) == 7:
+        p[0] = Node('Range', [p[3], p[5]],
+                    line_number=getattr(p.slice[1], 'lineno', None))
+    else:
+        p[0] = p[1]
+
+
 def p_retry_modifiers(p):
     '''retry_modifiers : retry_modifier retry_modifiers
                        | retry_modifier
@@ -645,7 +686,18 @@ def p_unary_expr(p):
 # 全局变量用于存储解析错误
 _parse_errors = []
 _parse_source = ""
+_parser = None
 _expression_parser = None
+_parser_lock = threading.RLock()
+
+# 随包发布的预生成解析表（由 build_parse_tables() 生成）。
+# PLY 会校验表中的语法签名，语法变化后表失效时在内存中重新生成，
+# 但绝不会写回当前工作目录。
+PARSE_TABLE_MODULE = 'dsl_parsetab'
+EXPRESSION_PARSE_TABLE_MODULE = 'dsl_expression_parsetab'
+
+# ${...} 占位符表达式解析结果缓存的最大条目数
+EXPRESSION_CACHE_SIZE = 4096
 
 
 TOKEN_LABELS = {
@@ -678,7 +730,7 @@ TOKEN_LABELS = {
 }
 
 BLOCK_START_PATTERN = re.compile(
-    r'^\s*(if|for|retry|function|teardown)\b.*\bdo\b'
+    r'^\s*(if|for|retry|parallel|function|teardown)\b.*\bdo\b'
 )
 BLOCK_END_PATTERN = re.compile(r'^\s*end\b')
 
@@ -933,8 +985,33 @@ def p_error(p):
         _parse_errors.append(_build_syntax_error(eof=True))
 
 
+def _build_parser(tabmodule, start=None, debug=False):
+    return yacc.yacc(
+        module=sys.modules[__name__],
+        start=start,
+        tabmodule=tabmodule,
+        debug=debug,
+        write_tables=False,
+        errorlog=yacc.PlyLogger(sys.stderr) if debug else yacc.NullLogger()
+    )
+
+
 def get_parser(debug=False):
-    return yacc.yacc(debug=debug)
+    """获取进程内共享的 DSL parser。
+
+    首次调用时加载随包发布的解析表，后续调用直接复用同一个实例。
+    """
+    global _parser
+
+    if debug:
+        return _build_parser(PARSE_TABLE_MODULE, debug=True)
+
+    if _parser is None:
+        with _parser_lock:
+            if _parser is None:
+                _parser = _build_parser(PARSE_TABLE_MODULE)
+
+    return _parser
 
 
 def get_expression_parser(debug=False):
@@ -942,20 +1019,44 @@ def get_expression_parser(debug=False):
     global _expression_parser
 
     if debug:
-        return yacc.yacc(module=sys.modules[__name__], start='expression',
-                         debug=debug, write_tables=False)
+        return _build_parser(EXPRESSION_PARSE_TABLE_MODULE,
+                             start='expression', debug=True)
 
     if _expression_parser is None:
-        _expression_parser = yacc.yacc(
+        with _parser_lock:
+            if _expression_parser is None:
+                _expression_parser = _build_parser(
+                    EXPRESSION_PARSE_TABLE_MODULE, start='expression')
+
+    return _expression_parser
+
+
+def build_parse_tables(outputdir=None):
+    """重新生成随包发布的解析表模块。
+
+    修改语法规则后需要调用一次并提交生成的文件::
+
+        python -c "from pytest_dsl.core.parser import build_parse_tables; build_parse_tables()"
+
+    Args:
+        outputdir: 输出目录，默认为本模块所在目录
+    """
+    outputdir = outputdir or os.path.dirname(os.path.abspath(__file__))
+    for tabmodule, start in ((PARSE_TABLE_MODULE, None),
+                             (EXPRESSION_PARSE_TABLE_MODULE, 'expression')):
+        stale = os.path.join(outputdir, tabmodule + '.py')
+        if os.path.exists(stale):
+            os.remove(stale)
+        yacc.yacc(
             module=sys.modules[__name__],
-            start='expression',
+            start=start,
+            tabmodule=tabmodule,
+            outputdir=outputdir,
             debug=False,
-            write_tables=False,
+            write_tables=True,
             errorlog=yacc.NullLogger()
         )
 
-    return _expression_parser
-
 
 def parse_with_error_handling(content, lexer=None):
     """带错误处理的解析函数
@@ -968,19 +1069,20 @@ def parse_with_error_handling(content, lexer=None):
         tuple: (AST节点, 错误列表)
     """
     global _parse_errors, _parse_source
-    _parse_errors = []  # 清空之前的错误
-    _parse_source = content
 
     if lexer is None:
         from pytest_dsl.core.lexer import get_lexer
         lexer = get_lexer()
 
-    _prepare_lexer(lexer)
     parser = get_parser()
-    ast = parser.parse(content, lexer=lexer)
+    with _parser_lock:
+        _parse_errors = []  # 清空之前的错误
+        _parse_source = content
+        _prepare_lexer(lexer)
+        ast = parser.parse(content, lexer=lexer)
 
-    # 返回AST和错误列表
-    return ast, _merge_parse_and_lexer_errors(lexer, content)
+        # 返回AST和错误列表
+        return ast, _merge_parse_and_lexer_errors(lexer, content)
 
 
 def parse_expression_fragment(content, lexer=None):
@@ -994,17 +1096,40 @@ def parse_expression_fragment(content, lexer=None):
         tuple: (表达式AST节点, 错误列表)
     """
     global _parse_errors, _parse_source
-    _parse_errors = []
-    _parse_source = content
 
     if lexer is None:
         from pytest_dsl.core.lexer import get_lexer
         lexer = get_lexer()
 
-    _prepare_lexer(lexer)
     parser = get_expression_parser()
-    ast = parser.parse(content, lexer=lexer)
-    return ast, _merge_parse_and_lexer_errors(lexer, content)
+    with _parser_lock:
+        _parse_errors = []
+        _parse_source = content
+        _prepare_lexer(lexer)
+        ast = parser.parse(content, lexer=lexer)
+        return ast, _merge_parse_and_lexer_errors(lexer, content)
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _parse_expression_cached(content):
+    ast, errors = parse_expression_fragment(content)
+    return ast, tuple(errors)
+
+
+def parse_expression_cached(content):
+    """带LRU缓存的 parse_expression_fragment。
+
+    同一段占位符文本只解析一次，返回的表达式AST在调用方之间共享，
+    调用方不得修改它。
+
+    Args:
+        content: 表达式内容，不包含外层 ``${`` 和 ``}``
+
+    Returns:
+        tuple: (表达式AST节点, 错误列表)
+    """
+    ast, errors = _parse_expression_cached(content)
+    return ast, list(errors)
 
 # 定义远程关键字调用的语法规则
 
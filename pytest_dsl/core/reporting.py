@@ -4,6 +4,9 @@ import contextlib
 import io
 import json
 import os
+import threading
+import time
+from collections import Counter
 from typing import Any, Callable, Dict, Iterable, Optional, TypeVar
 
 import allure
@@ -30,6 +33,18 @@ SENSITIVE_KEY_PARTS = (
 T = TypeVar("T")
 DEFAULT_PRINT_MAX_CHARS = 2000
 
+# Allure reporting level for DSL execution bookkeeping:
+#   full    - (default) one step per statement/keyword/parameter plus attachments
+#   summary - no per-step Allure calls; one structured attachment per test
+#   off     - no execution bookkeeping in Allure at all
+REPORT_LEVEL_ENV = "PYTEST_DSL_REPORT_LEVEL"
+REPORT_LEVELS = ("off", "summary", "full")
+SUMMARY_ATTACHMENT_NAME = "DSL执行摘要"
+SUMMARY_MAX_ERRORS = 20
+
+_NO_STEP = contextlib.nullcontext()
+_summary_state = threading.local()
+
 
 def is_verbose() -> bool:
     """Return whether detailed DSL diagnostics should be emitted."""
@@ -46,6 +61,142 @@ def _truthy_env(name: str) -> bool:
     return value in {"1", "true", "yes", "y", "on"}
 
 
+def report_level() -> str:
+    """Return the active DSL reporting level (off / summary / full)."""
+    value = os.getenv(REPORT_LEVEL_ENV, "").strip().lower()
+    return value if value in REPORT_LEVELS else "full"
+
+
+def report_step(title, summary_key: str = None):
+    """Open an Allure step according to the reporting level.
+
+    ``title`` may be a callable so the text is only built in full mode. In
+    summary mode the step is counted under ``summary_key`` (if given).
+    """
+    level = report_level()
+    if level == "full":
+        return allure.step(title() if callable(title) else title)
+    if level == "summary" and summary_key is not None:
+        summary = current_report_summary()
+        if summary is not None:
+            summary.count_step(summary_key)
+    return _NO_STEP
+
+
+def report_attach(name: str, details, error: bool = False) -> None:
+    """Attach text according to the reporting level.
+
+    ``details`` may be a callable so formatting is skipped unless needed.
+    Summary mode keeps error details (``error=True``) in the test summary
+    and only counts other attachments.
+    """
+    level = report_level()
+    if level == "full":
+        allure.attach(
+            details() if callable(details) else details,
+            name=name,
+            attachment_type=allure.attachment_type.TEXT,
+        )
+        return
+    if level == "summary":
+        summary = current_report_summary()
+        if summary is None:
+            return
+        if error:
+            summary.add_error(name, details() if callable(details) else details)
+        else:
+            summary.count_attachment(name)
+
+
+class ReportSummary:
+    """Execution counters collected for one test in summary mode."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.steps = Counter()
+        self.attachments = Counter()
+        self.errors = []
+        self.dropped_errors = 0
+        self.depth = 0
+        # Parallel DSL branches report into the same summary
+        self._lock = threading.Lock()
+
+    def count_step(self, key: str) -> None:
+        with self._lock:
+            self.steps[key] += 1
+
+    def count_attachment(self, name: str) -> None:
+        with self._lock:
+            self.attachments[name] += 1
+
+    def add_error(self, name: str, details: str) -> None:
+        with self._lock:
+            if len(self.errors) < SUMMARY_MAX_ERRORS:
+                self.errors.append({"name": name, "details": str(details)})
+            else:
+                self.dropped_errors += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "duration_ms": round(
+                (time.perf_counter() - self.started) * 1000, 3),
+            "steps": dict(self.steps),
+            "attachments": dict(self.attachments),
+            "errors": self.errors,
+        }
+        if self.dropped_errors:
+            data["dropped_errors"] = self.dropped_errors
+        return data
+
+
+def current_report_summary() -> Optional[ReportSummary]:
+    """Return the summary collected on this thread, if a test is running."""
+    return getattr(_summary_state, "summary", None)
+
+
+@contextlib.contextmanager
+def report_summary_scope():
+    """Collect a test's summary and attach it when the outermost scope ends.
+
+    Nested scopes (e.g. a DSL file executed from within a test) share the
+    outer summary. Nothing is collected unless the level is ``summary``.
+    """
+    summary = current_report_summary()
+    if summary is None:
+        if report_level() != "summary":
+            yield None
+            return
+        summary = _summary_state.summary = ReportSummary()
+
+    summary.depth += 1
+    try:
+        yield summary
+    finally:
+        summary.depth -= 1
+        if summary.depth == 0:
+            _summary_state.summary = None
+            allure.attach(
+                json.dumps(summary.to_dict(), ensure_ascii=False, indent=2),
+                name=SUMMARY_ATTACHMENT_NAME,
+                attachment_type=allure.attachment_type.JSON,
+            )
+
+
+@contextlib.contextmanager
+def shared_report_summary(summary: Optional[ReportSummary]):
+    """Report into ``summary`` (taken from another thread) on this thread.
+
+    Used by worker threads such as parallel DSL branches; the owning thread's
+    :func:`report_summary_scope` still writes the attachment.
+    """
+    previous = current_report_summary()
+    _summary_state.summary = summary
+    try:
+        yield summary
+    finally:
+        _summary_state.summary = previous
+
+
 def print_verbose(message: str) -> None:
     """Print detailed console diagnostics only when verbose mode is enabled."""
     if is_verbose():
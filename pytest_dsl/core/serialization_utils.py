@@ -210,7 +210,27 @@ class XMLRPCSerializer:
 
         XML-RPC只支持32位整数。发送端会把超出范围的整数编码为
         ``__bigint__:<digits>`` 字符串，接收端在进入业务逻辑前还原。
+        不含标记时（绝大多数调用）直接返回原对象，不重建容器。
         """
+        if not XMLRPCSerializer.contains_bigint_marker(value):
+            return value
+        return XMLRPCSerializer._restore_bigint_markers(value)
+
+    @staticmethod
+    def contains_bigint_marker(value: Any) -> bool:
+        """检查值中是否含有大整数标记，不创建新对象"""
+        if isinstance(value, str):
+            return value.startswith(XMLRPCSerializer.BIGINT_PREFIX)
+        if isinstance(value, dict):
+            return any(XMLRPCSerializer.contains_bigint_marker(item)
+                       for item in value.values())
+        if isinstance(value, (list, tuple)):
+            return any(XMLRPCSerializer.contains_bigint_marker(item)
+                       for item in value)
+        return False
+
+    @staticmethod
+    def _restore_bigint_markers(value: Any) -> Any:
         if isinstance(value, str):
             if value.startswith(XMLRPCSerializer.BIGINT_PREFIX):
                 bigint_text = value[len(XMLRPCSerializer.BIGINT_PREFIX):]
@@ -222,19 +242,19 @@ class XMLRPCSerializer:
 
         if isinstance(value, dict):
             return {
-                key: XMLRPCSerializer.restore_bigints(item)
+                key: XMLRPCSerializer._restore_bigint_markers(item)
                 for key, item in value.items()
             }
 
         if isinstance(value, list):
             return [
-                XMLRPCSerializer.restore_bigints(item)
+                XMLRPCSerializer._restore_bigint_markers(item)
                 for item in value
             ]
 
         if isinstance(value, tuple):
             return tuple(
-                XMLRPCSerializer.restore_bigints(item)
+                XMLRPCSerializer._restore_bigint_markers(item)
                 for item in value
             )
 
@@ -479,6 +499,10 @@ class XMLRPCSerializer:
             # 获取方法
             method = getattr(server_proxy, method_name)
 
+            if getattr(type(server_proxy), 'native_types', False):
+                # 紧凑传输协议按原样传输大整数和bytes，不需要转换
+                return method(*args, **kwargs)
+
             # 先转换参数（处理超长整数等边界情况）
             # 这样可以确保超长整数在验证前就被转换为字符串格式
             converted_args = []
@@ -12,8 +12,15 @@ class VariableProvider(ABC):
     """变量提供者接口
 
     所有的变量提供者都需要实现这个接口，以便可以注册到TestContext中。
+
+    提供者可以通过 ``generation`` 属性提供版本号：变量变化时版本号随之
+    变化，TestContext据此缓存变量名的解析结果；为None表示不能缓存。
     """
 
+    # 提供者对应的变量层，如 'yaml'、'global'
+    layer = None
+    generation = None
+
     @abstractmethod
     def get_variable(self, key: str) -> Optional[Any]:
         """获取变量值
@@ -53,11 +60,17 @@ class YAMLVariableProvider(VariableProvider):
     将yaml_vars包装成变量提供者，使其可以注入到TestContext中。
     """
 
+    layer = 'yaml'
+
     def __init__(self):
         # 延迟导入，避免循环依赖
         from pytest_dsl.core.yaml_vars import yaml_vars
         self.yaml_vars = yaml_vars
 
+    @property
+    def generation(self):
+        return self.yaml_vars.generation
+
     def get_variable(self, key: str) -> Optional[Any]:
         """从YAML变量源获取变量值"""
         return self.yaml_vars.get_variable(key)
@@ -77,40 +90,37 @@ class GlobalContextVariableProvider(VariableProvider):
     将global_context包装成变量提供者，但需要避免和YAML变量重复。
     """
 
+    layer = 'global'
+
     def __init__(self):
         # 延迟导入，避免循环依赖
         from pytest_dsl.core.global_context import global_context
         self.global_context = global_context
 
+    @property
+    def generation(self):
+        return getattr(self.global_context.store, 'generation', None)
+
     def get_variable(self, key: str) -> Optional[Any]:
         """从全局上下文获取变量值"""
         # 注意：global_context的get_variable方法内部也会调用yaml_vars
         # 为了避免重复，这里直接访问存储的变量
         try:
-            # 直接从全局变量存储中获取，跳过YAML变量
-            from filelock import FileLock
-            with FileLock(self.global_context._lock_file):
-                variables = self.global_context._load_variables()
-                return variables.get(key)
+            return self.global_context.get_stored_variable(key)
         except Exception:
             return None
 
     def has_variable(self, key: str) -> bool:
         """检查全局上下文中是否存在变量"""
         try:
-            from filelock import FileLock
-            with FileLock(self.global_context._lock_file):
-                variables = self.global_context._load_variables()
-                return key in variables
+            return self.global_context.has_stored_variable(key)
         except Exception:
             return False
 
     def get_all_variables(self) -> Dict[str, Any]:
         """获取所有全局变量"""
         try:
-            from filelock import FileLock
-            with FileLock(self.global_context._lock_file):
-                return self.global_context._load_variables()
+            return self.global_context.get_all_stored_variables()
         except Exception:
             return {}
 
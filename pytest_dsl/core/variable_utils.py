@@ -3,11 +3,12 @@
 该模块提供了高级的变量替换功能，支持复杂的变量访问语法。
 """
 
+import functools
 import json
 from collections.abc import Mapping
 from typing import Any, Dict, List, Optional
 from pytest_dsl.core.global_context import global_context
-from pytest_dsl.core.context import TestContext
+from pytest_dsl.core.context import MISSING, TestContext
 from pytest_dsl.core.expression_utils import (
     evaluate_arithmetic_operation,
     evaluate_comparison_operation,
@@ -17,6 +18,116 @@ from pytest_dsl.core.expression_utils import (
 from pytest_dsl.core.serialization_utils import XMLRPCSerializer
 
 
+# 预编译插值模板缓存的最大条目数
+TEMPLATE_CACHE_SIZE = 4096
+
+
+def find_placeholders(value: str) -> List[tuple]:
+    """扫描字符串中的 ${...} 占位符边界。
+
+    Returns:
+        list: (起始位置, 结束位置, 占位符内部文本) 元组列表
+    """
+    matches = []
+    index = 0
+
+    while index < len(value):
+        start = value.find('${', index)
+        if start == -1:
+            break
+
+        end = find_placeholder_end(value, start)
+        if end is None:
+            break
+
+        matches.append((start, end, value[start + 2:end - 1]))
+        index = end
+
+    return matches
+
+
+def find_placeholder_end(value: str, start: int) -> Optional[int]:
+    """找到从 start 开始的占位符结束位置。"""
+    depth = 1
+    index = start + 2
+    quote = None
+
+    while index < len(value):
+        char = value[index]
+
+        if quote:
+            if char == '\\':
+                index += 2
+                continue
+            if char == quote:
+                quote = None
+        else:
+            if char in ("'", '"'):
+                quote = char
+            elif value.startswith('${', index):
+                depth += 1
+                index += 2
+                continue
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    return index + 1
+
+        index += 1
+
+    return None
+
+
+class PlaceholderSegment:
+    """插值模板中的一个占位符：原始文本及其解析结果"""
+
+    __slots__ = ('text', 'node', 'errors')
+
+    def __init__(self, text: str, node=None, errors=None):
+        self.text = text
+        self.node = node
+        self.errors = errors or []
+
+
+class InterpolationTemplate:
+    """预编译的插值字符串
+
+    由字面量片段和占位符表达式AST交替组成，``literals`` 比
+    ``placeholders`` 多一个元素。同一模板可被反复渲染而无需再次
+    扫描占位符或解析表达式。
+    """
+
+    __slots__ = ('source', 'literals', 'placeholders', 'is_single')
+
+    def __init__(self, source: str, literals: List[str],
+                 placeholders: List[PlaceholderSegment]):
+        self.source = source
+        self.literals = literals
+        self.placeholders = placeholders
+        # 整个字符串就是一个占位符时，渲染结果保持原始类型
+        self.is_single = (
+            len(placeholders) == 1 and literals[0] == '' and literals[1] == ''
+        )
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def compile_interpolation_template(value: str) -> InterpolationTemplate:
+    """把含 ${...} 的字符串编译为插值模板（带LRU缓存）"""
+    from pytest_dsl.core.parser import parse_expression_cached
+
+    literals = []
+    placeholders = []
+    position = 0
+    for start, end, text in find_placeholders(value):
+        literals.append(value[position:start])
+        node, errors = parse_expression_cached(text)
+        placeholders.append(PlaceholderSegment(text, node, errors))
+        position = end
+    literals.append(value[position:])
+
+    return InterpolationTemplate(value, literals, placeholders)
+
+
 class VariableReplacer:
     """变量替换器，支持高级变量访问语法"""
 
@@ -48,10 +159,10 @@ class VariableReplacer:
     def get_variable(self, var_name: str) -> Any:
         """获取变量值，按优先级顺序查找
 
-        查找顺序：
-        1. 本地变量
-        2. 测试上下文
-        3. 全局上下文（包含YAML变量的访问）
+        查找顺序（每一层只查找一次）：
+        1. 本地变量（自定义关键字的参数也绑定在执行器的本地变量中）
+        2. 测试上下文：上下文变量 > 外部提供者（YAML变量 > 全局变量）
+        3. 全局上下文（上下文没有注册默认提供者时）
 
         Args:
             var_name: 变量名
@@ -62,20 +173,22 @@ class VariableReplacer:
         Raises:
             KeyError: 当变量不存在时
         """
-        # 从本地变量获取
-        if var_name in self.local_variables:
-            value = self.local_variables[var_name]
-            return self._convert_value(value)
+        local_variables = self.local_variables
+        if var_name in local_variables:
+            return self._convert_value(local_variables[var_name])
 
-        # 从测试上下文中获取（优先级高于YAML变量）
+        # 测试上下文（优先级高于YAML变量）
         context = self.test_context
-        if context and context.has(var_name):
-            value = context.get(var_name)
-            return self._convert_value(value)
+        if context is not None:
+            value = context.lookup(var_name, MISSING)
+            if value is not MISSING:
+                return self._convert_value(value)
+            if context.covers_global_context:
+                raise KeyError(f"变量 '{var_name}' 不存在")
 
         # 从全局上下文获取（包含对YAML变量的统一访问）
-        if global_context.has_variable(var_name):
-            value = global_context.get_variable(var_name)
+        value = global_context.lookup_variable(var_name, MISSING)
+        if value is not MISSING:
             return self._convert_value(value)
 
         # 如果变量不存在，抛出异常
@@ -137,44 +250,61 @@ class VariableReplacer:
         if not isinstance(value, str) or '${' not in value:
             return value
 
-        matches = self._find_placeholders(value)
-        if not matches:
-            return value
+        evaluate_segment = None
+        if expression_evaluator:
+            def evaluate_segment(segment):
+                return expression_evaluator(segment.text)
 
-        # 检查是否整个字符串就是一个变量引用
-        is_single_placeholder = (
-            len(matches) == 1 and
-            matches[0][0] == 0 and
-            matches[0][1] == len(value)
-        )
-        if is_single_placeholder:
+        return self.render_template(
+            compile_interpolation_template(value), evaluate_segment)
+
+    def render_template(self, template: InterpolationTemplate,
+                        evaluate_segment=None) -> Any:
+        """渲染预编译的插值模板
+
+        Args:
+            template: compile_interpolation_template 生成的模板
+            evaluate_segment: 可选的占位符求值回调，参数为
+                PlaceholderSegment；默认使用本替换器求值表达式AST
+
+        Returns:
+            替换后的字符串或原始对象（如果整个值是单一变量引用）
+
+        Raises:
+            KeyError: 当变量不存在时
+        """
+        placeholders = template.placeholders
+        if not placeholders:
+            return template.source
+
+        evaluate_segment = evaluate_segment or self._evaluate_segment
+
+        if template.is_single:
             # 如果整个字符串就是一个变量引用，直接返回变量值（保持原始类型）
-            var_ref = matches[0][2]
+            segment = placeholders[0]
             try:
-                return self._evaluate_placeholder(
-                    var_ref, expression_evaluator)
+                return evaluate_segment(segment)
             except (KeyError, IndexError, TypeError, ValueError) as e:
-                raise KeyError(f"无法解析变量引用 '${{{var_ref}}}': {str(e)}")
-
-        # 如果字符串中包含多个变量引用或混合了字面量，进行字符串替换
-        result = value
-
-        # 从后向前替换，避免位置偏移
-        for start, end, var_ref in reversed(matches):
+                raise KeyError(
+                    f"无法解析变量引用 '${{{segment.text}}}': {str(e)}")
 
+        # 字符串中包含多个变量引用或混合了字面量，从后向前求值后拼接
+        values = [None] * len(placeholders)
+        for index in range(len(placeholders) - 1, -1, -1):
+            segment = placeholders[index]
             try:
-                var_value = self._evaluate_placeholder(
-                    var_ref, expression_evaluator)
-                # 替换变量引用，转换为字符串
-                result = (
-                    result[:start] +
-                    self._stringify_placeholder_value(var_value) +
-                    result[end:]
-                )
+                values[index] = self._stringify_placeholder_value(
+                    evaluate_segment(segment))
             except (KeyError, IndexError, TypeError, ValueError) as e:
-                raise KeyError(f"无法解析变量引用 '${{{var_ref}}}': {str(e)}")
+                raise KeyError(
+                    f"无法解析变量引用 '${{{segment.text}}}': {str(e)}")
 
-        return result
+        literals = template.literals
+        parts = [literals[0]]
+        for var_value, literal in zip(values, literals[1:]):
+            parts.append(var_value)
+            parts.append(literal)
+        return ''.join(parts)
 
     def _stringify_placeholder_value(self, value: Any) -> str:
         """Convert a placeholder value for mixed string interpolation."""
@@ -184,53 +314,11 @@ class VariableReplacer:
 
     def _find_placeholders(self, value: str) -> List[tuple]:
         """扫描字符串中的 ${...} 占位符边界。"""
-        matches = []
-        index = 0
-
-        while index < len(value):
-            start = value.find('${', index)
-            if start == -1:
-                break
-
-            end = self._find_placeholder_end(value, start)
-            if end is None:
-                break
-
-            matches.append((start, end, value[start + 2:end - 1]))
-            index = end
-
-        return matches
+        return find_placeholders(value)
 
     def _find_placeholder_end(self, value: str, start: int) -> Optional[int]:
         """找到从 start 开始的占位符结束位置。"""
-        depth = 1
-        index = start + 2
-        quote = None
-
-        while index < len(value):
-            char = value[index]
-
-            if quote:
-                if char == '\\':
-                    index += 2
-                    continue
-                if char == quote:
-                    quote = None
-            else:
-                if char in ("'", '"'):
-                    quote = char
-                elif value.startswith('${', index):
-                    depth += 1
-                    index += 2
-                    continue
-                elif char == '}':
-                    depth -= 1
-                    if depth == 0:
-                        return index + 1
-
-            index += 1
-
-        return None
+        return find_placeholder_end(value, start)
 
     def _evaluate_placeholder(self, var_ref: str, expression_evaluator=None):
         """求值占位符内部表达式。"""
@@ -241,19 +329,24 @@ class VariableReplacer:
 
     def _evaluate_expression_text(self, expr_text: str):
         """通过 parser 解析并求值占位符表达式。"""
-        from pytest_dsl.core.parser import (
-            format_parse_errors,
-            parse_expression_fragment,
-        )
+        from pytest_dsl.core.parser import parse_expression_cached
+
+        expr_node, errors = parse_expression_cached(expr_text)
+        return self._evaluate_segment(
+            PlaceholderSegment(expr_text, expr_node, errors))
+
+    def _evaluate_segment(self, segment: PlaceholderSegment):
+        """求值模板中已解析的占位符表达式。"""
+        if segment.errors:
+            from pytest_dsl.core.parser import format_parse_errors
 
-        expr_node, errors = parse_expression_fragment(expr_text)
-        if errors:
-            messages = format_parse_errors(errors)
-            raise ValueError(f"无效的占位符表达式 '{expr_text}': {messages}")
-        if expr_node is None:
-            raise ValueError(f"无效的占位符表达式 '{expr_text}'")
+            messages = format_parse_errors(segment.errors)
+            raise ValueError(
+                f"无效的占位符表达式 '{segment.text}': {messages}")
+        if segment.node is None:
+            raise ValueError(f"无效的占位符表达式 '{segment.text}'")
 
-        return self._eval_expression_node(expr_node)
+        return self._eval_expression_node(segment.node)
 
     def _eval_expression_node(self, expr_node):
         """求值 parser 生成的表达式节点。"""
@@ -65,7 +65,7 @@ def load_yaml_variables_from_args(yaml_files=None, yaml_vars_dir=None,
     if hook_variables:
         print(f"🔌 通过Hook加载了 {len(hook_variables)} 个变量")
         # 将hook变量加载到yaml_vars中
-        yaml_vars._variables.update(hook_variables)
+        yaml_vars.update_variables(hook_variables)
 
     # 加载用户指定的YAML文件（第二优先级）
     if yaml_files:
@@ -298,12 +298,31 @@ def load_remote_servers_from_yaml(variable_source=None):
                 api_key = server_config.get('api_key')
                 sync_config = server_config.get('sync_config')
                 timeout = server_config.get('timeout')
+                pool = server_config.get('pool')
+                # urls: 同一别名下的一组等价服务器，按balance策略分配调用
+                urls = server_config.get('urls')
+
+                if urls and alias:
+                    url = ', '.join(urls)
+                    print(f"自动连接远程服务器组: {alias} -> {url}")
+                    success = (
+                        remote_keyword_manager.register_remote_server_group(
+                            urls, alias, api_key=api_key,
+                            sync_config=sync_config, timeout=timeout,
+                            pool=pool, balance=server_config.get(
+                                'balance', 'least_outstanding')))
+                    if success:
+                        print(f"✓ 远程服务器组 {alias} 连接成功")
+                    else:
+                        print(f"✗ 远程服务器组 {alias} 连接失败")
 
-                if url and alias:
+                    results.append(
+                        {'alias': alias, 'url': url, 'success': success})
+                elif url and alias:
                     print(f"自动连接远程服务器: {alias} -> {url}")
                     success = remote_keyword_manager.register_remote_server(
                         url, alias, api_key=api_key, sync_config=sync_config,
-                        timeout=timeout
+                        timeout=timeout, pool=pool
                     )
                     if success:
                         print(f"✓ 远程服务器 {alias} 连接成功")
@@ -313,7 +332,9 @@ def load_remote_servers_from_yaml(variable_source=None):
                     results.append(
                         {'alias': alias, 'url': url, 'success': success})
                 else:
-                    print(f"警告：服务器配置缺少必要字段 url 或 alias: {server_config}")
+                    print(
+                        "警告：服务器配置缺少必要字段 url（或 urls）或 alias: "
+                        f"{server_config}")
 
         return results
 
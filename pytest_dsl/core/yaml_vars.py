@@ -11,6 +11,26 @@ class YAMLVariableManager:
         self._loaded_files: List[str] = []
         self._variables: Dict[str, Any] = {}
         self._enable_hooks = True  # 是否启用hook
+        # 变量版本号，通过本类方法修改变量时递增
+        self._generation = 0
+
+    @property
+    def generation(self) -> Optional[int]:
+        """变量版本号，变量可能由hook或桥接动态提供时为None（不可缓存）"""
+        if 'get_variable' in self.__dict__:
+            # get_variable被替换（如远程服务器的变量桥接）
+            return None
+        if self._enable_hooks and self._has_variable_hooks():
+            return None
+        return self._generation
+
+    def _has_variable_hooks(self) -> bool:
+        try:
+            from .hook_manager import hook_manager
+            hook_manager.initialize()
+            return bool(hook_manager.get_plugins())
+        except Exception:
+            return False
 
     def has_variable(self, name: str) -> bool:
         """检查变量是否存在
@@ -45,9 +65,15 @@ class YAMLVariableManager:
                     self._loaded_files.append(file_path)
                     # 更新变量字典，新文件中的变量会覆盖旧的
                     self._variables.update(variables)
+                    self._generation += 1
             except yaml.YAMLError as e:
                 raise ValueError(f"YAML文件格式错误 {file_path}: {str(e)}")
 
+    def update_variables(self, variables: Dict[str, Any]) -> None:
+        """批量设置变量，覆盖同名变量"""
+        self._variables.update(variables)
+        self._generation += 1
+
     def load_yaml_files(self, file_paths: List[str]) -> None:
         """批量加载多个YAML文件中的变量"""
         for file_path in file_paths:
@@ -147,11 +173,13 @@ class YAMLVariableManager:
             enable: 是否启用hook
         """
         self._enable_hooks = enable
+        self._generation += 1
 
     def clear(self) -> None:
         """清除所有已加载的变量"""
         self._variables.clear()
         self._loaded_files.clear()
+        self._generation += 1
 
 
 # 创建全局YAML变量管理器实例
@@ -4,12 +4,14 @@
 """
 
 import allure
+import copy
 import re
 import yaml
 import json
 import os
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Union
 
 from pytest_dsl.core.keyword_manager import keyword_manager
@@ -364,6 +366,18 @@ def _normalize_retry_config(config, assert_retry_count=None,
     return standard_retry_config
 
 
+def _apply_retry_config(config, retry_config):
+    """将标准化后的重试配置写回请求配置的retry_assertions字段"""
+    if retry_config['enabled']:
+        config['retry_assertions'] = {
+            'count': retry_config['count'],
+            'interval': retry_config['interval'],
+            'all': retry_config['all'],
+            'indices': retry_config['indices'],
+            'specific': retry_config['specific']
+        }
+
+
 @keyword_manager.register('HTTP请求', [
     {'name': '客户端', 'mapping': 'client',
      'description': '客户端名称，对应YAML变量文件中的客户端配置',
@@ -480,14 +494,7 @@ def http_request(context, **kwargs):
                                                assert_retry_interval)
 
         # 为了兼容性，将标准化后的重试配置写回到配置中
-        if retry_config['enabled']:
-            config['retry_assertions'] = {
-                'count': retry_config['count'],
-                'interval': retry_config['interval'],
-                'all': retry_config['all'],
-                'indices': retry_config['indices'],
-                'specific': retry_config['specific']
-            }
+        _apply_retry_config(config, retry_config)
 
         config = _process_request_config(config, test_context=context)
 
@@ -571,6 +578,182 @@ def http_request(context, **kwargs):
         }
 
 
+def _load_request_config(config, test_context: TestContext = None):
+    """对YAML配置字符串进行变量替换并解析，字典配置原样返回"""
+    if isinstance(config, str):
+        config = _replace_config_variables(config, test_context)
+    if isinstance(config, str):
+        try:
+            config = yaml.safe_load(config) if config else {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"无效的YAML配置: {str(e)}")
+    return config if config is not None else {}
+
+
+def _send_prepared_request(client, method, url, request_kwargs):
+    """在工作线程中发送已准备好的请求，只做网络IO"""
+    return client.make_request(method, url, **request_kwargs)
+
+
+@keyword_manager.register('HTTP批量请求', [
+    {'name': '客户端', 'mapping': 'client',
+     'description': '客户端名称，对应YAML变量文件中的客户端配置',
+     'default': 'default'},
+    {'name': '请求列表', 'mapping': 'requests',
+     'description': '请求配置列表，每项为YAML字符串或字典，会深度合并到基础配置上'},
+    {'name': '配置', 'mapping': 'config',
+     'description': '所有请求共用的基础YAML配置（可包含捕获和断言）'},
+    {'name': '模板', 'mapping': 'template',
+     'description': '使用YAML变量文件中定义的请求模板作为基础配置'},
+    {'name': '会话', 'mapping': 'session',
+     'description': '会话名称，所有请求共用该会话'},
+    {'name': '并发数', 'mapping': 'concurrency',
+     'description': '同时发送的最大请求数', 'default': 10},
+    {'name': '禁用授权', 'mapping': 'disable_auth',
+     'description': '禁用客户端配置中的授权机制', 'default': False},
+    {'name': '断言重试次数', 'mapping': 'assert_retry_count',
+     'description': '断言失败时的重试次数', 'default': 0},
+    {'name': '断言重试间隔', 'mapping': 'assert_retry_interval',
+     'description': '断言重试间隔时间（秒）', 'default': 1}
+], category='系统/接口测试', tags=['接口', '请求', '并发'],
+    returns={
+        'type': 'dict',
+        'description': 'result 为按请求顺序排列的捕获变量字典列表'
+    })
+def http_batch_request(context, **kwargs):
+    """并发执行一组HTTP请求
+
+    所有请求先在当前线程中完成变量替换、模板合并和参数构建，然后由线程池
+    并发发送（共享同一个按并发数扩容的连接池）。响应返回后按请求顺序逐个
+    记录报告、处理捕获和断言，因此结果顺序与请求列表一致。全部请求处理
+    完成后，如有失败则汇总抛出AssertionError。
+
+    Args:
+        context: 测试上下文
+        client: 客户端名称
+        requests: 请求配置列表
+        config: 共用的基础配置
+        template: 模板名称
+        session: 会话名称
+        concurrency: 最大并发数
+        disable_auth: 禁用客户端配置中的授权机制
+        assert_retry_count: 断言失败时的重试次数
+        assert_retry_interval: 断言重试间隔时间（秒）
+
+    Returns:
+        按请求顺序排列的捕获变量列表
+    """
+    client_name = kwargs.get('client', 'default')
+    request_items = kwargs.get('requests')
+    base_config = kwargs.get('config')
+    template_name = kwargs.get('template')
+    session_name = kwargs.get('session')
+    concurrency = max(1, int(kwargs.get('concurrency') or 10))
+    disable_auth = kwargs.get('disable_auth', False)
+    assert_retry_count = kwargs.get('assert_retry_count')
+    assert_retry_interval = kwargs.get('assert_retry_interval')
+
+    if isinstance(request_items, str):
+        request_items = _load_request_config(request_items, context)
+    if not isinstance(request_items, (list, tuple)) or not request_items:
+        raise ValueError("请求列表必须是非空列表")
+
+    from pytest_dsl.core.http_client import http_client_manager
+    http_client_manager.set_context(context)
+
+    # 基础配置 = 模板 + 共用配置
+    base = {}
+    if template_name:
+        http_templates = context.get("http_templates") or {}
+        template = http_templates.get(template_name)
+        if not template:
+            raise ValueError(f"未找到名为 '{template_name}' 的HTTP请求模板")
+        base = copy.deepcopy(template)
+    if base_config:
+        base = _deep_merge(base, _load_request_config(base_config, context))
+
+    # 在当前线程中完成所有配置解析和客户端获取，工作线程只负责发送
+    prepared = []
+    for item in request_items:
+        config = _deep_merge(copy.deepcopy(base),
+                             _load_request_config(item, context))
+        retry_config = _normalize_retry_config(config, assert_retry_count,
+                                               assert_retry_interval)
+        _apply_retry_config(config, retry_config)
+        config = _process_request_config(config, test_context=context)
+
+        http_req = HTTPRequest(config, client_name, session_name)
+        prepared.append((http_req, retry_config,
+                         http_req.prepare(disable_auth)))
+
+    for client in {id(p[2][0]): p[2][0] for p in prepared}.values():
+        client.ensure_pool_size(concurrency)
+
+    total = len(prepared)
+    results = []
+    captured_all = {}
+    status_codes = []
+    failures = []
+
+    with allure.step(f"发送HTTP批量请求 (客户端: {client_name}, "
+                     f"请求数: {total}, 并发数: {concurrency})"):
+        with ThreadPoolExecutor(max_workers=min(concurrency, total)) as pool:
+            futures = []
+            for _, _, (client, method, url, request_kwargs) in prepared:
+                send_kwargs = dict(request_kwargs)
+                if isinstance(send_kwargs.get('headers'), dict):
+                    send_kwargs['headers'] = dict(send_kwargs['headers'])
+                futures.append(pool.submit(_send_prepared_request, client,
+                                           method, url, send_kwargs))
+
+            # 报告、捕获和断言都在当前线程中按请求顺序处理
+            for index, ((http_req, retry_config,
+                         (_, method, url, request_kwargs)),
+                        future) in enumerate(zip(prepared, futures), 1):
+                with allure.step(f"请求 {index}/{total}: {method} {url}"):
+                    http_req._log_request_to_allure(method, url,
+                                                    request_kwargs)
+                    try:
+                        try:
+                            response = future.result()
+                        except Exception as e:
+                            http_req._raise_request_error(e, method, url)
+                        http_req.handle_response(response)
+
+                        if retry_config['enabled']:
+                            _process_assertions_with_unified_retry(
+                                http_req, retry_config, disable_auth)
+                        else:
+                            http_req.process_asserts()
+                    except (AssertionError, ValueError) as e:
+                        failures.append(f"请求 {index} ({method} {url}): {e}")
+
+                captured_values = http_req.captured_values
+                for var_name, value in captured_values.items():
+                    context.set(var_name, value)
+                captured_all.update(captured_values)
+                results.append(captured_values)
+                status_codes.append(
+                    getattr(http_req.response, 'status_code', None))
+
+    if failures:
+        raise AssertionError(
+            f"HTTP批量请求中 {len(failures)}/{total} 个请求失败:\n" +
+            "\n".join(failures))
+
+    return {
+        "result": results,
+        "side_effects": {
+            "variables": captured_all,
+            "context_updates": {}
+        },
+        "metadata": {
+            "status_codes": status_codes,
+            "keyword_type": "http_batch_request"
+        }
+    }
+
+
 
 
 
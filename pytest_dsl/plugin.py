@@ -37,6 +37,14 @@ def pytest_addoption(parser):
     # 使用yaml_loader模块添加YAML相关选项
     add_yaml_options(parser)
 
+    group = parser.getgroup('pytest-dsl')
+    group.addoption(
+        '--dsl-no-ast-cache',
+        action='store_true',
+        default=False,
+        help='不在.pytest_cache中持久化DSL语法树缓存（进程内缓存仍然生效）'
+    )
+
 
 @pytest.hookimpl
 def pytest_collect_file(file_path, parent):
@@ -65,6 +73,8 @@ def pytest_configure(config):
     )
     config._pytest_dsl_lifecycle_state = DslLifecycleState()
     auto_directory.reset_hook_execution_state()
+    _configure_ast_cache(config)
+    _configure_remote_spec_cache(config)
 
     # 确保全局变量存储目录存在
     os.makedirs(global_context._storage_dir, exist_ok=True)
@@ -194,6 +204,37 @@ def _execute_teardown_once(state: DslLifecycleState, directory: Path) -> None:
     state.teardown_executed.add(directory)
 
 
+def _configure_ast_cache(config) -> None:
+    """在启用pytest缓存插件时把DSL语法树持久化到.pytest_cache。"""
+    from pytest_dsl.core.ast_cache import ast_cache
+
+    cache = getattr(config, "cache", None)
+    if cache is None or config.getoption("dsl_no_ast_cache", default=False):
+        ast_cache.enable_disk_cache(None)
+        return
+    try:
+        ast_cache.enable_disk_cache(cache.mkdir("pytest-dsl-ast"))
+    except OSError as e:
+        print_verbose(f"pytest环境：DSL语法树磁盘缓存不可用: {e}")
+        ast_cache.enable_disk_cache(None)
+
+
+def _configure_remote_spec_cache(config) -> None:
+    """在启用pytest缓存插件时把远程关键字库规格持久化到.pytest_cache。"""
+    from pytest_dsl.remote.spec_cache import library_spec_cache
+
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        library_spec_cache.enable_disk_cache(None)
+        return
+    try:
+        library_spec_cache.enable_disk_cache(
+            cache.mkdir("pytest-dsl-remote-specs"))
+    except OSError as e:
+        print_verbose(f"pytest环境：远程关键字规格磁盘缓存不可用: {e}")
+        library_spec_cache.enable_disk_cache(None)
+
+
 def _get_lifecycle_state(config) -> DslLifecycleState:
     state = getattr(config, "_pytest_dsl_lifecycle_state", None)
     if state is None:
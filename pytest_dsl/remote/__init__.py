@@ -7,20 +7,24 @@ This module provides remote keyword server functionality.
 __version__ = "0.33.0"
 
 # 导出远程关键字管理器和相关功能
+from .artifacts import RemoteArtifact
 from .keyword_client import (
     RemoteKeywordCallOutcome,
     RemoteKeywordClient,
     RemoteKeywordExecutionError,
     RemoteKeywordManager,
+    RemoteServerBusyError,
     remote_keyword_manager,
 )
 from .keyword_server import RemoteKeywordServer
+from .server_group import RemoteServerGroup
 from .variable_bridge import VariableBridge
 
 # 导出便捷函数
 
 
-def register_remote_server(url, alias, api_key=None, sync_config=None, timeout=None):
+def register_remote_server(url, alias, api_key=None, sync_config=None, timeout=None,
+                           pool=None):
     """注册远程关键字服务器的便捷函数
 
     Args:
@@ -29,12 +33,35 @@ def register_remote_server(url, alias, api_key=None, sync_config=None, timeout=N
         api_key: API密钥(可选)
         sync_config: 变量同步配置(可选)
         timeout: XML-RPC调用超时时间(秒)
+        pool: 连接池配置(可选)
 
     Returns:
         bool: 是否成功连接
     """
     return remote_keyword_manager.register_remote_server(
-        url, alias, api_key, sync_config, timeout
+        url, alias, api_key, sync_config, timeout, pool
+    )
+
+
+def register_remote_server_group(urls, alias, api_key=None, sync_config=None,
+                                 timeout=None, pool=None,
+                                 balance="least_outstanding"):
+    """把一组等价的远程服务器注册在同一个别名下的便捷函数
+
+    Args:
+        urls: 成员服务器URL列表
+        alias: 服务器组别名
+        api_key: API密钥(可选)
+        sync_config: 变量同步配置(可选)
+        timeout: XML-RPC调用超时时间(秒)
+        pool: 连接池配置(可选)
+        balance: 负载均衡策略，least_outstanding 或 round_robin
+
+    Returns:
+        bool: 是否至少有一个成员连接成功
+    """
+    return remote_keyword_manager.register_remote_server_group(
+        urls, alias, api_key, sync_config, timeout, pool, balance
     )
 
 
@@ -55,10 +82,16 @@ def register_multiple_servers(servers_config):
             api_key = server_config.get("api_key")
             sync_config = server_config.get("sync_config")
             timeout = server_config.get("timeout")
-
-            if url and alias:
+            pool = server_config.get("pool")
+            urls = server_config.get("urls")
+
+            if urls and alias:
+                results[alias] = register_remote_server_group(
+                    urls, alias, api_key, sync_config, timeout, pool,
+                    server_config.get("balance", "least_outstanding"))
+            elif url and alias:
                 success = register_remote_server(
-                    url, alias, api_key, sync_config, timeout
+                    url, alias, api_key, sync_config, timeout, pool
                 )
                 results[alias] = success
 
@@ -73,9 +106,13 @@ __all__ = [
     "RemoteKeywordClient",
     "RemoteKeywordCallOutcome",
     "RemoteKeywordExecutionError",
+    "RemoteServerBusyError",
     "RemoteKeywordServer",
+    "RemoteServerGroup",
+    "RemoteArtifact",
     "VariableBridge",
     # 便捷函数
     "register_remote_server",
+    "register_remote_server_group",
     "register_multiple_servers",
 ]
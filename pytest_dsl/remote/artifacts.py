@@ -0,0 +1,261 @@
+"""远程关键字的大结果和文件分块传输
+
+关键字返回的大字符串、bytes以及 ``RemoteArtifact`` 文件不再放进run_keyword
+的响应中，而是保存在服务器的制品存储里，响应中只放一个引用::
+
+    {'__artifact__': id, 'kind': 'text'|'bytes'|'file',
+     'name': 名称, 'size': 字节数, 'content_type': 类型}
+
+客户端再通过 ``read_artifact`` 分块读取：文件直接写入本地磁盘并作为Allure
+附件，大字符串和bytes还原为原来的值。只有客户端在调用时声明支持
+（run_keyword的options中 ``artifacts`` 为True）时服务器才会这样处理，
+旧版本客户端收到的结果不变。
+"""
+
+import os
+import tempfile
+import threading
+import time
+import uuid
+
+
+# 超过该字节数的返回值改为分块传输
+ARTIFACT_THRESHOLD_ENV = 'PYTEST_DSL_REMOTE_ARTIFACT_THRESHOLD'
+DEFAULT_ARTIFACT_THRESHOLD = 1024 * 1024
+# 客户端保存文件制品的目录
+ARTIFACT_DIR_ENV = 'PYTEST_DSL_REMOTE_ARTIFACT_DIR'
+
+CHUNK_SIZE = 512 * 1024
+# 未被读取完的制品保留时间（秒）
+ARTIFACT_TTL = 600.0
+
+ARTIFACT_KEY = '__artifact__'
+
+
+def artifact_threshold() -> int:
+    try:
+        value = int(os.environ.get(ARTIFACT_THRESHOLD_ENV, ''))
+    except ValueError:
+        return DEFAULT_ARTIFACT_THRESHOLD
+    return value if value > 0 else DEFAULT_ARTIFACT_THRESHOLD
+
+
+class RemoteArtifact:
+    """关键字返回的文件或二进制数据，总是以分块方式传给客户端
+
+    Args:
+        path: 服务器上的文件路径，传输完成前不能删除
+        data: 二进制数据，与path二选一
+        name: 附件名称，默认为文件名
+        content_type: MIME类型，如 ``image/png``
+    """
+
+    def __init__(self, path=None, data=None, name=None, content_type=None):
+        if (path is None) == (data is None):
+            raise ValueError("RemoteArtifact需要path或data之一")
+        self.path = os.fspath(path) if path is not None else None
+        self.data = data
+        self.name = name or (os.path.basename(self.path) if self.path
+                             else 'artifact')
+        self.content_type = content_type
+
+
+class ArtifactStore:
+    """服务器端的制品存储，数据写入临时文件，按块读取"""
+
+    def __init__(self, ttl=ARTIFACT_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._artifacts = {}
+        self._dir = None
+
+    def put(self, kind, name, content_type, data=None, path=None):
+        """保存制品，返回引用字典"""
+        self.purge_expired()
+        artifact_id = uuid.uuid4().hex
+        owned = path is None
+        if owned:
+            path = os.path.join(self._spool_dir(), artifact_id)
+            with open(path, 'wb') as f:
+                f.write(data)
+        size = os.path.getsize(path)
+        with self._lock:
+            self._artifacts[artifact_id] = {
+                'path': path, 'owned': owned, 'created': time.monotonic()}
+        return {ARTIFACT_KEY: artifact_id, 'kind': kind, 'name': name,
+                'size': size, 'content_type': content_type or ''}
+
+    def read(self, artifact_id, offset, size=CHUNK_SIZE):
+        """读取一块数据，返回空bytes表示已读完"""
+        with self._lock:
+            entry = self._artifacts.get(artifact_id)
+        if entry is None:
+            raise KeyError(f"制品不存在或已过期: {artifact_id}")
+        with open(entry['path'], 'rb') as f:
+            f.seek(offset)
+            return f.read(min(int(size), CHUNK_SIZE))
+
+    def release(self, artifact_id):
+        """客户端读取完成后删除制品"""
+        with self._lock:
+            entry = self._artifacts.pop(artifact_id, None)
+        if entry is not None and entry['owned']:
+            try:
+                os.remove(entry['path'])
+            except OSError:
+                pass
+
+    def purge_expired(self):
+        now = time.monotonic()
+        with self._lock:
+            expired = [artifact_id for artifact_id, entry
+                       in self._artifacts.items()
+                       if now - entry['created'] > self.ttl]
+        for artifact_id in expired:
+            self.release(artifact_id)
+
+    def _spool_dir(self):
+        if self._dir is None:
+            with self._lock:
+                if self._dir is None:
+                    self._dir = tempfile.mkdtemp(
+                        prefix='pytest-dsl-artifacts-')
+        return self._dir
+
+
+def externalize_artifacts(value, store, threshold=None):
+    """把结果中的RemoteArtifact和超过阈值的字符串/bytes替换为制品引用"""
+    if threshold is None:
+        threshold = artifact_threshold()
+
+    if isinstance(value, RemoteArtifact):
+        if value.path is not None:
+            return store.put('file', value.name, value.content_type,
+                             path=value.path)
+        return store.put('file', value.name, value.content_type,
+                         data=bytes(value.data))
+    if isinstance(value, (bytes, bytearray)) and len(value) > threshold:
+        return store.put('bytes', 'result.bin', 'application/octet-stream',
+                         data=bytes(value))
+    # 按UTF-8最多4字节估算，超过阈值时才编码
+    if isinstance(value, str) and len(value) * 4 > threshold:
+        data = value.encode('utf-8')
+        if len(data) > threshold:
+            return store.put('text', 'result.txt', 'text/plain', data=data)
+        return value
+    if isinstance(value, dict):
+        return {key: externalize_artifacts(item, store, threshold)
+                for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [externalize_artifacts(item, store, threshold)
+                for item in value]
+    return value
+
+
+def _contains_remote_artifact(value) -> bool:
+    if isinstance(value, RemoteArtifact):
+        return True
+    if isinstance(value, dict):
+        return any(_contains_remote_artifact(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_contains_remote_artifact(item) for item in value)
+    return False
+
+
+def inline_artifacts(value):
+    """客户端不支持分块传输时，把RemoteArtifact替换为其二进制内容"""
+    if not _contains_remote_artifact(value):
+        return value
+    if isinstance(value, RemoteArtifact):
+        if value.data is not None:
+            return bytes(value.data)
+        with open(value.path, 'rb') as f:
+            return f.read()
+    if isinstance(value, dict):
+        return {key: inline_artifacts(item) for key, item in value.items()}
+    return [inline_artifacts(item) for item in value]
+
+
+def is_artifact_ref(value) -> bool:
+    return isinstance(value, dict) and ARTIFACT_KEY in value
+
+
+def contains_artifact_refs(value) -> bool:
+    if is_artifact_ref(value):
+        return True
+    if isinstance(value, dict):
+        return any(contains_artifact_refs(item) for item in value.values())
+    if isinstance(value, list):
+        return any(contains_artifact_refs(item) for item in value)
+    return False
+
+
+def _local_artifact_dir():
+    path = os.environ.get(ARTIFACT_DIR_ENV) or os.path.join(
+        tempfile.gettempdir(), 'pytest-dsl-artifacts')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def download_artifact(read_chunk, ref, dest_path):
+    """分块下载制品并写入dest_path
+
+    Args:
+        read_chunk: read_chunk(制品ID, 偏移) -> bytes
+        ref: 制品引用
+        dest_path: 本地文件路径
+    """
+    offset = 0
+    with open(dest_path, 'wb') as f:
+        while True:
+            chunk = read_chunk(ref[ARTIFACT_KEY], offset)
+            if not chunk:
+                break
+            f.write(chunk)
+            offset += len(chunk)
+    if offset != ref.get('size', offset):
+        raise IOError(
+            f"制品 {ref.get('name')} 下载不完整: {offset}/{ref.get('size')}")
+    return dest_path
+
+
+def materialize_artifacts(value, read_chunk, release=None):
+    """下载结果中的制品引用
+
+    文件制品保存到本地目录（PYTEST_DSL_REMOTE_ARTIFACT_DIR）并作为Allure附件，
+    替换为本地文件路径；大字符串和bytes还原为原来的值。
+    """
+    if is_artifact_ref(value):
+        artifact_id = value[ARTIFACT_KEY]
+        name = os.path.basename(str(value.get('name') or 'artifact'))
+        path = os.path.join(_local_artifact_dir(), f"{artifact_id}-{name}")
+        try:
+            download_artifact(read_chunk, value, path)
+        finally:
+            if release is not None:
+                release(artifact_id)
+
+        if value.get('kind') == 'file':
+            _attach_file(path, name)
+            return path
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        finally:
+            os.remove(path)
+        return data.decode('utf-8') if value.get('kind') == 'text' else data
+    if isinstance(value, dict):
+        return {key: materialize_artifacts(item, read_chunk, release)
+                for key, item in value.items()}
+    if isinstance(value, list):
+        return [materialize_artifacts(item, read_chunk, release)
+                for item in value]
+    return value
+
+
+def _attach_file(path, name):
+    try:
+        import allure
+        allure.attach.file(path, name=name)
+    except Exception:
+        pass
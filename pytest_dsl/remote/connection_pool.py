@@ -0,0 +1,251 @@
+"""远程关键字服务器的连接池
+
+``xmlrpc.client.ServerProxy`` 和其Transport不能在线程间共享。连接池为每个
+线程分配独立的服务器代理（HTTP/1.1长连接），使并行执行器的多个线程可以
+同时调用同一台远程服务器，而不需要互相等待。
+
+- 空闲超过 ``idle_timeout`` 秒的连接会被关闭，下次使用时重新建立
+- 后台线程每 ``health_interval`` 秒探测一次服务器，不可用时关闭空闲连接
+- 连接被拒绝时按指数退避重连；请求可能已经到达服务器的错误（如超时）
+  不会重试，避免关键字被重复执行
+"""
+
+import http.client
+import threading
+import time
+import weakref
+import xmlrpc.client
+
+
+DEFAULT_POOL_CONFIG = {
+    'idle_timeout': 60.0,       # 空闲连接的最长保留时间（秒）
+    'health_interval': 30.0,    # 健康检查间隔（秒），0表示关闭
+    'reconnect_attempts': 3,    # 连接被拒绝时的重连次数
+    'backoff_base': 0.2,        # 第一次重连前的等待时间（秒）
+    'backoff_max': 5.0,         # 重连等待时间上限（秒）
+}
+
+
+def _is_transport_error(error) -> bool:
+    """连接已不可用，需要丢弃当前线程的代理"""
+    if isinstance(error, xmlrpc.client.Fault):
+        return False
+    return isinstance(error, (OSError, http.client.HTTPException,
+                              xmlrpc.client.ProtocolError))
+
+
+def _close_proxy(proxy):
+    try:
+        if isinstance(proxy, xmlrpc.client.ServerProxy):
+            proxy('close')()
+        else:
+            proxy.close()
+    except Exception:
+        pass
+
+
+class _PooledConnection:
+    __slots__ = ('proxy', 'last_used', 'in_use', 'closed', '__weakref__')
+
+    def __init__(self, proxy):
+        self.proxy = proxy
+        self.last_used = time.monotonic()
+        self.in_use = False
+        self.closed = False
+
+
+class RemoteConnectionPool:
+    """按线程分配服务器代理的连接池
+
+    Args:
+        factory: 创建服务器代理的无参函数
+        **config: 覆盖 DEFAULT_POOL_CONFIG 中的配置项
+    """
+
+    def __init__(self, factory, **config):
+        options = {**DEFAULT_POOL_CONFIG, **config}
+        self._factory = factory
+        self.idle_timeout = float(options['idle_timeout'])
+        self.health_interval = float(options['health_interval'])
+        self.reconnect_attempts = int(options['reconnect_attempts'])
+        self.backoff_base = float(options['backoff_base'])
+        self.backoff_max = float(options['backoff_max'])
+
+        self.healthy = True
+        # 健康检查发现服务器从可用变为不可用的次数，服务器可能已重启
+        self.outages = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # 线程结束后其连接随线程本地数据一起释放
+        self._connections = weakref.WeakSet()
+        self._stop = threading.Event()
+        self._health_thread = None
+
+    def call(self, method, *args):
+        """在当前线程的连接上调用远程方法"""
+        attempt = 0
+        while True:
+            connection = self._acquire()
+            try:
+                return getattr(connection.proxy, method)(*args)
+            except Exception as e:
+                if not _is_transport_error(e):
+                    raise
+                self._discard(connection)
+                # 只有连接被拒绝时请求一定没有到达服务器，可以安全重试
+                if (not isinstance(e, ConnectionRefusedError) or
+                        attempt >= self.reconnect_attempts):
+                    raise
+                time.sleep(self._backoff(attempt))
+                attempt += 1
+            finally:
+                self._release(connection)
+
+    def close(self):
+        """停止健康检查并关闭所有连接"""
+        self._stop.set()
+        with self._lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for connection in connections:
+            connection.closed = True
+            _close_proxy(connection.proxy)
+
+    def _backoff(self, attempt):
+        return min(self.backoff_max, self.backoff_base * (2 ** attempt))
+
+    def _acquire(self):
+        self._ensure_health_thread()
+        connection = getattr(self._local, 'connection', None)
+        with self._lock:
+            if connection is not None and (
+                    connection.closed or
+                    time.monotonic() - connection.last_used >
+                    self.idle_timeout):
+                connection.closed = True
+                self._connections.discard(connection)
+                stale, connection = connection, None
+                _close_proxy(stale.proxy)
+            if connection is not None:
+                connection.in_use = True
+                return connection
+
+        connection = _PooledConnection(self._factory())
+        connection.in_use = True
+        self._local.connection = connection
+        with self._lock:
+            self._connections.add(connection)
+        return connection
+
+    def _release(self, connection):
+        connection.last_used = time.monotonic()
+        connection.in_use = False
+
+    def _discard(self, connection):
+        with self._lock:
+            connection.closed = True
+            self._connections.discard(connection)
+        if getattr(self._local, 'connection', None) is connection:
+            self._local.connection = None
+        _close_proxy(connection.proxy)
+
+    def _evict_idle(self, force=False):
+        """关闭空闲连接，force为True时关闭所有未在使用的连接"""
+        now = time.monotonic()
+        with self._lock:
+            evicted = [
+                connection for connection in self._connections
+                if not connection.in_use and (
+                    force or now - connection.last_used > self.idle_timeout)
+            ]
+            for connection in evicted:
+                connection.closed = True
+                self._connections.discard(connection)
+        for connection in evicted:
+            _close_proxy(connection.proxy)
+
+    def ping(self):
+        """探测服务器是否可用，使用独立的连接"""
+        proxy = self._factory()
+        try:
+            proxy.get_server_capabilities()
+            return True
+        except xmlrpc.client.Fault:
+            # 服务器能够响应，只是不支持该方法
+            return True
+        except Exception:
+            return False
+        finally:
+            _close_proxy(proxy)
+
+    def check_health(self):
+        """探测服务器，不可用时关闭空闲连接并记录一次中断"""
+        healthy = self.ping()
+        if not healthy:
+            if self.healthy:
+                self.outages += 1
+            # 服务器重启后旧连接都已失效
+            self._evict_idle(force=True)
+        self.healthy = healthy
+        return healthy
+
+    def _ensure_health_thread(self):
+        if self.health_interval <= 0 or self._health_thread is not None:
+            return
+        with self._lock:
+            if self._health_thread is not None:
+                return
+            self._health_thread = threading.Thread(
+                target=_health_loop, args=(weakref.ref(self), self._stop),
+                name='pytest-dsl-remote-health', daemon=True)
+        self._health_thread.start()
+
+
+def _health_loop(pool_ref, stop):
+    """健康检查线程只持有连接池的弱引用，连接池释放后自动退出"""
+    while True:
+        pool = pool_ref()
+        if pool is None:
+            return
+        interval = pool.health_interval
+        del pool
+        if stop.wait(interval):
+            return
+
+        pool = pool_ref()
+        if pool is None:
+            return
+        pool._evict_idle()
+        pool.check_health()
+        del pool
+
+
+class PooledServerProxy:
+    """通过连接池调用远程方法，接口与ServerProxy相同"""
+
+    native_types = False
+
+    def __init__(self, pool):
+        self._pool = pool
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return _PooledMethod(self._pool, name)
+
+
+class PooledCompactServerProxy(PooledServerProxy):
+    """紧凑传输协议的连接池代理，参数和返回值按原样传输"""
+
+    native_types = True
+
+
+class _PooledMethod:
+    __slots__ = ('_pool', '_name')
+
+    def __init__(self, pool, name):
+        self._pool = pool
+        self._name = name
+
+    def __call__(self, *args):
+        return self._pool.call(self._name, *args)
@@ -14,6 +14,9 @@ from typing import Any, Dict, List, Optional
 DEFAULT_MAX_CHARS = 20000
 DEFAULT_MAX_LOG_RECORDS = 200
 DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_LIVE_MAX_CHARS = 1000000
+# Seconds a finished live output is kept for a client that never reads it.
+LIVE_OUTPUT_TTL = 300.0
 
 _capture_state = threading.local()
 _stream_install_lock = threading.RLock()
@@ -91,6 +94,82 @@ class _LimitedTextBuffer:
         return redact_diagnostic_text("".join(self.parts))
 
 
+class LiveOutput:
+    """Output of a running keyword that the client polls by offset.
+
+    Offsets count characters since the keyword started; only the last
+    ``max_chars`` characters are retained for slow readers.
+    """
+
+    def __init__(self, max_chars: int):
+        self.max_chars = max_chars
+        self.parts: List[str] = []
+        self.base = 0
+        self.end = 0
+        self.done = False
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    def write(self, text: Any) -> None:
+        if not text:
+            return
+        text = str(text)
+        with self._lock:
+            self.parts.append(text)
+            self.end += len(text)
+            while self.parts and self.end - self.base > self.max_chars:
+                self.base += len(self.parts.pop(0))
+
+    def finish(self) -> None:
+        with self._lock:
+            self.done = True
+            self.finished_at = time.monotonic()
+
+    def read(self, offset: int) -> Dict[str, Any]:
+        with self._lock:
+            text = "".join(self.parts)
+            start = max(int(offset), self.base) - self.base
+            return {
+                "text": redact_diagnostic_text(text[start:]),
+                "offset": self.end,
+                "done": self.done,
+            }
+
+
+_live_outputs: Dict[str, LiveOutput] = {}
+_live_outputs_lock = threading.Lock()
+
+
+def open_live_output(request_id: str) -> LiveOutput:
+    """Register a live output buffer for ``request_id``."""
+    live_output = LiveOutput(_env_int("PYTEST_DSL_REMOTE_LIVE_MAX_CHARS",
+                                      DEFAULT_LIVE_MAX_CHARS))
+    now = time.monotonic()
+    with _live_outputs_lock:
+        for key, item in list(_live_outputs.items()):
+            if item.done and now - item.finished_at > LIVE_OUTPUT_TTL:
+                del _live_outputs[key]
+        _live_outputs[request_id] = live_output
+    return live_output
+
+
+def read_live_output(request_id: str, offset: int) -> Dict[str, Any]:
+    """Read output written after ``offset``.
+
+    Unknown ids report ``done=False`` because the request may still be
+    queued. A finished buffer is dropped once its tail has been read.
+    """
+    with _live_outputs_lock:
+        live_output = _live_outputs.get(request_id)
+    if live_output is None:
+        return {"text": "", "offset": int(offset), "done": False}
+    chunk = live_output.read(offset)
+    if chunk["done"]:
+        with _live_outputs_lock:
+            _live_outputs.pop(request_id, None)
+    return chunk
+
+
 def _capture_stack() -> List["RemoteExecutionCapture"]:
     stack = getattr(_capture_state, "stack", None)
     if stack is None:
@@ -205,8 +284,9 @@ class RemoteExecutionCapture:
 
     def __init__(self, keyword: str, request_id: str = None,
                  max_chars: int = None, max_log_records: int = None,
-                 log_level: int = None):
+                 log_level: int = None, live_output: LiveOutput = None):
         self.keyword = keyword
+        self.live_output = live_output
         self.request_id = request_id or uuid.uuid4().hex
         self.max_chars = max_chars or _env_int(
             "PYTEST_DSL_REMOTE_DIAG_MAX_CHARS", DEFAULT_MAX_CHARS)
@@ -237,6 +317,8 @@ class RemoteExecutionCapture:
             logging.getLogger().removeHandler(self._handler)
             self._handler = None
         _release_root_log_level()
+        if self.live_output is not None:
+            self.live_output.finish()
 
         stack = _capture_stack()
         if stack and stack[-1] is self:
@@ -246,6 +328,8 @@ class RemoteExecutionCapture:
         return False
 
     def write_stream(self, stream_name: str, text: Any) -> None:
+        if self.live_output is not None:
+            self.live_output.write(text)
         if stream_name == "stderr":
             self.stderr.write(text)
         else:
@@ -1,12 +1,22 @@
+import copy
 import xmlrpc.client
 from functools import partial
 import logging
 import difflib
 import os
+import sys
+import threading
+import uuid
+import weakref
 from dataclasses import dataclass, field
 from typing import Any, Dict
 
 from pytest_dsl.core.keyword_manager import keyword_manager, Parameter
+from pytest_dsl.remote.connection_pool import (
+    PooledCompactServerProxy,
+    PooledServerProxy,
+    RemoteConnectionPool,
+)
 from pytest_dsl.remote.log_utils import is_verbose, preview_keys, preview_value
 
 # 配置日志
@@ -47,6 +57,25 @@ class RemoteKeywordExecutionError(Exception):
         super().__init__(message)
 
 
+class RemoteServerBusyError(RemoteKeywordExecutionError):
+    """服务器并发已满，请求被拒绝，关键字没有执行，可以安全地重试"""
+
+
+# 服务器并发已满时返回的错误信息前缀，见 RemoteKeywordServer.run_keyword
+_SERVER_BUSY_PREFIX = '服务器繁忙'
+
+
+def is_server_busy_result(result) -> bool:
+    """run_keyword的结果是否为服务器繁忙（关键字没有执行）"""
+    return (isinstance(result, dict) and result.get('status') != 'PASS' and
+            str(result.get('error', '')).startswith(_SERVER_BUSY_PREFIX))
+
+
+def is_variable_resync_result(result) -> bool:
+    """服务器没有找到变量会话（如已重启），关键字没有执行，需要全量同步"""
+    return isinstance(result, dict) and bool(result.get('resync_variables'))
+
+
 class _TimeoutMixin:
     """为xmlrpc transport注入连接超时。"""
 
@@ -77,6 +106,43 @@ def _create_server_proxy(url, timeout):
     return xmlrpc.client.ServerProxy(url, allow_none=True, transport=transport)
 
 
+_MISSING = object()
+
+
+def _snapshot_value(value):
+    """复制已同步的变量值，用于之后比较是否发生变化"""
+    try:
+        return copy.deepcopy(value)
+    except Exception:
+        return value
+
+
+def _same_value(old_value, new_value) -> bool:
+    try:
+        return old_value is new_value or (
+            type(old_value) is type(new_value) and
+            bool(old_value == new_value))
+    except Exception:
+        return False
+
+
+class _VariableSyncState:
+    """记录某个上下文已同步到远程服务器的变量，用于计算增量
+
+    服务器支持变量会话时，每个状态对应服务器上的一个变量会话。
+    """
+
+    def __init__(self):
+        self.session_id = uuid.uuid4().hex
+        # 服务器还没有确认收到该会话的全部变量
+        self.full_sync = True
+        self.version = -1
+        self.values = {}
+
+    def session_options(self):
+        return {'session_id': self.session_id, 'full_sync': self.full_sync}
+
+
 def _is_verbose() -> bool:
     return is_verbose()
 
@@ -86,14 +152,110 @@ def _print_verbose(message: str) -> None:
         print(message)
 
 
+# 设置为1时，远程关键字执行期间实时打印其输出
+STREAM_OUTPUT_ENV = 'PYTEST_DSL_REMOTE_STREAM_OUTPUT'
+_STREAM_POLL_INTERVAL = 0.5
+
+
+def _stream_output_enabled() -> bool:
+    return os.environ.get(STREAM_OUTPUT_ENV, '').strip().lower() in (
+        '1', 'true', 'yes', 'on')
+
+
+class _OutputFollower:
+    """在后台线程中轮询read_output，实时打印远程关键字的输出
+
+    轮询线程通过连接池使用自己的连接，不影响正在等待结果的调用。
+    request_id为None时不做任何事。
+    """
+
+    def __init__(self, client, request_id):
+        self._client = client
+        self._request_id = request_id
+        self._offset = 0
+        self._partial = ''
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        if self._request_id:
+            self._thread = threading.Thread(
+                target=self._run, name='pytest-dsl-remote-output',
+                daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._thread is None:
+            return False
+        self._stop.set()
+        self._thread.join()
+        if exc_type is None:
+            # 读取关键字结束前最后写入的输出
+            self._poll()
+        if self._partial:
+            self._write_line(self._partial + '\n')
+        return False
+
+    def _run(self):
+        while not self._stop.wait(_STREAM_POLL_INTERVAL):
+            if not self._poll():
+                return
+
+    def _poll(self):
+        from pytest_dsl.core.serialization_utils import XMLRPCSerializer
+
+        try:
+            chunk = XMLRPCSerializer.safe_xmlrpc_call(
+                self._client.server, 'read_output', self._request_id,
+                self._offset, self._client.api_key)
+        except Exception as e:
+            _print_verbose(f"远程输出: {self._client.alias} 读取失败: {e}")
+            return False
+
+        self._offset = chunk.get('offset', self._offset)
+        lines = (self._partial + (chunk.get('text') or '')).splitlines(True)
+        self._partial = ''
+        if lines and not lines[-1].endswith('\n'):
+            self._partial = lines.pop()
+        for line in lines:
+            self._write_line(line)
+        return not chunk.get('done')
+
+    def _write_line(self, line):
+        sys.stdout.write(f"[{self._client.alias}] {line}")
+
+
 class RemoteKeywordClient:
     """远程关键字客户端，用于连接远程关键字服务器并执行关键字"""
 
+    # 服务器声明支持的可选能力，连接时获取；旧版本服务器为空
+    capabilities = frozenset()
+    # 协商后使用的传输协议：xmlrpc、json或msgpack
+    wire_protocol = 'xmlrpc'
+    # 每个上下文的变量增量同步状态，上下文释放后自动移除
+    _sync_states = None
+    # 不支持变量会话的服务器只保存一份变量，记录最后同步的上下文
+    _last_synced_context = None
+    # 已处理过的连接池健康检查中断次数
+    _seen_outages = 0
+    # 已通知但尚未发送的变量变化，下次调用本服务器前一并同步；
+    # 属于某个上下文的变化只随该上下文的调用发送
+    _pending_changes = None
+    _context_pending_changes = None
+    _sync_lock = threading.Lock()
+    _pool = None
+
     def __init__(self, url='http://localhost:8270/', api_key=None, alias=None,
-                 sync_config=None, timeout=None):
+                 sync_config=None, timeout=None, pool=None):
         self.url = url
         self.timeout = float(timeout) if timeout is not None else 600.0
-        self.server = _create_server_proxy(url, self.timeout)
+        # 连接池配置，见 connection_pool.DEFAULT_POOL_CONFIG
+        self.pool_config = dict(pool or {})
+        self._pool = RemoteConnectionPool(
+            partial(_create_server_proxy, url, self.timeout),
+            **self.pool_config)
+        self.server = PooledServerProxy(self._pool)
         self.keyword_cache = {}
         self.param_mappings = {}  # 存储每个关键字的参数映射
         self.api_key = api_key
@@ -109,18 +271,31 @@ class RemoteKeywordClient:
                 'private', 'remote_servers'  # 排除远程服务器配置避免循环
             ]
         }
+        self._sync_lock = threading.Lock()
+        self._sync_states = weakref.WeakKeyDictionary()
 
     def connect(self):
         """连接到远程服务器并获取可用关键字"""
         try:
             _print_verbose(f"远程连接: 开始连接 {self.alias} ({self.url})")
             from pytest_dsl.core.serialization_utils import XMLRPCSerializer
-            keyword_names = XMLRPCSerializer.safe_xmlrpc_call(
-                self.server, 'get_keyword_names')
-            _print_verbose(
-                f"远程连接: {self.alias} 加载关键字 {len(keyword_names)} 个")
-            for name in keyword_names:
-                self._register_remote_keyword(name)
+            # 重新连接的服务器可能已重启，之前同步的变量都需要重新发送
+            self.reset_variable_sync()
+            self.capabilities = self._fetch_capabilities()
+            self._select_wire_protocol()
+            if 'library_spec' in self.capabilities:
+                contracts = self._load_library_spec()
+                _print_verbose(
+                    f"远程连接: {self.alias} 加载关键字 {len(contracts)} 个")
+                for contract in contracts:
+                    self._register_remote_keyword(contract['name'], contract)
+            else:
+                keyword_names = XMLRPCSerializer.safe_xmlrpc_call(
+                    self.server, 'get_keyword_names')
+                _print_verbose(
+                    f"远程连接: {self.alias} 加载关键字 {len(keyword_names)} 个")
+                for name in keyword_names:
+                    self._register_remote_keyword(name)
 
             # 连接时传递变量到远程服务器
             self._send_initial_variables()
@@ -137,18 +312,88 @@ class RemoteKeywordClient:
             )
             return False
 
-    def _register_remote_keyword(self, name):
-        """注册远程关键字到本地关键字管理器"""
+    def _fetch_capabilities(self):
+        """获取服务器支持的可选能力，旧版本服务器返回空集合"""
+        from pytest_dsl.core.serialization_utils import XMLRPCSerializer
+        try:
+            capabilities = XMLRPCSerializer.safe_xmlrpc_call(
+                self.server, 'get_server_capabilities')
+        except Exception as e:
+            _print_verbose(f"远程连接: {self.alias} 不支持能力协商: {e}")
+            return frozenset()
+        return frozenset(capabilities or [])
+
+    def _select_wire_protocol(self):
+        """服务器支持时改用紧凑传输协议（JSON/msgpack），否则保持XML-RPC"""
+        from pytest_dsl.remote.wire import CompactServerProxy, negotiate_codec
+
+        codec = negotiate_codec(self.capabilities)
+        if codec is None:
+            return
+
+        pool = RemoteConnectionPool(
+            partial(CompactServerProxy, self.url, codec, self.timeout),
+            **self.pool_config)
+        try:
+            pool.call('get_server_capabilities')
+        except Exception as e:
+            # 例如中间代理不转发该路径，继续使用XML-RPC
+            _print_verbose(
+                f"远程连接: {self.alias} 紧凑协议不可用，使用XML-RPC: {e}")
+            pool.close()
+            return
+
+        if self._pool is not None:
+            self._pool.close()
+        self._pool = pool
+        self.server = PooledCompactServerProxy(pool)
+        self.wire_protocol = codec.name
+        _print_verbose(f"远程连接: {self.alias} 使用 {codec.name} 传输协议")
+
+    def close(self):
+        """关闭到远程服务器的所有连接"""
+        if self._pool is not None:
+            self._pool.close()
+
+    def _load_library_spec(self):
+        """获取全部关键字契约，服务器规格未变化时使用本地缓存
+
+        Returns:
+            list: 关键字契约列表
+        """
+        from pytest_dsl.core.serialization_utils import XMLRPCSerializer
+        from pytest_dsl.remote.spec_cache import library_spec_cache
+
+        cached = library_spec_cache.get(self.url)
+        known_hash = cached['hash'] if cached else ''
+        spec = XMLRPCSerializer.safe_xmlrpc_call(
+            self.server, 'get_library_spec', known_hash)
+
+        if spec.get('unchanged') and cached:
+            _print_verbose(f"远程连接: {self.alias} 关键字规格未变化，使用缓存")
+            return cached['keywords']
+
+        library_spec_cache.put(self.url, spec)
+        return spec['keywords']
+
+    def _register_remote_keyword(self, name, contract=None):
+        """注册远程关键字到本地关键字管理器
+
+        Args:
+            name: 远程关键字名称
+            contract: 已获取的关键字契约，为None时向服务器查询
+        """
         # 获取关键字参数信息
         try:
             from pytest_dsl.core.serialization_utils import XMLRPCSerializer
-            contract = {}
-            try:
-                contract = XMLRPCSerializer.safe_xmlrpc_call(
-                    self.server, 'get_keyword_contract', name)
-            except Exception as e:
-                _print_verbose(
-                    f"远程关键字: {name} 契约获取失败，回退旧接口: {e}")
+            if contract is None:
+                contract = {}
+                try:
+                    contract = XMLRPCSerializer.safe_xmlrpc_call(
+                        self.server, 'get_keyword_contract', name)
+                except Exception as e:
+                    _print_verbose(
+                        f"远程关键字: {name} 契约获取失败，回退旧接口: {e}")
 
             param_names = []
             doc = ""
@@ -271,17 +516,201 @@ class RemoteKeywordClient:
     def _execute_remote_keyword_impl(self, return_outcome=False, **kwargs):
         """执行远程关键字"""
         name = kwargs.pop('name')
+        context = kwargs.pop('context', None)
+
+        # 在执行前同步自上次调用以来变化的上下文变量，
+        # 服务器支持时随run_keyword一起发送，省去一次往返
+        carried_variables = self._sync_context_variables_before_execution(
+            context, piggyback=True)
+        mapped_kwargs = self._map_call_arguments(name, kwargs)
+
+        options = self._run_keyword_options()
+        session = self._variable_session(context)
+        result = self._call_run_keyword(
+            name, mapped_kwargs, carried_variables, options, session, context)
+        if session is not None and is_variable_resync_result(result):
+            # 服务器已重启或淘汰了变量会话，全量同步后重新执行
+            carried_variables, session = self._resync_variables(context)
+            result = self._call_run_keyword(
+                name, mapped_kwargs, carried_variables, options, session,
+                context)
+
+        if options.get('artifacts'):
+            result = self._download_artifacts(result)
+        return self.handle_run_keyword_result(name, result, return_outcome)
+
+    def _call_run_keyword(self, name, mapped_kwargs, carried_variables,
+                          options, session, context=None):
+        """调用服务器的run_keyword，按需携带变量、会话和调用选项"""
+        # 检查是否需要传递API密钥
+        from pytest_dsl.core.serialization_utils import XMLRPCSerializer
+        if session is not None:
+            options = {**options, **session.session_options()}
+        try:
+            if options:
+                with _OutputFollower(self, options.get('request_id')):
+                    result = XMLRPCSerializer.safe_xmlrpc_call(
+                        self.server, 'run_keyword', name, mapped_kwargs,
+                        self.api_key, carried_variables or {}, options)
+            elif carried_variables:
+                result = XMLRPCSerializer.safe_xmlrpc_call(
+                    self.server, 'run_keyword', name, mapped_kwargs,
+                    self.api_key, carried_variables)
+            elif self.api_key:
+                result = XMLRPCSerializer.safe_xmlrpc_call(
+                    self.server, 'run_keyword', name, mapped_kwargs, self.api_key)
+            else:
+                result = XMLRPCSerializer.safe_xmlrpc_call(
+                    self.server, 'run_keyword', name, mapped_kwargs)
+        except Exception as e:
+            if carried_variables:
+                # 无法确认服务器是否已收到变量，下次调用重新全量同步
+                self.reset_variable_sync()
+            raise Exception(
+                "远程关键字调用失败: "
+                f"{self.alias}|{name} ({self.url}, timeout={self.timeout}s): {e}"
+            ) from e
+
+        self._after_variables_sent(result, carried_variables, session, context)
+        return result
+
+    def _after_variables_sent(self, result, carried_variables, session,
+                              context=None):
+        """根据服务器的第一个结果确认携带的变量是否已被接收"""
+        if session is not None:
+            # 服务器在排队前合并会话变量，繁忙时也已收到
+            if not is_variable_resync_result(result):
+                session.full_sync = False
+        elif carried_variables and is_server_busy_result(result):
+            # 服务器没有处理请求，携带的变量留到下次调用再发送
+            self.queue_variable_changes(carried_variables, context=context)
+
+    def _resync_variables(self, context):
+        """服务器丢失了变量会话：重新发送初始变量并全量同步上下文变量
+
+        Returns:
+            tuple: (需要随调用携带的变量, 新的变量会话状态)
+        """
+        _print_verbose(f"远程同步: {self.alias} 变量会话已失效，重新全量同步")
+        self.reset_variable_sync()
+        self._send_initial_variables()
+        carried_variables = self._sync_context_variables_before_execution(
+            context, piggyback=True)
+        return carried_variables, self._variable_session(context)
+
+    def _run_keyword_options(self):
+        """根据服务器能力生成run_keyword的调用选项"""
+        options = {}
+        if 'artifacts' in self.capabilities:
+            options['artifacts'] = True
+        if ('output_stream' in self.capabilities and
+                _stream_output_enabled()):
+            options['request_id'] = uuid.uuid4().hex
+            options['stream_output'] = True
+        return options
+
+    def _download_artifacts(self, result):
+        """分块下载结果中的制品，文件保存到本地并作为Allure附件"""
+        from pytest_dsl.remote.artifacts import (
+            contains_artifact_refs, materialize_artifacts
+        )
+
+        if not (isinstance(result, dict) and
+                contains_artifact_refs(result.get('return'))):
+            return result
+        result = dict(result)
+        result['return'] = materialize_artifacts(
+            result['return'], self._read_artifact_chunk,
+            self._release_artifact)
+        return result
+
+    def _read_artifact_chunk(self, artifact_id, offset):
+        from pytest_dsl.core.serialization_utils import XMLRPCSerializer
+
+        chunk = XMLRPCSerializer.safe_xmlrpc_call(
+            self.server, 'read_artifact', artifact_id, offset, self.api_key)
+        if isinstance(chunk, xmlrpc.client.Binary):
+            return chunk.data
+        return chunk
 
-        # 在执行前同步最新的上下文变量
-        self._sync_context_variables_before_execution(kwargs.get('context'))
+    def _release_artifact(self, artifact_id):
+        from pytest_dsl.core.serialization_utils import XMLRPCSerializer
+
+        try:
+            XMLRPCSerializer.safe_xmlrpc_call(
+                self.server, 'release_artifact', artifact_id, self.api_key)
+        except Exception as e:
+            # 服务器会在过期后自动清理
+            _print_verbose(f"远程制品: 释放 {artifact_id} 失败: {e}")
 
-        # 移除context参数，因为它不能被序列化
-        if 'context' in kwargs:
-            kwargs.pop('context', None)
+    def run_keyword_batch(self, calls, context=None):
+        """在一次请求中依次执行多个远程关键字
+
+        服务器按顺序执行，遇到失败的关键字即停止。需要服务器支持
+        run_keywords能力。
+
+        Args:
+            calls: [(关键字名称, 参数字典), ...]
+            context: TestContext实例，用于执行前同步变量
 
+        Returns:
+            list: 每个已执行关键字的run_keyword原始结果，交给
+                handle_run_keyword_result处理；遇到失败后停止，
+                因此长度可能小于calls
+        """
+        carried_variables = self._sync_context_variables_before_execution(
+            context, piggyback=True)
+        payload = [
+            {'name': name, 'args': self._map_call_arguments(name, kwargs)}
+            for name, kwargs in calls
+        ]
+        names = ", ".join(name for name, _ in calls)
+
+        session = self._variable_session(context)
+        results = self._call_run_keywords(
+            payload, names, carried_variables, session, context)
+        if (session is not None and results and
+                is_variable_resync_result(results[0])):
+            carried_variables, session = self._resync_variables(context)
+            results = self._call_run_keywords(
+                payload, names, carried_variables, session, context)
+        return results
+
+    def _call_run_keywords(self, payload, names, carried_variables, session,
+                           context=None):
+        from pytest_dsl.core.serialization_utils import XMLRPCSerializer
+
+        args = [payload, self.api_key, carried_variables or {}]
+        if session is not None:
+            args.append(session.session_options())
+        try:
+            results = XMLRPCSerializer.safe_xmlrpc_call(
+                self.server, 'run_keywords', *args)
+        except Exception as e:
+            self.reset_variable_sync()
+            raise Exception(
+                "远程关键字批量调用失败: "
+                f"{self.alias}|[{names}] ({self.url}, "
+                f"timeout={self.timeout}s): {e}"
+            ) from e
+
+        if results:
+            self._after_variables_sent(
+                results[0], carried_variables, session, context)
+        return results
+
+    def _map_call_arguments(self, name, kwargs):
+        """校验远程关键字参数并映射为服务器端参数名
+
+        Args:
+            name: 关键字名称
+            kwargs: 调用参数（不含context）
+
+        Returns:
+            dict: 映射后的参数
+        """
         # 移除step_name参数，这是自动添加的，不需要传递给远程服务器
-        if 'step_name' in kwargs:
-            kwargs.pop('step_name', None)
+        kwargs = {k: v for k, v in kwargs.items() if k != 'step_name'}
 
         # 参数名校验：避免“参数不存在但不报错”的静默问题
         if name in self.param_mappings:
@@ -355,23 +784,10 @@ class RemoteKeywordClient:
             _print_verbose(f"远程调用: {name} 支持参数: {param_names}")
             # 不再显示警告信息，因为参数已经在服务器端正确处理
             # 服务器端会使用默认值或者报错，客户端不需要重复警告
+        return mapped_kwargs
 
-        # 执行远程调用
-        # 检查是否需要传递API密钥
-        from pytest_dsl.core.serialization_utils import XMLRPCSerializer
-        try:
-            if self.api_key:
-                result = XMLRPCSerializer.safe_xmlrpc_call(
-                    self.server, 'run_keyword', name, mapped_kwargs, self.api_key)
-            else:
-                result = XMLRPCSerializer.safe_xmlrpc_call(
-                    self.server, 'run_keyword', name, mapped_kwargs)
-        except Exception as e:
-            raise Exception(
-                "远程关键字调用失败: "
-                f"{self.alias}|{name} ({self.url}, timeout={self.timeout}s): {e}"
-            ) from e
-
+    def handle_run_keyword_result(self, name, result, return_outcome=False):
+        """处理run_keyword返回的结果，失败时抛出RemoteKeywordExecutionError"""
         _print_verbose(f"远程调用: 结果 {result}")
 
         diagnostics = result.get('diagnostics', {}) if isinstance(result, dict) else {}
@@ -416,7 +832,9 @@ class RemoteKeywordClient:
         else:
             error_msg = result.get('error', '未知错误')
             traceback_lines = result.get('traceback', [])
-            raise RemoteKeywordExecutionError(
+            error_class = (RemoteServerBusyError if is_server_busy_result(result)
+                           else RemoteKeywordExecutionError)
+            raise error_class(
                 error_msg,
                 alias=self.alias,
                 keyword=name,
@@ -587,31 +1005,46 @@ class RemoteKeywordClient:
         except Exception:
             return None
 
-    def _sync_context_variables_before_execution(self, context):
+    def _sync_context_variables_before_execution(self, context,
+                                                 piggyback=False):
         """在执行远程关键字前同步最新的上下文变量
 
+        只发送自上次同步到本服务器以来发生变化的变量（首次或切换上下文时
+        全量发送）。
+
+        通过queue_variable_changes缓存的变量变化也在此时一并发送。
+
         Args:
-            context: TestContext实例，如果为None则跳过同步
+            context: TestContext实例，如果为None则只发送缓存的变量变化
+            piggyback: 为True且服务器支持随run_keyword携带变量时，
+                不单独发送，而是返回待携带的变量
+
+        Returns:
+            需要随run_keyword携带的变量字典，不需要携带时返回None
         """
-        if context is None:
-            return
+        pending_changes = self._take_pending_changes(context)
+        if context is None and not pending_changes:
+            return None
 
         try:
-            # 获取所有上下文变量
-            context_variables = context.get_all_context_variables()
+            # 获取变化的上下文变量
+            context_variables = {}
+            if context is not None:
+                context_variables = self._collect_changed_context_variables(
+                    context)
 
-            if not context_variables:
+            if not context_variables and not pending_changes:
                 _print_verbose("远程同步: 没有上下文变量需要同步")
-                return
+                return None
 
             # 使用统一的序列化工具进行变量过滤
             from pytest_dsl.core.serialization_utils import XMLRPCSerializer
-            
+
             # 扩展排除模式
             exclude_patterns = self.sync_config.get('yaml_exclude_patterns', [
                 'remote_servers'
             ])
-            
+
             variables_to_sync = XMLRPCSerializer.filter_variables(
                 context_variables, exclude_patterns)
 
@@ -619,27 +1052,140 @@ class RemoteKeywordClient:
             variables_to_sync = self._apply_hook_filter(
                 variables_to_sync, context_variables, 'realtime')
 
-            if variables_to_sync:
-                # 调用远程服务器的变量同步接口
-                try:
-                    from pytest_dsl.core.serialization_utils import XMLRPCSerializer
-                    result = XMLRPCSerializer.safe_xmlrpc_call(
-                        self.server, 'sync_variables_from_client',
-                        variables_to_sync, self.api_key)
-                    if result.get('status') == 'success':
-                        _print_verbose(
-                            f"✅ 同步变量 {len(variables_to_sync)} 项 -> {self.alias}"
-                        )
-                    else:
-                        print(f"❌ 实时同步变量失败: {result.get('error', '未知错误')}")
-                except Exception as e:
-                    print(f"❌ 调用远程变量同步接口失败: {str(e)}")
-            else:
+            # 缓存的变量变化已在通知时过滤，上下文中的最新值优先
+            variables_to_sync = {**pending_changes, **variables_to_sync}
+
+            if not variables_to_sync:
                 _print_verbose("远程同步: 没有需要同步的变量")
+                return None
+
+            if piggyback and 'run_keyword_variables' in self.capabilities:
+                _print_verbose(
+                    f"✅ 随调用携带变量 {len(variables_to_sync)} 项 -> {self.alias}"
+                )
+                return variables_to_sync
+
+            # 调用远程服务器的变量同步接口
+            try:
+                result = XMLRPCSerializer.safe_xmlrpc_call(
+                    self.server, 'sync_variables_from_client',
+                    variables_to_sync, self.api_key)
+                if result.get('status') == 'success':
+                    _print_verbose(
+                        f"✅ 同步变量 {len(variables_to_sync)} 项 -> {self.alias}"
+                    )
+                else:
+                    self.reset_variable_sync()
+                    print(f"❌ 实时同步变量失败: {result.get('error', '未知错误')}")
+            except Exception as e:
+                self.reset_variable_sync()
+                print(f"❌ 调用远程变量同步接口失败: {str(e)}")
 
         except Exception as e:
+            self.reset_variable_sync()
             logger.warning(f"实时变量同步失败: {str(e)}")
             print(f"❌ 实时变量同步失败: {str(e)}")
+        return None
+
+    def queue_variable_changes(self, variables, context=None):
+        """缓存变量变化，在下次调用本服务器的关键字前一并同步
+
+        同一变量多次变化只保留最新值，未再调用本服务器时不产生网络请求。
+
+        Args:
+            variables: 已过滤的变量字典
+            context: 变化所属的TestContext。指定时只随该上下文的调用发送，
+                并行分支的变量不会发送到其他分支；为None时随下一次调用发送
+        """
+        with self._sync_lock:
+            if context is None:
+                if self._pending_changes is None:
+                    self._pending_changes = {}
+                self._pending_changes.update(variables)
+                return
+            if self._context_pending_changes is None:
+                self._context_pending_changes = weakref.WeakKeyDictionary()
+            self._context_pending_changes.setdefault(
+                context, {}).update(variables)
+
+    def _take_pending_changes(self, context=None):
+        """取出并清空不属于任何上下文的、以及属于context的变量变化"""
+        with self._sync_lock:
+            pending_changes = self._pending_changes or {}
+            self._pending_changes = None
+            if context is not None and self._context_pending_changes:
+                pending_changes = {
+                    **pending_changes,
+                    **self._context_pending_changes.pop(context, {})}
+        return pending_changes
+
+    def _collect_changed_context_variables(self, context):
+        """收集自上次同步到本服务器以来发生变化的上下文变量
+
+        每个上下文单独记录同步状态，并行分支各自计算增量。本地变量通过
+        TestContext的版本号找出变化项，外部提供者的变量（YAML、全局变量）
+        与上次发送的值比较。上下文不支持版本号时退化为全量同步。
+
+        服务器不支持变量会话时只保存一份变量，切换上下文后需要全量同步；
+        健康检查发现服务器中断过时，所有上下文都重新全量同步。
+
+        Args:
+            context: TestContext实例
+
+        Returns:
+            dict: 需要同步的变量
+        """
+        if not hasattr(context, 'get_changed_variables'):
+            return context.get_all_context_variables()
+
+        sessions = 'variable_sessions' in self.capabilities
+        outages = getattr(self._pool, 'outages', 0)
+        with self._sync_lock:
+            if self._sync_states is None or outages != self._seen_outages:
+                self._sync_states = weakref.WeakKeyDictionary()
+                self._seen_outages = outages
+            last_context = self._last_synced_context
+            if (not sessions and last_context is not None and
+                    last_context() is not context):
+                self._sync_states.clear()
+
+            state = self._sync_states.get(context)
+            if state is None or context.cleared_since(state.version):
+                state = _VariableSyncState()
+                candidates = context.get_all_context_variables()
+            else:
+                candidates = context.get_changed_variables(state.version)
+                local_variables = context.get_local_variables()
+                for name, value in context.get_external_variables().items():
+                    if name not in local_variables:
+                        candidates[name] = value
+
+            changed = {
+                name: value for name, value in candidates.items()
+                if not _same_value(state.values.get(name, _MISSING), value)
+            }
+            for name, value in changed.items():
+                state.values[name] = _snapshot_value(value)
+            state.version = context.version
+            self._sync_states[context] = state
+            self._last_synced_context = weakref.ref(context)
+            return changed
+
+    def _variable_session(self, context):
+        """上下文对应的变量会话状态，服务器不支持变量会话时返回None"""
+        if context is None or 'variable_sessions' not in self.capabilities:
+            return None
+        with self._sync_lock:
+            return (self._sync_states or {}).get(context)
+
+    def reset_variable_sync(self):
+        """丢弃所有增量同步状态，之后每个上下文重新全量同步
+
+        在重新连接，或无法确认服务器是否收到变量时调用。
+        """
+        with self._sync_lock:
+            self._sync_states = weakref.WeakKeyDictionary()
+            self._last_synced_context = None
 
     def _collect_context_variables(self, context):
         """从TestContext收集所有变量（包括外部提供者变量）
@@ -717,36 +1263,24 @@ class RemoteKeywordClient:
 
         # 获取所有全局变量（包括g_开头的变量）
         try:
-            # 这里需要访问全局上下文的内部存储
-            # 由于GlobalContext使用文件存储，我们需要直接读取
-            import json
-            import os
-            from filelock import FileLock
-
-            storage_file = global_context._storage_file
-            lock_file = global_context._lock_file
-
-            if os.path.exists(storage_file):
-                with FileLock(lock_file):
-                    with open(storage_file, 'r', encoding='utf-8') as f:
-                        stored_vars = json.load(f)
-                        # 只同步g_开头的全局变量
-                        global_vars = {
-                            name: value for name, value in stored_vars.items() 
-                            if name.startswith('g_')
-                        }
-                        if global_vars:
-                            from pytest_dsl.core.serialization_utils import (
-                                XMLRPCSerializer
-                            )
-                            filtered_global_vars = XMLRPCSerializer.filter_variables(
-                                global_vars)
+            stored_vars = global_context.get_all_stored_variables()
+            # 只同步g_开头的全局变量
+            global_vars = {
+                name: value for name, value in stored_vars.items()
+                if name.startswith('g_')
+            }
+            if global_vars:
+                from pytest_dsl.core.serialization_utils import (
+                    XMLRPCSerializer
+                )
+                filtered_global_vars = XMLRPCSerializer.filter_variables(
+                    global_vars)
 
-                            # 应用Hook过滤
-                            filtered_global_vars = self._apply_hook_filter(
-                                filtered_global_vars, global_vars, 'initial', 'global')
+                # 应用Hook过滤
+                filtered_global_vars = self._apply_hook_filter(
+                    filtered_global_vars, global_vars, 'initial', 'global')
 
-                            variables.update(filtered_global_vars)
+                variables.update(filtered_global_vars)
         except Exception as e:
             logger.warning(f"收集全局变量失败: {str(e)}")
 
@@ -866,7 +1400,7 @@ class RemoteKeywordManager:
         self.clients = {}  # 别名 -> 客户端实例
 
     def register_remote_server(self, url, alias, api_key=None,
-                               sync_config=None, timeout=None):
+                               sync_config=None, timeout=None, pool=None):
         """注册远程关键字服务器
 
         Args:
@@ -875,19 +1409,57 @@ class RemoteKeywordManager:
             api_key: API密钥(可选)
             sync_config: 变量同步配置(可选)
             timeout: XML-RPC调用超时时间(秒)
+            pool: 连接池配置(可选)，如 {'idle_timeout': 60, 'health_interval': 30}
 
         Returns:
             bool: 是否成功连接
         """
         _print_verbose(f"远程连接: 注册服务器 {alias} ({url})")
         client = RemoteKeywordClient(url=url, api_key=api_key, alias=alias,
-                                     sync_config=sync_config, timeout=timeout)
+                                     sync_config=sync_config, timeout=timeout,
+                                     pool=pool)
+        return self._connect_and_register(client, alias, url)
+
+    def register_remote_server_group(self, urls, alias, api_key=None,
+                                     sync_config=None, timeout=None,
+                                     pool=None, balance='least_outstanding'):
+        """把一组等价的远程服务器注册在同一个别名下
+
+        调用按负载均衡策略分配到各成员，成员繁忙或拒绝连接时自动改由
+        其他成员执行。
+
+        Args:
+            urls: 成员服务器URL列表
+            alias: 服务器组别名
+            api_key: API密钥(可选)，所有成员相同
+            sync_config: 变量同步配置(可选)
+            timeout: XML-RPC调用超时时间(秒)
+            pool: 连接池配置(可选)
+            balance: 负载均衡策略，least_outstanding 或 round_robin
+
+        Returns:
+            bool: 是否至少有一个成员连接成功
+        """
+        from pytest_dsl.remote.server_group import create_server_group
+
+        urls = list(urls)
+        _print_verbose(f"远程连接: 注册服务器组 {alias} ({', '.join(urls)})")
+        group = create_server_group(
+            urls, alias, strategy=balance, api_key=api_key,
+            sync_config=sync_config, timeout=timeout, pool=pool)
+        return self._connect_and_register(group, alias, ', '.join(urls))
+
+    def _connect_and_register(self, client, alias, url):
         success = client.connect()
 
         if success:
             _print_verbose(f"远程连接: 注册完成 {alias} ({url})")
+            previous = self.clients.get(alias)
             self.clients[alias] = client
+            if previous is not None and previous is not client:
+                previous.close()
         else:
+            client.close()
             _print_verbose(f"远程连接: 注册失败 {alias} ({url})")
 
         return success
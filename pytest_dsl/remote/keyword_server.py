@@ -1,4 +1,6 @@
+import xmlrpc.client
 import xmlrpc.server
+import hashlib
 import inspect
 import json
 import sys
@@ -10,16 +12,124 @@ import time
 import socketserver
 import platform
 
+from pytest_dsl.core.context import TestContext
 from pytest_dsl.core.keyword_manager import keyword_manager
 from pytest_dsl.core.reporting import (
     print_verbose,
     run_with_suppressed_success_output,
 )
 from pytest_dsl.core.serialization_utils import XMLRPCSerializer
-from pytest_dsl.remote.diagnostics import RemoteExecutionCapture
+from pytest_dsl.core.variable_providers import (
+    setup_context_with_default_providers
+)
+from pytest_dsl.remote.artifacts import (
+    ArtifactStore,
+    externalize_artifacts,
+    inline_artifacts,
+)
+from pytest_dsl.remote.diagnostics import (
+    RemoteExecutionCapture,
+    open_live_output,
+    read_live_output,
+)
 from pytest_dsl.remote.hook_manager import hook_manager, HookType
 
 from pytest_dsl.remote.log_utils import is_verbose, preview_keys, preview_value
+from pytest_dsl.remote.variable_sessions import (
+    SessionVariableProvider,
+    VariableSessionStore,
+)
+from pytest_dsl.remote.wire import (
+    COMPACT_RPC_PATH,
+    dispatch_compact_request,
+    native_types_active,
+    native_types_scope,
+    wire_capabilities,
+)
+from pytest_dsl.remote.work_queue import (
+    DEFAULT_MAX_QUEUE,
+    DEFAULT_MAX_WAIT,
+    KeywordProcessPool,
+    KeywordWorkQueue,
+    QueueFullError,
+)
+
+
+# 服务器支持的可选能力，客户端连接时据此选择更高效的调用方式
+SERVER_CAPABILITIES = (
+    'run_keyword_variables',  # run_keyword可随调用携带待同步的变量
+    'library_spec',  # get_library_spec一次返回全部关键字契约
+    'run_keywords',  # run_keywords在一次请求中依次执行多个关键字
+    # run_keywords在设置了变量的关键字之后结束，后续调用可能依赖这些变量
+    'run_keywords_dependencies',
+    'artifacts',  # 大结果和文件通过read_artifact分块传输
+    'output_stream',  # 执行期间可通过read_output实时读取输出
+    'variable_sessions',  # 上下文变量按客户端会话保存，不写入全局变量
+)
+
+_work_queue_lock = threading.Lock()
+_thread_state = threading.local()
+
+
+def _thread_test_context(session_variables=None):
+    """当前工作线程复用的测试上下文，每次执行关键字前清空本地变量
+
+    变量提供者只在创建时注册一次，YAML变量和全局变量仍然实时读取。
+    session_variables为请求所属会话的变量，优先于YAML变量和全局变量。
+    """
+    test_context = getattr(_thread_state, 'test_context', None)
+    if test_context is None:
+        test_context = TestContext()
+        _thread_state.session_provider = SessionVariableProvider()
+        test_context.register_external_variable_provider(
+            _thread_state.session_provider)
+        setup_context_with_default_providers(test_context)
+        _thread_state.test_context = test_context
+    else:
+        test_context.clear()
+        test_context.executor = None
+    _thread_state.session_provider.use(session_variables)
+    return test_context
+
+
+def _sets_variables(result):
+    """关键字结果是否会在客户端设置变量（captures或side_effects中的变量）"""
+    data = result.get('return')
+    while isinstance(data, dict):
+        if data.get('captures'):
+            return True
+        side_effects = data.get('side_effects')
+        if isinstance(side_effects, dict) and side_effects.get('variables'):
+            return True
+        # 客户端也会处理嵌套在result中的新格式结果
+        data = data.get('result')
+    return False
+
+
+class KeywordRPCRequestHandler(xmlrpc.server.SimpleXMLRPCRequestHandler):
+    """XML-RPC请求处理器，同时提供紧凑协议通道并保持HTTP/1.1长连接。"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        if not self.path.endswith(COMPACT_RPC_PATH):
+            return super().do_POST()
+
+        length = int(self.headers.get('content-length') or 0)
+        body = self.rfile.read(length)
+        data, content_type = dispatch_compact_request(
+            self.server, body, self.headers.get('content-type'))
+        if data is None:
+            self.send_response(415)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
 
 
 class ThreadedXMLRPCServer(socketserver.ThreadingMixIn,
@@ -29,19 +139,39 @@ class ThreadedXMLRPCServer(socketserver.ThreadingMixIn,
     daemon_threads = True
     allow_reuse_address = True
 
+    def __init__(self, addr, requestHandler=KeywordRPCRequestHandler,
+                 **kwargs):
+        super().__init__(addr, requestHandler, **kwargs)
+
 
 class RemoteKeywordServer:
     """远程关键字服务器，提供关键字的远程调用能力"""
 
+    # 等待工作线程的最大请求数和最长等待时间（秒）
+    max_queue = DEFAULT_MAX_QUEUE
+    max_wait = DEFAULT_MAX_WAIT
+    _work_queue = None
+    _process_pool = None
+    _artifact_store = None
+    _variable_sessions = None
+    # 关键字名称 -> (关键字信息, 参数映射)，所有服务器实例共享
+    _keyword_mappings = {}
+
     def __init__(self, host='localhost', port=8270, api_key=None,
-                 max_concurrency=20, register_shutdown_handlers=True):
+                 max_concurrency=20, register_shutdown_handlers=True,
+                 max_queue=DEFAULT_MAX_QUEUE, max_wait=DEFAULT_MAX_WAIT,
+                 process_keywords=None, process_workers=None,
+                 extensions=None):
         self.host = host
         self.port = port
         self.server = None
         self.api_key = api_key
         self.max_concurrency = int(max_concurrency) if max_concurrency else 20
-        self._concurrency_limiter = threading.BoundedSemaphore(
-            self.max_concurrency)
+        self.max_queue = int(max_queue)
+        self.max_wait = float(max_wait)
+        if process_keywords:
+            self._process_pool = KeywordProcessPool(
+                process_keywords, process_workers, extensions)
 
         # 变量存储
         self.shared_variables = {}  # 存储共享变量
@@ -123,6 +253,11 @@ class RemoteKeywordServer:
         except Exception as e:
             print(f"执行关闭hook时出错: {e}")
 
+        # 停止工作队列和进程池
+        for executor in (self._work_queue, self._process_pool):
+            if executor is not None:
+                executor.shutdown()
+
         # 关闭XML-RPC服务器
         if self.server:
             try:
@@ -166,11 +301,17 @@ class RemoteKeywordServer:
         # 注册核心方法
         self.server.register_function(self.get_keyword_names)
         self.server.register_function(self.run_keyword)
+        self.server.register_function(self.run_keywords)
         self.server.register_function(self.get_keyword_arguments)
         self.server.register_function(self.get_keyword_parameter_details)
         self.server.register_function(self.get_keyword_documentation)
         self.server.register_function(self.get_keyword_contract)
+        self.server.register_function(self.get_library_spec)
         self.server.register_function(self.authenticate)
+        self.server.register_function(self.get_server_capabilities)
+        self.server.register_function(self.read_artifact)
+        self.server.register_function(self.release_artifact)
+        self.server.register_function(self.read_output)
 
         # 注册变量同步方法
         self.server.register_function(self.sync_variables_from_client)
@@ -206,13 +347,27 @@ class RemoteKeywordServer:
         """获取所有可用的关键字名称"""
         return list(keyword_manager._keywords.keys())
 
-    def run_keyword(self, name, args_dict, api_key=None):
+    def get_server_capabilities(self):
+        """获取服务器支持的可选能力列表"""
+        return list(SERVER_CAPABILITIES) + wire_capabilities()
+
+    def run_keyword(self, name, args_dict, api_key=None, variables=None,
+                    options=None):
         """执行关键字并返回结果
 
         Args:
             name: 关键字名称
             args_dict: 关键字参数字典
             api_key: API密钥(可选)
+            variables: 执行前需要同步的客户端变量(可选)，
+                与sync_variables_from_client效果相同
+            options: 客户端声明的调用选项(可选)：
+                request_id - 由客户端指定的请求ID；
+                artifacts - 大结果和文件以制品引用返回；
+                stream_output - 执行期间可通过read_output读取输出；
+                session_id - 变量会话ID，variables合并到该会话中，
+                    只对该会话的关键字可见；
+                full_sync - variables是会话的全部变量
 
         Returns:
             dict: 包含执行结果的字典，格式为:
@@ -223,6 +378,8 @@ class RemoteKeywordServer:
                     'traceback': 错误堆栈 (如果失败),
                     'diagnostics': 远程执行诊断信息
                 }
+                变量会话不存在（如服务器已重启）时不执行关键字，
+                返回结果中resync_variables为True，客户端需要全量同步。
         """
         # 验证API密钥
         if self.api_key and not self.authenticate(api_key):
@@ -232,23 +389,137 @@ class RemoteKeywordServer:
                 'traceback': []
             }
 
-        # 并发限流，避免线程无限增长导致进程不稳定
-        if not self._concurrency_limiter.acquire(blocking=False):
+        options = options or {}
+        session_variables = None
+        if options.get('session_id'):
+            variables = self._restore_variables(variables)
+            # 排队前合并，服务器繁忙时变量也不会丢失
+            session_variables = self._get_variable_sessions().update(
+                options['session_id'], variables,
+                options.get('full_sync', False))
+            if session_variables is None:
+                return {
+                    'status': 'FAIL',
+                    'error': '变量会话不存在，需要重新同步变量',
+                    'traceback': [],
+                    'resync_variables': True
+                }
+            if variables:
+                # 本地变量只属于会话，g_全局变量和共享变量仍对所有请求可见
+                self._publish_client_variables(variables)
+            variables = None
+
+        # 关键字由固定数量的工作线程执行，忙时在有界队列中等待
+        work_queue = self._get_work_queue()
+        try:
+            return work_queue.run(self._execute_keyword, name, args_dict,
+                                  variables, options, native_types_active(),
+                                  session_variables)
+        except QueueFullError as e:
             return {
                 'status': 'FAIL',
-                'error': (
-                    f'服务器繁忙：并发请求已达上限 '
-                    f'({self.max_concurrency})，请稍后重试'
-                ),
-                'traceback': []
+                'error': f'服务器繁忙：{e}，请稍后重试',
+                'traceback': [],
+                'diagnostics': {'queue_depth': work_queue.depth}
             }
 
+    def _get_work_queue(self):
+        if self._work_queue is None:
+            with _work_queue_lock:
+                if self._work_queue is None:
+                    self._work_queue = KeywordWorkQueue(
+                        self.max_concurrency, self.max_queue, self.max_wait)
+        return self._work_queue
+
+    def _execute_keyword(self, queue_stats, name, args_dict, variables,
+                         options, native_types, session_variables=None):
+        """在工作线程中执行关键字，native_types为请求所用的传输协议"""
+        with native_types_scope(native_types):
+            return self._execute_keyword_now(
+                queue_stats, name, args_dict, variables, options,
+                session_variables)
+
+    def _get_variable_sessions(self):
+        if self._variable_sessions is None:
+            with _work_queue_lock:
+                if self._variable_sessions is None:
+                    self._variable_sessions = VariableSessionStore()
+        return self._variable_sessions
+
+    def _restore_variables(self, variables):
+        """还原XML-RPC传输的大整数，紧凑协议原样传输"""
+        if not variables or native_types_active():
+            return variables or {}
+        return XMLRPCSerializer.restore_bigints(variables)
+
+    def _get_artifact_store(self):
+        if self._artifact_store is None:
+            with _work_queue_lock:
+                if self._artifact_store is None:
+                    self._artifact_store = ArtifactStore()
+        return self._artifact_store
+
+    def read_artifact(self, artifact_id, offset, api_key=None):
+        """分块读取关键字结果中的制品
+
+        Returns:
+            从offset开始的一块数据，空数据表示已读完
+        """
+        if self.api_key and not self.authenticate(api_key):
+            raise Exception('认证失败：无效的API密钥')
+        chunk = self._get_artifact_store().read(artifact_id, int(offset))
+        if native_types_active():
+            return chunk
+        return xmlrpc.client.Binary(chunk)
+
+    def release_artifact(self, artifact_id, api_key=None):
+        """客户端读取完成后释放制品"""
+        if self.api_key and not self.authenticate(api_key):
+            raise Exception('认证失败：无效的API密钥')
+        self._get_artifact_store().release(artifact_id)
+        return True
+
+    def read_output(self, request_id, offset, api_key=None):
+        """读取正在执行的关键字自offset以来的输出
+
+        Returns:
+            dict: {'text': 新输出, 'offset': 下次读取的偏移, 'done': 是否已结束}
+        """
+        if self.api_key and not self.authenticate(api_key):
+            raise Exception('认证失败：无效的API密钥')
+        return read_live_output(request_id, int(offset))
+
+    def _keyword_mapping(self, name):
+        """获取关键字的参数映射，按关键字信息对象缓存
+
+        关键字被重新注册时关键字信息是新对象，缓存自动失效。
+        """
+        cached = self._keyword_mappings.get(name)
+        if (cached is not None and
+                keyword_manager._keywords.get(name) is cached[0]):
+            return cached[1]
+
+        keyword_info = keyword_manager.get_keyword_info(name)
+        if not keyword_info:
+            raise Exception(f"未注册的关键字: {name}")
+        mapping = keyword_info.get('mapping', {})
+        self._keyword_mappings[name] = (keyword_info, mapping)
+        return mapping
+
+    def _execute_keyword_now(self, queue_stats, name, args_dict, variables,
+                             options, session_variables=None):
         start_time = time.time()
         com_initialized = False
         pythoncom_module = None
         capture = None
+        request_id = options.get('request_id') or None
+        live_output = None
+        if request_id and options.get('stream_output'):
+            live_output = open_live_output(request_id)
         try:
-            with RemoteExecutionCapture(name) as capture:
+            with RemoteExecutionCapture(
+                    name, request_id=request_id,
+                    live_output=live_output) as capture:
                 # WMI 基于 COM，线程化服务端中每个工作线程都要独立初始化 COM。
                 if platform.system().lower() == 'windows':
                     try:
@@ -265,16 +536,15 @@ class RemoteKeywordServer:
                     args_dict = json.loads(args_dict) if isinstance(
                         args_dict, str) else {}
 
-                from pytest_dsl.core.serialization_utils import XMLRPCSerializer
-                args_dict = XMLRPCSerializer.restore_bigints(args_dict)
+                # 紧凑协议原样传输大整数，只有XML-RPC参数需要还原标记
+                if not native_types_active():
+                    args_dict = XMLRPCSerializer.restore_bigints(args_dict)
 
-                # 获取关键字信息
-                keyword_info = keyword_manager.get_keyword_info(name)
-                if not keyword_info:
-                    raise Exception(f"未注册的关键字: {name}")
+                if variables:
+                    self._apply_client_variables(variables)
 
-                # 获取参数映射
-                mapping = keyword_info.get('mapping', {})
+                # 获取关键字的参数映射
+                mapping = self._keyword_mapping(name)
 
                 # 准备执行参数
                 exec_kwargs = {}
@@ -282,35 +552,14 @@ class RemoteKeywordServer:
                 # 添加默认的步骤名称
                 exec_kwargs['step_name'] = name
 
-                # 创建测试上下文（所有关键字都需要）
-                from pytest_dsl.core.context import TestContext
-                test_context = TestContext()
-
-                # 设置变量提供者，确保可以访问YAML变量和全局变量
-                try:
-                    from pytest_dsl.core.variable_providers import setup_context_with_default_providers
-                    setup_context_with_default_providers(test_context)
-                except ImportError:
-                    # 如果导入失败，记录警告但继续执行
-                    print("警告：无法设置变量提供者")
-
+                # 复用当前工作线程的测试上下文（所有关键字都需要）
+                test_context = _thread_test_context(session_variables)
                 exec_kwargs['context'] = test_context
 
                 # 映射参数（通用逻辑）
                 for param_name, param_value in args_dict.items():
-                    # 处理大整数：如果参数值是以 __bigint__: 开头的字符串，转换为整数
-                    if isinstance(param_value, str) and param_value.startswith("__bigint__:"):
-                        try:
-                            bigint_value = int(param_value.split(":", 1)[1])
-                            param_value = bigint_value
-                            print(f"参数 {param_name} 的大整数字符串已转换为整数: {bigint_value}")
-                        except (ValueError, IndexError):
-                            pass  # 转换失败，保持原值
-
-                    if param_name in mapping:
-                        exec_kwargs[mapping[param_name]] = param_value
-                    else:
-                        exec_kwargs[param_name] = param_value
+                    exec_kwargs[mapping.get(param_name, param_name)] = \
+                        param_value
 
                 # 执行关键字执行前的hook
                 before_context = hook_manager.execute_hooks(
@@ -326,8 +575,12 @@ class RemoteKeywordServer:
                 if 'keyword_args' in before_context.data:
                     exec_kwargs.update(before_context.data['keyword_args'])
 
-                # 执行关键字
-                result = keyword_manager.execute(name, **exec_kwargs)
+                # 执行关键字，CPU密集型关键字可配置在进程池中执行
+                if (self._process_pool is not None and
+                        self._process_pool.handles(name)):
+                    result = self._process_pool.execute(name, exec_kwargs)
+                else:
+                    result = keyword_manager.execute(name, **exec_kwargs)
 
                 # 执行关键字执行后的hook
                 after_context = hook_manager.execute_hooks(
@@ -344,25 +597,33 @@ class RemoteKeywordServer:
                 if 'keyword_result' in after_context.data:
                     result = after_context.data['keyword_result']
 
+                # 客户端支持时，大结果和文件改为分块传输
+                if options.get('artifacts'):
+                    result = externalize_artifacts(
+                        result, self._get_artifact_store())
+                else:
+                    result = inline_artifacts(result)
+
                 # 处理返回结果
                 return_data = self._process_keyword_result(result, test_context)
 
-                return XMLRPCSerializer.convert_to_serializable({
+                return self._wire_payload({
                     'status': 'PASS',
                     'return': return_data,
-                    'diagnostics': capture.to_payload('PASS')
+                    'diagnostics': {**capture.to_payload('PASS'),
+                                    **queue_stats}
                 })
         except Exception as e:
             exc_type, exc_value, exc_tb = sys.exc_info()
             formatted_traceback = traceback.format_exception(
                 exc_type, exc_value, exc_tb)
-            diagnostics = {}
+            diagnostics = dict(queue_stats)
             if capture is not None:
-                diagnostics = capture.to_payload(
+                diagnostics.update(capture.to_payload(
                     'FAIL',
                     error=str(e),
-                    traceback_lines=formatted_traceback)
-            return XMLRPCSerializer.convert_to_serializable({
+                    traceback_lines=formatted_traceback))
+            return self._wire_payload({
                 'status': 'FAIL',
                 'error': str(e),
                 'traceback': formatted_traceback,
@@ -378,7 +639,38 @@ class RemoteKeywordServer:
             elapsed_ms = (time.time() - start_time) * 1000
             if elapsed_ms >= 1000:
                 print(f"关键字执行耗时: {name} {elapsed_ms:.1f}ms")
-            self._concurrency_limiter.release()
+
+    def run_keywords(self, calls, api_key=None, variables=None,
+                     options=None):
+        """在一次请求中依次执行多个关键字
+
+        遇到执行失败的关键字即停止，后续关键字不再执行。关键字设置了
+        变量时也停止：后续关键字的参数在客户端预先求值，可能依赖这些
+        变量，由客户端用最新的变量重新调用。
+
+        Args:
+            calls: [{'name': 关键字名称, 'args': 参数字典}, ...]
+            api_key: API密钥(可选)
+            variables: 执行前需要同步的客户端变量(可选)
+            options: 变量会话选项(可选)，见run_keyword
+
+        Returns:
+            list: 每个已执行关键字的run_keyword结果
+        """
+        options = options or {}
+        # 变量只随第一个关键字合并一次，之后的关键字使用同一会话
+        later_options = {key: value for key, value in options.items()
+                         if key != 'full_sync'}
+        results = []
+        for index, call in enumerate(calls):
+            result = self.run_keyword(
+                call.get('name'), call.get('args', {}), api_key,
+                variables if index == 0 else None,
+                options if index == 0 else later_options)
+            results.append(result)
+            if result.get('status') != 'PASS' or _sets_variables(result):
+                break
+        return results
 
     def get_keyword_arguments(self, name):
         """获取关键字的参数信息"""
@@ -446,6 +738,28 @@ class RemoteKeywordServer:
         }
         return self._ensure_serializable(contract)
 
+    def get_library_spec(self, known_hash=''):
+        """一次性获取全部关键字的契约
+
+        Args:
+            known_hash: 客户端缓存的规格哈希，与当前规格一致时不再返回契约
+
+        Returns:
+            dict: {'hash': 规格哈希, 'keywords': [契约...]}，
+                规格未变化时为 {'hash': 规格哈希, 'unchanged': True}
+        """
+        keywords = [
+            self.get_keyword_contract(name)
+            for name in self.get_keyword_names()
+        ]
+        spec_hash = hashlib.sha256(json.dumps(
+            keywords, sort_keys=True, ensure_ascii=False, default=str
+        ).encode('utf-8')).hexdigest()
+
+        if known_hash and known_hash == spec_hash:
+            return {'hash': spec_hash, 'unchanged': True}
+        return {'hash': spec_hash, 'keywords': keywords}
+
     def _process_keyword_result(self, result, test_context):
         """处理关键字执行结果，确保可序列化并提取上下文变量
 
@@ -513,6 +827,12 @@ class RemoteKeywordServer:
         side_effects['variables'] = variables
         return side_effects
 
+    def _wire_payload(self, payload):
+        """按当前请求的传输协议转换响应，紧凑协议直接返回原值"""
+        if native_types_active():
+            return payload
+        return XMLRPCSerializer.convert_to_serializable(payload)
+
     def _ensure_serializable(self, obj):
         """确保对象可以被XML-RPC安全传输"""
         from pytest_dsl.core.serialization_utils import XMLRPCSerializer
@@ -520,6 +840,11 @@ class RemoteKeywordServer:
         if obj is None or isinstance(obj, bool):
             return obj
 
+        if native_types_active() and isinstance(
+                obj, (int, float, str, bytes)):
+            # 紧凑协议原样传输大整数和bytes
+            return obj
+
         if isinstance(obj, int):
             return XMLRPCSerializer.safe_serialize_value(obj)
 
@@ -564,31 +889,7 @@ class RemoteKeywordServer:
             }
 
         try:
-            # 将所有同步的变量注入到 shared/yaml_vars/global_context，默认只输出摘要避免刷屏
-            from pytest_dsl.core.yaml_vars import yaml_vars
-            from pytest_dsl.core.global_context import global_context
-            from pytest_dsl.core.serialization_utils import XMLRPCSerializer
-
-            variables = XMLRPCSerializer.restore_bigints(variables)
-
-            global_count = 0
-            for name, value in variables.items():
-                self.shared_variables[name] = value
-                yaml_vars._variables[name] = value
-                if name.startswith('g_'):
-                    global_context.set_variable(name, value)
-                    global_count += 1
-
-                if is_verbose():
-                    print(f"同步变量: {name} = {preview_value(value)}")
-
-            if is_verbose():
-                print(
-                    "✅ 客户端变量同步完成: "
-                    f"total={len(variables)} global={global_count} "
-                    f"keys=[{preview_keys(variables)}]"
-                )
-
+            variables = self._apply_client_variables(variables)
             return {
                 'status': 'success',
                 'message': f'成功同步 {len(variables)} 个变量，全部实现无缝访问'
@@ -599,6 +900,46 @@ class RemoteKeywordServer:
                 'error': f'同步变量失败: {str(e)}'
             }
 
+    def _apply_client_variables(self, variables):
+        """将客户端同步的变量注入到 shared/yaml_vars/global_context
+
+        默认只输出摘要避免刷屏。
+
+        Returns:
+            dict: 还原大整数后的变量字典
+        """
+        from pytest_dsl.core.yaml_vars import yaml_vars
+
+        variables = XMLRPCSerializer.restore_bigints(variables)
+        yaml_vars.update_variables(variables)
+        return self._publish_client_variables(variables)
+
+    def _publish_client_variables(self, variables):
+        """把客户端同步的变量写入shared_variables，g_开头的写入global_context
+
+        Returns:
+            dict: 传入的变量字典
+        """
+        from pytest_dsl.core.global_context import global_context
+
+        global_count = 0
+        for name, value in variables.items():
+            self.shared_variables[name] = value
+            if name.startswith('g_'):
+                global_context.set_variable(name, value)
+                global_count += 1
+
+            if is_verbose():
+                print(f"同步变量: {name} = {preview_value(value)}")
+
+        if is_verbose():
+            print(
+                "✅ 客户端变量同步完成: "
+                f"total={len(variables)} global={global_count} "
+                f"keys=[{preview_keys(variables)}]"
+            )
+        return variables
+
     def get_variables_for_client(self, api_key=None):
         """获取要发送给客户端的变量
 
@@ -739,6 +1080,14 @@ def main():
     parser.add_argument('--extensions', help='扩展模块路径，多个路径用逗号分隔')
     parser.add_argument('--max-concurrency', type=int, default=20,
                         help='最大并发请求数（默认: 20）')
+    parser.add_argument('--max-queue', type=int, default=DEFAULT_MAX_QUEUE,
+                        help=f'并发已满时最多排队的请求数（默认: {DEFAULT_MAX_QUEUE}）')
+    parser.add_argument('--max-wait', type=float, default=DEFAULT_MAX_WAIT,
+                        help=f'请求最长排队时间，秒（默认: {DEFAULT_MAX_WAIT:g}）')
+    parser.add_argument('--process-keywords',
+                        help='在进程池中执行的CPU密集型关键字，多个用逗号分隔')
+    parser.add_argument('--process-workers', type=int,
+                        help='进程池的进程数（默认: CPU核数）')
 
     args = parser.parse_args()
 
@@ -752,9 +1101,15 @@ def main():
     _auto_load_extensions()
 
     # 创建并启动服务器（服务器初始化时会自动加载标准关键字）
+    process_keywords = [
+        name.strip() for name in (args.process_keywords or '').split(',')
+        if name.strip()
+    ]
     server = RemoteKeywordServer(
         host=args.host, port=args.port, api_key=args.api_key,
-        max_concurrency=args.max_concurrency)
+        max_concurrency=args.max_concurrency, max_queue=args.max_queue,
+        max_wait=args.max_wait, process_keywords=process_keywords,
+        process_workers=args.process_workers, extensions=args.extensions)
     server.start()
 
 
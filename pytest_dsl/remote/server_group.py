@@ -0,0 +1,216 @@
+"""同一别名下的远程服务器组
+
+多个等价的远程服务器（例如多台相同的设备代理）可以注册在同一个别名下，
+``别名|[关键字]`` 的调用按负载分配到组内成员：
+
+- ``least_outstanding``（默认）：选择当前未完成请求最少的成员
+- ``round_robin``：依次轮流使用各成员
+
+成员返回“服务器繁忙”或拒绝连接时关键字并没有执行，调用会自动改由组内
+其他成员执行；所有成员都不可用时才报告失败。
+"""
+
+import logging
+import threading
+from functools import partial
+
+from pytest_dsl.core.keyword_manager import keyword_manager
+from pytest_dsl.remote.keyword_client import (
+    RemoteKeywordClient,
+    RemoteServerBusyError,
+    _print_verbose,
+    is_server_busy_result,
+)
+
+logger = logging.getLogger(__name__)
+
+BALANCE_STRATEGIES = ('least_outstanding', 'round_robin')
+
+
+def _is_retryable(error) -> bool:
+    """请求一定没有被服务器执行，可以改由其他成员执行"""
+    if isinstance(error, RemoteServerBusyError):
+        return True
+    # 连接错误经过safe_xmlrpc_call和客户端两层包装
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, ConnectionRefusedError):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class RemoteServerGroup:
+    """把一组远程关键字客户端作为一个客户端使用
+
+    接口与RemoteKeywordClient一致，可以直接放入
+    RemoteKeywordManager.clients。
+
+    Args:
+        alias: 服务器组别名
+        members: 成员客户端列表，别名都应为alias
+        strategy: 负载均衡策略，见 BALANCE_STRATEGIES
+    """
+
+    def __init__(self, alias, members, strategy='least_outstanding'):
+        if strategy not in BALANCE_STRATEGIES:
+            raise ValueError(
+                f"不支持的负载均衡策略: {strategy}，"
+                f"可选: {', '.join(BALANCE_STRATEGIES)}")
+        self.alias = alias
+        self.members = list(members)
+        self.strategy = strategy
+        self._lock = threading.Lock()
+        # 成员序号 -> 未完成的请求数
+        self._outstanding = [0] * len(self.members)
+        self._next = 0
+        self._local = threading.local()
+
+    @property
+    def url(self):
+        return ', '.join(member.url for member in self.members)
+
+    @property
+    def api_key(self):
+        return self.members[0].api_key
+
+    @property
+    def timeout(self):
+        return self.members[0].timeout
+
+    @property
+    def capabilities(self):
+        """所有成员都支持的能力"""
+        return frozenset.intersection(
+            *(frozenset(member.capabilities) for member in self.members))
+
+    @property
+    def keyword_cache(self):
+        return self.members[0].keyword_cache
+
+    def connect(self):
+        """连接所有成员，连接失败的成员被移出服务器组
+
+        Returns:
+            bool: 至少一个成员连接成功
+        """
+        connected = []
+        for member in self.members:
+            if member.connect():
+                connected.append(member)
+            else:
+                member.close()
+                print(f"服务器组 {self.alias} 成员不可用，已跳过: {member.url}")
+        if not connected:
+            return False
+
+        with self._lock:
+            self.members = connected
+            self._outstanding = [0] * len(connected)
+            self._next = 0
+
+        # 成员注册的关键字指向各自的客户端，改为经由服务器组调用
+        for name in self.keyword_cache:
+            keyword_info = keyword_manager._keywords.get(
+                f"{self.alias}|{name}")
+            if keyword_info is not None:
+                remote_func = partial(self._execute_remote_keyword, name=name)
+                remote_func.__doc__ = keyword_info['func'].__doc__
+                keyword_info['func'] = remote_func
+
+        logger.info(f"已连接远程服务器组: {self.alias}, 成员: {self.url}")
+        return True
+
+    def close(self):
+        """关闭所有成员的连接"""
+        for member in self.members:
+            member.close()
+
+    def _candidates(self):
+        """按负载均衡策略排列的成员顺序"""
+        with self._lock:
+            count = len(self.members)
+            start = self._next
+            self._next = (start + 1) % count
+            order = [(start + offset) % count for offset in range(count)]
+            if self.strategy == 'least_outstanding':
+                # 未完成请求数相同时轮流选择，避免总是落到第一个成员
+                order.sort(key=lambda index: self._outstanding[index])
+        return order
+
+    def _call(self, operation):
+        """在选中的成员上执行operation，繁忙或拒绝连接时换下一个成员"""
+        last_error = None
+        for index in self._candidates():
+            member = self.members[index]
+            with self._lock:
+                self._outstanding[index] += 1
+            try:
+                return operation(member)
+            except Exception as e:
+                if not _is_retryable(e):
+                    raise
+                last_error = e
+                _print_verbose(
+                    f"远程负载均衡: {self.alias} 成员 {member.url} 不可用，"
+                    f"改用其他成员: {e}")
+            finally:
+                with self._lock:
+                    self._outstanding[index] -= 1
+        raise last_error
+
+    def _execute_remote_keyword(self, **kwargs):
+        """在组内某个成员上执行远程关键字"""
+        return self._call(
+            lambda member: member._execute_remote_keyword(**kwargs))
+
+    def _execute_remote_keyword_with_outcome(self, **kwargs):
+        """在组内某个成员上执行远程关键字并保留远程诊断信息"""
+        return self._call(
+            lambda member: member._execute_remote_keyword_with_outcome(
+                **kwargs))
+
+    def run_keyword_batch(self, calls, context=None):
+        """在组内某个成员上批量执行关键字，见RemoteKeywordClient"""
+        def run_batch(member):
+            results = member.run_keyword_batch(calls, context=context)
+            if results and is_server_busy_result(results[0]):
+                raise RemoteServerBusyError(
+                    results[0].get('error'), alias=self.alias,
+                    url=member.url)
+            self._local.batch_member = member
+            return results
+
+        return self._call(run_batch)
+
+    def handle_run_keyword_result(self, name, result, return_outcome=False):
+        """由执行该批次的成员处理run_keyword结果"""
+        member = getattr(self._local, 'batch_member', None) or self.members[0]
+        return member.handle_run_keyword_result(name, result, return_outcome)
+
+    def queue_variable_changes(self, variables, context=None):
+        """变量变化需要同步到所有成员"""
+        for member in self.members:
+            member.queue_variable_changes(variables, context=context)
+
+    def _apply_hook_filter(self, *args, **kwargs):
+        return self.members[0]._apply_hook_filter(*args, **kwargs)
+
+
+def create_server_group(urls, alias, strategy='least_outstanding',
+                        **client_options):
+    """为每个URL创建成员客户端并组成服务器组
+
+    Args:
+        urls: 成员服务器URL列表
+        alias: 服务器组别名
+        strategy: 负载均衡策略
+        **client_options: 传给RemoteKeywordClient的其他参数
+
+    Returns:
+        RemoteServerGroup: 尚未连接的服务器组
+    """
+    members = [RemoteKeywordClient(url=url, alias=alias, **client_options)
+               for url in urls]
+    return RemoteServerGroup(alias, members, strategy=strategy)
@@ -0,0 +1,97 @@
+"""远程关键字库规格缓存
+
+客户端连接远程服务器时需要获取全部关键字的契约。该模块按服务器URL缓存
+``get_library_spec`` 返回的规格及其哈希，重新连接时只需把哈希发给服务器
+确认是否变化（类似ETag），未变化时直接使用缓存的契约。可选地把规格保存到
+``.pytest_cache`` 下，使多个xdist工作进程和重复运行共享同一份规格。
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+
+class LibrarySpecCache:
+    """以服务器URL为键的远程关键字库规格缓存"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 服务器URL -> {'hash': 规格哈希, 'keywords': [契约...]}
+        self._specs = {}
+        self._disk_dir = None
+
+    def enable_disk_cache(self, cache_dir):
+        """启用磁盘缓存，cache_dir 为 None 时关闭"""
+        with self._lock:
+            if cache_dir is None:
+                self._disk_dir = None
+                return
+            self._disk_dir = Path(cache_dir)
+            self._disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def clear(self):
+        """清空内存缓存（不删除磁盘缓存）"""
+        with self._lock:
+            self._specs.clear()
+
+    def get(self, url):
+        """获取缓存的规格，不存在时返回None"""
+        with self._lock:
+            spec = self._specs.get(url)
+        if spec is not None:
+            return spec
+
+        spec = self._load_from_disk(url)
+        if spec is not None:
+            with self._lock:
+                self._specs[url] = spec
+        return spec
+
+    def put(self, url, spec):
+        """缓存服务器返回的规格"""
+        spec = {'hash': spec['hash'], 'keywords': spec['keywords']}
+        with self._lock:
+            self._specs[url] = spec
+        self._save_to_disk(url, spec)
+
+    def _disk_path(self, url):
+        if self._disk_dir is None:
+            return None
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]
+        return self._disk_dir / f"{digest}.json"
+
+    def _load_from_disk(self, url):
+        path = self._disk_path(url)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('url') != url:
+                return None
+            return {'hash': data['hash'], 'keywords': data['keywords']}
+        except Exception:
+            # 损坏的缓存文件直接忽略，重新获取
+            return None
+
+    def _save_to_disk(self, url, spec):
+        path = self._disk_path(url)
+        if path is None:
+            return
+        tmp_path = path.with_name(
+            f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'url': url, **spec}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+# 创建全局规格缓存实例
+library_spec_cache = LibrarySpecCache()
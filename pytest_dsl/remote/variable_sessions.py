@@ -0,0 +1,91 @@
+"""远程服务器按客户端会话保存的上下文变量
+
+客户端只发送自上次同步以来变化的上下文变量，服务器需要知道这些变化是在
+哪份变量之上累积的。每个客户端上下文对应服务器上的一个变量会话：服务器
+把增量合并到会话中，执行该会话的关键字时通过请求级的变量提供者交给测试
+上下文，不写入全局的YAML变量。共享同一服务器的多个客户端、同一客户端的
+多个并行分支因此互不覆盖。g_开头的全局变量本来就是全局的，服务器仍把它们
+写入全局上下文。
+
+服务器重启或会话被淘汰后收到增量时不执行关键字，而是要求客户端全量同步。
+"""
+
+import threading
+from collections import OrderedDict
+
+from pytest_dsl.core.variable_providers import VariableProvider
+
+
+# 服务器最多保存的变量会话数，超出时淘汰最久未使用的会话
+DEFAULT_MAX_SESSIONS = 256
+
+
+class VariableSessionStore:
+    """以会话ID为键保存客户端同步的变量"""
+
+    def __init__(self, max_sessions=DEFAULT_MAX_SESSIONS):
+        self.max_sessions = int(max_sessions)
+        self._lock = threading.Lock()
+        self._sessions = OrderedDict()
+
+    def update(self, session_id, variables, full_sync=False):
+        """把客户端同步的变量合并到会话中
+
+        会话的变量字典只替换不修改，正在执行的请求看到的变量不会中途变化。
+
+        Args:
+            session_id: 客户端生成的会话ID
+            variables: 本次同步的变量
+            full_sync: 为True时variables是会话的全部变量
+
+        Returns:
+            dict: 会话当前的全部变量；会话不存在且不是全量同步时返回None
+        """
+        with self._lock:
+            current = self._sessions.get(session_id)
+            if full_sync:
+                current = dict(variables or {})
+            elif current is None:
+                return None
+            elif variables:
+                current = {**current, **variables}
+
+            self._sessions[session_id] = current
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+            return current
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
+
+
+class SessionVariableProvider(VariableProvider):
+    """提供当前请求所属会话的变量，优先于YAML变量和全局变量"""
+
+    layer = 'session'
+
+    def __init__(self):
+        self.variables = {}
+        self._generation = 0
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def use(self, variables):
+        """切换到另一份会话变量"""
+        variables = variables or {}
+        if variables is not self.variables:
+            self.variables = variables
+            self._generation += 1
+
+    def get_variable(self, key):
+        return self.variables.get(key)
+
+    def has_variable(self, key):
+        return key in self.variables
+
+    def get_all_variables(self):
+        return dict(self.variables)
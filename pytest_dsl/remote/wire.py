@@ -0,0 +1,270 @@
+"""远程关键字的紧凑传输协议
+
+XML-RPC编码冗长，且只支持32位整数，二进制数据需要base64。该模块在同一个
+HTTP服务上提供另一条RPC通道：请求和响应体使用JSON或msgpack编码（HTTP的
+Content-Length即长度前缀），通过HTTP/1.1长连接发送，调用的仍是服务器上
+注册的同一组函数。大整数和bytes按原样传输，不需要 ``__bigint__:`` 标记。
+
+客户端连接时通过 ``get_server_capabilities`` 协商（``wire:json``、
+``wire:msgpack``），服务器不支持时继续使用XML-RPC。
+"""
+
+import base64
+import contextlib
+import datetime
+import http.client
+import json
+import os
+import threading
+import xmlrpc.client
+from urllib.parse import urlsplit
+
+try:
+    import msgpack
+except ImportError:  # msgpack是可选依赖
+    msgpack = None
+
+
+# 紧凑协议的RPC路径，与XML-RPC共用同一个端口
+COMPACT_RPC_PATH = '/rpc-compact'
+
+# 选择传输协议的环境变量：auto（默认，优先msgpack）、xmlrpc、json、msgpack
+WIRE_ENV = 'PYTEST_DSL_REMOTE_WIRE'
+
+_native = threading.local()
+
+
+def native_types_active() -> bool:
+    """当前线程是否正在处理紧凑协议的请求
+
+    为True时服务器函数可以直接返回大整数和bytes，不需要转换为XML-RPC
+    兼容的格式。
+    """
+    return getattr(_native, 'active', False)
+
+
+@contextlib.contextmanager
+def native_types_scope(active=True):
+    """在当前线程中按紧凑协议（active为True）或XML-RPC处理请求"""
+    previous = native_types_active()
+    _native.active = active
+    try:
+        yield
+    finally:
+        _native.active = previous
+
+
+def _fallback_value(value):
+    """把编码器不支持的对象转换为可传输的值"""
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.replace(tzinfo=None)
+        return value.isoformat()
+
+    from pytest_dsl.core.serialization_utils import XMLRPCSerializer
+    converted = XMLRPCSerializer.convert_to_serializable(value)
+    if converted is None:
+        return f"<{type(value).__name__}: 无法序列化>"
+    return converted
+
+
+class JSONCodec:
+    """JSON编码，整数精度不受限制，bytes以 ``{"__bytes__": base64}`` 表示"""
+
+    name = 'json'
+    content_type = 'application/x-pytest-dsl-json'
+
+    @staticmethod
+    def _default(value):
+        if isinstance(value, (bytes, bytearray)):
+            return {'__bytes__': base64.b64encode(value).decode('ascii')}
+        return _fallback_value(value)
+
+    @staticmethod
+    def _object_hook(obj):
+        if len(obj) == 1 and '__bytes__' in obj:
+            return base64.b64decode(obj['__bytes__'])
+        return obj
+
+    def dumps(self, value) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'),
+                          default=self._default).encode('utf-8')
+
+    def loads(self, data: bytes):
+        return json.loads(data.decode('utf-8'), object_hook=self._object_hook)
+
+
+class MsgpackCodec:
+    """msgpack编码，bytes原生支持，超出64位的整数使用扩展类型"""
+
+    name = 'msgpack'
+    content_type = 'application/x-pytest-dsl-msgpack'
+    BIGINT_EXT_TYPE = 1
+
+    def _default(self, value):
+        if isinstance(value, int):
+            return msgpack.ExtType(self.BIGINT_EXT_TYPE,
+                                   str(value).encode('ascii'))
+        return _fallback_value(value)
+
+    def _ext_hook(self, code, data):
+        if code == self.BIGINT_EXT_TYPE:
+            return int(data.decode('ascii'))
+        return msgpack.ExtType(code, data)
+
+    def dumps(self, value) -> bytes:
+        return msgpack.packb(value, use_bin_type=True, default=self._default)
+
+    def loads(self, data: bytes):
+        return msgpack.unpackb(data, raw=False, strict_map_key=False,
+                               ext_hook=self._ext_hook)
+
+
+def available_codecs():
+    """本机可用的编码，按优先级排列"""
+    codecs = {}
+    if msgpack is not None:
+        codecs['msgpack'] = MsgpackCodec()
+    codecs['json'] = JSONCodec()
+    return codecs
+
+
+def wire_capabilities():
+    """服务器声明的传输协议能力"""
+    return [f'wire:{name}' for name in available_codecs()]
+
+
+def negotiate_codec(capabilities):
+    """根据服务器能力和 PYTEST_DSL_REMOTE_WIRE 选择编码
+
+    Returns:
+        编码实例，使用XML-RPC时返回None
+    """
+    preferred = os.environ.get(WIRE_ENV, 'auto').strip().lower()
+    if preferred == 'xmlrpc':
+        return None
+    for name, codec in available_codecs().items():
+        if preferred not in ('auto', name):
+            continue
+        if f'wire:{name}' in capabilities:
+            return codec
+    return None
+
+
+class CompactRPCFault(xmlrpc.client.Fault):
+    """服务器函数执行失败，与XML-RPC的Fault一致处理"""
+
+
+def dispatch_compact_request(server, body, content_type):
+    """在服务器端处理一次紧凑协议请求
+
+    Args:
+        server: 注册了RPC函数的SimpleXMLRPCServer
+        body: 请求体
+        content_type: 请求的Content-Type，用于选择编码
+
+    Returns:
+        tuple: (响应体, Content-Type)，编码不支持时返回 (None, None)
+    """
+    codec = next((codec for codec in available_codecs().values()
+                  if codec.content_type == content_type), None)
+    if codec is None:
+        return None, None
+
+    try:
+        request = codec.loads(body)
+        with native_types_scope():
+            result = server._dispatch(request['method'],
+                                      tuple(request.get('params') or ()))
+        response = {'result': result}
+    except Exception as e:
+        response = {'fault': {'code': 1,
+                              'message': f"{type(e).__name__}:{e}"}}
+    return codec.dumps(response), codec.content_type
+
+
+class _CompactMethod:
+    def __init__(self, proxy, name):
+        self._proxy = proxy
+        self._name = name
+
+    def __call__(self, *params):
+        return self._proxy._call(self._name, params)
+
+
+class CompactServerProxy:
+    """通过紧凑协议调用远程服务器函数，接口与ServerProxy相同
+
+    持有一个HTTP/1.1长连接，与ServerProxy一样不能在线程间共享，
+    多线程使用时由连接池为每个线程分配独立的代理。
+    """
+
+    # 参数和返回值按原样传输，不需要XML-RPC的类型转换
+    native_types = True
+
+    def __init__(self, url, codec, timeout=None):
+        parts = urlsplit(url)
+        self.url = url
+        self.codec = codec
+        self.timeout = timeout
+        self._https = parts.scheme == 'https'
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = parts.path.rstrip('/') + COMPACT_RPC_PATH
+        self._conn = None
+        self._reused = False
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return _CompactMethod(self, name)
+
+    def _connection(self):
+        if self._conn is None:
+            conn_class = (http.client.HTTPSConnection if self._https
+                          else http.client.HTTPConnection)
+            self._conn = conn_class(self._host, self._port,
+                                    timeout=self.timeout)
+            self._reused = False
+        return self._conn
+
+    def close(self):
+        """关闭连接"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _call(self, method, params):
+        body = self.codec.dumps({'method': method, 'params': list(params)})
+        for attempt in (0, 1):
+            conn = self._connection()
+            reused = self._reused
+            try:
+                conn.request('POST', self._path, body, {
+                    'Content-Type': self.codec.content_type,
+                })
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    ConnectionAbortedError, BrokenPipeError):
+                # 复用的长连接可能已被服务器关闭，重新连接后重试一次
+                self.close()
+                if attempt or not reused:
+                    raise
+                continue
+            except Exception:
+                self.close()
+                raise
+
+            self._reused = True
+            if response.status != 200:
+                self.close()
+                raise http.client.HTTPException(
+                    f"{response.status} {response.reason}")
+            payload = self.codec.loads(data)
+            if 'fault' in payload:
+                fault = payload['fault']
+                raise CompactRPCFault(fault.get('code'), fault.get('message'))
+            return payload.get('result')
@@ -0,0 +1,181 @@
+"""远程关键字服务器的工作队列
+
+HTTP请求仍由每个连接的线程接收，关键字交给固定数量的工作线程执行。
+工作线程都在忙时请求进入有界队列等待，而不是立即以“服务器繁忙”拒绝；
+只有队列已满或等待超过 ``max_wait`` 秒仍未开始执行时才拒绝。被拒绝的
+请求一定没有执行，客户端可以安全地重试或改由其他服务器执行。
+
+CPU密集型关键字可以配置为在进程池中执行，避免占用GIL影响其他请求。
+"""
+
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+DEFAULT_MAX_QUEUE = 100
+DEFAULT_MAX_WAIT = 30.0
+
+
+class QueueFullError(Exception):
+    """请求没有在允许的时间内开始执行"""
+
+
+class _Ticket:
+    __slots__ = ('enqueued_at', 'depth', 'state', 'lock', 'started')
+
+    def __init__(self, depth):
+        self.enqueued_at = time.monotonic()
+        self.depth = depth
+        # queued -> running 或 expired
+        self.state = 'queued'
+        self.lock = threading.Lock()
+        self.started = threading.Event()
+
+
+class KeywordWorkQueue:
+    """固定数量的工作线程加有界等待队列
+
+    Args:
+        workers: 工作线程数，即同时执行的关键字数量
+        max_queue: 最多等待的请求数
+        max_wait: 请求在队列中等待的最长时间（秒）
+    """
+
+    def __init__(self, workers, max_queue=DEFAULT_MAX_QUEUE,
+                 max_wait=DEFAULT_MAX_WAIT):
+        self.workers = int(workers)
+        self.max_queue = int(max_queue)
+        self.max_wait = float(max_wait)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix='pytest-dsl-keyword')
+        # 正在执行和等待执行的请求，包括等待超时被放弃但仍在执行器队列中的
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_queue)
+        self._lock = threading.Lock()
+        self._queued = 0
+
+    @property
+    def depth(self):
+        """正在等待工作线程的请求数"""
+        return self._queued
+
+    def run(self, func, *args):
+        """在工作线程中执行 func(queue_stats, *args) 并等待结果
+
+        queue_stats 为 {'queue_depth': 进入队列时前面等待的请求数,
+        'queue_wait_ms': 在队列中等待的毫秒数}。
+
+        Raises:
+            QueueFullError: 队列已满，或等待超过max_wait仍未开始执行
+        """
+        if not self._slots.acquire(blocking=False):
+            raise QueueFullError(
+                f"并发请求已达上限 ({self.workers})，"
+                f"等待队列已满 ({self.max_queue})")
+        with self._lock:
+            ticket = _Ticket(self._queued)
+            self._queued += 1
+
+        try:
+            future = self._executor.submit(self._work, ticket, func, args)
+        except BaseException:
+            self._dequeue()
+            self._slots.release()
+            raise
+
+        if not ticket.started.wait(self.max_wait):
+            with ticket.lock:
+                if ticket.state == 'queued':
+                    ticket.state = 'expired'
+            if ticket.state == 'expired':
+                raise QueueFullError(
+                    f"并发请求已达上限 ({self.workers})，"
+                    f"排队等待超过 {self.max_wait:g} 秒")
+        return future.result()
+
+    def _dequeue(self):
+        with self._lock:
+            self._queued -= 1
+
+    def _work(self, ticket, func, args):
+        self._dequeue()
+        try:
+            with ticket.lock:
+                if ticket.state == 'expired':
+                    return None
+                ticket.state = 'running'
+            ticket.started.set()
+
+            queue_stats = {
+                'queue_depth': ticket.depth,
+                'queue_wait_ms': round(
+                    (time.monotonic() - ticket.enqueued_at) * 1000, 3),
+            }
+            return func(queue_stats, *args)
+        finally:
+            self._slots.release()
+
+    def shutdown(self):
+        """不再接收新请求，已在执行的关键字继续完成"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _init_keyword_process(extensions):
+    """进程池子进程的初始化：加载与服务器相同的关键字"""
+    from pytest_dsl.core.plugin_discovery import (
+        load_all_plugins, scan_local_keywords
+    )
+    from pytest_dsl.core.reporting import run_with_suppressed_success_output
+
+    run_with_suppressed_success_output(
+        lambda: __import__("pytest_dsl.keywords"))
+    load_all_plugins()
+    scan_local_keywords()
+    if extensions:
+        from pytest_dsl.remote.keyword_server import _load_extensions
+        _load_extensions(extensions)
+
+
+def _execute_keyword_in_process(name, kwargs):
+    """在子进程中执行关键字，使用新的测试上下文"""
+    from pytest_dsl.core.context import TestContext
+    from pytest_dsl.core.keyword_manager import keyword_manager
+    from pytest_dsl.core.variable_providers import (
+        setup_context_with_default_providers
+    )
+
+    test_context = TestContext()
+    setup_context_with_default_providers(test_context)
+    return keyword_manager.execute(name, context=test_context, **kwargs)
+
+
+class KeywordProcessPool:
+    """在子进程中执行CPU密集型关键字
+
+    子进程加载与服务器相同的关键字；关键字参数和返回值需要可以pickle，
+    关键字对测试上下文的修改不会带回服务器进程。
+
+    Args:
+        keywords: 在子进程中执行的关键字名称
+        workers: 子进程数量，None表示CPU核数
+        extensions: 服务器启动时加载的扩展模块（--extensions）
+    """
+
+    def __init__(self, keywords, workers=None, extensions=None):
+        self.keywords = frozenset(keywords)
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_keyword_process,
+            initargs=(extensions,))
+
+    def handles(self, name):
+        return name in self.keywords
+
+    def execute(self, name, exec_kwargs):
+        """在子进程中执行关键字，exec_kwargs中的context不会传给子进程"""
+        kwargs = {key: value for key, value in exec_kwargs.items()
+                  if key != 'context'}
+        return self._executor.submit(
+            _execute_keyword_in_process, name, kwargs).result()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,84 @@
+import os
+
+from pytest_dsl.core import ast_cache as ast_cache_module
+from pytest_dsl.core.ast_cache import DSLAstCache
+
+
+pytest_plugins = ["pytester"]
+
+
+def test_same_content_shares_one_ast():
+    cache = DSLAstCache()
+
+    first, errors = cache.parse('x = 1\n[打印], 内容: "${x}"\n')
+    second, second_errors = cache.parse('x = 1\n[打印], 内容: "${x}"\n')
+
+    assert errors == [] and second_errors == []
+    assert first is second
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_parse_errors_are_not_cached():
+    cache = DSLAstCache()
+
+    _ast, errors = cache.parse('[打印] 内容: "missing comma"')
+    _ast, errors_again = cache.parse('[打印] 内容: "missing comma"')
+
+    assert errors and errors_again
+    assert cache.misses == 0
+
+
+def test_modified_file_is_reparsed(tmp_path):
+    cache = DSLAstCache()
+    case = tmp_path / "case.dsl"
+    case.write_text("x = 1\n", encoding="utf-8")
+
+    content, first, _errors = cache.parse_file(case)
+    assert content == "x = 1\n"
+    assert cache.parse_file(case)[1] is first
+
+    case.write_text("x = 22\n", encoding="utf-8")
+    stat = case.stat()
+    os.utime(case, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    content, second, _errors = cache.parse_file(case)
+    assert content == "x = 22\n"
+    assert second is not first
+
+
+def test_disk_cache_skips_parsing_in_new_process(tmp_path, monkeypatch):
+    writer = DSLAstCache()
+    writer.enable_disk_cache(tmp_path)
+    writer.parse("x = 1\n")
+
+    def fail_parse(*_args, **_kwargs):
+        raise AssertionError("should have been loaded from disk")
+
+    monkeypatch.setattr(ast_cache_module, "parse_with_error_handling", fail_parse)
+    reader = DSLAstCache()
+    reader.enable_disk_cache(tmp_path)
+
+    ast, errors = reader.parse("x = 1\n")
+
+    assert errors == []
+    assert ast.type == "Start"
+
+
+def test_data_driven_rows_reuse_collected_ast(pytester, monkeypatch):
+    from pytest_dsl.core.ast_cache import ast_cache
+
+    (pytester.path / "tests").mkdir()
+    (pytester.path / "tests" / "rows.csv").write_text(
+        "name\nalice\nbob\ncarol\n", encoding="utf-8")
+    (pytester.path / "tests" / "case.dsl").write_text(
+        '@data: "rows.csv" using csv\n[打印], 内容: "${name}"\n',
+        encoding="utf-8",
+    )
+    ast_cache.clear()
+
+    result = pytester.runpytest_inprocess("tests", "-q", "-p", "no:cacheprovider")
+
+    result.assert_outcomes(passed=3)
+    assert ast_cache.misses == 1
+    assert ast_cache.hits == 3
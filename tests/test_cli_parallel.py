@@ -0,0 +1,74 @@
+import argparse
+
+import pytest
+
+from pytest_dsl import cli
+
+
+def _write_suite(root):
+    root.mkdir()
+    (root / "setup.auto").write_text("ready = True\n", encoding="utf-8")
+    (root / "teardown.auto").write_text("done = True\n", encoding="utf-8")
+    for index in range(4):
+        (root / f"case_{index}.dsl").write_text(
+            f"total = 0\nfor i in range(0, {index + 2}) do\n"
+            "    total = total + i\nend\n",
+            encoding="utf-8",
+        )
+    (root / "broken.dsl").write_text("[不存在的关键字]\n", encoding="utf-8")
+
+
+def _args(path, workers, mode):
+    return argparse.Namespace(path=str(path), yaml_vars=[], yaml_vars_dir=None,
+                              workers=workers, worker_mode=mode)
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_parallel_run_aggregates_results_and_runs_hooks_once(
+        tmp_path, monkeypatch, capsys, mode):
+    suite = tmp_path / "suite"
+    _write_suite(suite)
+    monkeypatch.chdir(tmp_path)
+
+    hook_calls = []
+    monkeypatch.setattr(
+        cli, "execute_hook_file",
+        lambda file_path, is_setup, dir_path: hook_calls.append(
+            (file_path.name, is_setup)),
+    )
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli.run_dsl_tests(_args(suite, 3, mode))
+
+    assert exc_info.value.code == 1
+    assert hook_calls == [("setup.auto", True), ("teardown.auto", False)]
+    output = capsys.readouterr().out
+    assert "总计 1/5 个测试失败" in output
+
+
+def test_worker_executors_are_isolated_per_thread(tmp_path, monkeypatch):
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    for index in range(6):
+        (suite / f"case_{index}.dsl").write_text(
+            f"value = {index}\n", encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    seen = []
+    original = cli._get_worker_executor
+
+    def recording_executor():
+        executor = original()
+        seen.append(id(executor))
+        return executor
+
+    monkeypatch.setattr(cli, "_get_worker_executor", recording_executor)
+
+    results = cli.run_in_workers(
+        cli._execute_file_task,
+        [str(path) for path in sorted(suite.iterdir())],
+        _args(suite, 2, "thread"),
+    )
+
+    assert results == [True] * 6
+    assert 1 <= len(set(seen)) <= 2
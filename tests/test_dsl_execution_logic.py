@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from pytest_dsl.core.dsl_executor import DSLExecutor
@@ -248,3 +250,140 @@ override_result = [format_user], name: "alice", count: 3
     variables = executor.variable_replacer.local_variables
     assert variables["default_result"] == "guest:1"
     assert variables["override_result"] == "alice:3"
+
+
+def test_compiled_mode_matches_interpreter_for_control_flow(monkeypatch):
+    ast, errors = parse_with_error_handling(
+        '''
+total = 0
+for i in range(0, 10) do
+    if i == 3 do
+        continue
+    elif i == 8 do
+        break
+    end
+    total = total + i
+end
+''',
+        lexer=get_lexer(),
+    )
+    assert errors == []
+    monkeypatch.setenv("PYTEST_DSL_KEEP_VARIABLES", "1")
+
+    results = []
+    for compiled in (False, True):
+        executor = DSLExecutor(enable_hooks=False, enable_tracking=False,
+                               compiled=compiled)
+        executor.execute(ast)
+        results.append(executor.variable_replacer.local_variables["total"])
+
+    assert results == [25, 25]
+
+
+def test_compiled_mode_reports_failing_line_and_tracks_steps(monkeypatch):
+    from pytest_dsl.core.execution_tracker import ExecutionTracker
+
+    ast, errors = parse_with_error_handling(
+        'x = 1\ny = 2\n[不存在的关键字]\n',
+        lexer=get_lexer(),
+    )
+    assert errors == []
+
+    executor = DSLExecutor(enable_hooks=False, enable_tracking=True,
+                           compiled=True)
+    executor.execution_tracker = ExecutionTracker("compiled")
+
+    with pytest.raises(Exception) as exc_info:
+        executor.execute(ast)
+
+    assert getattr(exc_info.value, "line_number", None) == 3
+    failed = [step for step in executor.execution_tracker.steps
+              if step.error]
+    assert failed and failed[-1].line_number == 3
+    assert executor._node_stack == []
+
+
+def test_compiled_closures_live_on_the_ast_and_are_shared(monkeypatch):
+    ast, errors = parse_with_error_handling(
+        'total = 0\nfor i in range(0, 3) do\n    total = total + i\nend\n',
+        lexer=get_lexer(),
+    )
+    assert errors == []
+    monkeypatch.setenv("PYTEST_DSL_KEEP_VARIABLES", "1")
+
+    first = DSLExecutor(enable_hooks=False, enable_tracking=False,
+                        compiled=True)
+    first.execute(ast)
+    compiled_run = ast._compiled_run
+
+    second = DSLExecutor(enable_hooks=False, enable_tracking=False,
+                         compiled=True)
+    second.execute(ast)
+
+    assert ast._compiled_run is compiled_run
+    assert second.variable_replacer.local_variables["total"] == 3
+    assert "_compiled_run" not in pickle.loads(pickle.dumps(ast)).__dict__
+
+
+def test_for_loops_iterate_lazily_over_ranges_and_generators(monkeypatch):
+    from pytest_dsl.core.keyword_manager import keyword_manager
+
+    produced = []
+
+    @keyword_manager.register("惰性循环数据源", [])
+    def lazy_source(**kwargs):
+        def generate():
+            for value in range(3):
+                produced.append(value)
+                yield value
+        return generate()
+
+    try:
+        executor = _execute_dsl(
+            '''
+total = 0
+for i in range(0, 1000000000000) do
+    if i == 3 do
+        break
+    end
+    total = total + i
+end
+
+items = [惰性循环数据源]
+streamed = 0
+for item in items do
+    streamed = streamed + item
+end
+''',
+            monkeypatch,
+        )
+    finally:
+        keyword_manager._keywords.pop("惰性循环数据源", None)
+
+    variables = executor.variable_replacer.local_variables
+    assert variables["total"] == 3
+    assert variables["streamed"] == 3
+    assert produced == [0, 1, 2]
+
+
+def test_loop_break_message_is_reported(monkeypatch):
+    attachments = []
+
+    def record_attachment(body, name=None, attachment_type=None):
+        attachments.append((name, body))
+
+    monkeypatch.setattr("allure.attach", record_attachment)
+    monkeypatch.delenv("PYTEST_DSL_REPORT_LEVEL", raising=False)
+
+    _execute_dsl(
+        '''
+for i in range(0, 10) do
+    if i == 2 do
+        break
+    end
+end
+''',
+        monkeypatch,
+    )
+
+    assert ("循环Break", "在 i = 2 时遇到break语句，退出循环") in attachments
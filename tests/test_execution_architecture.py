@@ -104,3 +104,113 @@ def test_executor_delegates_remote_keyword_calls_to_invoker():
     executor = DSLExecutor(enable_hooks=False, enable_tracking=False)
 
     assert isinstance(executor.remote_invoker, RemoteKeywordInvoker)
+
+
+def test_interpolation_is_parsed_once_across_loop_iterations(monkeypatch):
+    from pytest_dsl.core import parser as parser_module
+    from pytest_dsl.core.parser import parse_with_error_handling
+    from pytest_dsl.core.variable_utils import compile_interpolation_template
+
+    ast, errors = parse_with_error_handling(
+        'text = ""\n'
+        'for i in range(0, 5) do\n'
+        '    text = "${text}[${i * 2 + 1001}]"\n'
+        'end\n',
+        lexer=get_lexer(),
+    )
+    assert errors == []
+
+    parser_module._parse_expression_cached.cache_clear()
+    compile_interpolation_template.cache_clear()
+    calls = []
+    original = parser_module.parse_expression_fragment
+
+    def counting_parse(content, lexer=None):
+        calls.append(content)
+        return original(content, lexer)
+
+    monkeypatch.setattr(parser_module, "parse_expression_fragment", counting_parse)
+    monkeypatch.setenv("PYTEST_DSL_KEEP_VARIABLES", "1")
+    executor = DSLExecutor(enable_hooks=False, enable_tracking=False)
+    executor.execute(ast)
+
+    assert executor.variables["text"] == "[1001][1003][1005][1007][1009]"
+    assert sorted(calls) == ["i * 2 + 1001", "text"]
+
+
+def test_interpolation_template_keeps_single_placeholder_type():
+    from pytest_dsl.core.variable_utils import (
+        VariableReplacer,
+        compile_interpolation_template,
+    )
+
+    replacer = VariableReplacer({"items": [1, 2], "name": "dsl"})
+    template = compile_interpolation_template("${items}")
+
+    assert template.is_single
+    assert replacer.render_template(template) == [1, 2]
+    assert replacer.replace_in_string("${name}-${items[1]}") == "dsl-2"
+    assert compile_interpolation_template("${name}-${items[1]}") is (
+        compile_interpolation_template("${name}-${items[1]}"))
+
+
+def test_keyword_call_site_validates_parameters_once(monkeypatch):
+    from pytest_dsl.core.execution.keyword_invoker import KeywordInvoker
+    from pytest_dsl.core.keyword_manager import keyword_manager
+    from pytest_dsl.core.parser import parse_with_error_handling
+
+    @keyword_manager.register("调用点缓存测试", [
+        {"name": "值", "mapping": "value", "description": "值"},
+        {"name": "步长", "mapping": "step", "description": "步长",
+         "default": 10},
+    ])
+    def call_site_keyword(**kwargs):
+        return kwargs["value"] + kwargs["step"]
+
+    ast, errors = parse_with_error_handling(
+        'total = 0\n'
+        'for i in range(0, 20) do\n'
+        '    total = [调用点缓存测试], 值: total\n'
+        'end\n',
+        lexer=get_lexer(),
+    )
+    assert errors == []
+
+    validations = []
+    original = KeywordInvoker._validate_params
+    monkeypatch.setattr(
+        KeywordInvoker, "_validate_params",
+        lambda self, node, info: validations.append(node) or
+        original(self, node, info))
+    monkeypatch.setenv("PYTEST_DSL_KEEP_VARIABLES", "1")
+    try:
+        executor = DSLExecutor(enable_hooks=False, enable_tracking=False)
+        executor.execute(ast)
+        assert executor.variables["total"] == 200
+        assert len(validations) == 1
+
+        @keyword_manager.register("调用点缓存测试", [
+            {"name": "值", "mapping": "value", "description": "值"},
+        ])
+        def call_site_keyword_v2(**kwargs):
+            return kwargs["value"] - 1
+
+        executor = DSLExecutor(enable_hooks=False, enable_tracking=False)
+        executor.execute(ast)
+        assert executor.variables["total"] == -20
+        assert len(validations) == 2
+    finally:
+        keyword_manager._keywords.pop("调用点缓存测试", None)
+
+
+def test_keyword_registry_generation_tracks_direct_changes():
+    from pytest_dsl.core.keyword_manager import KeywordManager
+
+    manager = KeywordManager()
+    generation = manager.generation
+
+    manager._keywords["a"] = {}
+    manager._keywords.update(b={})
+    manager._keywords.pop("a")
+
+    assert manager.generation == generation + 3
@@ -0,0 +1,169 @@
+import json
+import os
+import sys
+
+import pytest
+
+from pytest_dsl.core.global_context import (
+    GlobalContext,
+    JSONFileGlobalStore,
+    SQLiteGlobalStore,
+)
+
+
+def _json_store(tmp_path):
+    return JSONFileGlobalStore(str(tmp_path / "global_vars.json"),
+                               str(tmp_path / "global_vars.lock"))
+
+
+def _sqlite_store(tmp_path):
+    return SQLiteGlobalStore(str(tmp_path / "global_vars.db"))
+
+
+@pytest.fixture(params=[_json_store, _sqlite_store], ids=["json", "sqlite"])
+def make_store(request, tmp_path):
+    return lambda: request.param(tmp_path)
+
+
+def test_store_sees_writes_from_other_instances(make_store):
+    writer = make_store()
+    reader = make_store()
+
+    writer.set("g_token", "abc")
+    assert reader.get("g_token") == "abc"
+
+    writer.set("g_token", "def")
+    writer.set("g_count", 3)
+    assert reader.get("g_token") == "def"
+    assert reader.get_all() == {"g_token": "def", "g_count": 3}
+
+    reader.delete("g_token")
+    assert not writer.has("g_token")
+
+    writer.clear()
+    assert reader.get_all() == {}
+
+
+def test_store_reads_hit_memory_until_file_changes(tmp_path, monkeypatch):
+    store = _json_store(tmp_path)
+    store.set("g_name", "value")
+
+    def fail_read(*_args, **_kwargs):
+        raise AssertionError("unchanged file must not be re-read")
+
+    monkeypatch.setattr(store, "_read_file", fail_read)
+    for _ in range(100):
+        assert store.get("g_name") == "value"
+        assert store.has("g_name")
+        assert not store.has("g_missing")
+
+
+def test_store_shares_values_and_replaces_them_on_write(make_store):
+    store = make_store()
+    store.set("g_user", {"roles": ["admin"]})
+
+    value = store.get("g_user")
+    assert store.get("g_user") is value
+
+    store.set("g_user", {"roles": ["guest"]})
+
+    assert value == {"roles": ["admin"]}
+    assert store.get("g_user") == {"roles": ["guest"]}
+
+
+def test_json_store_appends_writes_to_journal(tmp_path):
+    store = _json_store(tmp_path)
+    store.set("g_name", "值")
+    store.set("g_count", 1)
+    store.delete("g_count")
+
+    assert not os.path.exists(tmp_path / "global_vars.json")
+    with open(tmp_path / "global_vars.json.journal", encoding="utf-8") as f:
+        assert [json.loads(line)["op"] for line in f] == [
+            "set", "set", "delete"]
+    assert _json_store(tmp_path).get_all() == {"g_name": "值"}
+
+
+def test_json_store_reads_only_new_journal_entries(tmp_path, monkeypatch):
+    writer = _json_store(tmp_path)
+    reader = _json_store(tmp_path)
+    writer.set("g_first", 1)
+    assert reader.get("g_first") == 1
+
+    def fail_read(*_args, **_kwargs):
+        raise AssertionError("appended journal must not reload the snapshot")
+
+    monkeypatch.setattr(reader, "_read_file", fail_read)
+    writer.set("g_second", 2)
+    with open(tmp_path / "global_vars.json.journal", "ab") as f:
+        f.write(b'{"op": "set", "name": "g_partial"')
+
+    assert reader.get("g_second") == 2
+    assert not reader.has("g_partial")
+
+
+def test_json_store_compacts_journal_into_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys.modules["pytest_dsl.core.global_context"],
+                        "JOURNAL_COMPACT_BYTES", 64)
+    writer = _json_store(tmp_path)
+    reader = _json_store(tmp_path)
+    writer.set("g_name", "值")
+    assert reader.get("g_name") == "值"
+
+    for index in range(5):
+        writer.set(f"g_var_{index}", index)
+
+    expected = {"g_name": "值", **{f"g_var_{i}": i for i in range(5)}}
+    with open(tmp_path / "global_vars.json", encoding="utf-8") as f:
+        snapshot = json.load(f)
+    assert snapshot.items() <= expected.items()
+    assert os.path.getsize(tmp_path / "global_vars.json.journal") <= 64
+    assert reader.get_all() == expected
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_global_context_store_is_replaceable():
+    class DictStore:
+        def __init__(self):
+            self.data = {}
+
+        def get(self, name):
+            return self.data.get(name)
+
+        def has(self, name):
+            return name in self.data
+
+        def get_all(self):
+            return dict(self.data)
+
+        def set(self, name, value):
+            self.data[name] = value
+
+        def delete(self, name):
+            self.data.pop(name, None)
+
+        def clear(self):
+            self.data.clear()
+
+    context = GlobalContext()
+    store = DictStore()
+    context.set_store(store)
+
+    context.set_variable("g_stand_in", 1)
+
+    assert store.data == {"g_stand_in": 1}
+    assert context.get_stored_variable("g_stand_in") == 1
+    assert context.get_all_stored_variables() == {"g_stand_in": 1}
+
+
+def test_store_generation_changes_on_every_write(make_store):
+    writer = make_store()
+    reader = make_store()
+    before = reader.generation
+
+    writer.set("g_token", "abc")
+    after_other_write = reader.generation
+    assert after_other_write != before
+
+    reader.delete("g_token")
+    assert reader.generation != after_other_write
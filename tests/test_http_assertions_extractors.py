@@ -466,5 +466,52 @@ class TestHTTPAssertions:
         assert "201 Created" in str(attachments[1][1])
 
 
+class TestHTTPResponseMemo:
+    """测试响应解码缓存"""
+
+    def _json_response(self, payload):
+        response = Mock()
+        response.status_code = 200
+        response.headers = {'Content-Type': 'application/json'}
+        response.json.return_value = payload
+        response.text = json.dumps(payload)
+        return response
+
+    def test_body_is_decoded_once_per_response(self):
+        config = {
+            'captures': {f'v{i}': ['jsonpath', f'$.items[{i}]']
+                         for i in range(10)},
+            'asserts': [['jsonpath', f'$.items[{i}]', 'eq', i]
+                        for i in range(10)] +
+                       [['regex', r'"items"', 'exists']],
+        }
+        response = self._json_response({'items': list(range(10))})
+
+        http_req = HTTPRequest(config)
+        http_req.response = response
+        http_req.process_captures()
+        http_req.process_asserts()
+
+        assert response.json.call_count == 1
+        assert http_req.captured_values['v9'] == 9
+
+    def test_memo_is_invalidated_when_response_is_replaced(self):
+        config = {'asserts': [['jsonpath', '$.status', 'eq', 'done']]}
+        http_req = HTTPRequest(config)
+
+        http_req.response = self._json_response({'status': 'pending'})
+        with pytest.raises(AssertionError):
+            http_req.process_asserts()
+
+        http_req.response = self._json_response({'status': 'done'})
+        http_req.process_asserts()
+
+    def test_compiled_expressions_are_shared(self):
+        from pytest_dsl.core.http_request import compile_jsonpath, compile_regex
+
+        assert compile_jsonpath('$.a.b') is compile_jsonpath('$.a.b')
+        assert compile_regex(r'\d+') is compile_regex(r'\d+')
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
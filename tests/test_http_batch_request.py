@@ -0,0 +1,94 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pytest_dsl.core.context import TestContext
+from pytest_dsl.core.http_client import http_client_manager
+from pytest_dsl.keywords.http_keywords import http_batch_request
+
+
+class _Handler(BaseHTTPRequestHandler):
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.in_flight -= 1
+
+        body = json.dumps({"id": int(self.path.rsplit("/", 1)[-1])}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def context():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _Handler.peak = 0
+
+    context = TestContext()
+    context.set("http_clients", {
+        "batch": {"base_url": f"http://127.0.0.1:{server.server_port}/"},
+    })
+    http_client_manager.close_all()
+    try:
+        yield context
+    finally:
+        http_client_manager.close_all()
+        server.shutdown()
+        server.server_close()
+
+
+def test_batch_request_runs_concurrently_and_keeps_order(context):
+    result = http_batch_request(
+        context=context,
+        client="batch",
+        config="method: GET\nasserts:\n  - [status, eq, 200]\n",
+        requests=[
+            {"url": f"/items/{i}",
+             "captures": {f"id_{i}": ["jsonpath", "$.id"]}}
+            for i in range(8)
+        ],
+        concurrency=4,
+    )
+
+    assert result["result"] == [{f"id_{i}": i} for i in range(8)]
+    assert result["metadata"]["status_codes"] == [200] * 8
+    assert context.get("id_7") == 7
+    assert 1 < _Handler.peak <= 4
+
+
+def test_batch_request_reports_all_failures_after_completion(context):
+    with pytest.raises(AssertionError) as exc_info:
+        http_batch_request(
+            context=context,
+            client="batch",
+            requests=[
+                "method: GET\nurl: /items/1\n"
+                "asserts:\n  - [jsonpath, '$.id', eq, 1]\n",
+                "method: GET\nurl: /items/2\n"
+                "asserts:\n  - [jsonpath, '$.id', eq, 3]\n",
+                "method: GET\nurl: /items/3\n"
+                "captures:\n  last_id: [jsonpath, '$.id']\n",
+            ],
+        )
+
+    assert "1/3 个请求失败" in str(exc_info.value)
+    assert "请求 2" in str(exc_info.value)
+    assert context.get("last_id") == 3
@@ -0,0 +1,143 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pytest_dsl.core.http_client import HTTPClient, http_client_manager
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures_left = 0
+    received_cookies = []
+
+    def do_GET(self):
+        cls = type(self)
+        cls.received_cookies.append(self.headers.get("Cookie"))
+        if self.path == "/flaky" and cls.failures_left > 0:
+            cls.failures_left -= 1
+            self._reply(503, b"busy")
+            return
+        self._reply(200, b"ok", {"Set-Cookie": "sid=abc; Path=/"})
+
+    def _reply(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    _Handler.received_cookies = []
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pool_and_retry_config_are_mounted_on_session():
+    client = HTTPClient(
+        base_url="https://api.example.com",
+        retry={"max_retries": 3, "connect": 2, "backoff_factor": 0.2,
+               "retry_on_status": [503]},
+        pool={"connections": 4, "maxsize": 20, "block": True,
+              "keep_alive": False,
+              "hosts": {"https://slow.example.com": {"maxsize": 2}}},
+    )
+
+    adapter = client._session.get_adapter("https://api.example.com/users")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 20
+    assert adapter._pool_block is True
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.connect == 2
+    assert adapter.max_retries.status_forcelist == [503]
+
+    host_adapter = client._session.get_adapter("https://slow.example.com/x")
+    assert host_adapter._pool_maxsize == 2
+    assert client._session.headers["Connection"] == "close"
+
+    client.ensure_pool_size(50)
+    adapter = client._session.get_adapter("https://api.example.com/users")
+    assert adapter._pool_maxsize == 50
+    assert adapter.max_retries.total == 3
+    assert client._session.get_adapter(
+        "https://slow.example.com/x")._pool_maxsize == 2
+
+
+def test_transport_retry_returns_final_response(base_url):
+    _Handler.failures_left = 2
+    client = HTTPClient(base_url=base_url,
+                        retry={"max_retries": 2, "retry_interval": 0})
+
+    response = client.make_request("GET", "/flaky")
+
+    assert response.status_code == 200
+    assert len(_Handler.received_cookies) == 3
+
+
+def test_non_session_client_reuses_pool_without_keeping_cookies(base_url):
+    client = HTTPClient(base_url=base_url, session=False)
+
+    first = client.make_request("GET", "/a")
+    transport = client._transport
+    second = client.make_request("GET", "/b")
+
+    assert first.status_code == second.status_code == 200
+    assert client._session is None
+    assert client._transport is transport
+    assert _Handler.received_cookies == [None, None]
+
+    client.close()
+    assert client._transport is None
+
+
+def test_manager_passes_pool_config_from_http_clients():
+    manager = type(http_client_manager)()
+    manager._get_http_clients_config = lambda: {
+        "pooled": {"base_url": "https://api.example.com",
+                   "pool": {"maxsize": 32}},
+    }
+
+    client = manager.get_client("pooled")
+
+    assert client._session.get_adapter(
+        "https://api.example.com")._pool_maxsize == 32
+
+
+def test_request_logging_is_skipped_unless_debug(monkeypatch, caplog):
+    from unittest.mock import Mock
+    from pytest_dsl.core import http_client as http_client_module
+
+    response = Mock(status_code=200, reason="OK", headers={},
+                    encoding="utf-8", content=b"x" * 5000, elapsed_ms=10.0)
+    response.json.side_effect = AssertionError("body must not be re-parsed")
+    client = HTTPClient(base_url="https://api.example.com")
+    monkeypatch.setattr(client._session, "request",
+                        lambda *args, **kwargs: response)
+    dumps = Mock(side_effect=http_client_module.json.dumps)
+    monkeypatch.setattr(http_client_module.json, "dumps", dumps)
+
+    caplog.set_level("INFO", logger=http_client_module.logger.name)
+    client.make_request("POST", "/items", json={"name": "a"},
+                        headers={"Authorization": "secret"})
+    assert dumps.call_count == 0
+    assert not caplog.records
+
+    caplog.set_level("DEBUG", logger=http_client_module.logger.name)
+    client.make_request("POST", "/items", json={"name": "a"},
+                        headers={"Authorization": "secret"})
+    text = caplog.text
+    assert "secret" not in text
+    assert "<共 5000 字节>" in text
+    assert "x" * 2049 not in text
@@ -0,0 +1,243 @@
+import json
+import threading
+import time
+
+import pytest
+
+import pytest_dsl.keywords  # noqa: F401 - import registers builtin keywords
+from pytest_dsl.core.dsl_executor import DSLExecutor
+from pytest_dsl.core.execution import ParallelExecutionError
+from pytest_dsl.core.execution_tracker import ExecutionStatus
+from pytest_dsl.core.keyword_manager import keyword_manager
+from pytest_dsl.core.parser import parse_with_error_handling
+from pytest_dsl.remote.keyword_client import remote_keyword_manager
+from pytest_dsl.remote.keyword_server import (
+    RemoteKeywordServer,
+    ThreadedXMLRPCServer,
+)
+from pytest_dsl.remote.spec_cache import library_spec_cache
+
+_barrier = threading.Barrier(3, timeout=5)
+_remote_barrier = threading.Barrier(3, timeout=5)
+_pair_barrier = threading.Barrier(2, timeout=5)
+_active = {"now": 0, "peak": 0}
+_active_lock = threading.Lock()
+
+
+@keyword_manager.register("并行屏障", [
+    {"name": "值", "mapping": "value", "description": "值"},
+])
+def parallel_barrier_keyword(**kwargs):
+    _barrier.wait()
+    return kwargs["value"]
+
+
+@keyword_manager.register("并行计数", [
+    {"name": "值", "mapping": "value", "description": "值"},
+])
+def parallel_counting_keyword(**kwargs):
+    with _active_lock:
+        _active["now"] += 1
+        _active["peak"] = max(_active["peak"], _active["now"])
+    time.sleep(0.05)
+    with _active_lock:
+        _active["now"] -= 1
+    return kwargs["value"]
+
+
+@keyword_manager.register("并行读取远程变量", [
+    {"name": "变量名", "mapping": "var_name", "description": "变量名"},
+])
+def parallel_remote_read_keyword(**kwargs):
+    # 三个分支的变量都同步到服务器后再读取
+    _remote_barrier.wait()
+    return kwargs["context"].get(kwargs["var_name"])
+
+
+@keyword_manager.register("并行两方屏障", [])
+def parallel_pair_barrier_keyword(**kwargs):
+    _pair_barrier.wait()
+
+
+@keyword_manager.register("并行读取远程变量或默认", [
+    {"name": "变量名", "mapping": "var_name", "description": "变量名"},
+])
+def parallel_remote_read_or_default_keyword(**kwargs):
+    return kwargs["context"].get(kwargs["var_name"], "<未同步>")
+
+
+@pytest.fixture(autouse=True)
+def keep_variables(monkeypatch):
+    monkeypatch.setenv("PYTEST_DSL_KEEP_VARIABLES", "1")
+    _barrier.reset()
+    _remote_barrier.reset()
+    _pair_barrier.reset()
+    _active.update(now=0, peak=0)
+
+
+def test_parallel_block_runs_branches_concurrently():
+    executor = DSLExecutor(enable_hooks=False)
+    executor.execute_from_content('''
+base = 10
+parallel do
+    a = [并行屏障], 值: ${base} + 1
+    b = [并行屏障], 值: 2
+    c = [并行屏障], 值: 3
+end
+total = ${a} + ${b} + ${c}
+''')
+
+    assert executor.variables["total"] == 16
+
+
+def test_parallel_branches_are_isolated_and_merge_in_branch_order():
+    executor = DSLExecutor(enable_hooks=False)
+    executor.execute_from_content('''
+shared = "parent"
+parallel for item in [1, 2, 3] do
+    before = shared
+    shared = item
+    [并行计数], 值: item
+    [断言], 条件: "${shared} == ${item}", 消息: "看到了其他分支的写入"
+end
+''')
+
+    variables = executor.variables
+    assert variables["before"] == "parent"
+    assert variables["shared"] == 3
+    assert variables["item"] == 3
+
+
+def test_parallel_for_with_max_limits_concurrency():
+    executor = DSLExecutor(enable_hooks=False, compiled=True)
+    executor.execute_from_content('''
+parallel for item in range(0, 6) with max 2 do
+    [并行计数], 值: item
+end
+''')
+
+    assert _active["peak"] == 2
+
+
+def test_parallel_failures_are_aggregated_after_all_branches_finish():
+    executor = DSLExecutor(enable_hooks=False)
+
+    with pytest.raises(ParallelExecutionError) as exc_info:
+        executor.execute_from_content('''
+parallel for item in [1, 2, 3] do
+    [并行计数], 值: item
+    [断言], 条件: "${item} == 2", 消息: "分支失败"
+end
+''')
+
+    assert [label for label, _ in exc_info.value.errors] == [
+        "item = 1", "item = 3"]
+    assert all(isinstance(error, AssertionError)
+               for _, error in exc_info.value.errors)
+
+
+def test_parallel_branch_steps_stay_nested_in_tracker():
+    executor = DSLExecutor(enable_hooks=False)
+    executor.execute_from_content('''
+parallel for item in [1, 2, 3, 4] do
+    value = [并行计数], 值: item
+    doubled = ${value} * 2
+end
+''', dsl_id="parallel_tracker_test")
+
+    tracker = executor.execution_tracker
+    assert tracker.fork_step_stack() == []
+    assert all(step.status == ExecutionStatus.SUCCESS
+               for step in tracker.steps)
+    # Start、ParallelFor，加上每个分支的两条语句
+    assert len(tracker.steps) == 2 + 4 * 2
+
+
+def test_parallel_branches_share_the_report_summary(monkeypatch):
+    attachments = []
+    monkeypatch.setenv("PYTEST_DSL_REPORT_LEVEL", "summary")
+    monkeypatch.setattr(
+        "allure.attach",
+        lambda body, name=None, attachment_type=None:
+            attachments.append((name, body)))
+
+    DSLExecutor(enable_hooks=False).execute_from_content('''
+parallel for item in [1, 2, 3] do
+    [并行计数], 值: item
+end
+''')
+
+    summary = json.loads(dict(attachments)["DSL执行摘要"])
+    assert summary["steps"]["并行分支"] == 3
+    assert summary["steps"]["调用关键字: 并行计数"] == 3
+
+
+def test_parallel_for_rejects_keywords_other_than_max():
+    _, errors = parse_with_error_handling(
+        "parallel for item in [1, 2] with min 2 do\n    x = item\nend\n")
+
+    assert errors and errors[0]["token_value"] == "min"
+
+
+@pytest.fixture
+def remote_url():
+    server = RemoteKeywordServer.__new__(RemoteKeywordServer)
+    server.api_key = None
+    server.max_concurrency = 4
+    server.shared_variables = {}
+
+    xmlrpc_server = ThreadedXMLRPCServer(("127.0.0.1", 0), allow_none=True,
+                                         logRequests=False)
+    for func in (server.get_server_capabilities, server.get_library_spec,
+                 server.run_keyword, server.sync_variables_from_client):
+        xmlrpc_server.register_function(func)
+    thread = threading.Thread(target=xmlrpc_server.serve_forever, daemon=True)
+    thread.start()
+    remote_keyword_manager.clients.clear()
+    try:
+        yield f"http://127.0.0.1:{xmlrpc_server.server_address[1]}/"
+    finally:
+        remote_keyword_manager.clients.clear()
+        library_spec_cache.clear()
+        for name in list(keyword_manager._keywords):
+            if name.startswith("par|"):
+                keyword_manager._keywords.pop(name)
+        xmlrpc_server.shutdown()
+        xmlrpc_server.server_close()
+        thread.join(timeout=2)
+
+
+def test_parallel_branches_send_their_own_variables_to_remote(remote_url):
+    executor = DSLExecutor(enable_hooks=False)
+    executor.execute_from_content(f"""
+@remote: "{remote_url}" as par
+
+parallel for item in ["a", "b", "c"] do
+    seen = par|[并行读取远程变量], 变量名: "item"
+    [断言], 条件: "'${{seen}}' == '${{item}}'", 消息: "读取到其他分支的变量"
+end
+""")
+
+    assert executor.variables["seen"] == "c"
+
+
+def test_parallel_branch_does_not_receive_another_branch_variables(
+        remote_url):
+    executor = DSLExecutor(enable_hooks=False)
+    executor.execute_from_content(f"""
+@remote: "{remote_url}" as par
+
+parallel for item in ["A", "B"] do
+    if item == "A" do
+        # 循环变量的变化会通知远程服务器，只应随分支A的调用发送
+        for x_leak in ["from-A"] do
+            [并行两方屏障]
+        end
+    else
+        [并行两方屏障]
+        seen = par|[并行读取远程变量或默认], 变量名: "x_leak"
+    end
+end
+""")
+
+    assert executor.variables["seen"] == "<未同步>"
@@ -0,0 +1,67 @@
+import importlib
+import sys
+
+import ply.yacc as yacc
+
+from pytest_dsl.core import parser as parser_module
+from pytest_dsl.core.lexer import get_lexer
+from pytest_dsl.core.parser import (
+    EXPRESSION_PARSE_TABLE_MODULE,
+    PARSE_TABLE_MODULE,
+    get_expression_parser,
+    get_parser,
+    parse_with_error_handling,
+)
+
+
+def _grammar_signature(start=None):
+    pdict = {name: getattr(parser_module, name) for name in dir(parser_module)}
+    if start is not None:
+        pdict['start'] = start
+    reflect = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+    reflect.get_all()
+    return reflect.signature()
+
+
+def test_shipped_parse_tables_match_current_grammar():
+    """语法修改后必须重新执行 build_parse_tables() 并提交生成的表。"""
+    tables = importlib.import_module(f"pytest_dsl.core.{PARSE_TABLE_MODULE}")
+    expr_tables = importlib.import_module(
+        f"pytest_dsl.core.{EXPRESSION_PARSE_TABLE_MODULE}")
+
+    assert tables._lr_signature == _grammar_signature()
+    assert expr_tables._lr_signature == _grammar_signature('expression')
+
+
+def test_parsers_are_process_wide_singletons():
+    assert get_parser() is get_parser()
+    assert get_expression_parser() is get_expression_parser()
+    assert get_parser() is not get_expression_parser()
+
+
+def test_lexer_clones_keep_independent_state():
+    first = get_lexer()
+    second = get_lexer()
+    assert first is not second
+
+    _ast, errors = parse_with_error_handling('[打印], 内容: "abc', lexer=first)
+    assert errors
+    assert first.dsl_errors
+    assert second.dsl_errors == []
+
+    ast, errors = parse_with_error_handling('x = 1\ny = 2', lexer=second)
+    assert errors == []
+    assert ast.children[1].children[1].line_number == 2
+
+
+def test_parsing_never_writes_tables_into_cwd(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(parser_module, '_parser', None)
+    monkeypatch.setattr(parser_module, '_expression_parser', None)
+    sys.modules.pop('parsetab', None)
+
+    ast, errors = parse_with_error_handling('x = 1', lexer=get_lexer())
+
+    assert errors == []
+    assert ast is not None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,141 @@
+import threading
+import time
+
+import pytest
+
+from pytest_dsl.core.keyword_manager import keyword_manager
+from pytest_dsl.remote import keyword_client as keyword_client_module
+from pytest_dsl.remote.artifacts import RemoteArtifact, inline_artifacts
+from pytest_dsl.remote.diagnostics import LiveOutput
+from pytest_dsl.remote.keyword_client import RemoteKeywordClient
+from pytest_dsl.remote.keyword_server import (
+    RemoteKeywordServer,
+    ThreadedXMLRPCServer,
+)
+
+LARGE_TEXT = "远程大结果" * 2000
+ARTIFACT_BYTES = bytes(range(256)) * 40
+
+
+@keyword_manager.register("制品大文本", [])
+def artifact_large_text_keyword(**kwargs):
+    return {"text": LARGE_TEXT, "small": "ok"}
+
+
+@keyword_manager.register("制品截图", [
+    {"name": "路径", "mapping": "path", "description": "文件路径"},
+])
+def artifact_file_keyword(**kwargs):
+    return RemoteArtifact(path=kwargs["path"], name="screen.png",
+                          content_type="image/png")
+
+
+@keyword_manager.register("制品实时输出", [])
+def artifact_live_output_keyword(**kwargs):
+    print("第一行")
+    time.sleep(0.2)
+    print("第二行")
+    return True
+
+
+@pytest.fixture
+def server():
+    server = RemoteKeywordServer.__new__(RemoteKeywordServer)
+    server.api_key = None
+    server.max_concurrency = 4
+    server.shared_variables = {}
+
+    xmlrpc_server = ThreadedXMLRPCServer(("127.0.0.1", 0), allow_none=True,
+                                         logRequests=False)
+    for func in (server.get_server_capabilities, server.get_library_spec,
+                 server.run_keyword, server.read_artifact,
+                 server.release_artifact, server.read_output):
+        xmlrpc_server.register_function(func)
+    thread = threading.Thread(target=xmlrpc_server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{xmlrpc_server.server_address[1]}/"
+    try:
+        yield server
+    finally:
+        for name in list(keyword_manager._keywords):
+            if name.startswith("art|"):
+                keyword_manager._keywords.pop(name)
+        xmlrpc_server.shutdown()
+        xmlrpc_server.server_close()
+        thread.join(timeout=2)
+
+
+def connect(url):
+    client = RemoteKeywordClient(url=url, alias="art")
+    client._send_initial_variables = lambda: None
+    assert client.connect()
+    return client
+
+
+@pytest.mark.parametrize("wire", ["xmlrpc", "json"])
+def test_large_result_is_transferred_in_chunks(server, monkeypatch, wire):
+    monkeypatch.setenv("PYTEST_DSL_REMOTE_WIRE", wire)
+    monkeypatch.setenv("PYTEST_DSL_REMOTE_ARTIFACT_THRESHOLD", "1024")
+    monkeypatch.setattr("pytest_dsl.remote.artifacts.CHUNK_SIZE", 4096)
+    client = connect(server.url)
+    reads = []
+    original_read = client._read_artifact_chunk
+    monkeypatch.setattr(client, "_read_artifact_chunk",
+                        lambda *args: reads.append(args) or original_read(*args))
+
+    result = client._execute_remote_keyword(name="制品大文本", context=None)
+
+    assert result == {"text": LARGE_TEXT, "small": "ok"}
+    assert len(reads) > 2
+    assert server._artifact_store._artifacts == {}
+
+
+def test_file_artifact_is_saved_locally(server, monkeypatch, tmp_path):
+    monkeypatch.setenv("PYTEST_DSL_REMOTE_WIRE", "xmlrpc")
+    monkeypatch.setenv("PYTEST_DSL_REMOTE_ARTIFACT_DIR",
+                       str(tmp_path / "local"))
+    source = tmp_path / "screen.png"
+    source.write_bytes(ARTIFACT_BYTES)
+    client = connect(server.url)
+
+    local_path = client._execute_remote_keyword(
+        name="制品截图", 路径=str(source), context=None)
+
+    assert local_path.startswith(str(tmp_path / "local"))
+    assert local_path.endswith("screen.png")
+    with open(local_path, "rb") as f:
+        assert f.read() == ARTIFACT_BYTES
+    assert source.exists()
+
+
+def test_remote_output_is_streamed_while_keyword_runs(server, monkeypatch,
+                                                      capsys):
+    monkeypatch.setenv("PYTEST_DSL_REMOTE_STREAM_OUTPUT", "1")
+    monkeypatch.setattr(keyword_client_module, "_STREAM_POLL_INTERVAL", 0.05)
+    client = connect(server.url)
+
+    assert client._execute_remote_keyword(
+        name="制品实时输出", context=None) is True
+
+    output = capsys.readouterr().out
+    assert "[art] 第一行\n" in output
+    assert "[art] 第二行\n" in output
+
+
+def test_live_output_keeps_offsets_after_dropping_old_text():
+    live_output = LiveOutput(max_chars=5)
+    live_output.write("abc")
+    live_output.write("defg")
+
+    assert live_output.read(0) == {"text": "defg", "offset": 7, "done": False}
+    assert live_output.read(5)["text"] == "fg"
+
+
+def test_artifacts_are_inlined_for_clients_without_support(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"payload")
+    result = {"file": RemoteArtifact(path=path), "other": [1]}
+
+    assert inline_artifacts(result) == {"file": b"payload", "other": [1]}
+    plain = {"a": [1, 2]}
+    assert inline_artifacts(plain) is plain
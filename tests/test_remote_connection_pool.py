@@ -0,0 +1,118 @@
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pytest_dsl.remote import connection_pool
+from pytest_dsl.remote.connection_pool import (
+    PooledServerProxy,
+    RemoteConnectionPool,
+)
+
+
+class _FakeProxy:
+    instances = []
+
+    def __init__(self, failures=()):
+        self.failures = list(failures)
+        self.closed = False
+        self.owner = None
+        type(self).instances.append(self)
+
+    def echo(self, value):
+        if self.failures:
+            raise self.failures.pop(0)
+        # 同一个代理不能被两个线程同时使用
+        assert self.owner in (None, threading.get_ident())
+        self.owner = threading.get_ident()
+        time.sleep(0.001)
+        self.owner = None
+        return value
+
+    def get_server_capabilities(self):
+        return []
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def reset_instances():
+    _FakeProxy.instances = []
+
+
+def make_pool(factory=_FakeProxy, **config):
+    config.setdefault("health_interval", 0)
+    return RemoteConnectionPool(factory, **config)
+
+
+def test_each_thread_gets_its_own_connection():
+    pool = make_pool()
+    proxy = PooledServerProxy(pool)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(proxy.echo, range(200)))
+
+    assert results == list(range(200))
+    assert 1 < len(_FakeProxy.instances) <= 4
+
+    proxy.echo("main")
+    main_connection = _FakeProxy.instances[-1]
+    pool.close()
+    assert main_connection.closed
+
+
+def test_idle_connections_are_replaced():
+    pool = make_pool(idle_timeout=0)
+
+    pool.call("echo", 1)
+    first = _FakeProxy.instances[0]
+    time.sleep(0.01)
+    pool.call("echo", 2)
+
+    assert first.closed
+    assert len(_FakeProxy.instances) == 2
+
+
+def test_refused_connections_are_retried_with_backoff(monkeypatch):
+    delays = []
+    monkeypatch.setattr(connection_pool.time, "sleep", delays.append)
+    attempts = iter([
+        _FakeProxy([ConnectionRefusedError()]),
+        _FakeProxy([ConnectionRefusedError()]),
+        _FakeProxy(),
+    ])
+    pool = make_pool(lambda: next(attempts), backoff_base=0.1)
+
+    assert pool.call("echo", "ok") == "ok"
+    assert delays[:2] == [0.1, 0.2]
+
+
+def test_requests_that_may_have_reached_the_server_are_not_retried():
+    pool = make_pool(lambda: _FakeProxy([socket.timeout("timed out")]))
+
+    with pytest.raises(socket.timeout):
+        pool.call("echo", "once")
+
+    assert len(_FakeProxy.instances) == 1
+    assert _FakeProxy.instances[0].closed
+
+
+def test_health_check_drops_connections_when_server_is_down():
+    class _DownProxy(_FakeProxy):
+        def get_server_capabilities(self):
+            raise ConnectionRefusedError()
+
+    pool = RemoteConnectionPool(_DownProxy, health_interval=0.01)
+    pool.call("echo", 1)
+    connection = pool._local.connection
+
+    deadline = time.monotonic() + 2
+    while pool.healthy and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert not pool.healthy
+    assert connection.closed
+    pool.close()
@@ -37,7 +37,6 @@ def make_server():
     server = RemoteKeywordServer.__new__(RemoteKeywordServer)
     server.api_key = None
     server.max_concurrency = 20
-    server._concurrency_limiter = threading.BoundedSemaphore(20)
     server.shared_variables = {}
     return server
 
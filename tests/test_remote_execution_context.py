@@ -0,0 +1,65 @@
+from pytest_dsl.core.keyword_manager import keyword_manager
+from pytest_dsl.core.serialization_utils import XMLRPCSerializer
+from pytest_dsl.remote.keyword_server import RemoteKeywordServer
+
+
+@keyword_manager.register("远程上下文复用测试", [
+    {"name": "值", "mapping": "value", "description": "写入上下文的值"},
+])
+def remote_context_reuse_keyword(**kwargs):
+    context = kwargs["context"]
+    leaked = context.get("context_reuse_value")
+    context.set("context_reuse_value", kwargs["value"])
+    return {"context_id": id(context), "leaked": leaked,
+            "yaml_provider": bool(context._external_providers)}
+
+
+def make_server():
+    server = RemoteKeywordServer.__new__(RemoteKeywordServer)
+    server.api_key = None
+    server.max_concurrency = 1
+    server.shared_variables = {}
+    return server
+
+
+def test_worker_context_is_reused_and_cleared_between_calls():
+    server = make_server()
+
+    first = server.run_keyword("远程上下文复用测试", {"值": "a"})
+    second = server.run_keyword("远程上下文复用测试", {"值": "b"})
+    server._work_queue.shutdown()
+
+    first_result = first["return"]["result"]
+    second_result = second["return"]["result"]
+    assert first_result["context_id"] == second_result["context_id"]
+    assert second_result["leaked"] is None
+    assert second_result["yaml_provider"]
+    assert second["return"]["captures"] == {"context_reuse_value": "b"}
+
+
+def test_reregistered_keyword_uses_new_mapping(monkeypatch):
+    server = make_server()
+    monkeypatch.setitem(keyword_manager._keywords, "远程映射缓存测试", {
+        "func": lambda **kwargs: kwargs.get("old"),
+        "mapping": {"参数": "old"}, "parameters": [], "defaults": {},
+    })
+    assert server.run_keyword(
+        "远程映射缓存测试", {"参数": 1})["return"]["result"] == 1
+
+    monkeypatch.setitem(keyword_manager._keywords, "远程映射缓存测试", {
+        "func": lambda **kwargs: kwargs.get("new"),
+        "mapping": {"参数": "new"}, "parameters": [], "defaults": {},
+    })
+    result = server.run_keyword("远程映射缓存测试", {"参数": 2})
+    server._work_queue.shutdown()
+
+    assert result["return"]["result"] == 2
+
+
+def test_restore_bigints_returns_original_object_without_markers():
+    args = {"数量": 1, "列表": ["a", {"b": 2}]}
+    marked = {"数量": "__bigint__:12345678901234567890", "列表": ["a"]}
+
+    assert XMLRPCSerializer.restore_bigints(args) is args
+    assert XMLRPCSerializer.restore_bigints(marked) == {
+        "数量": 12345678901234567890, "列表": ["a"]}
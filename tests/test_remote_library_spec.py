@@ -0,0 +1,105 @@
+import pytest
+
+from pytest_dsl.core.keyword_manager import keyword_manager
+from pytest_dsl.remote.keyword_client import RemoteKeywordClient
+from pytest_dsl.remote.keyword_server import RemoteKeywordServer
+from pytest_dsl.remote.spec_cache import library_spec_cache
+
+
+@keyword_manager.register("远程规格测试", [
+    {"name": "名称", "mapping": "name", "description": "名称",
+     "default": "world"},
+])
+def remote_spec_keyword(**kwargs):
+    return kwargs.get("name")
+
+
+class _CountingProxy:
+    """在进程内转发到RemoteKeywordServer并记录调用的方法"""
+
+    def __init__(self, server):
+        self._server = server
+        self.calls = []
+
+    def __getattr__(self, name):
+        self.calls.append(name)
+        return getattr(self._server, name)
+
+
+def make_server():
+    server = RemoteKeywordServer.__new__(RemoteKeywordServer)
+    server.api_key = None
+    server.max_concurrency = 4
+    server.shared_variables = {}
+    return server
+
+
+def connect(proxy, alias):
+    client = RemoteKeywordClient(url="http://spec-host:8270/", alias=alias)
+    client.server = proxy
+    client._send_initial_variables = lambda: None
+    assert client.connect()
+    return client
+
+
+def forget_remote_keywords():
+    # 服务器与客户端在同一进程内，避免已注册的远程关键字改变服务器规格
+    for name in list(keyword_manager._keywords):
+        if name.startswith(("spec_a|", "spec_b|", "spec_c|")):
+            keyword_manager._keywords.pop(name)
+
+
+@pytest.fixture
+def spec_cache(tmp_path, monkeypatch):
+    # 进程内代理没有HTTP服务，固定使用XML-RPC代理
+    monkeypatch.setenv("PYTEST_DSL_REMOTE_WIRE", "xmlrpc")
+    library_spec_cache.clear()
+    library_spec_cache.enable_disk_cache(tmp_path)
+    yield library_spec_cache
+    library_spec_cache.enable_disk_cache(None)
+    library_spec_cache.clear()
+    forget_remote_keywords()
+
+
+def test_connect_discovers_keywords_in_one_call(spec_cache):
+    proxy = _CountingProxy(make_server())
+
+    client = connect(proxy, "spec_a")
+
+    assert proxy.calls == ["get_server_capabilities", "get_library_spec"]
+    info = keyword_manager.get_keyword_info("spec_a|远程规格测试")
+    assert info["defaults"] == {"name": "world"}
+    assert client.param_mappings["远程规格测试"]["名称"] == "name"
+
+
+def test_reconnect_reuses_cached_spec_when_unchanged(spec_cache):
+    server = make_server()
+    connect(_CountingProxy(server), "spec_a")
+    forget_remote_keywords()
+
+    # 新进程中的工作进程只能读到磁盘缓存
+    spec_cache.clear()
+    original = server.get_library_spec
+    responses = []
+    server.get_library_spec = lambda known_hash='': responses.append(
+        original(known_hash)) or responses[-1]
+
+    connect(_CountingProxy(server), "spec_b")
+
+    assert responses[0].get("unchanged") is True
+    assert "keywords" not in responses[0]
+    assert "spec_b|远程规格测试" in keyword_manager._keywords
+
+
+def test_changed_spec_replaces_cache(spec_cache):
+    server = make_server()
+    connect(_CountingProxy(server), "spec_a")
+    current_hash = spec_cache.get("http://spec-host:8270/")["hash"]
+    forget_remote_keywords()
+
+    spec_cache.put("http://spec-host:8270/",
+                   {"hash": "outdated", "keywords": []})
+    connect(_CountingProxy(server), "spec_c")
+
+    assert spec_cache.get("http://spec-host:8270/")["hash"] == current_hash
+    assert "spec_c|远程规格测试" in keyword_manager._keywords
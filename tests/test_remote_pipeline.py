@@ -0,0 +1,161 @@
+import threading
+
+import pytest
+
+from pytest_dsl.core.dsl_executor import DSLExecutor
+from pytest_dsl.core.keyword_manager import keyword_manager
+from pytest_dsl.remote.keyword_client import remote_keyword_manager
+from pytest_dsl.remote.keyword_server import (
+    RemoteKeywordServer,
+    ThreadedXMLRPCServer,
+)
+from pytest_dsl.remote.spec_cache import library_spec_cache
+
+
+EXECUTED = []
+
+
+@keyword_manager.register("流水线记录", [
+    {"name": "值", "mapping": "value", "description": "记录的值"},
+])
+def pipeline_record_keyword(**kwargs):
+    value = kwargs.get("value")
+    if value == "boom":
+        raise RuntimeError("pipeline boom")
+    EXECUTED.append(value)
+    return value
+
+
+@keyword_manager.register("流水线设置变量", [
+    {"name": "名称", "mapping": "name", "description": "变量名"},
+    {"name": "值", "mapping": "value", "description": "变量值"},
+])
+def pipeline_set_variable_keyword(**kwargs):
+    kwargs["context"].set(kwargs["name"], kwargs["value"])
+    return kwargs["value"]
+
+
+def make_server():
+    server = RemoteKeywordServer.__new__(RemoteKeywordServer)
+    server.api_key = None
+    server.max_concurrency = 4
+    server.shared_variables = {}
+    return server
+
+
+@pytest.fixture
+def remote_url(monkeypatch):
+    monkeypatch.setenv("PYTEST_DSL_REMOTE_PIPELINE", "1")
+    server = make_server()
+    calls = []
+
+    def counted(func):
+        def wrapper(*args):
+            calls.append(func.__name__)
+            return func(*args)
+        wrapper.__name__ = func.__name__
+        return wrapper
+
+    xmlrpc_server = ThreadedXMLRPCServer(("127.0.0.1", 0), allow_none=True)
+    for func in (server.get_server_capabilities, server.get_library_spec,
+                 server.run_keyword, server.run_keywords,
+                 server.sync_variables_from_client):
+        xmlrpc_server.register_function(counted(func))
+    thread = threading.Thread(target=xmlrpc_server.serve_forever, daemon=True)
+    thread.start()
+
+    EXECUTED.clear()
+    library_spec_cache.clear()
+    remote_keyword_manager.clients.clear()
+    try:
+        yield f"http://127.0.0.1:{xmlrpc_server.server_address[1]}/", calls
+    finally:
+        remote_keyword_manager.clients.clear()
+        library_spec_cache.clear()
+        for name in list(keyword_manager._keywords):
+            if name.startswith("pipe|"):
+                keyword_manager._keywords.pop(name)
+        xmlrpc_server.shutdown()
+        xmlrpc_server.server_close()
+        thread.join(timeout=2)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_consecutive_remote_calls_are_sent_in_one_batch(remote_url, compiled):
+    url, calls = remote_url
+    content = f"""
+@name: "远程流水线"
+@remote: "{url}" as pipe
+
+prefix = "v"
+pipe|[流水线记录], 值: "${{prefix}}1"
+pipe|[流水线记录], 值: "${{prefix}}2"
+pipe|[流水线记录], 值: "${{prefix}}3"
+prefix = "w"
+pipe|[流水线记录], 值: "${{prefix}}4"
+"""
+
+    DSLExecutor(enable_hooks=False, enable_tracking=False,
+                compiled=compiled).execute_from_content(content)
+
+    assert EXECUTED == ["v1", "v2", "v3", "w4"]
+    assert calls.count("run_keywords") == 1
+    assert calls.count("run_keyword") == 1
+
+
+def test_batch_stops_at_first_failure(remote_url):
+    url, calls = remote_url
+    content = f"""
+@name: "远程流水线失败"
+@remote: "{url}" as pipe
+
+pipe|[流水线记录], 值: "a"
+pipe|[流水线记录], 值: "boom"
+pipe|[流水线记录], 值: "c"
+"""
+
+    with pytest.raises(Exception, match="pipeline boom"):
+        DSLExecutor(enable_hooks=False,
+                    enable_tracking=False).execute_from_content(content)
+
+    assert EXECUTED == ["a"]
+    assert calls.count("run_keywords") == 1
+    assert "run_keyword" not in calls
+
+
+def test_batch_ends_after_a_call_that_sets_variables(remote_url):
+    url, calls = remote_url
+    content = f"""
+@name: "远程流水线依赖"
+@remote: "{url}" as pipe
+
+token = "old"
+pipe|[流水线设置变量], 名称: "token", 值: "new"
+pipe|[流水线记录], 值: "${{token}}"
+pipe|[流水线记录], 值: "done"
+"""
+
+    DSLExecutor(enable_hooks=False,
+                enable_tracking=False).execute_from_content(content)
+
+    assert EXECUTED == ["new", "done"]
+    assert calls.count("run_keywords") == 2
+
+
+def test_pipeline_setting_is_read_at_execution_time(remote_url, monkeypatch):
+    url, calls = remote_url
+    monkeypatch.delenv("PYTEST_DSL_REMOTE_PIPELINE")
+    executor = DSLExecutor(enable_hooks=False, enable_tracking=False,
+                           compiled=True)
+    monkeypatch.setenv("PYTEST_DSL_REMOTE_PIPELINE", "1")
+
+    executor.execute_from_content(f"""
+@name: "远程流水线开关"
+@remote: "{url}" as pipe
+
+pipe|[流水线记录], 值: "a"
+pipe|[流水线记录], 值: "b"
+""")
+
+    assert EXECUTED == ["a", "b"]
+    assert calls.count("run_keywords") == 1
@@ -0,0 +1,134 @@
+import pytest
+
+from pytest_dsl.core.context import TestContext
+from pytest_dsl.core.keyword_manager import keyword_manager
+from pytest_dsl.remote.keyword_client import (
+    RemoteKeywordClient,
+    RemoteKeywordExecutionError,
+    RemoteServerBusyError,
+)
+from pytest_dsl.remote.server_group import RemoteServerGroup
+
+BUSY = {"status": "FAIL", "error": "服务器繁忙：并发请求已达上限 (1)，请稍后重试",
+        "traceback": []}
+
+
+class _MemberProxy:
+    def __init__(self, name, responses=None, capabilities=()):
+        self.name = name
+        self.responses = list(responses or [])
+        self.capabilities = list(capabilities)
+        self.calls = []
+        self.carried = []
+
+    def get_server_capabilities(self):
+        return self.capabilities
+
+    def sync_variables_from_client(self, variables, api_key=None):
+        return {"status": "success"}
+
+    def run_keyword(self, name, args_dict, api_key=None, variables=None):
+        self.calls.append(name)
+        self.carried.append(variables)
+        if self.responses:
+            return self.responses.pop(0)
+        return {"status": "PASS", "return": {"result": self.name}}
+
+
+def make_member(proxy, alias="agents"):
+    client = RemoteKeywordClient(url=f"http://{proxy.name}:8270/", alias=alias)
+    client.server = proxy
+    client.capabilities = client._fetch_capabilities()
+    return client
+
+
+def make_group(*proxies, strategy="least_outstanding"):
+    return RemoteServerGroup(
+        "agents", [make_member(proxy) for proxy in proxies], strategy=strategy)
+
+
+def test_round_robin_spreads_calls_across_members():
+    proxies = [_MemberProxy(name) for name in ("a", "b", "c")]
+    group = make_group(*proxies, strategy="round_robin")
+
+    results = [group._execute_remote_keyword(name="打印") for _ in range(6)]
+
+    assert results == ["a", "b", "c", "a", "b", "c"]
+
+
+def test_least_outstanding_prefers_idle_member():
+    proxies = [_MemberProxy(name) for name in ("a", "b")]
+    group = make_group(*proxies)
+    group._outstanding[0] = 3
+
+    assert group._execute_remote_keyword(name="打印") == "b"
+    assert group._execute_remote_keyword(name="打印") == "b"
+
+
+def test_busy_member_is_retried_on_another_member():
+    busy, idle = _MemberProxy("a", [BUSY]), _MemberProxy("b")
+    group = make_group(busy, idle, strategy="round_robin")
+
+    assert group._execute_remote_keyword(name="打印") == "b"
+    assert busy.calls == idle.calls == ["打印"]
+
+
+def test_all_members_busy_reports_busy_error():
+    group = make_group(_MemberProxy("a", [BUSY]), _MemberProxy("b", [BUSY]))
+
+    with pytest.raises(RemoteServerBusyError):
+        group._execute_remote_keyword(name="打印")
+
+
+def test_refused_member_is_retried_on_another_member():
+    class _RefusedProxy(_MemberProxy):
+        def run_keyword(self, *args):
+            self.calls.append(args[0])
+            raise ConnectionRefusedError(111, "Connection refused")
+
+    refused, idle = _RefusedProxy("a"), _MemberProxy("b")
+    group = make_group(refused, idle, strategy="round_robin")
+
+    assert group._execute_remote_keyword(name="打印") == "b"
+    assert refused.calls == ["打印"]
+
+
+def test_keyword_failure_is_not_retried():
+    failed = {"status": "FAIL", "error": "断言失败", "traceback": []}
+    first, second = _MemberProxy("a", [failed]), _MemberProxy("b")
+    group = make_group(first, second, strategy="round_robin")
+
+    with pytest.raises(RemoteKeywordExecutionError) as exc_info:
+        group._execute_remote_keyword(name="打印")
+
+    assert not isinstance(exc_info.value, RemoteServerBusyError)
+    assert second.calls == []
+
+
+def test_variables_carried_with_busy_call_are_sent_again():
+    proxy = _MemberProxy("a", [BUSY], capabilities=["run_keyword_variables"])
+    client = make_member(proxy)
+    context = TestContext()
+    context.set("token", "abc")
+
+    with pytest.raises(RemoteServerBusyError):
+        client._execute_remote_keyword(name="打印", context=context)
+    client._execute_remote_keyword(name="打印", context=context)
+
+    assert proxy.carried == [{"token": "abc"}, {"token": "abc"}]
+
+
+def test_connect_drops_unavailable_members_and_routes_keywords(monkeypatch):
+    up, down = make_member(_MemberProxy("a")), make_member(_MemberProxy("b"))
+    monkeypatch.setattr(up, "connect", lambda: True)
+    monkeypatch.setattr(down, "connect", lambda: False)
+    up.keyword_cache["打印"] = {}
+    monkeypatch.setitem(keyword_manager._keywords, "agents|打印",
+                        {"func": up._execute_remote_keyword})
+
+    group = RemoteServerGroup("agents", [down, up])
+
+    assert group.connect()
+    assert group.members == [up]
+    func = keyword_manager._keywords["agents|打印"]["func"]
+    assert func.func == group._execute_remote_keyword
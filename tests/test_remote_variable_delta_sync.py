@@ -0,0 +1,262 @@
+import threading
+
+import pytest
+
+import pytest_dsl.keywords  # noqa: F401 - import registers builtin keywords
+from pytest_dsl.core.context import TestContext
+from pytest_dsl.core.global_context import global_context
+from pytest_dsl.core.keyword_manager import keyword_manager
+from pytest_dsl.core.yaml_vars import yaml_vars
+from pytest_dsl.remote.keyword_client import RemoteKeywordClient
+from pytest_dsl.remote.keyword_server import (
+    RemoteKeywordServer,
+    ThreadedXMLRPCServer,
+)
+
+
+@keyword_manager.register("远程增量同步读取变量", [
+    {"name": "变量名", "mapping": "var_name", "description": "变量名"},
+])
+def remote_delta_sync_read_keyword(**kwargs):
+    return kwargs["context"].get(kwargs["var_name"])
+
+
+class _RecordingProxy:
+    def __init__(self, capabilities=None):
+        self.capabilities = capabilities
+        self.synced = []
+        self.carried = []
+
+    def get_server_capabilities(self):
+        if self.capabilities is None:
+            raise Exception("method \"get_server_capabilities\" is not supported")
+        return self.capabilities
+
+    def sync_variables_from_client(self, variables, api_key=None):
+        self.synced.append(variables)
+        return {"status": "success"}
+
+    def run_keyword(self, name, args_dict, api_key=None, variables=None):
+        self.carried.append(variables)
+        return {"status": "PASS", "return": {"result": None}}
+
+
+def make_client(proxy):
+    client = RemoteKeywordClient(url="http://remote:8270/", alias="remote")
+    client.server = proxy
+    client.capabilities = client._fetch_capabilities()
+    return client
+
+
+def test_only_changed_variables_are_synced_before_each_call():
+    proxy = _RecordingProxy()
+    client = make_client(proxy)
+    context = TestContext()
+    context.set("token", "abc")
+    context.set("count", 1)
+
+    client._execute_remote_keyword(name="打印", context=context)
+    client._execute_remote_keyword(name="打印", context=context)
+    context.set("count", 2)
+    context.set("token", "abc")
+    client._execute_remote_keyword(name="打印", context=context)
+
+    assert proxy.synced == [{"token": "abc", "count": 1}, {"count": 2}]
+    assert proxy.carried == [None, None, None]
+
+
+def test_new_context_or_clear_triggers_full_sync():
+    proxy = _RecordingProxy()
+    client = make_client(proxy)
+    first = TestContext()
+    first.set("token", "abc")
+    client._execute_remote_keyword(name="打印", context=first)
+
+    second = TestContext()
+    second.set("token", "abc")
+    client._execute_remote_keyword(name="打印", context=second)
+
+    second.clear()
+    second.set("token", "abc")
+    client._execute_remote_keyword(name="打印", context=second)
+
+    assert proxy.synced == [{"token": "abc"}] * 3
+
+
+def test_variables_are_carried_with_run_keyword_when_supported():
+    proxy = _RecordingProxy(capabilities=["run_keyword_variables"])
+    client = make_client(proxy)
+    context = TestContext()
+    context.set("token", "abc")
+
+    client._execute_remote_keyword(name="打印", context=context)
+    client._execute_remote_keyword(name="打印", context=context)
+
+    assert proxy.synced == []
+    assert proxy.carried == [{"token": "abc"}, None]
+
+
+def test_server_applies_carried_variables_before_execution():
+    server = RemoteKeywordServer.__new__(RemoteKeywordServer)
+    server.api_key = None
+    server.max_concurrency = 4
+    server.shared_variables = {}
+
+    try:
+        result = server.run_keyword(
+            "远程增量同步读取变量", {"var_name": "delta_sync_token"},
+            None, {"delta_sync_token": "from-client"})
+    finally:
+        yaml_vars._variables.pop("delta_sync_token", None)
+
+    assert result["status"] == "PASS"
+    assert result["return"]["result"] == "from-client"
+    assert server.shared_variables == {"delta_sync_token": "from-client"}
+    assert "run_keyword_variables" in server.get_server_capabilities()
+
+
+def test_variable_change_notifications_are_flushed_on_next_call(monkeypatch):
+    from pytest_dsl.core.execution.remote_invoker import RemoteKeywordInvoker
+    from pytest_dsl.remote.keyword_client import remote_keyword_manager
+
+    used_proxy, idle_proxy = _RecordingProxy(), _RecordingProxy()
+    used, idle = make_client(used_proxy), make_client(idle_proxy)
+    monkeypatch.setattr(
+        remote_keyword_manager, "clients", {"used": used, "idle": idle})
+
+    invoker = RemoteKeywordInvoker(executor=None)
+    for i in range(1000):
+        invoker.notify_variable_changed("i", i)
+    invoker.notify_variable_changed("item", "last")
+
+    assert used_proxy.synced == idle_proxy.synced == []
+
+    used._execute_remote_keyword(name="打印", context=None)
+    used._execute_remote_keyword(name="打印", context=None)
+
+    assert used_proxy.synced == [{"i": 999, "item": "last"}]
+    assert idle_proxy.synced == []
+
+
+def test_health_check_outage_triggers_full_sync(monkeypatch):
+    proxy = _RecordingProxy()
+    client = make_client(proxy)
+    context = TestContext()
+    context.set("token", "abc")
+    client._execute_remote_keyword(name="打印", context=context)
+
+    monkeypatch.setattr(client._pool, "ping", lambda: False)
+    client._pool.check_health()
+    client._execute_remote_keyword(name="打印", context=context)
+
+    assert client._pool.outages == 1
+    assert proxy.synced == [{"token": "abc"}] * 2
+
+
+def _start_server(port=0):
+    server = RemoteKeywordServer.__new__(RemoteKeywordServer)
+    server.api_key = None
+    server.max_concurrency = 4
+    server.shared_variables = {}
+
+    xmlrpc_server = ThreadedXMLRPCServer(("127.0.0.1", port), allow_none=True,
+                                         logRequests=False)
+    for func in (server.get_server_capabilities, server.get_library_spec,
+                 server.run_keyword, server.sync_variables_from_client):
+        xmlrpc_server.register_function(func)
+    thread = threading.Thread(target=xmlrpc_server.serve_forever, daemon=True)
+    thread.start()
+    return xmlrpc_server, thread
+
+
+def _stop_server(xmlrpc_server, thread):
+    xmlrpc_server.shutdown()
+    xmlrpc_server.server_close()
+    thread.join(timeout=2)
+
+
+class _Servers:
+    def __init__(self):
+        self.running = {}
+
+    def __call__(self):
+        xmlrpc_server, thread = _start_server()
+        port = xmlrpc_server.server_address[1]
+        self.running[port] = (xmlrpc_server, thread)
+        return port
+
+    def restart(self, port):
+        _stop_server(*self.running.pop(port))
+        self.running[port] = _start_server(port)
+
+    def stop_all(self):
+        for xmlrpc_server, thread in self.running.values():
+            _stop_server(xmlrpc_server, thread)
+
+
+@pytest.fixture
+def servers():
+    started = _Servers()
+    yield started
+    for name in list(keyword_manager._keywords):
+        if name.startswith("delta|"):
+            keyword_manager._keywords.pop(name)
+    started.stop_all()
+
+
+def connect(port):
+    client = RemoteKeywordClient(url=f"http://127.0.0.1:{port}/",
+                                 alias="delta")
+    client._send_initial_variables = lambda: None
+    assert client.connect()
+    return client
+
+
+def read_token(client, context):
+    return client._execute_remote_keyword(
+        name="远程增量同步读取变量", 变量名="session_token", context=context)
+
+
+def test_clients_sharing_a_server_keep_their_own_variables(servers):
+    port = servers()
+    first, second = connect(port), connect(port)
+    first_context, second_context = TestContext(), TestContext()
+    first_context.set("session_token", "first")
+    second_context.set("session_token", "second")
+
+    assert read_token(first, first_context) == "first"
+    assert read_token(second, second_context) == "second"
+    # 增量为空时服务器仍按会话提供变量，不受另一个客户端影响
+    assert read_token(first, first_context) == "first"
+    assert yaml_vars.get_variable("session_token") is None
+
+
+def test_restarted_server_receives_full_sync(servers):
+    port = servers()
+    client = connect(port)
+    context = TestContext()
+    context.set("session_token", "before-restart")
+    assert read_token(client, context) == "before-restart"
+
+    servers.restart(port)
+    # 健康检查没有发现重启，只是空闲连接被关闭后重新建立
+    client._pool._evict_idle(force=True)
+
+    assert read_token(client, context) == "before-restart"
+    context.set("session_token", "after-restart")
+    assert read_token(client, context) == "after-restart"
+
+
+def test_synced_global_variables_reach_global_context(servers):
+    client = connect(servers())
+    context = TestContext()
+    context.set("g_session_sync_token", "abc")
+
+    try:
+        value = client._execute_remote_keyword(
+            name="获取全局变量", 变量名="g_session_sync_token",
+            context=context)
+    finally:
+        global_context.delete_variable("g_session_sync_token")
+
+    assert value == "abc"
@@ -0,0 +1,126 @@
+import threading
+
+import pytest
+
+from pytest_dsl.core.keyword_manager import keyword_manager
+from pytest_dsl.remote.keyword_client import RemoteKeywordClient
+from pytest_dsl.remote.keyword_server import (
+    RemoteKeywordServer,
+    ThreadedXMLRPCServer,
+)
+from pytest_dsl.remote.wire import JSONCodec, negotiate_codec
+
+
+@keyword_manager.register("传输协议回显", [
+    {"name": "数值", "mapping": "number", "description": "大整数"},
+])
+def wire_echo_keyword(**kwargs):
+    return {"number": kwargs["number"], "doubled": kwargs["number"] * 2,
+            "blob": b"\x00\xffdata", "items": [2 ** 40, "x"]}
+
+
+@pytest.fixture
+def server_url():
+    server = RemoteKeywordServer.__new__(RemoteKeywordServer)
+    server.api_key = None
+    server.max_concurrency = 4
+    server.shared_variables = {}
+
+    xmlrpc_server = ThreadedXMLRPCServer(("127.0.0.1", 0), allow_none=True,
+                                         logRequests=False)
+    for func in (server.get_server_capabilities, server.get_library_spec,
+                 server.run_keyword, server.sync_variables_from_client):
+        xmlrpc_server.register_function(func)
+    thread = threading.Thread(target=xmlrpc_server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{xmlrpc_server.server_address[1]}/"
+    finally:
+        for name in list(keyword_manager._keywords):
+            if name.startswith("wire|"):
+                keyword_manager._keywords.pop(name)
+        xmlrpc_server.shutdown()
+        xmlrpc_server.server_close()
+        thread.join(timeout=2)
+
+
+def connect(url):
+    client = RemoteKeywordClient(url=url, alias="wire")
+    client._send_initial_variables = lambda: None
+    assert client.connect()
+    return client
+
+
+def test_compact_protocol_keeps_big_ints_and_bytes(server_url, monkeypatch):
+    monkeypatch.setenv("PYTEST_DSL_REMOTE_WIRE", "json")
+    client = connect(server_url)
+
+    result = client._execute_remote_keyword(
+        name="传输协议回显", 数值=2 ** 70, context=None)
+    # 同一线程的后续调用复用长连接
+    connection = client._pool._local.connection.proxy._conn
+    client._execute_remote_keyword(name="传输协议回显", 数值=1, context=None)
+
+    assert client.wire_protocol == "json"
+    assert client._pool._local.connection.proxy._conn is connection
+    assert result["number"] == 2 ** 70
+    assert result["doubled"] == 2 ** 71
+    assert result["blob"] == b"\x00\xffdata"
+    assert result["items"] == [2 ** 40, "x"]
+
+
+def test_xmlrpc_remains_available_as_fallback(server_url, monkeypatch):
+    monkeypatch.setenv("PYTEST_DSL_REMOTE_WIRE", "xmlrpc")
+    client = connect(server_url)
+
+    result = client._execute_remote_keyword(
+        name="传输协议回显", 数值=2 ** 70, context=None)
+
+    assert client.wire_protocol == "xmlrpc"
+    assert result["number"] == 2 ** 70
+    assert result["items"] == [2 ** 40, "x"]
+
+
+def test_negotiation_prefers_codecs_the_server_supports(monkeypatch):
+    monkeypatch.setenv("PYTEST_DSL_REMOTE_WIRE", "auto")
+
+    assert isinstance(negotiate_codec({"wire:json"}), JSONCodec)
+    assert negotiate_codec({"run_keywords"}) is None
+
+
+def test_json_codec_roundtrips_bytes_and_big_ints():
+    codec = JSONCodec()
+    value = {"big": -(2 ** 80), "raw": b"\x01\x02", "nested": [{"b": b""}]}
+
+    assert codec.loads(codec.dumps(value)) == value
+
+
+def test_msgpack_codec_roundtrips_big_ints_bytes_and_sets():
+    pytest.importorskip("msgpack")
+    from pytest_dsl.remote.wire import MsgpackCodec
+
+    codec = MsgpackCodec()
+    value = {"negative": -(2 ** 80), "big": 2 ** 70, "raw": b"\x00\xff",
+             "items": {3, 1, 2}}
+
+    result = codec.loads(codec.dumps(value))
+
+    # 集合不是msgpack原生类型，按列表传输
+    assert sorted(result.pop("items")) == [1, 2, 3]
+    value.pop("items")
+    assert result == value
+
+
+def test_msgpack_protocol_end_to_end(server_url, monkeypatch):
+    pytest.importorskip("msgpack")
+    monkeypatch.setenv("PYTEST_DSL_REMOTE_WIRE", "msgpack")
+    client = connect(server_url)
+
+    result = client._execute_remote_keyword(
+        name="传输协议回显", 数值=-(2 ** 80), context=None)
+
+    assert client.wire_protocol == "msgpack"
+    assert result["number"] == -(2 ** 80)
+    assert result["doubled"] == -(2 ** 81)
+    assert result["blob"] == b"\x00\xffdata"
+    assert result["items"] == [2 ** 40, "x"]
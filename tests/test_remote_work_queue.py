@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+
+from pytest_dsl.core.keyword_manager import keyword_manager
+from pytest_dsl.remote.keyword_client import is_server_busy_result
+from pytest_dsl.remote.keyword_server import RemoteKeywordServer
+from pytest_dsl.remote.work_queue import (
+    KeywordProcessPool,
+    KeywordWorkQueue,
+    QueueFullError,
+)
+
+release = threading.Event()
+
+
+@keyword_manager.register("工作队列阻塞关键字", [])
+def work_queue_blocking_keyword(**kwargs):
+    release.wait(5)
+    return "done"
+
+
+def _blocking(queue_stats, started, gate):
+    started.set()
+    gate.wait(5)
+    return queue_stats
+
+
+def _occupy(queue, gate):
+    """占用唯一的工作线程，直到gate被设置"""
+    started = threading.Event()
+    thread = threading.Thread(
+        target=queue.run, args=(_blocking, started, gate), daemon=True)
+    thread.start()
+    assert started.wait(5)
+    return thread
+
+
+def test_request_waits_for_free_worker_instead_of_failing():
+    queue = KeywordWorkQueue(workers=1, max_queue=1, max_wait=5)
+    gate = threading.Event()
+    _occupy(queue, gate)
+    threading.Timer(0.05, gate.set).start()
+
+    stats = queue.run(lambda queue_stats: queue_stats)
+
+    assert stats["queue_depth"] == 0
+    assert stats["queue_wait_ms"] >= 40
+    queue.shutdown()
+
+
+def test_full_queue_is_rejected_immediately():
+    queue = KeywordWorkQueue(workers=1, max_queue=0, max_wait=5)
+    gate = threading.Event()
+    _occupy(queue, gate)
+
+    with pytest.raises(QueueFullError, match="等待队列已满"):
+        queue.run(lambda queue_stats: None)
+    gate.set()
+    queue.shutdown()
+
+
+def test_request_waiting_longer_than_max_wait_never_runs():
+    queue = KeywordWorkQueue(workers=1, max_queue=5, max_wait=0.05)
+    gate = threading.Event()
+    blocker = _occupy(queue, gate)
+    executed = []
+
+    with pytest.raises(QueueFullError, match="排队等待超过"):
+        queue.run(lambda queue_stats: executed.append(True))
+    gate.set()
+    blocker.join(5)
+    queue.run(lambda queue_stats: None)
+
+    assert executed == []
+    assert queue.depth == 0
+    queue.shutdown()
+
+
+def test_server_reports_queue_diagnostics_and_busy_result():
+    server = RemoteKeywordServer.__new__(RemoteKeywordServer)
+    server.api_key = None
+    server.max_concurrency = 1
+    server.max_queue = 0
+    server.shared_variables = {}
+    release.clear()
+    blocked = threading.Thread(
+        target=server.run_keyword, args=("工作队列阻塞关键字", {}), daemon=True)
+    blocked.start()
+    deadline = time.monotonic() + 5
+    while server._get_work_queue().depth or not blocked.is_alive():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    time.sleep(0.05)
+
+    busy = server.run_keyword("工作队列阻塞关键字", {})
+    release.set()
+    blocked.join(5)
+    result = server.run_keyword("工作队列阻塞关键字", {})
+    server._work_queue.shutdown()
+
+    assert is_server_busy_result(busy)
+    assert result["status"] == "PASS"
+    assert result["diagnostics"]["queue_depth"] == 0
+    assert "queue_wait_ms" in result["diagnostics"]
+
+
+def test_process_pool_executes_keyword_in_child_process():
+    pool = KeywordProcessPool(["求和"], workers=1)
+    try:
+        result = pool.execute("求和", {"data": [1, 2, 3], "start": 10,
+                                     "context": object()})
+    finally:
+        pool.shutdown()
+
+    assert pool.handles("求和") and not pool.handles("打印")
+    assert result == 16
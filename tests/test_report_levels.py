@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+import pytest_dsl.keywords  # noqa: F401 - import registers builtin keywords
+from pytest_dsl.core.dsl_executor import DSLExecutor
+from pytest_dsl.core.keyword_manager import keyword_manager
+
+LOOP_DSL = """
+@name: "报告级别测试"
+
+total = 0
+for i in range(0, 5) do
+    total = total + i
+    [报告级别累加], 值: total
+end
+"""
+
+FAILING_DSL = """
+@name: "报告级别失败测试"
+
+[断言], 条件: "1 == 2", 消息: "故意失败"
+"""
+
+
+@keyword_manager.register("报告级别累加", [
+    {"name": "值", "mapping": "value", "description": "值"},
+])
+def report_level_keyword(**kwargs):
+    return kwargs["value"]
+
+
+@pytest.fixture
+def allure_calls(monkeypatch):
+    calls = {"steps": [], "attachments": []}
+
+    class RecordStep:
+        def __init__(self, title):
+            calls["steps"].append(title)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    def record_attachment(body, name=None, attachment_type=None):
+        calls["attachments"].append((name, body))
+
+    monkeypatch.setattr("allure.step", RecordStep)
+    monkeypatch.setattr("allure.attach", record_attachment)
+    monkeypatch.delenv("PYTEST_DSL_VERBOSE", raising=False)
+    return calls
+
+
+def _summary(calls):
+    bodies = [body for name, body in calls["attachments"]
+              if name == "DSL执行摘要"]
+    assert len(bodies) == 1
+    return json.loads(bodies[0])
+
+
+def test_summary_level_writes_one_structured_attachment(monkeypatch,
+                                                       allure_calls):
+    monkeypatch.setenv("PYTEST_DSL_REPORT_LEVEL", "summary")
+
+    DSLExecutor(enable_hooks=False).execute_from_content(LOOP_DSL)
+
+    assert allure_calls["steps"] == []
+    assert [name for name, _ in allure_calls["attachments"]] == [
+        "DSL执行摘要"]
+    summary = _summary(allure_calls)
+    assert summary["steps"]["循环轮次"] == 5
+    assert summary["steps"]["调用关键字: 报告级别累加"] == 5
+    assert summary["errors"] == []
+
+
+def test_summary_level_keeps_error_details(monkeypatch, allure_calls):
+    monkeypatch.setenv("PYTEST_DSL_REPORT_LEVEL", "summary")
+
+    with pytest.raises(Exception):
+        DSLExecutor(enable_hooks=False).execute_from_content(FAILING_DSL)
+
+    errors = _summary(allure_calls)["errors"]
+    assert errors
+    assert any("故意失败" in error["details"] for error in errors)
+
+
+def test_off_level_skips_allure_bookkeeping(monkeypatch, allure_calls):
+    monkeypatch.setenv("PYTEST_DSL_REPORT_LEVEL", "off")
+
+    DSLExecutor(enable_hooks=False).execute_from_content(LOOP_DSL)
+
+    assert allure_calls == {"steps": [], "attachments": []}
+
+
+def test_full_level_is_the_default(monkeypatch, allure_calls):
+    monkeypatch.delenv("PYTEST_DSL_REPORT_LEVEL", raising=False)
+
+    DSLExecutor(enable_hooks=False).execute_from_content(LOOP_DSL)
+
+    assert "循环轮次: i = 4" in allure_calls["steps"]
+    assert "解析参数: 值" in allure_calls["steps"]
+    names = [name for name, _ in allure_calls["attachments"]]
+    assert "关键字调用" in names
+    assert "DSL执行摘要" not in names
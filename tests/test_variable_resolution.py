@@ -0,0 +1,120 @@
+import pytest
+
+from pytest_dsl.core.context import TestContext as DSLTestContext
+from pytest_dsl.core.execution.state import ExecutionState
+from pytest_dsl.core.global_context import global_context
+from pytest_dsl.core.variable_utils import VariableReplacer
+from pytest_dsl.core.yaml_vars import yaml_vars
+
+
+class CountingProvider:
+    layer = None
+
+    def __init__(self, variables, generation=0):
+        self.variables = variables
+        self.generation = generation
+        self.calls = 0
+
+    def get_variable(self, key):
+        self.calls += 1
+        return self.variables.get(key)
+
+
+@pytest.fixture
+def isolated_global_store(monkeypatch, tmp_path):
+    from pytest_dsl.core.global_context import JSONFileGlobalStore
+
+    store = JSONFileGlobalStore(str(tmp_path / "vars.json"),
+                                str(tmp_path / "vars.lock"))
+    monkeypatch.setattr(global_context, "_store", store)
+    return store
+
+
+def test_each_provider_is_asked_once_per_lookup():
+    context = DSLTestContext()
+    first = CountingProvider({}, generation=None)
+    second = CountingProvider({"name": "value"}, generation=None)
+    context.register_external_variable_provider(first)
+    context.register_external_variable_provider(second)
+
+    assert VariableReplacer({}, context).get_variable("name") == "value"
+    assert (first.calls, second.calls) == (1, 1)
+
+
+def test_resolved_provider_is_remembered_until_generation_changes():
+    context = DSLTestContext()
+    first = CountingProvider({})
+    second = CountingProvider({"name": "value"})
+    context.register_external_variable_provider(first)
+    context.register_external_variable_provider(second)
+
+    assert context.get("name") == "value"
+    assert context.get("name") == "value"
+    assert not context.has("missing")
+    assert not context.has("missing")
+    assert (first.calls, second.calls) == (2, 3)
+
+    first.variables["name"] = "override"
+    first.generation += 1
+    assert context.get("name") == "override"
+
+
+def test_global_variable_resolution_follows_store_changes(
+        isolated_global_store):
+    context = DSLTestContext()
+    from pytest_dsl.core.variable_providers import (
+        setup_context_with_default_providers
+    )
+    setup_context_with_default_providers(context)
+    replacer = VariableReplacer({}, context)
+
+    with pytest.raises(KeyError):
+        replacer.get_variable("g_resolution_value")
+
+    isolated_global_store.set("g_resolution_value", "first")
+    assert replacer.get_variable("g_resolution_value") == "first"
+    isolated_global_store.set("g_resolution_value", "second")
+    assert replacer.get_variable("g_resolution_value") == "second"
+
+    yaml_vars.update_variables({"g_resolution_value": "yaml"})
+    try:
+        assert replacer.get_variable("g_resolution_value") == "yaml"
+    finally:
+        yaml_vars._variables.pop("g_resolution_value")
+
+
+def test_global_context_lookup_without_test_context(isolated_global_store):
+    isolated_global_store.set("g_lookup_none", None)
+
+    assert global_context.lookup_variable("g_lookup_none", "default") is None
+    assert global_context.lookup_variable("g_lookup_missing",
+                                          "default") == "default"
+
+
+def test_set_local_variable_writes_each_layer_once():
+    class BoundExecutor:
+        pass
+
+    state = ExecutionState()
+    executor = BoundExecutor()
+    executor.state = state
+    state.bind_executor(executor)
+    writes = []
+    state.variables = WriteRecorder(writes)
+    state.variable_replacer.local_variables = state.variables
+
+    state.set_local_variable("name", 1)
+
+    assert writes == ["name"]
+    assert state.test_context.get("name") == 1
+    assert state.variable_replacer.get_variable("name") == 1
+
+
+class WriteRecorder(dict):
+    def __init__(self, writes):
+        super().__init__()
+        self.writes = writes
+
+    def __setitem__(self, key, value):
+        self.writes.append(key)
+        super().__setitem__(key, value)